@@ -0,0 +1,22 @@
+"""
+Dependencies shared by several API routers.
+"""
+
+from app.infra.analysis_cache import DesignAnalysisCache, design_analysis_cache
+from app.infra.executor import CPUExecutor, cpu_executor
+from app.infra.jobs import JobManager, job_manager
+
+
+def get_executor() -> CPUExecutor:
+    """Provide the executor that CPU-bound route work is dispatched through."""
+    return cpu_executor
+
+
+def get_job_manager() -> JobManager:
+    """Provide the in-process background job queue."""
+    return job_manager
+
+
+def get_analysis_cache() -> DesignAnalysisCache:
+    """Provide the per-design ML analysis cache (read by ML routes, cleared on design delete)."""
+    return design_analysis_cache
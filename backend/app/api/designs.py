@@ -4,20 +4,73 @@ SOLID: Single Responsibility - handles design CRUD and validation only.
 Now uses repository + services via FastAPI dependency injection.
 """
 
-from typing import List
+import json
+from typing import Callable, Dict, Iterable, Iterator, List, Literal, Tuple
 
-from fastapi import APIRouter, Depends, HTTPException
+from fastapi import APIRouter, Body, Depends, Header, HTTPException, Query, Request
+from fastapi.responses import Response, StreamingResponse
+from pydantic import BaseModel, Field
+from starlette.concurrency import run_in_threadpool
 
-from app.domain.models import Design
+from app.api.deps import get_analysis_cache, get_executor, get_job_manager
+from app.api.jobs import accepted
+from app.api.wire import (
+    DESIGN_REQUEST_BODY,
+    DESIGN_RESPONSES,
+    design_json_response,
+    design_response,
+    etag_matches,
+    negotiate,
+    parse_design,
+    revision_etag,
+)
+from app.domain.autoplacer import DEFAULT_MOVES_PER_COMPONENT, AutoplacerService
+from app.domain.autorouter import DEFAULT_GRID_MM, DEFAULT_TRACE_WIDTH_MM, AutorouterService
+from app.domain.gerber import export_basename
+from app.domain.incremental_drc import IncrementalDRCService, incremental_drc_service
+from app.domain.models import Design, Issue
+from app.domain.patching import DesignDelta, JsonPatchOperation, PatchError, PatchResult, PatchTestFailed
+from app.domain.projections import DesignPage
+from app.domain.ratsnest import RatsnestService, ratsnest_service
 from app.domain.services import DesignService, DRCService
-from app.infra.memory_repo import DesignRepository, design_repository
+from app.infra.analysis_cache import DesignAnalysisCache
+from app.infra.executor import CPUExecutor
+from app.infra.jobs import JobContext, JobFile, JobManager
+from app.infra.memory_repo import DEFAULT_PAGE_SIZE, DesignRepository, RevisionConflict
+from app.infra.repo_factory import get_configured_repository
+from app.infra.result_cache import DRCResultCache, board_fingerprint, drc_result_cache
 
 router = APIRouter(prefix="/designs", tags=["designs"])
 
+NDJSON_MEDIA_TYPE = "application/x-ndjson"
+SSE_MEDIA_TYPE = "text/event-stream"
+# Summary page size used to enumerate every design for validate-batch "all"
+BATCH_PAGE_SIZE = 500
+
+
+class BatchValidateRequest(BaseModel):
+    """Request to validate many designs at once."""
+    design_ids: List[str] | Literal["all"] = "all"
+    max_workers: int | None = Field(default=None, ge=1)
+
+
+class AutorouteRequest(BaseModel):
+    """Autorouter settings for one run (all optional)."""
+    grid: float = Field(default=DEFAULT_GRID_MM, gt=0, description="Routing grid pitch (mm)")
+    trace_width: float = Field(default=DEFAULT_TRACE_WIDTH_MM, gt=0, description="Track width (mm)")
+    max_workers: int | None = Field(default=None, ge=1)
+
+
+class AutoplaceRequest(BaseModel):
+    """Autoplacer settings for one run (all optional)."""
+    fixed: List[str] = Field(default_factory=list, description="Component IDs that must not move")
+    moves_per_component: int = Field(default=DEFAULT_MOVES_PER_COMPONENT, ge=1, le=10_000)
+    seed: int = 0
+
 
 def get_repo() -> DesignRepository:
-    """Provide the design repository (in-memory for MVP)."""
-    return design_repository
+    """Provide the design repository selected by PCB_REPO_BACKEND (in-memory by default)."""
+    return get_configured_repository()
 
 
 def get_design_service(repo: DesignRepository = Depends(get_repo)) -> DesignService:
@@ -30,6 +83,21 @@ def get_drc_service() -> DRCService:
     return DRCService()
 
 
+def get_incremental_drc_service() -> IncrementalDRCService:
+    """Provide the stateful incremental DRC checker (shared across requests)."""
+    return incremental_drc_service
+
+
+def get_drc_cache() -> DRCResultCache:
+    """Provide the content-addressed DRC result cache."""
+    return drc_result_cache
+
+
+def get_ratsnest_service() -> RatsnestService:
+    """Provide the stateful ratsnest service (shared across requests)."""
+    return ratsnest_service
+
+
 @router.post("", response_model=Design)
 async def create_design(
     design: Design,
@@ -39,35 +107,137 @@ async def create_design(
     return service.create_design(design)
 
 
-@router.get("/{design_id}", response_model=Design)
+@router.get("/drc-cache/stats")
+async def drc_cache_stats(cache: DRCResultCache = Depends(get_drc_cache)) -> dict:
+    """Hit/miss counters and occupancy of the DRC result cache."""
+    return cache.stats()
+
+
+@router.get("/{design_id}", response_model=Design, responses={**DESIGN_RESPONSES, 304: {"description": "Not modified"}})
 async def get_design(
     design_id: str,
+    accept: str | None = Header(None),
+    if_none_match: str | None = Header(None),
     service: DesignService = Depends(get_design_service),
-) -> Design:
-    """Get design by ID."""
+) -> Response:
+    """
+    Get design by ID as JSON or MessagePack (negotiated via Accept).
+
+    The ETag is the stored revision; a matching If-None-Match returns 304
+    without reading the body.
+    """
+    media_type = negotiate(accept)
     try:
-        return service.get_design(design_id)
+        # Read the revision before the body: a concurrent save can then only
+        # make the ETag older than the body, which costs a refetch, never a stale hit
+        etag = revision_etag(service.get_design_revision(design_id))
+        if if_none_match is not None and etag_matches(if_none_match, etag):
+            return Response(status_code=304, headers={"ETag": etag, "Vary": "Accept"})
+        body = service.get_design_json(design_id)
     except ValueError:
         raise HTTPException(status_code=404, detail="Design not found")
+    response = design_json_response(body, media_type)
+    response.headers["ETag"] = etag
+    return response
 
 
-@router.put("/{design_id}", response_model=Design)
+@router.put(
+    "/{design_id}",
+    response_model=Design,
+    responses={**DESIGN_RESPONSES, 412: {"description": "Design changed since the If-Match revision"}},
+    openapi_extra=DESIGN_REQUEST_BODY,
+)
 async def update_design(
     design_id: str,
-    design: Design,
+    request: Request,
+    accept: str | None = Header(None),
+    if_match: str | None = Header(None),
     service: DesignService = Depends(get_design_service),
-) -> Design:
-    """Update existing design."""
+) -> Response:
+    """
+    Update existing design; the body may be JSON or MessagePack (per Content-Type).
+
+    With If-Match, the save only happens if the stored design is still at
+    that ETag; otherwise 412 is returned and nothing is written.
+    """
+    media_type = negotiate(accept)
+    design = parse_design(await request.body(), request.headers.get("content-type"))
     # Ensure path and body IDs match for safety
     if design.id != design_id:
         raise HTTPException(status_code=400, detail="Design ID mismatch")
-    return service.update_design(design)
+
+    expected = None
+    if if_match is not None:
+        try:
+            expected = service.get_design_revision(design_id)
+        except ValueError:
+            raise HTTPException(status_code=412, detail="Design does not exist")
+        if not etag_matches(if_match, revision_etag(expected), weak=False):
+            raise HTTPException(status_code=412, detail="Design was modified; reload it and retry")
+    try:
+        # The repository re-checks the revision atomically with the write
+        revision = service.save_design(design, expected)
+    except RevisionConflict:
+        raise HTTPException(status_code=412, detail="Design was modified; reload it and retry")
+    response = design_response(design, media_type)
+    response.headers["ETag"] = revision_etag(revision)
+    return response
+
+
+@router.patch(
+    "/{design_id}",
+    response_model=PatchResult,
+    responses={412: {"description": "Design changed since the If-Match revision"}},
+)
+async def patch_design(
+    design_id: str,
+    response: Response,
+    patch: List[JsonPatchOperation] | DesignDelta = Body(...),
+    if_match: str | None = Header(None),
+    service: DesignService = Depends(get_design_service),
+) -> PatchResult:
+    """
+    Apply a partial update and return only what changed.
+
+    The body is either an RFC 6902 JSON Patch array (application/json-patch+json)
+    or a domain delta: {"ops": [{"op": "move_component", ...}, ...]}.
+    A failed "test" operation returns 409; an inapplicable patch returns 422.
+
+    With If-Match, the patch only applies to the design at that ETag (412
+    otherwise). Without it, a save racing the patch returns 409. The new
+    revision is returned as the ETag.
+    """
+    expected = None
+    if if_match is not None:
+        try:
+            expected = service.get_design_revision(design_id)
+        except ValueError:
+            raise HTTPException(status_code=412, detail="Design does not exist")
+        if not etag_matches(if_match, revision_etag(expected), weak=False):
+            raise HTTPException(status_code=412, detail="Design was modified; reload it and retry")
+    try:
+        result, _, revision = service.patch_design(design_id, patch, expected)
+    except RevisionConflict:
+        if expected is not None:
+            raise HTTPException(status_code=412, detail="Design was modified; reload it and retry")
+        raise HTTPException(status_code=409, detail="Design was modified while the patch applied; retry")
+    except PatchTestFailed as exc:
+        raise HTTPException(status_code=409, detail=str(exc))
+    except PatchError as exc:
+        raise HTTPException(status_code=422, detail=str(exc))
+    except ValueError:
+        raise HTTPException(status_code=404, detail="Design not found")
+    response.headers["ETag"] = revision_etag(revision)
+    return result
 
 
 @router.delete("/{design_id}")
 async def delete_design(
     design_id: str,
     service: DesignService = Depends(get_design_service),
+    incremental_drc: IncrementalDRCService = Depends(get_incremental_drc_service),
+    ratsnest: RatsnestService = Depends(get_ratsnest_service),
+    analysis_cache: DesignAnalysisCache = Depends(get_analysis_cache),
 ) -> dict:
     """Delete design."""
     try:
@@ -77,37 +247,406 @@ async def delete_design(
         raise HTTPException(status_code=404, detail="Design not found")
 
     service.delete_design(design_id)
+    incremental_drc.forget(design_id)
+    ratsnest.forget(design_id)
+    analysis_cache.invalidate(design_id)
     return {"message": "Design deleted"}
 
 
-@router.get("", response_model=List[Design])
+@router.get("/{design_id}/export/gerber", response_class=StreamingResponse)
+async def export_gerber(
+    design_id: str,
+    service: DesignService = Depends(get_design_service),
+) -> StreamingResponse:
+    """Download Gerber (RS-274X) layers and an Excellon drill file as a zip, streamed as generated."""
+    try:
+        design = service.get_design(design_id)
+    except ValueError:
+        raise HTTPException(status_code=404, detail="Design not found")
+    return StreamingResponse(
+        service.export_gerber(design),
+        media_type="application/zip",
+        headers={"Content-Disposition": f'attachment; filename="{export_basename(design)}-gerber.zip"'},
+    )
+
+
+@router.post("/{design_id}/export/gerber/job", status_code=202)
+async def export_gerber_job(
+    design_id: str,
+    service: DesignService = Depends(get_design_service),
+    jobs: JobManager = Depends(get_job_manager),
+):
+    """
+    Build the Gerber zip in the background and return the job (202, with a
+    Location header). Progress advances per file; download from
+    `/jobs/{job_id}/result` once it has succeeded.
+    """
+    try:
+        design = service.get_design(design_id)
+    except ValueError:
+        raise HTTPException(status_code=404, detail="Design not found")
+    filename = f"{export_basename(design)}-gerber.zip"
+
+    def run(ctx: JobContext) -> JobFile:
+        def on_file(index: int, total: int, name: str) -> None:
+            ctx.report(index / total, f"Writing {name}")
+
+        path = ctx.result_path(".zip")
+        with open(path, "wb") as archive:
+            for chunk in service.export_gerber(design, on_file):
+                archive.write(chunk)
+        return JobFile(path, "application/zip", filename)
+
+    return accepted(jobs.submit("export_gerber", run))
+
+
+@router.post("/{design_id}/autoroute/job", status_code=202)
+async def autoroute_job(
+    design_id: str,
+    payload: AutorouteRequest | None = None,
+    service: DesignService = Depends(get_design_service),
+    jobs: JobManager = Depends(get_job_manager),
+):
+    """
+    Route the design's nets in the background and return the job (202, with a
+    Location header). Existing traces and vias are replaced and the design is
+    saved; the result lists routed, failed and skipped nets. If the design is
+    edited while the job runs, the job fails and nothing is saved.
+    """
+    payload = payload or AutorouteRequest()
+    design, revision = _load_for_job(service, design_id)
+    if len(design.board.outline) < 3:
+        raise HTTPException(status_code=400, detail="Board outline is missing. Define board boundaries before routing.")
+    autorouter = AutorouterService(grid=payload.grid, trace_width=payload.trace_width)
+
+    def run(ctx: JobContext) -> dict:
+        def on_progress(done: int, total: int) -> None:
+            ctx.report(done / total if total else 1.0, f"Routed {done} of {total} nets")
+
+        result = autorouter.route(design, payload.max_workers, on_progress)
+        _save_job_design(ctx, service, autorouter.apply(design, result), revision)
+        return {"design_id": design_id, **result.summary()}
+
+    return accepted(jobs.submit("autoroute", run))
+
+
+@router.get("/{design_id}/ratsnest")
+async def get_ratsnest(
+    design_id: str,
+    service: DesignService = Depends(get_design_service),
+    ratsnest: RatsnestService = Depends(get_ratsnest_service),
+) -> dict:
+    """
+    Return the design's airwires: the minimum spanning tree of every net's
+    unrouted pins, with the total unrouted length. Only nets that changed
+    since the last call are recomputed.
+    """
+    try:
+        design = service.get_design(design_id)
+    except ValueError:
+        raise HTTPException(status_code=404, detail="Design not found")
+    result = await run_in_threadpool(ratsnest.compute, design)
+    return {"design_id": design_id, **result.summary()}
+
+
+@router.post("/{design_id}/autoplace/job", status_code=202)
+async def autoplace_job(
+    design_id: str,
+    payload: AutoplaceRequest | None = None,
+    service: DesignService = Depends(get_design_service),
+    jobs: JobManager = Depends(get_job_manager),
+):
+    """
+    Place the design's components in the background and return the job (202,
+    with a Location header). Components not listed in `fixed` are moved to
+    shorten the wiring and the design is saved; the result reports the wire
+    length before and after. If the design is edited while the job runs, the
+    job fails and nothing is saved.
+    """
+    payload = payload or AutoplaceRequest()
+    design, revision = _load_for_job(service, design_id)
+    if len(design.board.outline) < 3:
+        raise HTTPException(status_code=400, detail="Board outline is missing. Define board boundaries before placing.")
+    placer = AutoplacerService(moves_per_component=payload.moves_per_component, seed=payload.seed)
+
+    def run(ctx: JobContext) -> dict:
+        def on_progress(done: int, total: int) -> None:
+            ctx.report(done / total if total else 1.0, f"Annealing step {done} of {total}")
+
+        result = placer.place(design.board, payload.fixed, on_progress)
+        _save_job_design(ctx, service, placer.apply(design, result), revision)
+        return {"design_id": design_id, **result.summary()}
+
+    return accepted(jobs.submit("autoplace", run))
+
+
+@router.get("", response_model=DesignPage)
 async def list_designs(
+    limit: int = Query(DEFAULT_PAGE_SIZE, ge=1, le=500),
+    cursor: str | None = None,
+    name_prefix: str | None = None,
+    min_components: int | None = Query(None, ge=0),
+    max_components: int | None = Query(None, ge=0),
+    service: DesignService = Depends(get_design_service),
+) -> DesignPage:
+    """
+    List design summaries, one page at a time, ordered by ID.
+
+    Pass the returned `next_cursor` back as `cursor` to fetch the next page.
+    """
+    try:
+        return service.list_design_summaries(limit, cursor, name_prefix, min_components, max_components)
+    except ValueError:
+        raise HTTPException(status_code=400, detail="Invalid cursor")
+
+
+@router.post("/validate-batch")
+async def validate_designs_batch(
+    payload: BatchValidateRequest,
     service: DesignService = Depends(get_design_service),
-) -> List[Design]:
-    """List all designs."""
-    return service.list_designs()
+    drc_service: DRCService = Depends(get_drc_service),
+    executor: CPUExecutor = Depends(get_executor),
+) -> StreamingResponse:
+    """
+    Run DRC over many designs (a list of IDs or "all") on the shared executor.
+    Streams one NDJSON line per design as soon as its check completes.
+    """
+    revisions, missing = _batch_revisions(payload, service)
+
+    def stream():
+        for result in _batch_results(payload, revisions, missing, service, drc_service, executor):
+            yield json.dumps(result) + "\n"
+
+    # Sync generator: Starlette iterates it in a worker thread, off the event loop
+    return StreamingResponse(stream(), media_type=NDJSON_MEDIA_TYPE)
+
+
+@router.post("/validate-batch/job", status_code=202)
+async def validate_designs_batch_job(
+    payload: BatchValidateRequest,
+    service: DesignService = Depends(get_design_service),
+    drc_service: DRCService = Depends(get_drc_service),
+    executor: CPUExecutor = Depends(get_executor),
+    jobs: JobManager = Depends(get_job_manager),
+):
+    """
+    Run batch DRC in the background and return the job (202, with a Location
+    header). Progress advances per design; the result is the list of
+    per-design entries the streaming endpoint would have sent.
+    """
+    revisions, missing = _batch_revisions(payload, service)
+
+    def run(ctx: JobContext) -> List[dict]:
+        results = []
+        for result in _batch_results(payload, revisions, missing, service, drc_service, executor):
+            results.append(result)
+            if len(results) > len(missing):
+                checked = len(results) - len(missing)
+                ctx.report(checked / len(revisions), f"Checked {result['design_id']}")
+        return results
+
+    return accepted(jobs.submit("validate_batch", run))
+
+
+def _load_for_job(service: DesignService, design_id: str) -> Tuple[Design, int]:
+    """Design a job will rewrite, with the revision it must still be at when saved (404 if missing)."""
+    try:
+        # Revision first: a save in between makes the job conflict rather than overwrite it
+        revision = service.get_design_revision(design_id)
+        return service.get_design(design_id), revision
+    except ValueError:
+        raise HTTPException(status_code=404, detail="Design not found")
+
+
+def _save_job_design(ctx: JobContext, service: DesignService, design: Design, revision: int) -> None:
+    """Save a job's rewritten design unless the job was cancelled or the design changed meanwhile."""
+    # Last cancellation point: once saved, the job must not be reported as cancelled
+    ctx.check_cancelled()
+    try:
+        service.save_design(design, revision)
+    except RevisionConflict:
+        raise RuntimeError("The design was changed while the job ran; nothing was saved. Run the job again.")
+
+
+def _batch_revisions(payload: BatchValidateRequest, service: DesignService) -> Tuple[Dict[str, int], List[str]]:
+    """
+    IDs a batch request names with their current revisions, plus the IDs that
+    do not exist. Only summaries are read here; bodies are loaded as checked.
+    """
+    if payload.design_ids == "all":
+        revisions: Dict[str, int] = {}
+        cursor = None
+        while True:
+            page = service.list_design_summaries(limit=BATCH_PAGE_SIZE, cursor=cursor)
+            revisions.update((summary.id, summary.revision) for summary in page.items)
+            cursor = page.next_cursor
+            if cursor is None:
+                break
+        return revisions, []
+    revisions, missing = {}, []
+    for design_id in dict.fromkeys(payload.design_ids):
+        try:
+            revisions[design_id] = service.get_design_revision(design_id)
+        except ValueError:
+            missing.append(design_id)
+    return revisions, missing
+
+
+def _batch_results(
+    payload: BatchValidateRequest,
+    revisions: Dict[str, int],
+    missing: List[str],
+    service: DesignService,
+    drc_service: DRCService,
+    executor: CPUExecutor,
+) -> Iterator[dict]:
+    """One JSON-ready entry per requested design: not-found errors first, then issues as checks finish."""
+    for design_id in missing:
+        yield {"design_id": design_id, "error": "Design not found"}
+
+    # Designs are loaded as the checker asks for the next shard and dropped
+    # once their result is saved, so only the shards in flight are in memory
+    loaded: Dict[str, Design] = {}
+    vanished: List[str] = []
+
+    def load() -> Iterator[Design]:
+        for design_id in revisions:
+            try:
+                design = service.get_design(design_id)
+            except ValueError:
+                vanished.append(design_id)
+                continue
+            loaded[design_id] = design
+            yield design
+
+    for design_id, issues in drc_service.check_designs(load(), executor, max_workers=payload.max_workers):
+        # Persist issues like the single-design validate endpoint does, unless
+        # the design was edited meanwhile: the issues describe the old board
+        design = loaded.pop(design_id)
+        design.issues = issues
+        try:
+            service.save_design(design, revisions[design_id])
+        except RevisionConflict:
+            yield {"design_id": design_id, "error": "Design was modified while it was checked; validate it again"}
+            continue
+        yield {
+            "design_id": design_id,
+            "issues": [issue.model_dump(mode="json") for issue in issues],
+        }
+
+    # Deleted after the revisions were read: "all" no longer includes them
+    if payload.design_ids != "all":
+        for design_id in vanished:
+            yield {"design_id": design_id, "error": "Design not found"}
+
+
+def _stream_issues(
+    issues: Iterable[Issue],
+    media_type: str,
+    on_complete: Callable[[int], None] = lambda count: None,
+) -> Iterator[str]:
+    """
+    Serialize issues one by one as NDJSON lines or SSE events, then report
+    how many were sent. Only the count is kept; callers that need the
+    issues afterwards collect them from `issues` themselves.
+    """
+    count = 0
+    for issue in issues:
+        count += 1
+        if media_type == SSE_MEDIA_TYPE:
+            yield f"event: issue\ndata: {issue.model_dump_json()}\n\n"
+        else:
+            yield issue.model_dump_json() + "\n"
+    on_complete(count)
+    if media_type == SSE_MEDIA_TYPE:
+        # SSE clients reconnect on close, so the end of the stream is explicit
+        yield f"event: done\ndata: {json.dumps({'count': count})}\n\n"
 
 
 @router.post("/{design_id}/validate")
 async def validate_design(
     design_id: str,
+    incremental: bool = False,
+    stream: Literal["ndjson", "sse"] | None = None,
     service: DesignService = Depends(get_design_service),
     drc_service: DRCService = Depends(get_drc_service),
+    incremental_drc: IncrementalDRCService = Depends(get_incremental_drc_service),
+    cache: DRCResultCache = Depends(get_drc_cache),
+    executor: CPUExecutor = Depends(get_executor),
 ):
     """
     Run DRC (Design Rule Check) on design.
     Returns list of issues (errors, warnings, info).
+    Checks run in the CPU executor so large boards do not block other requests.
+
+    With `?incremental=true`, only nets and components changed since this
+    design was last validated are re-checked (cheap enough to run per edit).
+    Full checks are served from a cache when the board content is unchanged.
+
+    With `?stream=ndjson` (one issue per line) or `?stream=sse` (`issue`
+    events, then a `done` event), issues are sent as each rule produces them.
+    Streaming checks run in a worker thread rather than the CPU executor,
+    since a generator cannot be handed back from a process pool. Streaming
+    bounds the response body and the time to the first issue, not the
+    issues themselves: they are still collected to be cached and saved on
+    the design once the stream ends.
+
+    Issues are saved only if the design was not edited during the check;
+    otherwise 409 is returned (streams just skip the save).
     """
     try:
+        # Revision first: issues are only saved onto the board they describe
+        revision = service.get_design_revision(design_id)
         design = service.get_design(design_id)
     except ValueError:
         raise HTTPException(status_code=404, detail="Design not found")
 
-    issues = drc_service.check_design(design)
+    if stream is not None and not incremental:
+        salt = f"clearance={drc_service.clearance}"
+        key = await run_in_threadpool(board_fingerprint, design.board, salt)
+        cached = cache.get(key)
+        collected: List[Issue] = []
+
+        def collect() -> Iterator[Issue]:
+            for issue in drc_service.iter_issues(design):
+                collected.append(issue)
+                yield issue
 
-    # Update design with issues
+        def complete(count: int) -> None:
+            if cached is None:
+                cache.put(key, collected)
+            design.issues = cached if cached is not None else collected
+            try:
+                service.save_design(design, revision)
+            except RevisionConflict:
+                # The issues are already sent; they just are not stored over a newer edit
+                pass
+
+        media_type = SSE_MEDIA_TYPE if stream == "sse" else NDJSON_MEDIA_TYPE
+        source = cached if cached is not None else collect()
+        # Sync generator: Starlette iterates it in a worker thread, off the event loop
+        return StreamingResponse(_stream_issues(source, media_type, complete), media_type=media_type)
+
+    if incremental:
+        # Rule state lives in this process, so always use a thread
+        issues = await run_in_threadpool(incremental_drc.check_design, design)
+    else:
+        salt = f"clearance={drc_service.clearance}"
+        key = await run_in_threadpool(board_fingerprint, design.board, salt)
+        issues = cache.get(key)
+        if issues is None:
+            issues = await executor.run(drc_service.check_design, design)
+            cache.put(key, issues)
+
+    # Update design with issues, unless it was edited while being checked
     design.issues = issues
-    service.update_design(design)
+    try:
+        service.save_design(design, revision)
+    except RevisionConflict:
+        raise HTTPException(status_code=409, detail="Design was modified while it was checked; validate it again")
 
+    if stream is not None:
+        media_type = SSE_MEDIA_TYPE if stream == "sse" else NDJSON_MEDIA_TYPE
+        return StreamingResponse(_stream_issues(issues, media_type), media_type=media_type)
     return {"issues": issues}
 
@@ -0,0 +1,81 @@
+"""
+Background job API endpoints.
+SOLID: Single Responsibility - lets clients poll, stream, cancel and collect
+jobs; jobs themselves are submitted by the routers that own the work.
+"""
+
+from typing import List
+
+from fastapi import APIRouter, Depends, HTTPException
+from fastapi.responses import FileResponse, JSONResponse, Response, StreamingResponse
+
+from app.api.deps import get_job_manager
+from app.infra.jobs import JobFile, JobInfo, JobManager
+
+router = APIRouter(prefix="/jobs", tags=["jobs"])
+
+SSE_MEDIA_TYPE = "text/event-stream"
+
+
+def accepted(info: JobInfo) -> JSONResponse:
+    """202 response for a newly submitted job, pointing at its status URL."""
+    return JSONResponse(
+        status_code=202,
+        content=info.model_dump(mode="json"),
+        headers={"Location": f"/jobs/{info.id}"},
+    )
+
+
+@router.get("", response_model=List[JobInfo])
+async def list_jobs(jobs: JobManager = Depends(get_job_manager)) -> List[JobInfo]:
+    """List retained jobs, oldest first."""
+    return jobs.list()
+
+
+@router.get("/{job_id}", response_model=JobInfo)
+async def get_job(job_id: str, jobs: JobManager = Depends(get_job_manager)) -> JobInfo:
+    """Poll a job's status and progress."""
+    info = jobs.get(job_id)
+    if info is None:
+        raise HTTPException(status_code=404, detail="Job not found")
+    return info
+
+
+@router.get("/{job_id}/events")
+async def job_events(job_id: str, jobs: JobManager = Depends(get_job_manager)) -> StreamingResponse:
+    """
+    Stream a job's status as Server-Sent Events: a `progress` event on every
+    change, then a `done` event with the final status.
+    """
+    if jobs.get(job_id) is None:
+        raise HTTPException(status_code=404, detail="Job not found")
+
+    async def stream():
+        async for info in jobs.watch(job_id):
+            event = "done" if info.finished_at is not None else "progress"
+            yield f"event: {event}\ndata: {info.model_dump_json()}\n\n"
+
+    return StreamingResponse(stream(), media_type=SSE_MEDIA_TYPE)
+
+
+@router.get("/{job_id}/result")
+async def get_job_result(job_id: str, jobs: JobManager = Depends(get_job_manager)) -> Response:
+    """Download a succeeded job's result (a file, or JSON); 409 while it is not available."""
+    try:
+        result = jobs.result(job_id)
+    except KeyError:
+        raise HTTPException(status_code=404, detail="Job not found")
+    except LookupError as exc:
+        raise HTTPException(status_code=409, detail=str(exc))
+    if isinstance(result, JobFile):
+        return FileResponse(result.path, media_type=result.media_type, filename=result.filename)
+    return JSONResponse(content=result)
+
+
+@router.delete("/{job_id}", response_model=JobInfo)
+async def cancel_job(job_id: str, jobs: JobManager = Depends(get_job_manager)) -> JobInfo:
+    """Cancel a queued or running job (no effect once it has finished)."""
+    info = jobs.cancel(job_id)
+    if info is None:
+        raise HTTPException(status_code=404, detail="Job not found")
+    return info
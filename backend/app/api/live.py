@@ -0,0 +1,190 @@
+"""
+Live DRC WebSocket endpoint.
+SOLID: Single Responsibility - transports edit events in and issue deltas out;
+edit application and rule checking live in LiveDRCSession.
+
+Protocol (JSON messages):
+- server -> client on connect: {"type": "snapshot", "issues": [...]}
+- client -> server: {"type": "edit", "ops": [...]}      domain delta ops
+                    {"type": "patch", "patch": [...]}   RFC 6902 operations
+                    {"type": "flush"}                   check now, skip the debounce
+- server -> client: {"type": "issues", "seq": n, "added": [...], "removed": [issue ids]}
+                    {"type": "error", "detail": "..."}
+                    {"type": "conflict", "detail": "...", "issues": [...]}
+
+Edits are applied as they arrive, in a worker thread; DRC runs once edits
+pause for the debounce interval (or after `max_wait_ms` of continuous
+editing) over the coalesced changes, and only the issue delta is sent back.
+
+Saves only apply on top of the revision the session loaded. If the design
+was saved elsewhere meanwhile, the session's unsaved edits are dropped, it
+reloads the stored design and sends "conflict" with that design's issues;
+the client should reload the design (GET /designs/{id}) and redo its edits.
+"""
+
+import asyncio
+from typing import Any, Dict, List
+
+from fastapi import APIRouter, Depends, Query, WebSocket, WebSocketDisconnect
+from pydantic import TypeAdapter, ValidationError
+from starlette.concurrency import run_in_threadpool
+
+from app.api.designs import get_design_service, get_incremental_drc_service
+from app.domain.incremental_drc import IncrementalDRCService
+from app.domain.live_drc import LiveDRCSession
+from app.domain.patching import DesignDelta, JsonPatchOperation
+from app.domain.services import DesignService
+from app.infra.memory_repo import RevisionConflict
+
+router = APIRouter(tags=["live"])
+
+DEFAULT_DEBOUNCE_MS = 150
+DEFAULT_MAX_WAIT_MS = 1000
+
+# Close code for an unknown design (4000-4999 are application-defined)
+CLOSE_NOT_FOUND = 4404
+
+_json_patch = TypeAdapter(List[JsonPatchOperation])
+
+
+def _parse_edit(message: Dict[str, Any]) -> List[JsonPatchOperation] | DesignDelta:
+    """Turn an edit message into patch operations (raises ValueError if malformed)."""
+    try:
+        if message.get("type") == "edit":
+            return DesignDelta.model_validate({"ops": message.get("ops", [])})
+        if message.get("type") == "patch":
+            return _json_patch.validate_python(message.get("patch", []))
+    except ValidationError as exc:
+        raise ValueError(str(exc)) from exc
+    raise ValueError(f"Unknown message type: {message.get('type')!r}")
+
+
+class _LiveConnection:
+    """Debounce loop and serialized sends for one WebSocket."""
+
+    def __init__(self, websocket: WebSocket, session: LiveDRCSession, debounce: float, max_wait: float) -> None:
+        self._websocket = websocket
+        self._session = session
+        self._debounce = debounce
+        self._max_wait = max_wait
+        self._edited = asyncio.Event()
+        self._flush_now = asyncio.Event()
+        self._send_lock = asyncio.Lock()
+        self._seq = 0
+        self._closed = False
+
+    async def send(self, payload: Dict[str, Any]) -> None:
+        """Send a message unless the client has gone away."""
+        if self._closed:
+            return
+        async with self._send_lock:
+            try:
+                await self._websocket.send_json(payload)
+            except (WebSocketDisconnect, RuntimeError):
+                self._closed = True
+
+    def notify_edit(self, immediate: bool = False) -> None:
+        self._edited.set()
+        if immediate:
+            self._flush_now.set()
+
+    async def close(self, checker: "asyncio.Task[None]") -> None:
+        """Stop the check loop, letting it save edits still waiting for their debounce."""
+        self._closed = True
+        self.notify_edit(immediate=True)
+        await checker
+
+    async def _wait_for_quiet(self) -> None:
+        """Return once edits pause for the debounce interval, a flush is requested, or max_wait passes."""
+        loop = asyncio.get_running_loop()
+        deadline = loop.time() + self._max_wait
+        while not self._flush_now.is_set():
+            self._edited.clear()
+            remaining = deadline - loop.time()
+            if remaining <= 0:
+                return
+            try:
+                await asyncio.wait_for(self._edited.wait(), timeout=min(self._debounce, remaining))
+            except asyncio.TimeoutError:
+                return
+
+    async def _flush(self) -> None:
+        """Check coalesced edits and send the issue delta."""
+        # In a thread: the session lock may be held by an edit being applied
+        snapshot, changes = await run_in_threadpool(self._session.take_pending)
+        try:
+            added, removed = await run_in_threadpool(self._session.flush, snapshot, changes)
+        except RevisionConflict:
+            issues = await run_in_threadpool(self._session.resync)
+            await self.send({
+                "type": "conflict",
+                "detail": "The design was changed elsewhere; unsaved edits were discarded. Reload it.",
+                "issues": [issue.model_dump(mode="json") for issue in issues],
+            })
+            return
+        self._seq += 1
+        await self.send({
+            "type": "issues",
+            "seq": self._seq,
+            "added": [issue.model_dump(mode="json") for issue in added],
+            "removed": removed,
+        })
+
+    async def run_checks(self) -> None:
+        """Debounce edits and flush them; only this task ever runs DRC for the session."""
+        while not self._closed:
+            await self._edited.wait()
+            await self._wait_for_quiet()
+            self._edited.clear()
+            self._flush_now.clear()
+            if not self._session.dirty:
+                continue
+            try:
+                await self._flush()
+            except Exception as exc:  # Keep the session alive; the next edit retries
+                await self.send({"type": "error", "detail": f"DRC failed: {exc}"})
+
+
+@router.websocket("/designs/{design_id}/live")
+async def live_drc(
+    websocket: WebSocket,
+    design_id: str,
+    debounce_ms: int = Query(DEFAULT_DEBOUNCE_MS, ge=0, le=10_000),
+    max_wait_ms: int = Query(DEFAULT_MAX_WAIT_MS, ge=0, le=60_000),
+    service: DesignService = Depends(get_design_service),
+    incremental: IncrementalDRCService = Depends(get_incremental_drc_service),
+):
+    """Push edit events, receive DRC issue deltas (see module docstring for the protocol)."""
+    try:
+        # Revision first, so a save in between makes the first flush conflict rather than overwrite
+        revision = service.get_design_revision(design_id)
+        design = service.get_design(design_id)
+    except ValueError:
+        await websocket.close(code=CLOSE_NOT_FOUND)
+        return
+
+    await websocket.accept()
+    session = LiveDRCSession(design, service, incremental, revision)
+    issues = await run_in_threadpool(session.start)
+    connection = _LiveConnection(websocket, session, debounce_ms / 1000, max(max_wait_ms, debounce_ms) / 1000)
+    await connection.send({"type": "snapshot", "issues": [issue.model_dump(mode="json") for issue in issues]})
+
+    checker = asyncio.create_task(connection.run_checks())
+    try:
+        while True:
+            message = await websocket.receive_json()
+            if message.get("type") == "flush":
+                connection.notify_edit(immediate=True)
+                continue
+            try:
+                # Patching and the change diff scale with the board: keep them off the event loop
+                await run_in_threadpool(session.apply, _parse_edit(message))
+            except ValueError as exc:  # Includes PatchError
+                await connection.send({"type": "error", "detail": str(exc)})
+                continue
+            connection.notify_edit()
+    except WebSocketDisconnect:
+        pass
+    finally:
+        # Edits still waiting for their debounce are saved, not dropped
+        await connection.close(checker)
@@ -3,9 +3,14 @@ ML-powered assistant API endpoints.
 SOLID: Single Responsibility - handles ML suggestions and explanations only.
 """
 
-from fastapi import APIRouter
+from fastapi import APIRouter, Depends, HTTPException, Query
+from app.api.deps import get_analysis_cache, get_executor
+from app.api.designs import get_design_service
 from app.domain.models import Design
 from app.domain.ml_services import MLService
+from app.domain.services import DesignService
+from app.infra.analysis_cache import DesignAnalysisCache
+from app.infra.executor import CPUExecutor
 from pydantic import BaseModel
 from typing import Dict, List
 
@@ -30,12 +35,18 @@ class MLSuggestion(BaseModel):
 
 
 @router.post("/suggestions")
-async def get_suggestions(design: Design):
+async def get_suggestions(
+    design: Design,
+    placement: bool = Query(False, description="Run the autoplacer and attach its proposal"),
+    executor: CPUExecutor = Depends(get_executor),
+):
     """
     Get ML-powered suggestions for design improvements.
     Returns actionable hints for placement, routing, component selection.
+    With `placement`, the placement suggestion carries a move_components
+    action; without it the call stays cheap enough for every refresh.
     """
-    suggestions = ml_service.get_suggestions(design)
+    suggestions = await executor.run(ml_service.get_suggestions, design, None, placement)
     return {"suggestions": suggestions}
 
 
@@ -50,11 +61,61 @@ async def explain_error(payload: ExplainErrorRequest):
 
 
 @router.post("/next-action")
-async def suggest_next_action(design: Design):
+async def suggest_next_action(design: Design, executor: CPUExecutor = Depends(get_executor)):
     """
     Suggest the next logical action based on current design state.
     Used for wizard flow and smart coaching.
     """
-    suggestion = ml_service.suggest_next_action(design)
+    suggestion = await executor.run(ml_service.suggest_next_action, design)
     return suggestion
 
+
+async def _stored_design_analysis(
+    design_id: str,
+    service: DesignService,
+    executor: CPUExecutor,
+    cache: DesignAnalysisCache,
+) -> Dict:
+    """Analysis of the stored design, computed at most once per revision."""
+    try:
+        # Read the revision before the body: a concurrent save can then only
+        # make the cached entry newer than its key, never older
+        revision = service.get_design_revision(design_id)
+        analysis = cache.get(design_id, revision)
+        if analysis is None:
+            design = service.get_design(design_id)
+            analysis = await executor.run(ml_service.get_analysis, design)
+            cache.put(design_id, revision, analysis)
+    except ValueError:
+        raise HTTPException(status_code=404, detail="Design not found")
+    return analysis
+
+
+@router.get("/designs/{design_id}/suggestions")
+async def get_design_suggestions(
+    design_id: str,
+    service: DesignService = Depends(get_design_service),
+    executor: CPUExecutor = Depends(get_executor),
+    cache: DesignAnalysisCache = Depends(get_analysis_cache),
+):
+    """
+    Suggestions for a stored design, without uploading it.
+    Cached per design revision; any save recomputes on the next call.
+    """
+    analysis = await _stored_design_analysis(design_id, service, executor, cache)
+    return {"suggestions": analysis["suggestions"]}
+
+
+@router.get("/designs/{design_id}/next-action")
+async def suggest_design_next_action(
+    design_id: str,
+    service: DesignService = Depends(get_design_service),
+    executor: CPUExecutor = Depends(get_executor),
+    cache: DesignAnalysisCache = Depends(get_analysis_cache),
+):
+    """
+    Next coaching step for a stored design, without uploading it.
+    Cached per design revision; any save recomputes on the next call.
+    """
+    analysis = await _stored_design_analysis(design_id, service, executor, cache)
+    return analysis["next_action"]
@@ -0,0 +1,170 @@
+"""
+Wire formats for design payloads.
+SOLID: Single Responsibility - content negotiation and (de)serialization of
+Design bodies, so routes stay format-agnostic.
+
+JSON is always available. MessagePack is offered when the optional
+`msgpack` package is installed; it carries the same document as the JSON
+body (same field names and nesting), only smaller and faster to parse.
+
+A design's ETag is its stored revision, so it is the same in either format
+and can be checked without reading the body.
+"""
+
+import json
+from typing import Any, Dict, List, Tuple
+
+from fastapi import HTTPException
+from fastapi.exceptions import RequestValidationError
+from fastapi.responses import Response
+from pydantic import ValidationError
+
+from app.domain.models import Design
+
+try:
+    import msgpack
+except ImportError:  # Optional: pip install msgpack
+    msgpack = None
+
+JSON_MEDIA_TYPE = "application/json"
+MSGPACK_MEDIA_TYPE = "application/msgpack"
+# Names clients use for MessagePack in the wild
+MSGPACK_ALIASES = frozenset({MSGPACK_MEDIA_TYPE, "application/x-msgpack", "application/vnd.msgpack"})
+
+# OpenAPI fragments for routes that read or write designs in either format
+_DESIGN_SCHEMA = {"schema": {"$ref": "#/components/schemas/Design"}}
+DESIGN_RESPONSES: Dict[int | str, Dict[str, Any]] = {
+    200: {"content": {MSGPACK_MEDIA_TYPE: _DESIGN_SCHEMA}},
+    406: {"description": "No acceptable response format"},
+}
+DESIGN_REQUEST_BODY: Dict[str, Any] = {
+    "requestBody": {
+        "required": True,
+        "content": {JSON_MEDIA_TYPE: _DESIGN_SCHEMA, MSGPACK_MEDIA_TYPE: _DESIGN_SCHEMA},
+    }
+}
+
+
+def supported_media_types() -> List[str]:
+    """Response formats this server can produce, in order of preference."""
+    return [JSON_MEDIA_TYPE, MSGPACK_MEDIA_TYPE] if msgpack is not None else [JSON_MEDIA_TYPE]
+
+
+def _media_type(header: str) -> str:
+    media_type = header.split(";", 1)[0].strip().lower()
+    return MSGPACK_MEDIA_TYPE if media_type in MSGPACK_ALIASES else media_type
+
+
+def _parse_accept(accept: str) -> List[Tuple[str, float]]:
+    ranges = []
+    for part in accept.split(","):
+        if not part.strip():
+            continue
+        media_type, *params = part.split(";")
+        quality = 1.0
+        for param in params:
+            key, _, value = param.strip().partition("=")
+            if key.strip() == "q":
+                try:
+                    quality = float(value)
+                except ValueError:
+                    quality = 0.0
+        ranges.append((_media_type(media_type), quality))
+    return ranges
+
+
+def negotiate(accept: str | None) -> str:
+    """
+    Pick the response media type for an Accept header (raises 406 if none fits).
+
+    The most specific matching range sets each type's quality; ties go to a
+    type the client named explicitly, then to JSON.
+    """
+    if not accept:
+        return JSON_MEDIA_TYPE
+    ranges = _parse_accept(accept)
+
+    best: Tuple[float, int, int] | None = None
+    chosen = None
+    for preference, media_type in enumerate(supported_media_types()):
+        family = media_type.split("/", 1)[0] + "/*"
+        matches = [
+            (specificity, quality)
+            for candidate, quality in ranges
+            for specificity, pattern in ((2, media_type), (1, family), (0, "*/*"))
+            if candidate == pattern
+        ]
+        if not matches:
+            continue
+        specificity, quality = max(matches)
+        rank = (quality, specificity, -preference)
+        if quality > 0 and (best is None or rank > best):
+            best, chosen = rank, media_type
+
+    if chosen is None:
+        raise HTTPException(
+            status_code=406,
+            detail=f"Acceptable formats: {', '.join(supported_media_types())}",
+        )
+    return chosen
+
+
+def parse_design(body: bytes, content_type: str | None) -> Design:
+    """Validate a request body as a Design, decoding it per its Content-Type."""
+    media_type = _media_type(content_type) if content_type else JSON_MEDIA_TYPE
+    try:
+        if media_type == MSGPACK_MEDIA_TYPE:
+            if msgpack is None:
+                raise HTTPException(status_code=415, detail="MessagePack support is not installed")
+            try:
+                data = msgpack.unpackb(body)
+            except ValueError as exc:  # Includes msgpack's ExtraData/FormatError
+                raise HTTPException(status_code=400, detail=f"Invalid MessagePack body: {exc}")
+            return Design.model_validate(data)
+        if media_type == JSON_MEDIA_TYPE or media_type.endswith("+json"):
+            return Design.model_validate_json(body)
+    except ValidationError as exc:
+        # Same 422 shape FastAPI produces for a declared body parameter
+        raise RequestValidationError(
+            [{**error, "loc": ("body", *error["loc"])} for error in exc.errors(include_url=False)]
+        )
+    raise HTTPException(status_code=415, detail=f"Unsupported content type: {content_type}")
+
+
+def revision_etag(revision: int) -> str:
+    """Strong ETag for a stored design revision."""
+    return f'"{revision}"'
+
+
+def etag_matches(header: str, etag: str, weak: bool = True) -> bool:
+    """
+    Whether an If-Match / If-None-Match header names `etag` (or is "*").
+
+    If-None-Match uses weak comparison (W/"3" matches "3"); If-Match passes
+    weak=False, so only the exact strong tag matches.
+    """
+    for candidate in header.split(","):
+        candidate = candidate.strip()
+        if weak:
+            candidate = candidate.removeprefix("W/")
+        if candidate == "*" or candidate == etag:
+            return True
+    return False
+
+
+def design_json_response(design_json: str, media_type: str) -> Response:
+    """Response for a trusted, already-serialized design (no model is rebuilt)."""
+    if media_type == MSGPACK_MEDIA_TYPE:
+        content = msgpack.packb(json.loads(design_json))
+    else:
+        content = design_json.encode()
+    return Response(content=content, media_type=media_type, headers={"Vary": "Accept"})
+
+
+def design_response(design: Design, media_type: str) -> Response:
+    """Response for a validated Design, serialized once without response_model re-validation."""
+    if media_type == MSGPACK_MEDIA_TYPE:
+        content = msgpack.packb(design.model_dump(mode="json"))
+    else:
+        content = design.model_dump_json().encode()
+    return Response(content=content, media_type=media_type, headers={"Vary": "Accept"})
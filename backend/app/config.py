@@ -0,0 +1,55 @@
+"""
+Application settings.
+Read once from environment variables so deployments can tune the backend
+without code changes (no extra settings dependency for MVP).
+"""
+
+import os
+from dataclasses import dataclass
+from functools import lru_cache
+
+
+@dataclass(frozen=True)
+class Settings:
+    """Runtime configuration for the backend."""
+    # Where CPU-bound DRC/ML work runs: "thread" or "process"
+    executor_kind: str = "thread"
+    # Pool size; None lets concurrent.futures pick based on CPU count
+    executor_workers: int | None = None
+    # Design storage: "memory", "wal" or "sqlite"
+    repo_backend: str = "memory"
+    # Directory for on-disk repositories
+    data_dir: str = "data"
+    # fsync every log append (disable only for throwaway/dev data)
+    repo_fsync: bool = True
+    # Pooled connections for the SQLite repository
+    sqlite_pool_size: int = 4
+    # Background jobs running at once
+    job_workers: int = 2
+    # Seconds a finished job (and its result) is kept for polling
+    job_result_ttl: float = 900.0
+
+
+def _optional_int(value: str | None) -> int | None:
+    return int(value) if value else None
+
+
+def _flag(value: str | None, default: bool) -> bool:
+    if value is None:
+        return default
+    return value.strip().lower() in ("1", "true", "yes", "on")
+
+
+@lru_cache
+def get_settings() -> Settings:
+    """Build settings from PCB_* environment variables."""
+    return Settings(
+        executor_kind=os.getenv("PCB_EXECUTOR", "thread").lower(),
+        executor_workers=_optional_int(os.getenv("PCB_EXECUTOR_WORKERS")),
+        repo_backend=os.getenv("PCB_REPO_BACKEND", "memory").lower(),
+        data_dir=os.getenv("PCB_DATA_DIR", "data"),
+        repo_fsync=_flag(os.getenv("PCB_REPO_FSYNC"), True),
+        sqlite_pool_size=_optional_int(os.getenv("PCB_SQLITE_POOL_SIZE")) or 4,
+        job_workers=_optional_int(os.getenv("PCB_JOB_WORKERS")) or 2,
+        job_result_ttl=float(os.getenv("PCB_JOB_RESULT_TTL", "900")),
+    )
@@ -0,0 +1,448 @@
+"""
+Simulated-annealing autoplacer.
+SOLID: Single Responsibility - proposes component positions; callers decide
+whether to apply them (the placement suggestion and the autoplace job).
+
+The cost is the half-perimeter wire length (HPWL) of every net, measured over
+the centers of the components its connection_ids name, plus a density
+penalty on a coarse bin grid that keeps parts from piling up on each other.
+
+Each annealing step proposes a random displacement for a batch of components
+and scores the whole batch at once with NumPy. A net's bounding box without
+one of its components comes from per-net first and second extremes, so the
+HPWL delta of a move is a few gathers rather than a rescan of the net. Moves
+in a batch are judged independently; the extremes are rebuilt after every
+step, so that approximation never accumulates. Moves stay within a few
+component pitches when refining an existing placement and range board-wide
+when most parts start from random spots. Footprints never leave the board
+outline, and a final greedy pass nudges apart any parts that still overlap.
+"""
+
+import math
+from dataclasses import dataclass, field
+from typing import Callable, Dict, Iterable, List, Tuple
+
+import numpy as np
+
+from app.domain.board_arrays import DANGLING, BoardArrays
+from app.domain.footprints import footprint_boxes
+from app.domain.geometry import boxes_in_polygon, points_in_polygon
+from app.domain.models import Board, Design
+from app.domain.services import DEFAULT_CLEARANCE_MM
+from app.domain.spatial import DynamicGrid, box_gap
+
+DEFAULT_MOVES_PER_COMPONENT = 100
+# Share of the movable components proposed for a move in each step
+DEFAULT_BATCH_FRACTION = 0.25
+# Overflowing footprint area is charged as wire length: one component's worth
+# of overflow costs this many typical component pitches
+DEFAULT_DENSITY_WEIGHT = 2.0
+# Target share of each bin covered by footprints (raised on crowded boards)
+TARGET_DENSITY = 0.6
+# Moves start within this many component pitches, so an existing placement
+# is refined rather than scrambled
+START_RADIUS_PITCHES = 10
+# Final temperature and move radius, relative to their starting values
+FINAL_TEMPERATURE_RATIO = 1e-3
+# Density bins are this many component pitches wide
+BIN_PITCHES = 2
+# Legalization searches this many half-pitch rings around each overlapping part
+LEGALIZE_RINGS = 12
+# Random draws per part when scattering unplaced parts over the board
+SCATTER_ATTEMPTS = 100
+
+
+@dataclass
+class PlacementResult:
+    """New positions from one autoplacer run and the wire length they save."""
+    # component_id -> [x, y] for every component the placer was free to move
+    positions: Dict[str, List[float]] = field(default_factory=dict)
+    # HPWL over nets with two or more placed components, before and after
+    hpwl_before: float = 0.0
+    hpwl_after: float = 0.0
+    # Movable components that still overlap a neighbour after legalization
+    overlaps: List[str] = field(default_factory=list)
+    steps: int = 0
+
+    @property
+    def improvement(self) -> float:
+        """Share of the original wire length saved (0.0 when nothing was placed before)."""
+        if self.hpwl_before <= 0:
+            return 0.0
+        return 1.0 - self.hpwl_after / self.hpwl_before
+
+    def action(self) -> Dict:
+        """Suggestion action the frontend applies by moving each listed component."""
+        return {
+            "type": "move_components",
+            "params": {
+                "positions": self.positions,
+                "hpwl_before": round(self.hpwl_before, 3),
+                "hpwl_after": round(self.hpwl_after, 3),
+            },
+        }
+
+    def summary(self) -> Dict:
+        """JSON-ready figures, as returned by the API."""
+        return {
+            "moved_components": len(self.positions),
+            "hpwl_before": self.hpwl_before,
+            "hpwl_after": self.hpwl_after,
+            "improvement": self.improvement,
+            "overlaps": self.overlaps,
+            "steps": self.steps,
+        }
+
+
+@dataclass
+class _Nets:
+    """
+    Distinct (net, component) memberships of nets that span two or more components.
+
+    Members are sorted by net, so net k owns `starts[k]:ends[k]`; the
+    component-major view lists the nets of component c as
+    `comp_nets[comp_offsets[c]:comp_offsets[c + 1]]`.
+    """
+    member_net: np.ndarray
+    member_comp: np.ndarray
+    starts: np.ndarray
+    ends: np.ndarray
+    comp_nets: np.ndarray
+    comp_offsets: np.ndarray
+
+    @classmethod
+    def build(cls, arrays: BoardArrays, active: np.ndarray) -> "_Nets":
+        """Memberships restricted to components where `active` is set."""
+        n = max(len(arrays), 1)
+        comps = arrays.pin_components[arrays.net_pins].astype(np.int64)
+        nets = arrays.slot_nets.astype(np.int64)
+        keep = comps != DANGLING
+        keep[keep] = active[comps[keep]]
+        # One integer per (net, component) pair, so np.unique drops repeated pins
+        pairs = np.unique(nets[keep] * n + comps[keep])
+        member_net, member_comp = pairs // n, pairs % n
+        spans_two = np.bincount(member_net, minlength=len(arrays.net_ids)) >= 2
+        keep = spans_two[member_net]
+        _, member_net = np.unique(member_net[keep], return_inverse=True)
+        member_comp = member_comp[keep]
+
+        sizes = np.bincount(member_net) if len(member_net) else np.zeros(0, dtype=np.int64)
+        ends = np.cumsum(sizes)
+        by_comp = np.argsort(member_comp, kind="stable")
+        comp_offsets = np.zeros(len(arrays) + 1, dtype=np.int64)
+        comp_offsets[1:] = np.cumsum(np.bincount(member_comp, minlength=len(arrays)))
+        return cls(member_net, member_comp, ends - sizes, ends, member_net[by_comp], comp_offsets)
+
+    def __len__(self) -> int:
+        return len(self.starts)
+
+    def extremes(self, coords: np.ndarray) -> Tuple[np.ndarray, ...]:
+        """Per-net (lo, second lo, lo component, hi, second hi, hi component) of one axis."""
+        values = coords[self.member_comp]
+        low = values.min()
+        # Net-major, value-minor order from a single float key
+        order = np.argsort(self.member_net * (values.max() - low + 1.0) + (values - low))
+        values, comps = values[order], self.member_comp[order]
+        first, last = self.starts, self.ends - 1
+        return values[first], values[first + 1], comps[first], values[last], values[last - 1], comps[last]
+
+    def hpwl(self, positions: np.ndarray) -> float:
+        """Total half-perimeter wire length for (n, 2) component `positions`."""
+        if not len(self):
+            return 0.0
+        x, y = self.extremes(positions[:, 0]), self.extremes(positions[:, 1])
+        return float((x[3] - x[0]).sum() + (y[3] - y[0]).sum())
+
+    def moves(self, batch: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+        """(owner, net) of every net touched by `batch`; owner indexes `batch`."""
+        starts = self.comp_offsets[batch]
+        degrees = self.comp_offsets[batch + 1] - starts
+        owner = np.repeat(np.arange(len(batch)), degrees)
+        # Concatenated ranges starts[i]:starts[i] + degrees[i]
+        slots = np.arange(degrees.sum()) - np.repeat(np.cumsum(degrees) - degrees, degrees) + np.repeat(starts, degrees)
+        return owner, self.comp_nets[slots]
+
+
+def _span_delta(extremes: Tuple[np.ndarray, ...], nets: np.ndarray, comps: np.ndarray, moved: np.ndarray) -> np.ndarray:
+    """Change in each net's extent on one axis when `comps` moves to `moved`."""
+    lo1, lo2, lo_comp, hi1, hi2, hi_comp = (values[nets] for values in extremes)
+    lo = np.where(lo_comp == comps, lo2, lo1)
+    hi = np.where(hi_comp == comps, hi2, hi1)
+    return np.maximum(hi, moved) - np.minimum(lo, moved) - (hi1 - lo1)
+
+
+def _polygon_area(polygon: np.ndarray) -> float:
+    x, y = polygon[:, 0], polygon[:, 1]
+    return abs(float(np.dot(x, np.roll(y, -1)) - np.dot(y, np.roll(x, -1)))) / 2
+
+
+def _spiral(step: float, rings: int) -> np.ndarray:
+    """Offsets on a square lattice around the origin, nearest first (origin excluded)."""
+    axis = np.arange(-rings, rings + 1) * step
+    offsets = np.stack(np.meshgrid(axis, axis), axis=-1).reshape(-1, 2)
+    order = np.argsort(np.hypot(offsets[:, 0], offsets[:, 1]), kind="stable")
+    return offsets[order][1:]
+
+
+class AutoplacerService:
+    """
+    Places components to shorten wiring while keeping them on the board.
+
+    `moves_per_component` is the number of moves proposed per movable part
+    over the whole run; `batch_fraction` of the movable parts are moved in
+    each step. Runs are deterministic for a given `seed`.
+    """
+
+    def __init__(
+        self,
+        moves_per_component: int = DEFAULT_MOVES_PER_COMPONENT,
+        batch_fraction: float = DEFAULT_BATCH_FRACTION,
+        density_weight: float = DEFAULT_DENSITY_WEIGHT,
+        clearance: float = DEFAULT_CLEARANCE_MM,
+        seed: int = 0,
+    ) -> None:
+        self.moves_per_component = moves_per_component
+        self.batch_fraction = batch_fraction
+        self.density_weight = density_weight
+        self.clearance = clearance
+        self.seed = seed
+
+    def place(
+        self,
+        board: Board,
+        fixed: Iterable[str] = (),
+        on_progress: Callable[[int, int], None] | None = None,
+    ) -> PlacementResult:
+        """
+        Anneal every component not listed in `fixed` and return the new positions.
+
+        Components without a position (or not fully on the board) are placed
+        too. `on_progress(done, total)` is called as annealing steps finish.
+        Raises ValueError when the board has no outline.
+        """
+        outline = np.asarray(board.outline, dtype=np.float64).reshape(-1, 2)
+        if len(outline) < 3:
+            raise ValueError("Board outline is missing. Define board boundaries before placing.")
+        arrays = BoardArrays.build(board)
+        n = len(arrays)
+        fixed_ids = set(fixed)
+        movable = np.array(
+            [k for k, component_id in enumerate(arrays.component_ids) if component_id not in fixed_ids], dtype=np.int64
+        )
+        movable_mask = np.zeros(n, dtype=bool)
+        movable_mask[movable] = True
+        # Fixed parts without a position take no part at all
+        active = arrays.placed | movable_mask
+
+        origin = outline.min(axis=0)
+        boxes = footprint_boxes(np.zeros((n, 2)), arrays.sizes, arrays.rotations)
+        half = boxes[:, 2:4]
+        shifted = outline - origin
+
+        positions = arrays.positions - origin
+        placed_before = _Nets.build(arrays, arrays.placed)
+        hpwl_before = placed_before.hpwl(positions)
+
+        rng = np.random.default_rng(self.seed)
+        # Parts without a position, or hanging over the edge, restart at random spots on the board
+        on_board = np.zeros(n, dtype=bool)
+        on_board[movable] = arrays.placed[movable]
+        on_board[on_board] = boxes_in_polygon(np.hstack((positions - half, positions + half))[on_board], shifted)
+        stray = movable[~on_board[movable]]
+        positions[stray] = self._scatter(shifted, half[stray], rng)
+        nets = _Nets.build(arrays, active)
+
+        result = PlacementResult(hpwl_before=hpwl_before)
+        if len(movable):
+            positions, result.steps = self._anneal(
+                positions, nets, movable, active, half, shifted, rng, on_progress, scattered=2 * len(stray) > len(movable)
+            )
+            result.overlaps = [
+                arrays.component_ids[k] for k in self._legalize(positions, half, movable_mask, active, shifted)
+            ]
+        result.hpwl_after = nets.hpwl(positions)
+        placed = positions[movable] + origin
+        result.positions = {
+            arrays.component_ids[k]: [round(float(x), 3), round(float(y), 3)]
+            for k, (x, y) in zip(movable.tolist(), placed)
+        }
+        return result
+
+    def apply(self, design: Design, result: PlacementResult) -> Design:
+        """Copy of the design with the placed components moved."""
+        components = [
+            component.model_copy(update={"position": result.positions[component.id]})
+            if component.id in result.positions
+            else component
+            for component in design.board.components
+        ]
+        board = design.board.model_copy(update={"components": components})
+        return design.model_copy(update={"board": board})
+
+    def _scatter(self, outline: np.ndarray, half: np.ndarray, rng: np.random.Generator) -> np.ndarray:
+        """Random centers whose footprints (of half sizes `half`) lie inside the outline."""
+        low, high = outline.min(axis=0), outline.max(axis=0)
+        centers = np.full((len(half), 2), np.nan)
+        pending = np.arange(len(half))
+        for _ in range(SCATTER_ATTEMPTS):
+            if not len(pending):
+                break
+            candidates = rng.uniform(low + half[pending], np.maximum(high - half[pending], low + half[pending]))
+            boxes = np.hstack((candidates - half[pending], candidates + half[pending]))
+            fits = boxes_in_polygon(boxes, outline)
+            centers[pending[fits]] = candidates[fits]
+            pending = pending[~fits]
+        # Parts too big for the board stay at its center rather than failing the run
+        centers[pending] = (low + high) / 2
+        return centers
+
+    def _anneal(self, positions, nets, movable, active, half, outline, rng, on_progress, scattered) -> Tuple[np.ndarray, int]:
+        """Anneal `movable` in place; returns the cheapest positions seen and the step count."""
+        extent = outline.max(axis=0)
+        areas = np.where(active, (2 * half[:, 0] + self.clearance) * (2 * half[:, 1] + self.clearance), 0.0)
+        pitch = math.sqrt(areas[active].mean())
+
+        # Density bins: capacity is the bin's share of the board times the target density
+        bin_size = BIN_PITCHES * pitch
+        bins_x, bins_y = (int(v) for v in np.maximum(np.ceil(extent / bin_size), 1))
+        samples = (np.arange(4) + 0.5) / 4
+        offsets = np.stack(np.meshgrid(samples, samples), axis=-1).reshape(-1, 2)
+        cells = np.stack(np.meshgrid(np.arange(bins_x), np.arange(bins_y), indexing="ij"), axis=-1).reshape(-1, 2)
+        points = ((cells[:, None, :] + offsets) * bin_size).reshape(-1, 2)
+        inside_share = points_in_polygon(points, outline).reshape(len(cells), -1).mean(axis=1)
+        density = min(1.0, max(TARGET_DENSITY, 1.1 * areas.sum() / max(_polygon_area(outline), 1e-9)))
+        capacity = inside_share * bin_size ** 2 * density
+        penalty = self.density_weight / pitch
+
+        def bin_of(points: np.ndarray) -> np.ndarray:
+            cell = np.clip((points / bin_size).astype(np.int64), 0, (bins_x - 1, bins_y - 1))
+            return cell[:, 0] * bins_y + cell[:, 1]
+
+        bins = np.where(active, bin_of(np.nan_to_num(positions)), 0)
+        used = np.bincount(bins, weights=areas, minlength=len(cells))
+
+        def overflow(load: np.ndarray, cap: np.ndarray) -> np.ndarray:
+            return np.maximum(load - cap, 0.0)
+
+        def propose(batch: np.ndarray, radius: float) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+            moved = positions[batch] + rng.uniform(-radius, radius, size=(len(batch), 2))
+            fits = boxes_in_polygon(np.hstack((moved - half[batch], moved + half[batch])), outline)
+            delta = np.zeros(len(batch))
+            if len(nets):
+                owner, net = nets.moves(batch)
+                comps = batch[owner]
+                wire = _span_delta(ext_x, net, comps, moved[owner, 0]) + _span_delta(ext_y, net, comps, moved[owner, 1])
+                delta += np.bincount(owner, weights=wire, minlength=len(batch))
+            source, target = bins[batch], bin_of(moved)
+            area = areas[batch]
+            crowding = (
+                overflow(used[source] - area, capacity[source]) - overflow(used[source], capacity[source])
+                + overflow(used[target] + area, capacity[target]) - overflow(used[target], capacity[target])
+            )
+            delta += np.where(source == target, 0.0, crowding * penalty)
+            return moved, fits, delta
+
+        def extremes() -> Tuple[tuple, tuple]:
+            if not len(nets):
+                return (), ()
+            return nets.extremes(positions[:, 0]), nets.extremes(positions[:, 1])
+
+        def current_cost() -> float:
+            cost = penalty * float(overflow(used, capacity).sum())
+            if len(nets):
+                cost += float((ext_x[3] - ext_x[0]).sum() + (ext_y[3] - ext_y[0]).sum())
+            return cost
+
+        batch_size = max(1, math.ceil(len(movable) * self.batch_fraction))
+        steps = max(1, math.ceil(self.moves_per_component * len(movable) / batch_size))
+        # A mostly random start needs board-wide moves; a real placement only local ones
+        radius0 = float(extent.max()) / 4
+        if not scattered:
+            radius0 = min(radius0, START_RADIUS_PITCHES * pitch)
+        radius_end = min(radius0, pitch / 2)
+
+        # Start warm, not hot: a typical uphill move is accepted about 2% of the
+        # time, which refines an existing placement instead of scrambling it
+        ext_x, ext_y = extremes()
+        _, fits, delta = propose(rng.choice(movable, batch_size, replace=False), radius0)
+        uphill = delta[fits & (delta > 0)]
+        temperature0 = float(np.median(uphill)) / math.log(50) if len(uphill) else pitch
+
+        report = on_progress or (lambda done, total: None)
+        report_every = max(1, steps // 50)
+        best_cost, best = math.inf, positions.copy()
+        for step in range(steps):
+            progress = step / max(steps - 1, 1)
+            temperature = temperature0 * FINAL_TEMPERATURE_RATIO ** progress
+            radius = radius0 * (radius_end / radius0) ** progress
+
+            ext_x, ext_y = extremes()
+            cost = current_cost()
+            if cost < best_cost:
+                best_cost, best = cost, positions.copy()
+
+            batch = rng.choice(movable, batch_size, replace=False)
+            moved, fits, delta = propose(batch, radius)
+            chance = np.exp(-np.maximum(delta, 0.0) / temperature)
+            accept = fits & ((delta <= 0) | (rng.random(len(batch)) < chance))
+            accepted = batch[accept]
+            positions[accepted] = moved[accept]
+            bins[accepted] = bin_of(moved[accept])
+            used = np.bincount(bins, weights=areas, minlength=len(cells))
+            if step % report_every == 0:
+                report(step + 1, steps)
+
+        ext_x, ext_y = extremes()
+        report(steps, steps)
+        return (positions if current_cost() < best_cost else best), steps
+
+    def _legalize(self, positions, half, movable_mask, active, outline) -> List[int]:
+        """
+        Move overlapping parts to the nearest free spot, largest first.
+
+        Updates `positions` in place and returns the movable components that
+        found no free spot within LEGALIZE_RINGS.
+        """
+        clearance = self.clearance
+        # Positions are reported rounded to the micron; keep that rounding clear of the DRC limit
+        gap = clearance + 2e-3
+        pitch = float(np.sqrt((4 * half[active, 0] * half[active, 1]).mean()))
+        offsets = _spiral(pitch / 2, LEGALIZE_RINGS)
+        grid = DynamicGrid(cell_size=2 * pitch, margin=clearance)
+        indices = np.flatnonzero(active)
+        fixed = indices[~movable_mask[indices]]
+        movable = indices[movable_mask[indices]]
+        # Fixed parts first, then the hardest parts to fit
+        order = np.concatenate((fixed, movable[np.argsort(-(half[movable, 0] * half[movable, 1]), kind="stable")]))
+        stuck: List[int] = []
+
+        def fits(key: str, box: Tuple[float, ...]) -> bool:
+            if any(box_gap(box, grid.box(other)) < gap for other in grid.query(box)):
+                return False
+            grid.insert(key, box)
+            return True
+
+        for k in order.tolist():
+            key = str(k)
+            hw, hh = half[k]
+            x, y = positions[k]
+            box = (x - hw, y - hh, x + hw, y + hh)
+            if not movable_mask[k]:
+                grid.insert(key, box)
+                continue
+            if fits(key, box):
+                continue
+            candidates = positions[k] + offsets
+            boxes = np.hstack((candidates - half[k], candidates + half[k]))
+            for cx, cy in candidates[boxes_in_polygon(boxes, outline)].tolist():
+                if fits(key, (cx - hw, cy - hh, cx + hw, cy + hh)):
+                    positions[k] = cx, cy
+                    break
+            else:
+                grid.insert(key, box)
+                stuck.append(k)
+        return stuck
+
+
+# Singleton autoplacer for the application
+autoplacer_service = AutoplacerService()
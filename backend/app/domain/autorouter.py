@@ -0,0 +1,706 @@
+"""
+Grid-based autorouter.
+SOLID: Single Responsibility - turns a placed board's nets into traces and
+vias; components are never moved.
+
+The board is rasterized into an occupancy grid with one plane per copper
+layer (1-2, following Board.layers). Cells outside the outline are blocked
+and the cells around every pad belong to the pad's net, widened by the
+clearance so other nets keep their distance. SMD pads sit on the top layer
+only, through-hole pads on both.
+
+Connections are found with an A* maze search: orthogonal steps cost one
+cell and layer changes cost `via_cost` plus a free via keep-out. Multi-pin
+nets grow in Prim order, each search starting from everything the net has
+routed so far.
+
+Nets are routed shortest first. Nets whose search windows (pin bounding box
+plus a margin) do not overlap are independent, so each round of them is
+routed in parallel worker processes on copies of their windows. Nets that
+fail in their window are retried on the whole board with rip-up-and-retry:
+the net may cross other nets' tracks at a penalty, and the nets it crosses
+are ripped up and queued again, a bounded number of times per net.
+"""
+
+import heapq
+import math
+import os
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass, field
+from typing import Callable, Dict, Iterable, Iterator, List, Sequence, Set, Tuple
+
+import numpy as np
+
+from app.domain.connectivity import split_connection_id
+from app.domain.geometry import points_in_polygon
+from app.domain.models import Board, Design, Trace, Via
+from app.domain.pads import find_pad, footprint_pads, rotate
+from app.domain.services import DEFAULT_CLEARANCE_MM
+
+# Cell states; cells owned by a net hold the net's index instead
+FREE = -1
+BLOCKED = -2
+
+DEFAULT_GRID_MM = 0.5
+DEFAULT_TRACE_WIDTH_MM = 0.25
+DEFAULT_VIA_DIAMETER_MM = 0.6
+DEFAULT_VIA_DRILL_MM = 0.3
+DEFAULT_VIA_COST = 8
+DEFAULT_MAX_RETRIES = 3
+
+# Extra cost per cell of another net's track while ripping up
+RIPUP_PENALTY = 30
+# Cells added around a net's pins for its parallel search window,
+# and for its whole-board retries (bounds the cost of hopeless searches)
+WINDOW_MARGIN_CELLS = 20
+RETRY_MARGIN_CELLS = 60
+# Coarse tile size (cells) used to find nets with disjoint windows
+TILE_CELLS = 16
+# Largest grid routed (cells over all layers), about 160 MB of int32
+MAX_GRID_CELLS = 40_000_000
+
+# (layers, rows, cols)
+Dims = Tuple[int, int, int]
+
+
+@dataclass
+class _Terminal:
+    """One pad of a net: its grid cells (one per copper layer it is on) and center."""
+    cells: List[int]
+    x: float
+    y: float
+
+
+@dataclass
+class _NetPlan:
+    """What the router needs about one routable net."""
+    index: int
+    net_id: str
+    terminals: List[_Terminal]
+    # Pin bounding box in cells: (row0, col0, row1, col1), inclusive
+    bounds: Tuple[int, int, int, int]
+
+    @property
+    def half_perimeter(self) -> int:
+        return self.bounds[2] - self.bounds[0] + self.bounds[3] - self.bounds[1]
+
+
+@dataclass
+class RoutingResult:
+    """Traces and vias of one autorouting run and which nets they complete."""
+    traces: List[Trace] = field(default_factory=list)
+    vias: List[Via] = field(default_factory=list)
+    routed_nets: List[str] = field(default_factory=list)
+    failed_nets: List[str] = field(default_factory=list)
+    # Nets with fewer than two placed, known pins (nothing to route)
+    skipped_nets: List[str] = field(default_factory=list)
+
+    @property
+    def completion_rate(self) -> float:
+        """Share of routable nets that were fully routed (1.0 if none needed routing)."""
+        attempted = len(self.routed_nets) + len(self.failed_nets)
+        return len(self.routed_nets) / attempted if attempted else 1.0
+
+    def summary(self) -> Dict:
+        """JSON-ready counts, as returned by the API."""
+        return {
+            "routed_nets": self.routed_nets,
+            "failed_nets": self.failed_nets,
+            "skipped_nets": self.skipped_nets,
+            "completion_rate": self.completion_rate,
+            "trace_count": len(self.traces),
+            "via_count": len(self.vias),
+        }
+
+
+class RoutingGrid:
+    """
+    Occupancy grid of a board: the owner of every cell on every copper layer.
+
+    `owner` starts as the fixed obstacles (outline and pads); routing state
+    lives in flat copies so a failed or ripped-up net is undone cell by cell.
+    """
+
+    def __init__(self, board: Board, pitch: float, clearance: float, trace_width: float) -> None:
+        outline = np.asarray(board.outline, dtype=np.float64).reshape(-1, 2)
+        if len(outline) < 3:
+            raise ValueError("Board outline is missing. Define board boundaries before routing.")
+        self.pitch = pitch
+        self.layers = 2 if board.layers >= 2 else 1
+        self.x0, self.y0 = outline.min(axis=0)
+        max_x, max_y = outline.max(axis=0)
+        self.cols = max(1, math.ceil((max_x - self.x0) / pitch))
+        self.rows = max(1, math.ceil((max_y - self.y0) / pitch))
+        cells = self.layers * self.rows * self.cols
+        if cells > MAX_GRID_CELLS:
+            raise ValueError(f"Board needs {cells} routing cells at a {pitch}mm grid; use a coarser grid.")
+
+        xs = self.x0 + (np.arange(self.cols) + 0.5) * pitch
+        ys = self.y0 + (np.arange(self.rows) + 0.5) * pitch
+        centers = np.column_stack((np.tile(xs, self.rows), np.repeat(ys, self.cols)))
+        inside = points_in_polygon(centers, outline).reshape(self.rows, self.cols)
+        self.owner = np.full((self.layers, self.rows, self.cols), FREE, dtype=np.int32)
+        self.owner[:, ~inside] = BLOCKED
+
+        self.net_ids: List[str] = []
+        self.plans: List[_NetPlan] = []
+        self.skipped: List[str] = []
+        self._rasterize_pads(board, clearance + trace_width / 2, trace_width)
+
+    @property
+    def dims(self) -> Dims:
+        return self.layers, self.rows, self.cols
+
+    def cell_center(self, index: int) -> Tuple[float, float]:
+        """Board coordinates of a flat cell index's center."""
+        row, col = divmod(index % (self.rows * self.cols), self.cols)
+        return self.x0 + (col + 0.5) * self.pitch, self.y0 + (row + 0.5) * self.pitch
+
+    def _cell_range(self, low: float, high: float, origin: float, count: int) -> Tuple[int, int]:
+        """Half-open range of cells whose centers lie within [low, high]."""
+        first = max(0, math.ceil((low - origin) / self.pitch - 0.5))
+        last = min(count, math.floor((high - origin) / self.pitch - 0.5) + 1)
+        return first, last
+
+    def _cell_of(self, x: float, y: float) -> Tuple[int, int]:
+        row = min(self.rows - 1, max(0, int((y - self.y0) // self.pitch)))
+        col = min(self.cols - 1, max(0, int((x - self.x0) // self.pitch)))
+        return row, col
+
+    def _regions(self, x: float, y: float, half_w: float, half_h: float, layers: range) -> Iterator[np.ndarray]:
+        """Views of the owner grid covering a box, one per layer."""
+        c0, c1 = self._cell_range(x - half_w, x + half_w, self.x0, self.cols)
+        r0, r1 = self._cell_range(y - half_h, y + half_h, self.y0, self.rows)
+        for layer in layers:
+            yield self.owner[layer, r0:r1, c0:c1]
+
+    def _rasterize_pads(self, board: Board, keepout: float, trace_width: float) -> None:
+        components = {component.id: component for component in board.components}
+        # (component ID, pad name) -> index of the first net it joins
+        pad_nets: Dict[Tuple[str, str], int] = {}
+        terminals: List[Dict[Tuple[str, str], _Terminal]] = []
+
+        for net in board.nets:
+            index = len(self.net_ids)
+            self.net_ids.append(net.id)
+            pads: Dict[Tuple[str, str], _Terminal] = {}
+            for connection_id in net.connection_ids:
+                component_id, pin = split_connection_id(connection_id, components.keys())
+                component = components.get(component_id)
+                if component is None or not component.position or len(component.position) < 2:
+                    continue
+                pad = find_pad(component, pin)
+                if pad is None:
+                    continue
+                key = (component_id, pad.name)
+                pad_nets.setdefault(key, index)
+                if key not in pads:
+                    dx, dy = rotate(pad.x, pad.y, component.rotation or 0.0)
+                    pads[key] = _Terminal([], component.position[0] + dx, component.position[1] + dy)
+            terminals.append(pads)
+
+        # Pads as (owner, center, half extent, layers); unconnected pads are obstacles
+        placed = []
+        for component in board.components:
+            if not component.position or len(component.position) < 2:
+                continue
+            rotation = component.rotation or 0.0
+            theta = math.radians(rotation)
+            cos_t, sin_t = abs(math.cos(theta)), abs(math.sin(theta))
+            for pad in footprint_pads(component):
+                dx, dy = rotate(pad.x, pad.y, rotation)
+                placed.append((
+                    pad_nets.get((component.id, pad.name), BLOCKED),
+                    component.position[0] + dx,
+                    component.position[1] + dy,
+                    (pad.width * cos_t + pad.height * sin_t) / 2,
+                    (pad.width * sin_t + pad.height * cos_t) / 2,
+                    _pad_layers(pad, self.layers),
+                ))
+
+        # Keep-outs first: where two nets' keep-outs meet, neither may route
+        for owner, x, y, half_w, half_h, layers in placed:
+            for region in self._regions(x, y, half_w + keepout, half_h + keepout, layers):
+                conflict = (region >= 0) & (region != owner)
+                region[region == FREE] = owner
+                region[conflict] = BLOCKED
+        # Then pad copper (plus half a track) always belongs to the pad's net
+        for owner, x, y, half_w, half_h, layers in placed:
+            if owner != BLOCKED:
+                for region in self._regions(x, y, half_w + trace_width / 2, half_h + trace_width / 2, layers):
+                    region[...] = owner
+
+        # Terminal cells always belong to the net, so every pad stays reachable
+        plane = self.rows * self.cols
+        flat = self.owner.reshape(-1)
+        for index, pads in enumerate(terminals):
+            if len(pads) < 2:
+                self.skipped.append(self.net_ids[index])
+                continue
+            rows, cols = [], []
+            for (component_id, pad_name), terminal in pads.items():
+                row, col = self._cell_of(terminal.x, terminal.y)
+                rows.append(row)
+                cols.append(col)
+                pad = find_pad(components[component_id], pad_name)
+                for layer in _pad_layers(pad, self.layers):
+                    cell = layer * plane + row * self.cols + col
+                    # A pin on several nets (a short) stays with the first one
+                    flat[cell] = pad_nets[component_id, pad_name]
+                    terminal.cells.append(cell)
+            bounds = (min(rows), min(cols), max(rows), max(cols))
+            self.plans.append(_NetPlan(index, self.net_ids[index], list(pads.values()), bounds))
+
+
+def _pad_layers(pad, layers: int) -> range:
+    """Copper layer indices a pad is on: SMD pads top only, through-hole pads all."""
+    return range(layers) if pad.drill is not None else range(1)
+
+
+# Search (pure functions over flat cell lists, so worker processes can run them)
+
+def _passable(value: int, base_value: int, net: int, penalty: int) -> int | None:
+    """Extra cost of entering a cell for `net`, or None if it may not enter."""
+    if value == FREE or value == net:
+        return 0
+    if penalty and value >= 0 and base_value == FREE:
+        return penalty
+    return None
+
+
+def _via_allowed(cells: Sequence[int], dims: Dims, index: int, net: int) -> bool:
+    """
+    A via needs its cell and keep-out ring free (or the net's own) on both
+    layers. Never on the grid's edge, so a window's vias keep their whole
+    ring inside the window.
+    """
+    _, rows, cols = dims
+    plane = rows * cols
+    row, col = divmod(index % plane, cols)
+    if not (0 < row < rows - 1 and 0 < col < cols - 1):
+        return False
+    for layer_start in (0, plane):
+        start = layer_start + row * cols + col
+        for cell in (start, start - 1, start + 1, start - cols, start + cols):
+            if cells[cell] != FREE and cells[cell] != net:
+                return False
+    return True
+
+
+def _search(
+    cells: Sequence[int],
+    base: Sequence[int] | None,
+    dims: Dims,
+    net: int,
+    sources: Iterable[int],
+    targets: Set[int],
+    via_cost: int,
+    penalty: int,
+    box: Tuple[int, int, int, int] | None = None,
+) -> List[int] | None:
+    """
+    A* from any source cell to any target cell; the path of cell indices, or
+    None. `box` (row0, col0, row1, col1, half-open) confines the search.
+    """
+    layers, rows, cols = dims
+    plane = rows * cols
+    row0, col0, row1, col1 = box or (0, 0, rows, cols)
+    goal_row, goal_col = divmod(next(iter(targets)) % plane, cols)
+
+    best: Dict[int, int] = {}
+    came_from: Dict[int, int] = {}
+    heap: List[Tuple[int, int, int, int]] = []
+    for source in sources:
+        best[source] = 0
+        row, col = divmod(source % plane, cols)
+        h = abs(row - goal_row) + abs(col - goal_col)
+        heap.append((h, h, 0, source))
+    heapq.heapify(heap)
+
+    while heap:
+        _, _, cost, index = heapq.heappop(heap)
+        if cost > best[index]:
+            continue
+        if index in targets:
+            path = [index]
+            while path[-1] in came_from:
+                path.append(came_from[path[-1]])
+            path.reverse()
+            return path
+
+        layer, rest = divmod(index, plane)
+        row, col = divmod(rest, cols)
+        steps = []
+        if col > col0:
+            steps.append((index - 1, 1))
+        if col < col1 - 1:
+            steps.append((index + 1, 1))
+        if row > row0:
+            steps.append((index - cols, 1))
+        if row < row1 - 1:
+            steps.append((index + cols, 1))
+        if layers == 2 and _via_allowed(cells, dims, index, net):
+            steps.append((index + plane if layer == 0 else index - plane, via_cost))
+
+        for neighbour, step in steps:
+            extra = _passable(cells[neighbour], base[neighbour] if base is not None else FREE, net, penalty)
+            if extra is None:
+                continue
+            new_cost = cost + step + extra
+            if new_cost < best.get(neighbour, new_cost + 1):
+                best[neighbour] = new_cost
+                came_from[neighbour] = index
+                n_row, n_col = divmod(neighbour % plane, cols)
+                h = abs(n_row - goal_row) + abs(n_col - goal_col)
+                heapq.heappush(heap, (new_cost + h, h, new_cost, neighbour))
+    return None
+
+
+def _prim_order(points: np.ndarray) -> List[int]:
+    """Visit order of points growing a minimum spanning tree from the first one."""
+    count = len(points)
+    order = [0]
+    distance = np.hypot(*(points - points[0]).T)
+    distance[0] = np.inf
+    visited = np.zeros(count, dtype=bool)
+    visited[0] = True
+    for _ in range(count - 1):
+        nearest = int(np.argmin(distance))
+        order.append(nearest)
+        visited[nearest] = True
+        distance = np.minimum(distance, np.hypot(*(points - points[nearest]).T))
+        distance[visited] = np.inf
+    return order
+
+
+def _route_net(
+    cells: Sequence[int],
+    base: Sequence[int] | None,
+    dims: Dims,
+    net: int,
+    terminals: List[List[int]],
+    centers: np.ndarray,
+    via_cost: int,
+    penalty: int = 0,
+    box: Tuple[int, int, int, int] | None = None,
+) -> List[List[int]] | None:
+    """Paths joining every terminal of `net`, or None if any terminal is unreachable."""
+    # Pins shorted to an earlier net belong to that net and can never be reached
+    if any(cells[cell] != net for terminal in terminals for cell in terminal):
+        return None
+    order = _prim_order(centers)
+    tree: Set[int] = set(terminals[order[0]])
+    paths: List[List[int]] = []
+    for k in order[1:]:
+        targets = set(terminals[k])
+        if tree & targets:
+            continue
+        path = _search(cells, base, dims, net, tree, targets, via_cost, penalty, box)
+        if path is None:
+            return None
+        paths.append(path)
+        tree.update(path)
+        tree.update(targets)
+    return paths
+
+
+def _route_window(task: Tuple) -> List[List[int]] | None:
+    """Worker entry point: route one net inside its copied window of the grid."""
+    window, net, terminals, centers, via_cost = task
+    return _route_net(window.reshape(-1).tolist(), None, window.shape, net, terminals, centers, via_cost)
+
+
+def _vias_of(path: List[int], plane: int) -> List[int]:
+    """Top-layer cells where a path changes layer."""
+    return [min(a, b) for a, b in zip(path, path[1:]) if abs(a - b) == plane]
+
+
+def _via_ring(index: int, dims: Dims) -> List[int]:
+    """A via's keep-out ring: the four neighbouring cells on both layers."""
+    plane, cols = dims[1] * dims[2], dims[2]
+    top = index % plane
+    return [
+        start + offset
+        for start in (top, top + plane)
+        for offset in (-1, 1, -cols, cols)
+    ]
+
+
+class AutorouterService:
+    """
+    Grid/A* autorouter for placed boards.
+    SOLID: Single Responsibility - routing only; callers decide what to save.
+    """
+
+    def __init__(
+        self,
+        grid: float = DEFAULT_GRID_MM,
+        trace_width: float = DEFAULT_TRACE_WIDTH_MM,
+        clearance: float = DEFAULT_CLEARANCE_MM,
+        via_cost: int = DEFAULT_VIA_COST,
+        max_retries: int = DEFAULT_MAX_RETRIES,
+    ) -> None:
+        self.grid = grid
+        self.trace_width = trace_width
+        self.clearance = clearance
+        self.via_cost = via_cost
+        self.max_retries = max_retries
+
+    def route(
+        self,
+        design: Design,
+        max_workers: int | None = None,
+        on_progress: Callable[[int, int], None] | None = None,
+    ) -> RoutingResult:
+        """
+        Route every net of the design from scratch (existing traces are ignored).
+
+        Raises ValueError if the board has no outline or is too large for the
+        grid. `on_progress(done, total)` is called as nets are settled.
+        """
+        grid = RoutingGrid(design.board, self.grid, self.clearance, self.trace_width)
+        plans = sorted(grid.plans, key=lambda plan: (plan.half_perimeter, plan.index))
+        report = on_progress or (lambda done, total: None)
+
+        state = grid.owner.copy()
+        # net index -> committed cells (for rip-up) and its paths
+        committed: Dict[int, List[int]] = {}
+        routed_paths: Dict[int, List[List[int]]] = {}
+
+        failed = self._route_windows(grid, state, plans, committed, routed_paths, max_workers, report)
+        failed = self._rip_up_and_retry(grid, state, failed, plans, committed, routed_paths, report)
+
+        result = RoutingResult(skipped_nets=list(grid.skipped))
+        for plan in sorted(plans, key=lambda plan: plan.index):
+            if plan.index in routed_paths:
+                result.routed_nets.append(plan.net_id)
+                self._geometry(grid, plan, routed_paths[plan.index], result)
+            else:
+                result.failed_nets.append(plan.net_id)
+        report(len(plans), len(plans))
+        return result
+
+    def apply(self, design: Design, result: RoutingResult) -> Design:
+        """Copy of the design with its traces and vias replaced by the routing result."""
+        board = design.board.model_copy(update={"traces": result.traces, "vias": result.vias})
+        return design.model_copy(update={"board": board})
+
+    # Phase 1: independent nets in parallel windows
+
+    def _route_windows(self, grid, state, plans, committed, routed_paths, max_workers, report) -> List[_NetPlan]:
+        layers, rows, cols = grid.dims
+        plane = rows * cols
+        pending = list(plans)
+        failed: List[_NetPlan] = []
+        workers = min(max_workers or os.cpu_count() or 1, max(1, len(plans)))
+        pool = ProcessPoolExecutor(max_workers=workers) if workers > 1 else None
+        try:
+            while pending:
+                batch, pending = _independent_batch(pending, rows, cols)
+                tasks, windows = [], []
+                for plan in batch:
+                    r0, c0, r1, c1 = _window(plan.bounds, rows, cols)
+                    window = state[:, r0:r1, c0:c1].copy()
+                    w_rows, w_cols = r1 - r0, c1 - c0
+                    local = [
+                        [
+                            (cell // plane) * w_rows * w_cols
+                            + ((cell % plane) // cols - r0) * w_cols
+                            + (cell % cols - c0)
+                            for cell in terminal.cells
+                        ]
+                        for terminal in plan.terminals
+                    ]
+                    tasks.append((window, plan.index, local, _centers(plan), self.via_cost))
+                    windows.append((r0, c0, w_rows, w_cols))
+
+                if pool is None:
+                    results = map(_route_window, tasks)
+                else:
+                    results = pool.map(_route_window, tasks, chunksize=max(1, len(tasks) // (workers * 4)))
+
+                flat = state.reshape(-1)
+                for plan, (r0, c0, w_rows, w_cols), paths in zip(batch, windows, results):
+                    if paths is None:
+                        failed.append(plan)
+                        continue
+                    w_plane = w_rows * w_cols
+                    global_paths = [
+                        [
+                            (cell // w_plane) * plane
+                            + ((cell % w_plane) // w_cols + r0) * cols
+                            + (cell % w_cols + c0)
+                            for cell in path
+                        ]
+                        for path in paths
+                    ]
+                    committed[plan.index] = self._commit(flat, grid.dims, plan.index, global_paths)
+                    routed_paths[plan.index] = global_paths
+                report(len(routed_paths), len(plans))
+        finally:
+            if pool is not None:
+                pool.shutdown(wait=True, cancel_futures=True)
+        return failed
+
+    # Phase 2: rip-up-and-retry on the whole board
+
+    def _rip_up_and_retry(self, grid, state, failed, plans, committed, routed_paths, report) -> List[_NetPlan]:
+        if not failed:
+            return []
+        cells = state.reshape(-1).tolist()
+        base = grid.owner.reshape(-1).tolist()
+        by_index = {plan.index: plan for plan in plans}
+        queue = deque(plan.index for plan in failed)
+        attempts: Dict[int, int] = {}
+        given_up: Set[int] = set()
+
+        while queue:
+            net = queue.popleft()
+            plan = by_index[net]
+            terminals = [terminal.cells for terminal in plan.terminals]
+            box = _window(plan.bounds, grid.rows, grid.cols, RETRY_MARGIN_CELLS)
+            paths = _route_net(cells, base, grid.dims, net, terminals, _centers(plan), self.via_cost, 0, box)
+            if paths is None and attempts.get(net, 0) < self.max_retries:
+                attempts[net] = attempts.get(net, 0) + 1
+                paths = _route_net(
+                    cells, base, grid.dims, net, terminals, _centers(plan), self.via_cost, RIPUP_PENALTY, box
+                )
+                if paths is not None:
+                    for victim in sorted(self._crossed(cells, base, grid.dims, net, paths)):
+                        for cell in committed.pop(victim):
+                            cells[cell] = base[cell]
+                        del routed_paths[victim]
+                        queue.append(victim)
+            if paths is None:
+                given_up.add(net)
+                continue
+            committed[net] = self._commit(cells, grid.dims, net, paths)
+            routed_paths[net] = paths
+            report(len(routed_paths), len(plans))
+        return [by_index[net] for net in given_up]
+
+    def _crossed(self, cells: List[int], base: List[int], dims: Dims, net: int, paths: List[List[int]]) -> Set[int]:
+        """Other nets whose tracks (or via keep-outs) the paths would occupy."""
+        plane = dims[1] * dims[2]
+        touched = [cell for path in paths for cell in path]
+        for path in paths:
+            for via in _vias_of(path, plane):
+                touched.extend(_via_ring(via, dims))
+        return {cell_net for cell_net, base_net in ((cells[cell], base[cell]) for cell in touched)
+                if cell_net >= 0 and cell_net != net and base_net == FREE}
+
+    def _commit(self, cells, dims: Dims, net: int, paths: List[List[int]]) -> List[int]:
+        """Claim the paths' cells and via keep-outs for `net`; returns the cells it changed."""
+        plane = dims[1] * dims[2]
+        changed = []
+        for path in paths:
+            claim = list(path)
+            for via in _vias_of(path, plane):
+                claim.extend(_via_ring(via, dims))
+            for cell in claim:
+                if cells[cell] == FREE:
+                    cells[cell] = net
+                    changed.append(cell)
+        return changed
+
+    # Output geometry
+
+    def _geometry(self, grid: RoutingGrid, plan: _NetPlan, paths: List[List[int]], result: RoutingResult) -> None:
+        plane = grid.rows * grid.cols
+        pad_centers = {cell: (terminal.x, terminal.y) for terminal in plan.terminals for cell in terminal.cells}
+        n_vias = n_traces = 0
+        for path in paths:
+            for via in _vias_of(path, plane):
+                x, y = grid.cell_center(via)
+                result.vias.append(Via(
+                    id=f"via_{plan.net_id}_{n_vias}",
+                    net_id=plan.net_id,
+                    position=[round(x, 4), round(y, 4)],
+                    diameter=DEFAULT_VIA_DIAMETER_MM,
+                    drill=DEFAULT_VIA_DRILL_MM,
+                ))
+                n_vias += 1
+            for run in _layer_runs(path, plane):
+                points = [grid.cell_center(cell) for cell in run]
+                if run[0] in pad_centers and run[0] == path[0]:
+                    points.insert(0, pad_centers[run[0]])
+                if run[-1] in pad_centers and run[-1] == path[-1]:
+                    points.append(pad_centers[run[-1]])
+                points = _simplify(points)
+                if len(points) < 2:
+                    continue
+                result.traces.append(Trace(
+                    id=f"trace_{plan.net_id}_{n_traces}",
+                    net_id=plan.net_id,
+                    layer=run[0] // plane + 1,
+                    width=self.trace_width,
+                    points=[[round(x, 4), round(y, 4)] for x, y in points],
+                ))
+                n_traces += 1
+
+
+def _centers(plan: _NetPlan) -> np.ndarray:
+    return np.array([[terminal.x, terminal.y] for terminal in plan.terminals], dtype=np.float64)
+
+
+def _window(
+    bounds: Tuple[int, int, int, int],
+    rows: int,
+    cols: int,
+    margin: int = WINDOW_MARGIN_CELLS,
+) -> Tuple[int, int, int, int]:
+    """Half-open (row0, col0, row1, col1) search window around a net's pins."""
+    r0, c0, r1, c1 = bounds
+    return max(0, r0 - margin), max(0, c0 - margin), min(rows, r1 + margin + 1), min(cols, c1 + margin + 1)
+
+
+def _independent_batch(plans: List[_NetPlan], rows: int, cols: int) -> Tuple[List[_NetPlan], List[_NetPlan]]:
+    """Split plans into a batch with pairwise disjoint windows and the rest, keeping order."""
+    taken: Set[Tuple[int, int]] = set()
+    batch, rest = [], []
+    for plan in plans:
+        r0, c0, r1, c1 = _window(plan.bounds, rows, cols)
+        tiles = {
+            (tr, tc)
+            for tr in range(r0 // TILE_CELLS, (r1 - 1) // TILE_CELLS + 1)
+            for tc in range(c0 // TILE_CELLS, (c1 - 1) // TILE_CELLS + 1)
+        }
+        if taken.isdisjoint(tiles):
+            taken |= tiles
+            batch.append(plan)
+        else:
+            rest.append(plan)
+    return batch, rest
+
+
+def _layer_runs(path: List[int], plane: int) -> List[List[int]]:
+    """Split a path into consecutive cells on the same layer."""
+    runs = [[path[0]]]
+    for cell in path[1:]:
+        if cell // plane == runs[-1][-1] // plane:
+            runs[-1].append(cell)
+        else:
+            runs.append([cell])
+    return runs
+
+
+def _simplify(points: List[Tuple[float, float]]) -> List[Tuple[float, float]]:
+    """Drop repeated points and interior points of straight runs."""
+    kept: List[Tuple[float, float]] = []
+    for point in points:
+        if kept and math.isclose(point[0], kept[-1][0]) and math.isclose(point[1], kept[-1][1]):
+            continue
+        if len(kept) >= 2:
+            (ax, ay), (bx, by) = kept[-2], kept[-1]
+            ux, uy, vx, vy = bx - ax, by - ay, point[0] - bx, point[1] - by
+            # Same direction (not a reversal) and no turn
+            if ux * vx + uy * vy > 0 and math.isclose(ux * vy, uy * vx, abs_tol=1e-9):
+                kept[-1] = point
+                continue
+        kept.append(point)
+    return kept
+
+
+# Singleton autorouter for the application
+autorouter_service = AutorouterService()
@@ -0,0 +1,181 @@
+"""
+Columnar board representation for rule engines.
+SOLID: Single Responsibility - converts a Board into flat arrays once, so DRC
+and ML rules scan NumPy columns instead of thousands of Pydantic objects.
+
+Entities are interned to integer IDs in board order: component k is
+`board.components[k]`, net k is `board.nets[k]`, and pins (distinct
+connection IDs) are numbered in order of first appearance. Net membership
+is stored in CSR form: the pins of net k are
+`net_pins[net_offsets[k]:net_offsets[k + 1]]`, in `connection_ids` order.
+"""
+
+from dataclasses import dataclass
+from functools import cached_property
+from typing import Dict, List, Tuple
+
+import numpy as np
+
+from app.domain.connectivity import split_connection_id
+from app.domain.footprints import (
+    DEFAULT_FOOTPRINT_SIZE,
+    DEFAULT_FOOTPRINT_SIZES,
+    footprint_boxes,
+    footprint_size,
+)
+from app.domain.models import Board
+
+# Marker in pin_components for connections naming a component not on the board
+DANGLING = -1
+
+
+@dataclass(eq=False)
+class BoardArrays:
+    """Flat, read-only arrays describing one board; build with `BoardArrays.build`."""
+    component_ids: List[str]
+    # component_id -> index (the last one wins if IDs repeat)
+    component_index: Dict[str, int]
+    # Lower-cased component types, interned: type of component k is type_names[type_codes[k]]
+    type_names: List[str]
+    type_codes: np.ndarray
+    # (n, 2) centers; NaN rows for components without a usable position
+    positions: np.ndarray
+    placed: np.ndarray
+    rotations: np.ndarray
+    # (n, 2) footprint width/height at rotation 0
+    sizes: np.ndarray
+    net_ids: List[str]
+    net_offsets: np.ndarray
+    net_pins: np.ndarray
+    # Distinct connection IDs; pin p belongs to component pin_components[p] (or DANGLING)
+    pin_ids: List[str]
+    pin_components: np.ndarray
+
+    @classmethod
+    def build(cls, board: Board) -> "BoardArrays":
+        """Convert a board in one pass over components and one over net connections."""
+        components = board.components
+        n = len(components)
+        component_ids = [component.id for component in components]
+        component_index = {component_id: k for k, component_id in enumerate(component_ids)}
+
+        type_lookup: Dict[str, int] = {}
+        kind_codes: Dict[str, int] = {}
+        type_names: List[str] = []
+        type_sizes: List[Tuple[float, float]] = []
+        type_codes = np.empty(n, dtype=np.int32)
+        positions = np.full((n, 2), np.nan)
+        placed = np.zeros(n, dtype=bool)
+        rotations = np.zeros(n)
+        sizes = np.empty((n, 2))
+
+        for k, component in enumerate(components):
+            code = type_lookup.get(component.type)
+            if code is None:
+                kind = component.type.lower()
+                code = kind_codes.setdefault(kind, len(kind_codes))
+                if code == len(type_names):
+                    type_names.append(kind)
+                    type_sizes.append(DEFAULT_FOOTPRINT_SIZES.get(kind, DEFAULT_FOOTPRINT_SIZE))
+                type_lookup[component.type] = code
+            type_codes[k] = code
+
+            # Explicit width/height properties are rare; only then is the slow path needed
+            sizes[k] = footprint_size(component) if component.properties else type_sizes[code]
+            position = component.position
+            if position and len(position) >= 2:
+                positions[k] = position[0], position[1]
+                placed[k] = True
+            if component.rotation:
+                rotations[k] = component.rotation
+
+        pin_index: Dict[str, int] = {}
+        net_pins: List[int] = []
+        net_offsets = np.zeros(len(board.nets) + 1, dtype=np.int64)
+        for k, net in enumerate(board.nets):
+            net_pins.extend([pin_index.setdefault(conn, len(pin_index)) for conn in net.connection_ids])
+            net_offsets[k + 1] = len(net_pins)
+
+        pin_ids = list(pin_index)
+        pin_components = np.empty(len(pin_ids), dtype=np.int32)
+        for p, connection_id in enumerate(pin_ids):
+            component_id, _, _ = connection_id.partition(".")
+            if component_id not in component_index:
+                # Slow path only for component IDs that contain dots
+                component_id, _ = split_connection_id(connection_id, component_index.keys())
+            pin_components[p] = component_index.get(component_id, DANGLING)
+
+        return cls(
+            component_ids=component_ids,
+            component_index=component_index,
+            type_names=type_names,
+            type_codes=type_codes,
+            positions=positions,
+            placed=placed,
+            rotations=rotations,
+            sizes=sizes,
+            net_ids=[net.id for net in board.nets],
+            net_offsets=net_offsets,
+            net_pins=np.asarray(net_pins, dtype=np.int32),
+            pin_ids=pin_ids,
+            pin_components=pin_components,
+        )
+
+    def __len__(self) -> int:
+        return len(self.component_ids)
+
+    @cached_property
+    def placed_boxes(self) -> Tuple[np.ndarray, np.ndarray]:
+        """(indices, boxes) of placed components, like `component_bounding_boxes`."""
+        indices = np.flatnonzero(self.placed)
+        boxes = footprint_boxes(self.positions[indices], self.sizes[indices], self.rotations[indices])
+        return indices, boxes
+
+    @cached_property
+    def slot_nets(self) -> np.ndarray:
+        """Net index of every connection slot (parallel to `net_pins`)."""
+        return np.repeat(np.arange(len(self.net_ids), dtype=np.int32), np.diff(self.net_offsets))
+
+    def net_sizes(self) -> np.ndarray:
+        """Number of connections listed on each net."""
+        return np.diff(self.net_offsets)
+
+    def type_mask(self, *kinds: str) -> np.ndarray:
+        """Boolean mask of components whose lower-cased type is one of `kinds`."""
+        codes = [code for code, name in enumerate(self.type_names) if name in kinds]
+        return np.isin(self.type_codes, codes)
+
+    def type_mask_where(self, predicate) -> np.ndarray:
+        """Boolean mask of components whose lower-cased type satisfies `predicate`."""
+        codes = [code for code, name in enumerate(self.type_names) if predicate(name)]
+        return np.isin(self.type_codes, codes)
+
+    def repeated_pin_slots(self) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        (slots, first_slots) for every repeat of a pin after its first listing.
+
+        Slots index `net_pins`, so they are in board order; `first_slots[i]`
+        is the slot where the pin of `slots[i]` first appeared.
+        """
+        pins = self.net_pins
+        order = np.argsort(pins, kind="stable")
+        sorted_pins = pins[order]
+        is_first = np.ones(len(pins), dtype=bool)
+        is_first[1:] = sorted_pins[1:] != sorted_pins[:-1]
+        # First slot of each pin, spread over that pin's run in sorted order
+        first_of_run = order[np.flatnonzero(is_first)]
+        first_slots = np.repeat(first_of_run, np.diff(np.append(np.flatnonzero(is_first), len(pins))))
+
+        repeats = ~is_first
+        slots, firsts = order[repeats], first_slots[repeats]
+        board_order = np.argsort(slots, kind="stable")
+        return slots[board_order], firsts[board_order]
+
+    def component_net_counts(self) -> np.ndarray:
+        """Number of distinct nets touching each component."""
+        components = self.pin_components[self.net_pins].astype(np.int64)
+        attached = components != DANGLING
+        # Encode (component, net) pairs as one integer so np.unique drops repeats
+        stride = max(len(self.net_ids), 1)
+        pairs = np.unique(components[attached] * stride + self.slot_nets[attached])
+        return np.bincount(pairs // stride, minlength=len(self.component_ids))
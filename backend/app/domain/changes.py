@@ -0,0 +1,25 @@
+"""
+Change sets describing an edit to a board.
+SOLID: Single Responsibility - the contract between editors (patches, live
+sessions) and consumers that re-check only what changed (incremental DRC).
+"""
+
+from dataclasses import dataclass, field
+from typing import Set
+
+
+@dataclass
+class BoardChanges:
+    """IDs of nets/components touched by an edit, plus whether the outline changed."""
+    nets: Set[str] = field(default_factory=set)
+    components: Set[str] = field(default_factory=set)
+    outline: bool = False
+
+    def is_empty(self) -> bool:
+        return not self.nets and not self.components and not self.outline
+
+    def merge(self, other: "BoardChanges") -> None:
+        """Fold another edit's changes into this one."""
+        self.nets |= other.nets
+        self.components |= other.components
+        self.outline = self.outline or other.outline
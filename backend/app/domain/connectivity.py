@@ -0,0 +1,84 @@
+"""
+Connectivity helpers for a board.
+SOLID: Single Responsibility - connection ID parsing, union-find and
+shorted-net islands for DRC rules, the ratsnest and ML detectors.
+
+Connection IDs follow the `componentId.pinName` convention documented on
+`Net.connection_ids` (e.g. "R1.1", "LED1.anode"). Lookups are by exact
+component ID, so "U1" never matches "U10.1".
+"""
+
+from typing import Dict, Iterable, List, Set, Tuple
+
+
+def split_connection_id(connection_id: str, component_ids: Set[str] | None = None) -> Tuple[str, str]:
+    """
+    Split "componentId.pinName" into (component_id, pin_name).
+
+    Component IDs may themselves contain dots; when `component_ids` is given
+    the longest known component prefix wins. Otherwise (or if no prefix is
+    known) the split is at the first dot. A connection without a dot names a
+    component with an empty pin.
+    """
+    if component_ids is not None:
+        dot = connection_id.rfind(".")
+        while dot > 0:
+            if connection_id[:dot] in component_ids:
+                return connection_id[:dot], connection_id[dot + 1:]
+            dot = connection_id.rfind(".", 0, dot)
+    component_id, _, pin = connection_id.partition(".")
+    return component_id, pin
+
+
+class DisjointSet:
+    """Union-find over 0..n-1 with path halving and union by size."""
+
+    def __init__(self, n: int) -> None:
+        self.parent = list(range(n))
+        self.size = [1] * n
+
+    def find(self, x: int) -> int:
+        parent = self.parent
+        while parent[x] != x:
+            parent[x] = parent[parent[x]]
+            x = parent[x]
+        return x
+
+    def union(self, a: int, b: int) -> bool:
+        """Merge the sets of `a` and `b`; False if they were already one set."""
+        a, b = self.find(a), self.find(b)
+        if a == b:
+            return False
+        if self.size[a] < self.size[b]:
+            a, b = b, a
+        self.parent[b] = a
+        self.size[a] += self.size[b]
+        return True
+
+
+def shorted_islands(n_nets: int, links: Iterable[Tuple[int, int, str]]) -> List[Tuple[List[int], List[str]]]:
+    """
+    Group nets joined through shared pins into electrical islands.
+
+    `links` are (net, earlier_net, connection_id) for every listing of a pin
+    on a net other than the first net it appeared on, in board order; nets
+    are positions in board.nets. Returns (nets, pins) for each island: nets
+    in board order, pins in the order they were first shared. Islands are
+    ordered by their first net.
+    """
+    links = list(links)
+    sets = DisjointSet(n_nets)
+    for net, earlier, _ in links:
+        sets.union(net, earlier)
+
+    nets: Dict[int, Set[int]] = {}
+    # Dicts keep each island's pins unique and in first-shared order
+    pins: Dict[int, Dict[str, None]] = {}
+    for net, earlier, connection_id in links:
+        root = sets.find(net)
+        nets.setdefault(root, set()).update((net, earlier))
+        pins.setdefault(root, {})[connection_id] = None
+
+    islands = [(sorted(members), list(pins[root])) for root, members in nets.items()]
+    islands.sort(key=lambda island: island[0][0])
+    return islands
@@ -0,0 +1,93 @@
+"""
+Component footprint geometry.
+SOLID: Single Responsibility - maps components to physical extents on the board.
+
+The schema only stores a component's center position and rotation, so footprint
+sizes come from per-type defaults (millimetres) that can be overridden with
+numeric "width"/"height" component properties.
+"""
+
+from typing import Dict, List, Tuple
+
+import numpy as np
+
+from app.domain.models import Component
+
+# Default footprint sizes in mm: (width, height) at rotation 0
+DEFAULT_FOOTPRINT_SIZES: Dict[str, Tuple[float, float]] = {
+    "resistor": (3.2, 1.6),
+    "capacitor": (3.2, 1.6),
+    "led": (3.2, 1.6),
+    "diode": (3.5, 1.8),
+    "transistor": (3.0, 2.5),
+    "header": (2.54, 10.16),
+    "connector": (5.0, 10.0),
+    "button": (6.0, 6.0),
+    "switch": (6.0, 6.0),
+    "ic": (6.0, 5.0),
+    "gate": (6.0, 5.0),
+    "mcu": (10.0, 10.0),
+    "microcontroller": (10.0, 10.0),
+}
+
+# Fallback for component types without a known footprint
+DEFAULT_FOOTPRINT_SIZE: Tuple[float, float] = (2.5, 2.5)
+
+
+def footprint_size(component: Component) -> Tuple[float, float]:
+    """Return (width, height) in mm for a component at rotation 0."""
+    width, height = DEFAULT_FOOTPRINT_SIZES.get(component.type.lower(), DEFAULT_FOOTPRINT_SIZE)
+
+    # Explicit numeric properties win over type defaults
+    for key in ("width", "height"):
+        prop = component.properties.get(key)
+        if prop is not None and isinstance(prop.value, (int, float)) and prop.value > 0:
+            if key == "width":
+                width = float(prop.value)
+            else:
+                height = float(prop.value)
+
+    return width, height
+
+
+def component_bounding_boxes(components: List[Component]) -> Tuple[List[int], np.ndarray]:
+    """
+    Compute axis-aligned bounding boxes for all positioned components.
+
+    Returns (indices, boxes) where indices are positions into `components` and
+    boxes is an (n, 4) array of [min_x, min_y, max_x, max_y].
+    Components without a position are skipped.
+    """
+    indices: List[int] = []
+    rows: List[Tuple[float, float, float, float, float]] = []
+
+    for i, component in enumerate(components):
+        if not component.position or len(component.position) < 2:
+            continue
+        width, height = footprint_size(component)
+        indices.append(i)
+        rows.append((component.position[0], component.position[1], width, height, component.rotation or 0.0))
+
+    if not rows:
+        return indices, np.zeros((0, 4), dtype=np.float64)
+
+    data = np.asarray(rows, dtype=np.float64)
+    return indices, footprint_boxes(data[:, 0:2], data[:, 2:4], data[:, 4])
+
+
+def footprint_boxes(centers: np.ndarray, sizes: np.ndarray, rotations: np.ndarray) -> np.ndarray:
+    """
+    Axis-aligned [min_x, min_y, max_x, max_y] boxes of rotated footprints.
+
+    `centers` and `sizes` are (n, 2), `rotations` is (n,) in degrees; rotation
+    is applied to every footprint in one vectorized pass.
+    """
+    if len(centers) == 0:
+        return np.zeros((0, 4), dtype=np.float64)
+    theta = np.radians(rotations)
+    cos_t, sin_t = np.abs(np.cos(theta)), np.abs(np.sin(theta))
+    half_w = (sizes[:, 0] * cos_t + sizes[:, 1] * sin_t) / 2
+    half_h = (sizes[:, 0] * sin_t + sizes[:, 1] * cos_t) / 2
+    return np.column_stack(
+        (centers[:, 0] - half_w, centers[:, 1] - half_h, centers[:, 0] + half_w, centers[:, 1] + half_h)
+    )
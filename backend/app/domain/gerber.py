@@ -0,0 +1,287 @@
+"""
+Gerber RS-274X and Excellon drill export.
+SOLID: Single Responsibility - turns a design into manufacturing files;
+packaging (zip) and transport live elsewhere.
+
+Every file is produced by a generator that yields one chunk per component
+(or outline, or routed trace), so export time is linear in board size and memory does not
+grow with it: apertures and drill tools are collected in a first pass over
+the distinct footprints, then features are streamed in a second pass.
+
+Coordinates are millimetres in 4.6 format (%FSLAX46Y46%). Editor Y grows
+downwards while Gerber Y grows upwards, so Y is negated to keep the board
+reading as drawn.
+"""
+
+import re
+from dataclasses import dataclass
+from typing import Callable, Dict, Iterator, List, Tuple
+
+from app.domain.footprints import footprint_size
+from app.domain.models import Component, Design
+from app.domain.pads import Pad, footprint_key, footprint_pads, rotate
+
+COORDINATE_SCALE = 10 ** 6
+GENERATOR = "PCB Design API,gerber,0.1.0"
+
+SOLDER_MASK_MARGIN = 0.05
+SILKSCREEN_LINE = 0.15
+OUTLINE_LINE = 0.1
+
+# (shape, dimensions...) - ("C", diameter) or ("R", width, height)
+Aperture = Tuple
+
+
+@dataclass(frozen=True)
+class GerberLayer:
+    """One Gerber file of the export."""
+    name: str
+    extension: str
+    file_function: str
+
+
+F_CU = GerberLayer("F_Cu", "gtl", "Copper,L1,Top")
+B_CU = GerberLayer("B_Cu", "gbl", "Copper,L2,Bot")
+F_MASK = GerberLayer("F_Mask", "gts", "Soldermask,Top")
+B_MASK = GerberLayer("B_Mask", "gbs", "Soldermask,Bot")
+F_SILK = GerberLayer("F_SilkS", "gto", "Legend,Top")
+EDGE_CUTS = GerberLayer("Edge_Cuts", "gm1", "Profile,NP")
+
+
+def _coord(value: float) -> str:
+    return str(round(value * COORDINATE_SCALE))
+
+
+def _xy(x: float, y: float) -> str:
+    return f"X{_coord(x)}Y{_coord(-y)}"
+
+
+def _placed(design: Design) -> Iterator[Component]:
+    for component in design.board.components:
+        if component.position and len(component.position) >= 2:
+            yield component
+
+
+def _quarter_turns(degrees: float) -> int | None:
+    """Number of 90 degree turns, or None if the rotation is not orthogonal."""
+    turns = degrees / 90
+    nearest = round(turns)
+    return nearest % 4 if abs(turns - nearest) < 1e-9 else None
+
+
+def _pad_aperture(pad: Pad, rotation: float, grow: float) -> Aperture | None:
+    """Aperture that flashes the pad, or None if it must be drawn as a region."""
+    if pad.round:
+        return ("C", pad.width + 2 * grow)
+    turns = _quarter_turns(rotation)
+    if turns is None:
+        return None
+    width, height = pad.width + 2 * grow, pad.height + 2 * grow
+    return ("R", height, width) if turns % 2 else ("R", width, height)
+
+
+def _aperture_definition(code: int, aperture: Aperture) -> str:
+    if aperture[0] == "C":
+        return f"%ADD{code}C,{aperture[1]:.6f}*%\n"
+    return f"%ADD{code}R,{aperture[1]:.6f}X{aperture[2]:.6f}*%\n"
+
+
+def _comment(text: str) -> str:
+    """Text safe inside a G04 or Excellon comment (no delimiters or line breaks)."""
+    return " ".join(re.sub(r"[*%]", " ", text).split())
+
+
+def _header(design: Design, layer: GerberLayer) -> str:
+    return (
+        f"G04 {_comment(design.name)} {layer.name}*\n"
+        f"%TF.GenerationSoftware,{GENERATOR}*%\n"
+        f"%TF.FileFunction,{layer.file_function}*%\n"
+        "%TF.FilePolarity,Positive*%\n"
+        "%FSLAX46Y46*%\n"
+        "%MOMM*%\n"
+        "%LPD*%\n"
+    )
+
+
+def _rotated_rect(cx: float, cy: float, width: float, height: float, rotation: float) -> List[Tuple[float, float]]:
+    corners = [(-width / 2, -height / 2), (width / 2, -height / 2), (width / 2, height / 2), (-width / 2, height / 2)]
+    return [(cx + dx, cy + dy) for dx, dy in (rotate(x, y, rotation) for x, y in corners)]
+
+
+def _closed_path(points: List[Tuple[float, float]]) -> str:
+    """Move to the first point, then draw through the rest and back."""
+    parts = [f"{_xy(*points[0])}D02*\n"]
+    parts.extend(f"{_xy(x, y)}D01*\n" for x, y in points[1:])
+    parts.append(f"{_xy(*points[0])}D01*\n")
+    return "".join(parts)
+
+
+def iter_pad_layer(
+    design: Design,
+    layer: GerberLayer,
+    include: Callable[[Pad], bool] = lambda pad: True,
+    grow: float = 0.0,
+    copper: int | None = None,
+) -> Iterator[str]:
+    """
+    Copper or solder-mask layer: one flash (or region) per included pad.
+    Copper layers (`copper` is the board layer number) also draw the routed
+    traces on that layer and flash every via.
+    """
+    yield _header(design, layer)
+
+    # Pass 1: apertures and rotated pad offsets, once per distinct (footprint, rotation).
+    # Keyed by value: the pad layout cache may rebuild a footprint's tuple
+    # between the passes on boards with many footprint sizes.
+    apertures: Dict[Aperture, int] = {}
+    placements: Dict[Tuple[Tuple[str, float, float], float], List[Tuple[int | None, float, float, Pad]]] = {}
+    for component in _placed(design):
+        key = footprint_key(component), component.rotation or 0.0
+        if key in placements:
+            continue
+        rotation = key[1]
+        placed = []
+        for pad in footprint_pads(component):
+            if not include(pad):
+                continue
+            aperture = _pad_aperture(pad, rotation, grow)
+            if aperture is not None and aperture not in apertures:
+                apertures[aperture] = 10 + len(apertures)
+            dx, dy = rotate(pad.x, pad.y, rotation)
+            placed.append((apertures.get(aperture), dx, dy, pad))
+        placements[key] = placed
+    traces = [trace for trace in design.board.traces if trace.layer == copper and len(trace.points) >= 2]
+    vias = design.board.vias if copper is not None else []
+    for aperture in [("C", trace.width) for trace in traces] + [("C", via.diameter) for via in vias]:
+        apertures.setdefault(aperture, 10 + len(apertures))
+    yield "".join(_aperture_definition(code, aperture) for aperture, code in apertures.items())
+    yield "G01*\n"
+
+    # Pass 2: features, one chunk per component
+    current = None
+    for component in _placed(design):
+        x, y = component.position[0], component.position[1]
+        rotation = component.rotation or 0.0
+        parts = []
+        for code, dx, dy, pad in placements[footprint_key(component), rotation]:
+            if code is None:
+                corners = _rotated_rect(x + dx, y + dy, pad.width + 2 * grow, pad.height + 2 * grow, rotation)
+                parts.append("G36*\n" + _closed_path(corners) + "G37*\n")
+                continue
+            if code != current:
+                parts.append(f"D{code}*\n")
+                current = code
+            parts.append(f"{_xy(x + dx, y + dy)}D03*\n")
+        if parts:
+            yield "".join(parts)
+
+    # Routed copper: one chunk per trace, then the via pads
+    for trace in traces:
+        code = apertures["C", trace.width]
+        select = f"D{code}*\n" if code != current else ""
+        current = code
+        (x, y), rest = trace.points[0], trace.points[1:]
+        yield select + f"{_xy(x, y)}D02*\n" + "".join(f"{_xy(px, py)}D01*\n" for px, py in rest)
+    for via in vias:
+        code = apertures["C", via.diameter]
+        select = f"D{code}*\n" if code != current else ""
+        current = code
+        yield select + f"{_xy(via.position[0], via.position[1])}D03*\n"
+
+    yield "M02*\n"
+
+
+def iter_silkscreen(design: Design) -> Iterator[str]:
+    """Top legend: the footprint outline of every placed component."""
+    yield _header(design, F_SILK)
+    yield _aperture_definition(10, ("C", SILKSCREEN_LINE)) + "G01*\nD10*\n"
+    for component in _placed(design):
+        width, height = footprint_size(component)
+        corners = _rotated_rect(component.position[0], component.position[1], width, height, component.rotation or 0.0)
+        yield _closed_path(corners)
+    yield "M02*\n"
+
+
+def iter_outline(design: Design) -> Iterator[str]:
+    """Board profile from the outline polygon (empty if the board has none)."""
+    yield _header(design, EDGE_CUTS)
+    yield _aperture_definition(10, ("C", OUTLINE_LINE)) + "G01*\nD10*\n"
+    outline = design.board.outline
+    if len(outline) >= 3:
+        yield _closed_path([(point[0], point[1]) for point in outline])
+    yield "M02*\n"
+
+
+def iter_excellon(design: Design) -> Iterator[str]:
+    """Excellon drill file for plated through-hole pads and vias, one tool per diameter."""
+    tools: Dict[float, int] = {}
+    seen = set()
+    for component in _placed(design):
+        key = footprint_key(component)
+        if key in seen:
+            continue
+        seen.add(key)
+        for pad in footprint_pads(component):
+            if pad.drill is not None and pad.drill not in tools:
+                tools[pad.drill] = len(tools) + 1
+    for via in design.board.vias:
+        tools.setdefault(via.drill, len(tools) + 1)
+
+    yield (
+        "M48\n"
+        f"; DRILL file for {_comment(design.name)}\n"
+        "; FORMAT={-:-/ absolute / metric / decimal}\n"
+        f"; #@! TF.GenerationSoftware,{GENERATOR}\n"
+        "; #@! TF.FileFunction,Plated,1,2,PTH\n"
+        "FMAT,2\n"
+        "METRIC\n"
+    )
+    yield "".join(f"T{tool}C{diameter:.3f}\n" for diameter, tool in sorted(tools.items(), key=lambda item: item[1]))
+    yield "%\nG90\nG05\n"
+
+    # One pass per tool keeps holes grouped by tool, as drilling machines expect
+    for diameter, tool in tools.items():
+        yield f"T{tool}\n"
+        for component in _placed(design):
+            rotation = component.rotation or 0.0
+            parts = []
+            for pad in footprint_pads(component):
+                if pad.drill == diameter:
+                    dx, dy = rotate(pad.x, pad.y, rotation)
+                    parts.append(f"X{component.position[0] + dx:.4f}Y{0.0 - (component.position[1] + dy):.4f}\n")
+            if parts:
+                yield "".join(parts)
+        holes = [
+            f"X{via.position[0]:.4f}Y{0.0 - via.position[1]:.4f}\n"
+            for via in design.board.vias
+            if via.drill == diameter
+        ]
+        if holes:
+            yield "".join(holes)
+    yield "M30\n"
+
+
+def export_basename(design: Design) -> str:
+    """File-name-safe prefix for a design's export files."""
+    return re.sub(r"[^A-Za-z0-9_-]+", "_", design.name).strip("_") or re.sub(r"[^A-Za-z0-9_-]+", "_", design.id)
+
+
+def gerber_files(design: Design) -> List[Tuple[str, Iterator[str]]]:
+    """(file name, chunk generator) for every file of a fabrication package; nothing runs until iterated."""
+    base = export_basename(design)
+    through_hole = lambda pad: pad.drill is not None  # noqa: E731
+    files = [
+        (f"{base}-{F_CU.name}.{F_CU.extension}", iter_pad_layer(design, F_CU, copper=1)),
+        (f"{base}-{F_MASK.name}.{F_MASK.extension}", iter_pad_layer(design, F_MASK, grow=SOLDER_MASK_MARGIN)),
+    ]
+    if design.board.layers >= 2:
+        files += [
+            (f"{base}-{B_CU.name}.{B_CU.extension}", iter_pad_layer(design, B_CU, through_hole, copper=2)),
+            (f"{base}-{B_MASK.name}.{B_MASK.extension}", iter_pad_layer(design, B_MASK, through_hole, SOLDER_MASK_MARGIN)),
+        ]
+    files += [
+        (f"{base}-{F_SILK.name}.{F_SILK.extension}", iter_silkscreen(design)),
+        (f"{base}-{EDGE_CUTS.name}.{EDGE_CUTS.extension}", iter_outline(design)),
+        (f"{base}-PTH.drl", iter_excellon(design)),
+    ]
+    return files
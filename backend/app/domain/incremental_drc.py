@@ -0,0 +1,445 @@
+"""
+Incremental Design Rule Check.
+SOLID: Single Responsibility - keeps per-design rule state and re-runs DRC
+rules only on the nets and components touched since the last check.
+
+Results are identical to DRCService.check_design; issue builders are shared
+with DRCService so both modes always report the same messages and IDs.
+"""
+
+import threading
+from collections import OrderedDict
+from dataclasses import dataclass, field
+from typing import Dict, Iterable, List, Set, Tuple
+
+from app.domain.changes import BoardChanges
+from app.domain.connectivity import shorted_islands, split_connection_id
+from app.domain.footprints import component_bounding_boxes
+from app.domain.models import Board, Component, Design, Issue, Net
+from app.domain.services import DRCService
+from app.domain.spatial import DynamicGrid, box_gap, suggest_cell_size
+
+
+def _net_signature(net: Net) -> Tuple:
+    return (net.name, tuple(net.connection_ids))
+
+
+def component_signature(component: Component) -> Tuple:
+    """Everything that feeds footprint geometry or placement (and so pad positions)."""
+    width = component.properties.get("width")
+    height = component.properties.get("height")
+    return (
+        component.type.lower(),
+        tuple(component.position) if component.position else None,
+        component.rotation,
+        width.value if width else None,
+        height.value if height else None,
+    )
+
+
+def _pin_owner(conn_id: str, component_by_id: Dict[str, Component]) -> str | None:
+    """Component a connection belongs to, resolved as BoardArrays does, or None if dangling."""
+    component_id, _, _ = conn_id.partition(".")
+    if component_id not in component_by_id:
+        component_id, _ = split_connection_id(conn_id, component_by_id.keys())
+    return component_id if component_id in component_by_id else None
+
+
+class DesignLocks:
+    """
+    One lock per design ID, so checks of one design run one at a time while
+    different designs are still checked in parallel.
+    """
+
+    def __init__(self) -> None:
+        self._guard = threading.Lock()
+        self._locks: Dict[str, threading.Lock] = {}
+
+    def __call__(self, design_id: str) -> threading.Lock:
+        with self._guard:
+            lock = self._locks.get(design_id)
+            if lock is None:
+                lock = self._locks[design_id] = threading.Lock()
+            return lock
+
+    def discard(self, design_id: str) -> None:
+        """Drop the lock of a design whose state is gone (kept while a check holds it)."""
+        with self._guard:
+            lock = self._locks.get(design_id)
+            if lock is not None and not lock.locked():
+                del self._locks[design_id]
+
+
+@dataclass
+class _DesignState:
+    """Rule state retained between checks of one design."""
+    net_order: List[str] = field(default_factory=list)
+    net_signatures: Dict[str, Tuple] = field(default_factory=dict)
+    net_counts: Dict[str, int] = field(default_factory=dict)
+    component_signatures: Dict[str, Tuple] = field(default_factory=dict)
+    outline: Tuple = ()
+    # Caller whose check last brought this state up to date (see check_design)
+    owner: object | None = None
+
+    # Rule results, keyed by the entity that owns them
+    unconnected: Dict[str, Issue] = field(default_factory=dict)
+    pin_to_nets: Dict[str, List[Tuple[str, int]]] = field(default_factory=dict)
+    shared_pins: Set[str] = field(default_factory=set)
+    # First net ID -> (island nets, shared pins, issue); island_of maps each member net to its key
+    shorts: Dict[str, Tuple[List[str], List[str], Issue]] = field(default_factory=dict)
+    island_of: Dict[str, str] = field(default_factory=dict)
+    component_links: Dict[str, int] = field(default_factory=dict)
+    isolated: Dict[str, Issue] = field(default_factory=dict)
+    no_position: Dict[str, Issue] = field(default_factory=dict)
+    out_of_bounds: Dict[str, Issue] = field(default_factory=dict)
+    clearance_pairs: Dict[Tuple[str, str], float] = field(default_factory=dict)
+    pairs_by_component: Dict[str, Set[Tuple[str, str]]] = field(default_factory=dict)
+    grid: DynamicGrid | None = None
+
+
+class IncrementalDRCService:
+    """
+    DRC that re-evaluates only what changed since the previous check.
+
+    Rule state (pin -> nets map, per-net connection counts, spatial grid of
+    footprints, per-entity issues) is kept per design ID. Callers may pass the
+    BoardChanges an edit produced; otherwise changes are found by comparing
+    cheap per-entity signatures against the previous check.
+
+    The service is shared across request threads: checks of the same design
+    are serialized by a per-design lock, and the state map by its own lock.
+    """
+
+    def __init__(self, drc: DRCService | None = None, max_designs: int = 32) -> None:
+        self._drc = drc or DRCService()
+        self._max_designs = max_designs
+        self._states: "OrderedDict[str, _DesignState]" = OrderedDict()
+        self._states_lock = threading.Lock()
+        self._locks = DesignLocks()
+
+    def forget(self, design_id: str) -> None:
+        """Drop retained state for a design (e.g. after it is deleted)."""
+        with self._locks(design_id):
+            with self._states_lock:
+                self._states.pop(design_id, None)
+        self._locks.discard(design_id)
+
+    def check_design(
+        self,
+        design: Design,
+        changes: BoardChanges | None = None,
+        owner: object | None = None,
+    ) -> List[Issue]:
+        """
+        Run DRC on `design`, reusing rule results for untouched entities.
+
+        `changes` describes the edits since `owner`'s previous check. It is
+        only trusted if no other caller has checked the design since then;
+        otherwise the retained state is at a different base and the
+        signature diff runs instead.
+        """
+        with self._locks(design.id):
+            return self._check_locked(design, changes, owner)
+
+    def _retain(self, design_id: str, state: _DesignState) -> None:
+        """Store `state` as the design's most recently used state, evicting the oldest."""
+        with self._states_lock:
+            self._states[design_id] = state
+            self._states.move_to_end(design_id)
+            evicted = []
+            while len(self._states) > self._max_designs:
+                evicted.append(self._states.popitem(last=False)[0])
+        for design_id in evicted:
+            self._locks.discard(design_id)
+
+    def _check_locked(self, design: Design, changes: BoardChanges | None, owner: object | None) -> List[Issue]:
+        board = design.board
+        net_by_id = {net.id: net for net in board.nets}
+        component_by_id = {component.id: component for component in board.components}
+
+        # Duplicate IDs cannot be keyed; fall back to a full check
+        if len(net_by_id) != len(board.nets) or len(component_by_id) != len(board.components):
+            with self._states_lock:
+                self._states.pop(design.id, None)
+            return self._drc.check_design(design)
+
+        with self._states_lock:
+            state = self._states.get(design.id)
+        if state is not None and state.owner is not owner:
+            changes = None
+        if state is None or (changes is None and self._nets_reordered(state, board, net_by_id)):
+            state = _DesignState()
+            changes = BoardChanges(set(net_by_id), set(component_by_id), outline=True)
+        elif changes is None:
+            changes = self._diff(state, board, net_by_id, component_by_id)
+
+        state.owner = owner
+        self._retain(design.id, state)
+
+        if not changes.is_empty():
+            self._apply(state, board, changes, net_by_id, component_by_id)
+        return self._collect(state, board, component_by_id)
+
+    def _nets_reordered(self, state: _DesignState, board: Board, net_by_id: Dict[str, Net]) -> bool:
+        """Short-circuit attribution depends on net order, so reordering forces a rebuild."""
+        previous = [net_id for net_id in state.net_order if net_id in net_by_id]
+        current = [net.id for net in board.nets if net.id in state.net_signatures]
+        return previous != current
+
+    def _diff(
+        self,
+        state: _DesignState,
+        board: Board,
+        net_by_id: Dict[str, Net],
+        component_by_id: Dict[str, Component],
+    ) -> BoardChanges:
+        """Find touched entities by comparing signatures with the previous check."""
+        changes = BoardChanges()
+        for net_id, net in net_by_id.items():
+            if state.net_signatures.get(net_id) != _net_signature(net):
+                changes.nets.add(net_id)
+        changes.nets.update(net_id for net_id in state.net_signatures if net_id not in net_by_id)
+
+        for component_id, component in component_by_id.items():
+            if state.component_signatures.get(component_id) != component_signature(component):
+                changes.components.add(component_id)
+        changes.components.update(c for c in state.component_signatures if c not in component_by_id)
+
+        changes.outline = state.outline != tuple(map(tuple, board.outline))
+        return changes
+
+    def _apply(
+        self,
+        state: _DesignState,
+        board: Board,
+        changes: BoardChanges,
+        net_by_id: Dict[str, Net],
+        component_by_id: Dict[str, Component],
+    ) -> None:
+        """Re-run every rule for the touched nets and components only."""
+        drc = self._drc
+        state.net_order = [net.id for net in board.nets]
+
+        # Pin owners depend on which component IDs exist, so additions and
+        # removals recount every component's links after the nets are updated
+        recount = any((c in component_by_id) != (c in state.component_signatures) for c in changes.components)
+        relinked: Set[str] = set()
+
+        def link(conn_id: str, delta: int) -> None:
+            owner = _pin_owner(conn_id, component_by_id)
+            if owner is not None and not recount:
+                state.component_links[owner] = state.component_links.get(owner, 0) + delta
+                relinked.add(owner)
+
+        # Nets: connection counts, unconnected rule, pin -> nets occurrences
+        touched_pins: Set[str] = set()
+        for net_id in changes.nets:
+            old = state.net_signatures.pop(net_id, None)
+            if old is not None:
+                for conn_id in old[1]:
+                    touched_pins.add(conn_id)
+                    occurrences = state.pin_to_nets.get(conn_id, [])
+                    kept = [occ for occ in occurrences if occ[0] != net_id]
+                    if len(kept) < len(occurrences):
+                        link(conn_id, len(kept) - len(occurrences))
+                    occurrences[:] = kept
+            state.net_counts.pop(net_id, None)
+            state.unconnected.pop(net_id, None)
+
+            net = net_by_id.get(net_id)
+            if net is None:
+                continue
+            state.net_signatures[net_id] = _net_signature(net)
+            state.net_counts[net_id] = len(net.connection_ids)
+            for index, conn_id in enumerate(net.connection_ids):
+                touched_pins.add(conn_id)
+                state.pin_to_nets.setdefault(conn_id, []).append((net_id, index))
+                link(conn_id, 1)
+            issue = drc.unconnected_net_issue(net)
+            if issue is not None:
+                state.unconnected[net_id] = issue
+
+        # Shorts: only islands holding a touched shared pin or a changed net are regrouped
+        if touched_pins:
+            net_position = {net_id: i for i, net_id in enumerate(state.net_order)}
+            seeds: Set[str] = set()
+            for conn_id in touched_pins:
+                occurrences = state.pin_to_nets.get(conn_id)
+                was_shared = conn_id in state.shared_pins
+                state.shared_pins.discard(conn_id)
+                if not occurrences:
+                    state.pin_to_nets.pop(conn_id, None)
+                    continue
+                occurrences.sort(key=lambda occ: (net_position[occ[0]], occ[1]))
+                if occurrences[-1][0] != occurrences[0][0]:
+                    state.shared_pins.add(conn_id)
+                    was_shared = True
+                if was_shared:
+                    seeds.update(net_id for net_id, _ in occurrences)
+            seeds.update(net_id for net_id in changes.nets if net_id in state.island_of)
+            if seeds:
+                self._regroup_shorts(state, net_position, seeds)
+
+        # Components: outline change re-checks every footprint against the edge
+        touched_components = set(changes.components)
+        if changes.outline:
+            state.outline = tuple(map(tuple, board.outline))
+            touched_components.update(component_by_id)
+        for component_id in changes.components:
+            component = component_by_id.get(component_id)
+            if component is None:
+                state.component_signatures.pop(component_id, None)
+            else:
+                state.component_signatures[component_id] = component_signature(component)
+
+        # Isolated components: re-test those whose link count changed
+        if recount:
+            state.component_links = {}
+            for conn_id, occurrences in state.pin_to_nets.items():
+                owner = _pin_owner(conn_id, component_by_id)
+                if owner is not None:
+                    state.component_links[owner] = state.component_links.get(owner, 0) + len(occurrences)
+            state.isolated = {}
+            relinked = set(component_by_id)
+        for component_id in relinked:
+            state.isolated.pop(component_id, None)
+            if component_id in component_by_id and not state.component_links.get(component_id):
+                state.isolated[component_id] = drc.isolated_component_issue(component_id)
+
+        present = [component_by_id[c] for c in touched_components if c in component_by_id]
+        for component_id in touched_components:
+            state.no_position.pop(component_id, None)
+            state.out_of_bounds.pop(component_id, None)
+        for component in present:
+            if component.position is None:
+                state.no_position[component.id] = drc.no_position_issue(component)
+        for issue in drc.out_of_bounds_issues(present, board.outline):
+            state.out_of_bounds[issue.related_ids[0]] = issue
+
+        self._update_clearance(state, changes.components, component_by_id)
+
+    def _regroup_shorts(self, state: _DesignState, net_position: Dict[str, int], seeds: Set[str]) -> None:
+        """Rebuild the islands that hold any seed net, in full-check order."""
+        nets = set(seeds)
+        for key in {state.island_of[net_id] for net_id in seeds if net_id in state.island_of}:
+            members, _, _ = state.shorts.pop(key)
+            nets.update(members)
+            for net_id in members:
+                del state.island_of[net_id]
+
+        # Every shared pin on these nets, and the links they make back to each pin's first net
+        links = []
+        pins = {conn_id for net_id in nets for conn_id in self._net_pins(state, net_id) if conn_id in state.shared_pins}
+        for conn_id in pins:
+            occurrences = state.pin_to_nets[conn_id]
+            first = occurrences[0][0]
+            links.extend(
+                (net_position[net_id], index, net_position[first], conn_id)
+                for net_id, index in occurrences[1:]
+                if net_id != first
+            )
+        # Board order of the repeating slot, as DRCService walks them
+        links.sort()
+        for members, island_pins in shorted_islands(len(state.net_order), ((n, f, p) for n, _, f, p in links)):
+            net_ids = [state.net_order[net] for net in members]
+            issue = self._drc.short_circuit_issue(net_ids, island_pins)
+            state.shorts[net_ids[0]] = (net_ids, island_pins, issue)
+            for net_id in net_ids:
+                state.island_of[net_id] = net_ids[0]
+
+    @staticmethod
+    def _net_pins(state: _DesignState, net_id: str) -> Tuple[str, ...]:
+        signature = state.net_signatures.get(net_id)
+        return signature[1] if signature else ()
+
+    def _update_clearance(
+        self,
+        state: _DesignState,
+        touched: Iterable[str],
+        component_by_id: Dict[str, Component],
+    ) -> None:
+        """Re-index moved footprints and re-test them against their grid neighbours."""
+        touched = list(touched)
+        if not touched:
+            return
+
+        present = [component_by_id[c] for c in touched if c in component_by_id]
+        indices, boxes = component_bounding_boxes(present)
+
+        if state.grid is None:
+            margin = self._drc.clearance / 2
+            state.grid = DynamicGrid(suggest_cell_size(boxes, margin), margin=margin)
+        grid = state.grid
+
+        for component_id in touched:
+            grid.remove(component_id)
+            for pair in state.pairs_by_component.pop(component_id, set()):
+                state.clearance_pairs.pop(pair, None)
+                other = pair[1] if pair[0] == component_id else pair[0]
+                state.pairs_by_component.get(other, set()).discard(pair)
+
+        placed = [present[i].id for i in indices]
+        for component_id, box in zip(placed, boxes.tolist()):
+            grid.insert(component_id, box)
+
+        for component_id in placed:
+            box = grid.box(component_id)
+            for other in grid.neighbours(component_id):
+                pair = (component_id, other) if component_id < other else (other, component_id)
+                if pair in state.clearance_pairs:
+                    continue
+                gap = box_gap(box, grid.box(other))
+                if gap < self._drc.clearance:
+                    state.clearance_pairs[pair] = gap
+                    state.pairs_by_component.setdefault(pair[0], set()).add(pair)
+                    state.pairs_by_component.setdefault(pair[1], set()).add(pair)
+
+    def _collect(
+        self,
+        state: _DesignState,
+        board: Board,
+        component_by_id: Dict[str, Component],
+    ) -> List[Issue]:
+        """Assemble retained rule results in the same order as a full check."""
+        drc = self._drc
+        issues: List[Issue] = []
+
+        # Check 1: Unconnected nets
+        if state.unconnected:
+            issues.extend(state.unconnected[net.id] for net in board.nets if net.id in state.unconnected)
+
+        # Check 2: Short-circuit islands by first net, then isolated components in board order
+        if state.shorts:
+            net_position = {net_id: i for i, net_id in enumerate(state.net_order)}
+            islands = sorted(state.shorts.values(), key=lambda island: net_position[island[0][0]])
+            issues.extend(issue for _, _, issue in islands)
+        if state.isolated:
+            issues.extend(state.isolated[c.id] for c in board.components if c.id in state.isolated)
+
+        # Check 3: Missing board outline
+        if not board.outline:
+            issues.append(drc.missing_outline_issue(len(issues)))
+
+        # Check 4: Components outside board outline (if outline exists)
+        if board.outline and (state.no_position or state.out_of_bounds):
+            for results in (state.no_position, state.out_of_bounds):
+                issues.extend(results[c.id] for c in board.components if c.id in results)
+
+        # Check 5: Component clearance, in board order
+        if state.clearance_pairs:
+            position = {component.id: i for i, component in enumerate(board.components)}
+            ordered = []
+            for (a, b), gap in state.clearance_pairs.items():
+                first, second = (a, b) if position[a] < position[b] else (b, a)
+                ordered.append((position[first], position[second], first, second, gap))
+            ordered.sort()
+            issues.extend(
+                drc.clearance_issue(component_by_id[first], component_by_id[second], gap)
+                for _, _, first, second, gap in ordered
+            )
+
+        return issues
+
+
+# Singleton incremental checker for MVP (state lives in-process)
+incremental_drc_service = IncrementalDRCService()
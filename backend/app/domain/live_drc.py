@@ -0,0 +1,129 @@
+"""
+Live DRC sessions for interactive editing.
+SOLID: Single Responsibility - applies a stream of edits to one design and
+reports how its issue list changed, re-checking only what the edits touched.
+
+Transport (WebSocket), debouncing and scheduling live in the API layer; this
+module is synchronous and deterministic.
+"""
+
+import threading
+from collections import defaultdict
+from typing import Dict, List, Tuple
+
+from app.domain.changes import BoardChanges
+from app.domain.incremental_drc import IncrementalDRCService
+from app.domain.models import Design, Issue
+from app.domain.patching import DesignDelta, JsonPatchOperation, PatchResult, apply_patch
+from app.domain.services import DesignService
+
+
+def diff_issues(old: List[Issue], new: List[Issue]) -> Tuple[List[Issue], List[str]]:
+    """
+    (added, removed_ids) turning `old` into `new`.
+
+    Issue IDs are not guaranteed unique (e.g. on boards with duplicate net
+    or component IDs), so IDs are diffed as groups: if anything under an ID changed, that
+    ID is removed and every current issue with it is re-sent.
+    """
+    def grouped(issues: List[Issue]) -> Dict[str, List[str]]:
+        groups: Dict[str, List[str]] = defaultdict(list)
+        for issue in issues:
+            groups[issue.id].append(issue.model_dump_json())
+        return groups
+
+    before, after = grouped(old), grouped(new)
+    changed = {issue_id for issue_id in before.keys() | after.keys() if before.get(issue_id) != after.get(issue_id)}
+    removed = [issue_id for issue_id in before if issue_id in changed]
+    added = [issue for issue in new if issue.id in changed]
+    return added, removed
+
+
+class LiveDRCSession:
+    """
+    One editor's live view of a design.
+
+    Edits are applied to an in-memory copy as they arrive; `flush` persists
+    the result once, runs incremental DRC over the coalesced changes and
+    returns the issue delta since the previous flush.
+
+    Saves are conditional on the revision the session last loaded or saved,
+    so an edit made elsewhere meanwhile (another session, a PUT, a job) is
+    never overwritten: `flush` raises RevisionConflict and the caller
+    `resync`s.
+
+    `apply`, `take_pending` and `resync` may run in different worker threads;
+    they are serialized by a lock so an edit never lands on a discarded copy.
+    """
+
+    def __init__(
+        self,
+        design: Design,
+        service: DesignService,
+        incremental: IncrementalDRCService,
+        revision: int | None = None,
+    ) -> None:
+        self.design = design
+        self.revision = revision
+        self._service = service
+        self._incremental = incremental
+        self._pending: BoardChanges | None = BoardChanges()
+        self._dirty = False
+        self._lock = threading.Lock()
+        self.issues: List[Issue] = []
+
+    @property
+    def dirty(self) -> bool:
+        """True if edits arrived since the last flush."""
+        return self._dirty
+
+    def start(self) -> List[Issue]:
+        """Check the design as loaded; returns the initial issue list."""
+        self.issues = self._incremental.check_design(self.design, owner=self)
+        return self.issues
+
+    def resync(self) -> List[Issue]:
+        """
+        Reload the stored design, dropping unsaved edits, and return its issues
+        (raises ValueError if the design has been deleted).
+        """
+        with self._lock:
+            # Revision first: a save in between only makes the next flush conflict again
+            self.revision = self._service.get_design_revision(self.design.id)
+            self.design = self._service.get_design(self.design.id)
+            self._pending = BoardChanges()
+            self._dirty = False
+        return self.start()
+
+    def apply(self, operations: List[JsonPatchOperation] | DesignDelta) -> PatchResult:
+        """Apply one edit event (raises PatchError; the design is then unchanged)."""
+        with self._lock:
+            self.design, result, changes = apply_patch(self.design, operations)
+            if changes is None or self._pending is None:
+                self._pending = None  # Unknown extent: the checker diffs signatures instead
+            else:
+                self._pending.merge(changes)
+            self._dirty = True
+        return result
+
+    def take_pending(self) -> Tuple[Design, BoardChanges | None]:
+        """Snapshot the design and its coalesced changes, and start a new batch."""
+        with self._lock:
+            snapshot, changes = self.design, self._pending
+            self._pending = BoardChanges()
+            self._dirty = False
+        return snapshot, changes
+
+    def flush(self, snapshot: Design, changes: BoardChanges | None) -> Tuple[List[Issue], List[str]]:
+        """
+        Persist a snapshot, re-check what changed and return (added, removed_ids).
+
+        Raises RevisionConflict, without saving, if the stored design changed
+        since this session's revision.
+        """
+        issues = self._incremental.check_design(snapshot, changes, owner=self)
+        snapshot.issues = issues
+        self.revision = self._service.save_design(snapshot, self.revision)
+        added, removed = diff_issues(self.issues, issues)
+        self.issues = issues
+        return added, removed
@@ -0,0 +1,254 @@
+"""
+Pattern rules behind MLService suggestions.
+SOLID: Open/Closed - new detectors are added as rules over a shared
+classification of the design, without new full-board scans.
+
+`classify_design` converts the board to columnar arrays once and groups
+components by interned type code; every rule then reads the precomputed groups.
+"""
+
+from dataclasses import dataclass, field
+from typing import Dict, List
+
+import numpy as np
+
+from app.domain.autoplacer import PlacementResult
+from app.domain.board_arrays import BoardArrays
+from app.domain.models import Component, Design, Net
+
+# Component types treated as ICs that need their inputs tied off
+IC_TYPES = frozenset({"mcu", "ic", "microcontroller", "gate"})
+# Component types that should have a decoupling capacitor nearby
+DECOUPLED_TYPES = frozenset({"mcu", "ic", "microcontroller"})
+POWER_NET_NAMES = frozenset({"VCC", "VDD", "POWER"})
+GROUND_NET_NAMES = frozenset({"GND", "GROUND"})
+# Smallest wire-length saving worth offering as a one-click placement
+MIN_PLACEMENT_GAIN = 0.05
+
+
+@dataclass
+class DesignFacts:
+    """Everything rules need to know about a design, computed in one pass."""
+    design: Design
+    arrays: BoardArrays
+    # Distinct nets per component, indexed like arrays.component_ids
+    net_counts: np.ndarray
+    leds: List[Component] = field(default_factory=list)
+    resistors: List[Component] = field(default_factory=list)
+    capacitors: List[Component] = field(default_factory=list)
+    ics: List[Component] = field(default_factory=list)
+    decoupled_ics: List[Component] = field(default_factory=list)
+    positioned: List[Component] = field(default_factory=list)
+    power_nets: List[Net] = field(default_factory=list)
+    ground_nets: List[Net] = field(default_factory=list)
+    # Power and ground nets together, in board order
+    supply_nets: List[Net] = field(default_factory=list)
+    # Autoplacer proposal, when the caller ran one (see MLService.analyze)
+    placement: PlacementResult | None = None
+
+
+def classify_design(design: Design) -> DesignFacts:
+    """Group components by type code and nets by role in one pass over each."""
+    arrays = BoardArrays.build(design.board)
+    facts = DesignFacts(design=design, arrays=arrays, net_counts=arrays.component_net_counts())
+    components = design.board.components
+
+    def pick(mask: np.ndarray) -> List[Component]:
+        return [components[k] for k in np.flatnonzero(mask).tolist()]
+
+    facts.leds = pick(arrays.type_mask("led"))
+    facts.resistors = pick(arrays.type_mask("resistor"))
+    facts.capacitors = pick(arrays.type_mask_where(lambda kind: "cap" in kind))
+    facts.ics = pick(arrays.type_mask(*IC_TYPES))
+    facts.decoupled_ics = pick(arrays.type_mask(*DECOUPLED_TYPES))
+    facts.positioned = pick(arrays.placed)
+
+    for net in design.board.nets:
+        if not net.name:
+            continue
+        name = net.name.upper()
+        if name in POWER_NET_NAMES:
+            facts.power_nets.append(net)
+            facts.supply_nets.append(net)
+        elif name in GROUND_NET_NAMES:
+            facts.ground_nets.append(net)
+            facts.supply_nets.append(net)
+
+    return facts
+
+
+class SuggestionRule:
+    """A detector that turns design facts into suggestions."""
+
+    name = "rule"
+
+    def suggest(self, facts: DesignFacts) -> List[Dict]:
+        raise NotImplementedError
+
+
+class FloatingInputsRule(SuggestionRule):
+    """Detect unconnected IC input pins (common beginner error)."""
+
+    name = "floating_inputs"
+
+    def suggest(self, facts: DesignFacts) -> List[Dict]:
+        suggestions: List[Dict] = []
+        for ic in facts.ics:
+            # Check if IC has unconnected pins (simplified: if net count < expected)
+            if facts.net_counts[facts.arrays.component_index[ic.id]] < 2:  # ICs typically need power, ground, and signals
+                suggestions.append({
+                    "id": f"floating_input_{ic.id}",
+                    "type": "component",
+                    "message": f"Component '{ic.id}' may have unconnected input pins. Make sure all required pins are connected (power, ground, and signal pins).",
+                    "action": {
+                        "type": "highlight_component",
+                        "params": {"component_id": ic.id}
+                    },
+                    "related_ids": [ic.id]
+                })
+        return suggestions
+
+
+class MissingDecouplingRule(SuggestionRule):
+    """Detect missing decoupling capacitors near ICs."""
+
+    name = "missing_decoupling"
+
+    def suggest(self, facts: DesignFacts) -> List[Dict]:
+        # Simplified check: any capacitor on the board counts
+        if facts.capacitors:
+            return []
+        return [
+            {
+                "id": f"decoupling_{ic.id}",
+                "type": "component",
+                "message": f"Consider adding a decoupling capacitor (0.1µF) near '{ic.id}' to filter power supply noise. This is a best practice for stable operation.",
+                "action": {
+                    "type": "add_component",
+                    "params": {"type": "capacitor", "value": "0.1µF", "near": ic.id}
+                },
+                "related_ids": [ic.id]
+            }
+            for ic in facts.decoupled_ics
+        ]
+
+
+class PowerGroundWidthRule(SuggestionRule):
+    """Check if power/ground nets are wide enough (layout concern)."""
+
+    name = "power_ground_width"
+
+    def suggest(self, facts: DesignFacts) -> List[Dict]:
+        if not facts.supply_nets:
+            return []
+        return [{
+            "id": "power_width_hint",
+            "type": "routing",
+            "message": "Power and ground traces should be wider than signal traces (typically 0.5mm or more) to handle higher current. Make sure to set appropriate trace widths in Board view.",
+            "action": None,
+            "related_ids": [n.id for n in facts.supply_nets]
+        }]
+
+
+class MissingPowerNetRule(SuggestionRule):
+    """Suggest a power net when the design has none."""
+
+    name = "missing_power_net"
+
+    def suggest(self, facts: DesignFacts) -> List[Dict]:
+        if facts.power_nets:
+            return []
+        return [{
+            "id": "suggest_power_net",
+            "type": "component",
+            "message": "Consider adding a power net (VCC/VDD) for your circuit. Most components need power to work.",
+            "action": {
+                "type": "add_net",
+                "params": {"name": "VCC"}
+            },
+            "related_ids": []
+        }]
+
+
+class MissingGroundNetRule(SuggestionRule):
+    """Suggest a ground net when the design has none."""
+
+    name = "missing_ground_net"
+
+    def suggest(self, facts: DesignFacts) -> List[Dict]:
+        if facts.ground_nets:
+            return []
+        return [{
+            "id": "suggest_ground_net",
+            "type": "component",
+            "message": "Consider adding a ground net (GND). All circuits need a common ground reference.",
+            "action": {
+                "type": "add_net",
+                "params": {"name": "GND"}
+            },
+            "related_ids": []
+        }]
+
+
+class LedResistorRule(SuggestionRule):
+    """Check for LEDs without a current-limiting resistor."""
+
+    name = "led_resistor"
+
+    def suggest(self, facts: DesignFacts) -> List[Dict]:
+        if not facts.leds or facts.resistors:
+            return []
+        return [{
+            "id": "suggest_led_resistor",
+            "type": "component",
+            "message": "LEDs need a current-limiting resistor to prevent damage. Add a resistor in series with your LED.",
+            "action": {
+                "type": "add_component",
+                "params": {"type": "resistor", "value": "220Ω"}
+            },
+            "related_ids": [led.id for led in facts.leds]
+        }]
+
+
+class PlacementGroupingRule(SuggestionRule):
+    """
+    Suggest grouping related components once parts are placed.
+
+    When the facts carry an autoplacer proposal that saves enough wire, the
+    suggestion's action moves the components to it.
+    """
+
+    name = "placement_grouping"
+
+    def suggest(self, facts: DesignFacts) -> List[Dict]:
+        if len(facts.positioned) <= 1:
+            return []
+        message = "Group related components together for shorter traces and better layout."
+        placement = facts.placement
+        if placement is None or placement.improvement < MIN_PLACEMENT_GAIN:
+            return [{
+                "id": "suggest_placement",
+                "type": "placement",
+                "message": message,
+                "action": None,
+                "related_ids": []
+            }]
+        return [{
+            "id": "suggest_placement",
+            "type": "placement",
+            "message": f"{message} The suggested placement shortens the wiring by about {placement.improvement:.0%}.",
+            "action": placement.action(),
+            "related_ids": list(placement.positions)
+        }]
+
+
+# Rules in the order their suggestions are reported
+DEFAULT_RULES: List[SuggestionRule] = [
+    FloatingInputsRule(),
+    MissingDecouplingRule(),
+    PowerGroundWidthRule(),
+    MissingPowerNetRule(),
+    MissingGroundNetRule(),
+    LedResistorRule(),
+    PlacementGroupingRule(),
+]
@@ -3,9 +3,15 @@ ML services for intelligent design assistance.
 SOLID: Single Responsibility - handles ML-powered suggestions only.
 """
 
-from typing import List, Dict
+from typing import List, Dict, Sequence
+from app.domain.autoplacer import AutoplacerService, autoplacer_service
+from app.domain.ml_rules import DEFAULT_RULES, DesignFacts, SuggestionRule, classify_design
 from app.domain.models import Design, Issue, IssueSeverity
 
+# Largest board that gets an autoplacer proposal when one is requested; bigger
+# boards take seconds to place and go through the autoplace job instead
+MAX_SUGGESTED_PLACEMENT_COMPONENTS = 2_000
+
 
 class MLSuggestion:
     """ML-generated suggestion."""
@@ -35,83 +41,67 @@ class MLService:
     - LEDs without current-limiting resistors
     - Floating inputs
     - Missing decoupling capacitors
+
+    Detectors are SuggestionRule objects run over one DesignFacts
+    classification; pass `rules` to add or replace detectors. `placer`
+    proposes the placement behind the placement suggestion when a caller
+    asks for one with `placement=True` (None disables it).
     """
     
-    def get_suggestions(self, design: Design) -> List[Dict]:
+    def __init__(
+        self,
+        rules: Sequence[SuggestionRule] | None = None,
+        placer: AutoplacerService | None = autoplacer_service,
+    ) -> None:
+        self._rules = list(DEFAULT_RULES if rules is None else rules)
+        self._placer = placer
+
+    @property
+    def rules(self) -> List[SuggestionRule]:
+        """Detectors run by get_suggestions, in report order."""
+        return list(self._rules)
+
+    def analyze(self, design: Design, placement: bool = False) -> DesignFacts:
+        """
+        Classify the design once; the result can be reused across calls.
+        `placement` also runs the placer for a proposed layout, which costs
+        far more than the classification and is off for coaching calls.
+        """
+        facts = classify_design(design)
+        board = design.board
+        if (
+            placement
+            and self._placer is not None
+            and len(board.outline) >= 3
+            and 1 < len(facts.positioned)
+            and len(board.components) <= MAX_SUGGESTED_PLACEMENT_COMPONENTS
+        ):
+            facts.placement = self._placer.place(board)
+        return facts
+    
+    def get_suggestions(
+        self, design: Design, facts: DesignFacts | None = None, placement: bool = False
+    ) -> List[Dict]:
         """
         Get ML-powered suggestions for design improvements.
         Returns actionable hints for placement, routing, component selection.
         Uses pattern-based detection for common beginner errors.
+        `placement` attaches a proposed layout to the placement suggestion.
         """
+        facts = facts or self.analyze(design, placement)
         suggestions: List[Dict] = []
-        
-        # Pattern 1: Check for floating inputs (unconnected IC inputs)
-        suggestions.extend(self._detect_floating_inputs(design))
-        
-        # Pattern 2: Missing decoupling capacitors near ICs
-        suggestions.extend(self._detect_missing_decoupling(design))
-        
-        # Pattern 3: Power/ground net width issues
-        suggestions.extend(self._check_power_ground_widths(design))
-        
-        # Suggestion 1: Check if power/ground nets exist
-        power_nets = [n for n in design.board.nets if n.name and n.name.upper() in ["VCC", "VDD", "POWER"]]
-        ground_nets = [n for n in design.board.nets if n.name and n.name.upper() in ["GND", "GROUND"]]
-        
-        if not power_nets:
-            suggestions.append({
-                "id": "suggest_power_net",
-                "type": "component",
-                "message": "Consider adding a power net (VCC/VDD) for your circuit. Most components need power to work.",
-                "action": {
-                    "type": "add_net",
-                    "params": {"name": "VCC"}
-                },
-                "related_ids": []
-            })
-        
-        if not ground_nets:
-            suggestions.append({
-                "id": "suggest_ground_net",
-                "type": "component",
-                "message": "Consider adding a ground net (GND). All circuits need a common ground reference.",
-                "action": {
-                    "type": "add_net",
-                    "params": {"name": "GND"}
-                },
-                "related_ids": []
-            })
-        
-        # Suggestion 2: Check for LED without current-limiting resistor
-        leds = [c for c in design.board.components if c.type.lower() == "led"]
-        resistors = [c for c in design.board.components if c.type.lower() == "resistor"]
-        
-        if leds and not resistors:
-            suggestions.append({
-                "id": "suggest_led_resistor",
-                "type": "component",
-                "message": "LEDs need a current-limiting resistor to prevent damage. Add a resistor in series with your LED.",
-                "action": {
-                    "type": "add_component",
-                    "params": {"type": "resistor", "value": "220Ω"}
-                },
-                "related_ids": [led.id for led in leds]
-            })
-        
-        # Suggestion 3: Placement optimization (if components have positions)
-        positioned_components = [c for c in design.board.components if c.position]
-        if len(positioned_components) > 1:
-            # Suggest grouping related components
-            suggestions.append({
-                "id": "suggest_placement",
-                "type": "placement",
-                "message": "Group related components together for shorter traces and better layout.",
-                "action": None,
-                "related_ids": []
-            })
-        
+        for rule in self._rules:
+            suggestions.extend(rule.suggest(facts))
         return suggestions
     
+    def get_analysis(self, design: Design) -> Dict:
+        """Suggestions and next action from a single classification pass."""
+        facts = self.analyze(design)
+        return {
+            "suggestions": self.get_suggestions(design, facts),
+            "next_action": self.suggest_next_action(design, facts),
+        }
+    
     def explain_error(self, error: str, context: Dict) -> Dict:
         """
         Explain a DRC error in beginner-friendly terms.
@@ -171,7 +161,7 @@ class MLService:
             ]
         }
     
-    def suggest_next_action(self, design: Design) -> Dict:
+    def suggest_next_action(self, design: Design, facts: DesignFacts | None = None) -> Dict:
         """
         Suggest the next logical action based on current design state.
         Used for wizard flow and smart coaching.
@@ -203,7 +193,7 @@ class MLService:
             }
         
         # If board outline exists but components not placed, suggest placement
-        positioned = [c for c in design.board.components if c.position]
+        positioned = facts.positioned if facts else [c for c in design.board.components if c.position]
         if design.board.outline and len(positioned) < len(design.board.components):
             return {
                 "action": "place_footprints",
@@ -217,68 +207,3 @@ class MLService:
             "message": "Now route the traces! Connect the pads according to your schematic connections.",
             "step": 5
         }
-    
-    def _detect_floating_inputs(self, design: Design) -> List[Dict]:
-        """Detect unconnected IC input pins (common beginner error)."""
-        suggestions: List[Dict] = []
-        
-        # Find IC components (MCU, logic gates, etc.)
-        ics = [c for c in design.board.components if c.type.lower() in ['mcu', 'ic', 'microcontroller', 'gate']]
-        
-        for ic in ics:
-            # Check if IC has unconnected pins (simplified: if net count < expected)
-            ic_nets = [n for n in design.board.nets if any(ic.id in conn for conn in n.connection_ids)]
-            if len(ic_nets) < 2:  # ICs typically need power, ground, and signals
-                suggestions.append({
-                    "id": f"floating_input_{ic.id}",
-                    "type": "component",
-                    "message": f"Component '{ic.id}' may have unconnected input pins. Make sure all required pins are connected (power, ground, and signal pins).",
-                    "action": {
-                        "type": "highlight_component",
-                        "params": {"component_id": ic.id}
-                    },
-                    "related_ids": [ic.id]
-                })
-        
-        return suggestions
-    
-    def _detect_missing_decoupling(self, design: Design) -> List[Dict]:
-        """Detect missing decoupling capacitors near ICs."""
-        suggestions: List[Dict] = []
-        
-        ics = [c for c in design.board.components if c.type.lower() in ['mcu', 'ic', 'microcontroller']]
-        capacitors = [c for c in design.board.components if 'cap' in c.type.lower() or 'capacitor' in c.type.lower()]
-        
-        for ic in ics:
-            # Check if there's a capacitor near this IC (simplified check)
-            if len(capacitors) == 0:
-                suggestions.append({
-                    "id": f"decoupling_{ic.id}",
-                    "type": "component",
-                    "message": f"Consider adding a decoupling capacitor (0.1µF) near '{ic.id}' to filter power supply noise. This is a best practice for stable operation.",
-                    "action": {
-                        "type": "add_component",
-                        "params": {"type": "capacitor", "value": "0.1µF", "near": ic.id}
-                    },
-                    "related_ids": [ic.id]
-                })
-        
-        return suggestions
-    
-    def _check_power_ground_widths(self, design: Design) -> List[Dict]:
-        """Check if power/ground nets are wide enough (layout concern)."""
-        suggestions: List[Dict] = []
-        
-        power_nets = [n for n in design.board.nets if n.name and n.name.upper() in ['VCC', 'VDD', 'POWER', 'GND', 'GROUND']]
-        
-        if len(power_nets) > 0:
-            suggestions.append({
-                "id": "power_width_hint",
-                "type": "routing",
-                "message": "Power and ground traces should be wider than signal traces (typically 0.5mm or more) to handle higher current. Make sure to set appropriate trace widths in Board view.",
-                "action": None,
-                "related_ids": [n.id for n in power_nets]
-            })
-        
-        return suggestions
-
@@ -19,6 +19,8 @@ try:
         Component,
         ComponentProperty,
         Net,
+        Trace,
+        Via,
         Board,
         Issue,
         IssueSeverity,
@@ -52,11 +54,27 @@ except ImportError:
         connection_ids: List[str] = Field(default_factory=list)
         name: Optional[str] = None
 
+    class Trace(BaseModel):
+        id: str
+        net_id: str
+        layer: int = Field(default=1)
+        width: float = 0.25
+        points: List[List[float]] = Field(default_factory=list)
+
+    class Via(BaseModel):
+        id: str
+        net_id: str
+        position: List[float]
+        diameter: float = 0.6
+        drill: float = 0.3
+
     class Board(BaseModel):
         outline: List[List[float]] = Field(default_factory=list)
         components: List[Component] = Field(default_factory=list)
         nets: List[Net] = Field(default_factory=list)
         layers: int = Field(default=1)
+        traces: List[Trace] = Field(default_factory=list)
+        vias: List[Via] = Field(default_factory=list)
 
     class Issue(BaseModel):
         id: str
@@ -78,6 +96,8 @@ __all__ = [
     "Component",
     "ComponentProperty",
     "Net",
+    "Trace",
+    "Via",
     "Board",
     "Issue",
     "IssueSeverity",
@@ -0,0 +1,174 @@
+"""
+Footprint pad layouts.
+SOLID: Single Responsibility - maps a component's pins to copper pads, for
+manufacturing export and for anything that needs pin coordinates.
+
+Pads are generated from the component type and its footprint size, so they
+always sit inside the extent DRC checks. Pins are numbered "1".."n"; common
+polarity names ("anode", "cathode", "+", "-") alias pins 1 and 2.
+"""
+
+import math
+from dataclasses import dataclass
+from functools import lru_cache
+from typing import Dict, List, Tuple
+
+from app.domain.footprints import footprint_size
+from app.domain.models import Component
+
+HEADER_PITCH = 2.54
+THT_PAD_DIAMETER = 1.7
+THT_DRILL = 1.0
+
+# Names commonly used for the pins of polarized two-terminal parts
+PIN_ALIASES: Dict[str, str] = {
+    "anode": "1",
+    "a": "1",
+    "+": "1",
+    "cathode": "2",
+    "k": "2",
+    "-": "2",
+}
+
+
+@dataclass(frozen=True)
+class Pad:
+    """One copper pad, relative to the component center at rotation 0 (mm)."""
+    name: str
+    x: float
+    y: float
+    width: float
+    height: float
+    # Plated hole diameter for through-hole pads; None for surface-mount pads
+    drill: float | None = None
+
+    @property
+    def round(self) -> bool:
+        return self.drill is not None
+
+
+def _two_terminal(width: float, height: float) -> List[Pad]:
+    pad_w = width * 0.3
+    offset = (width - pad_w) / 2
+    return [Pad("1", -offset, 0.0, pad_w, height), Pad("2", offset, 0.0, pad_w, height)]
+
+
+def _sot23(width: float, height: float) -> List[Pad]:
+    row = height / 2 - 0.4
+    return [
+        Pad("1", -0.95, row, 0.6, 0.7),
+        Pad("2", 0.95, row, 0.6, 0.7),
+        Pad("3", 0.0, -row, 0.6, 0.7),
+    ]
+
+
+def _header(width: float, height: float) -> List[Pad]:
+    count = max(1, round(height / HEADER_PITCH))
+    top = -(count - 1) * HEADER_PITCH / 2
+    return [
+        Pad(str(i + 1), 0.0, top + i * HEADER_PITCH, THT_PAD_DIAMETER, THT_PAD_DIAMETER, THT_DRILL)
+        for i in range(count)
+    ]
+
+
+def _connector(width: float, height: float) -> List[Pad]:
+    return [
+        Pad("1", 0.0, -height / 4, 2.0, 2.0, 1.2),
+        Pad("2", 0.0, height / 4, 2.0, 2.0, 1.2),
+    ]
+
+
+def _switch(width: float, height: float) -> List[Pad]:
+    dx, dy = width * 0.375, height * 0.375
+    corners = [(-dx, -dy), (dx, -dy), (-dx, dy), (dx, dy)]
+    return [Pad(str(i + 1), x, y, 1.8, 1.8, THT_DRILL) for i, (x, y) in enumerate(corners)]
+
+
+def _dual_row(width: float, height: float, per_side: int = 4, pitch: float = 1.27) -> List[Pad]:
+    """SOIC-style: pins down the left edge, then up the right edge."""
+    pad_w, pad_h = 1.5, min(0.6, pitch * 0.6)
+    x = width / 2 - pad_w / 2
+    top = -(per_side - 1) * pitch / 2
+    left = [Pad(str(i + 1), -x, top + i * pitch, pad_w, pad_h) for i in range(per_side)]
+    right = [Pad(str(per_side + i + 1), x, -top - i * pitch, pad_w, pad_h) for i in range(per_side)]
+    return left + right
+
+
+def _quad(width: float, height: float, per_side: int = 8, pitch: float = 0.8) -> List[Pad]:
+    """QFP-style: counter-clockwise from the top of the left edge."""
+    long, short = 1.2, min(0.45, pitch * 0.6)
+    span = (per_side - 1) * pitch / 2
+    pads: List[Pad] = []
+    sides = [
+        lambda t: (-width / 2 + long / 2, -span + t, long, short),  # left, downwards
+        lambda t: (-span + t, height / 2 - long / 2, short, long),  # bottom, rightwards
+        lambda t: (width / 2 - long / 2, span - t, long, short),  # right, upwards
+        lambda t: (span - t, -height / 2 + long / 2, short, long),  # top, leftwards
+    ]
+    for side in sides:
+        for i in range(per_side):
+            x, y, w, h = side(i * pitch)
+            pads.append(Pad(str(len(pads) + 1), x, y, w, h))
+    return pads
+
+
+_LAYOUTS = {
+    "resistor": _two_terminal,
+    "capacitor": _two_terminal,
+    "led": _two_terminal,
+    "diode": _two_terminal,
+    "transistor": _sot23,
+    "header": _header,
+    "connector": _connector,
+    "button": _switch,
+    "switch": _switch,
+    "ic": _dual_row,
+    "gate": _dual_row,
+    "mcu": _quad,
+    "microcontroller": _quad,
+}
+
+
+@lru_cache(maxsize=1024)
+def _layout(kind: str, width: float, height: float) -> Tuple[Pad, ...]:
+    return tuple(_LAYOUTS.get(kind, _two_terminal)(width, height))
+
+
+def footprint_key(component: Component) -> Tuple[str, float, float]:
+    """(kind, width, height): components with equal keys have identical pads."""
+    width, height = footprint_size(component)
+    return component.type.lower(), width, height
+
+
+def footprint_pads(component: Component) -> Tuple[Pad, ...]:
+    """Pads of a component at rotation 0; shared between components of one footprint."""
+    return _layout(*footprint_key(component))
+
+
+def rotate(x: float, y: float, degrees: float) -> Tuple[float, float]:
+    """Rotate an offset counter-clockwise (in board coordinates) about the origin."""
+    if not degrees:
+        return x, y
+    theta = math.radians(degrees)
+    cos_t, sin_t = math.cos(theta), math.sin(theta)
+    return x * cos_t - y * sin_t, x * sin_t + y * cos_t
+
+
+def find_pad(component: Component, pin: str) -> Pad | None:
+    """The pad a pin name (or polarity alias) refers to, or None if the footprint has no such pin."""
+    name = PIN_ALIASES.get(pin.lower(), pin)
+    for pad in footprint_pads(component):
+        if pad.name == name:
+            return pad
+    return None
+
+
+def pin_position(component: Component, pin: str) -> Tuple[float, float] | None:
+    """Board coordinates of a pin's pad center, or None if unplaced or unknown."""
+    if not component.position or len(component.position) < 2:
+        return None
+    pad = find_pad(component, pin)
+    if pad is None:
+        return None
+    dx, dy = rotate(pad.x, pad.y, component.rotation or 0.0)
+    return component.position[0] + dx, component.position[1] + dy
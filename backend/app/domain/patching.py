@@ -0,0 +1,499 @@
+"""
+Partial design updates: RFC 6902 JSON Patch and domain delta operations.
+SOLID: Single Responsibility - applies small edits to a design without
+re-validating the whole board.
+
+Edits touch only the entities they address. A patch on
+/board/components/12/position re-validates component 12, not the board, so
+the cost of an edit is independent of design size (apart from an O(n) lookup
+by component ID for domain ops).
+
+Patches are atomic: they run against a shallow working copy whose entity
+lists are copied and whose entities are replaced rather than mutated, so a
+failing operation leaves the stored design untouched.
+"""
+
+import copy
+from typing import Annotated, Any, Dict, List, Literal, Optional, Tuple, Union
+
+from pydantic import BaseModel, Field, TypeAdapter, ValidationError
+
+from app.domain.changes import BoardChanges
+from app.domain.models import Component, ComponentProperty, Design, Net
+
+# Board lists whose items are addressed individually (by index or ID)
+_ENTITY_LISTS: Dict[str, type[BaseModel]] = {"components": Component, "nets": Net}
+
+_adapters: Dict[Tuple[type, str], TypeAdapter] = {}
+
+
+class PatchError(ValueError):
+    """A patch operation could not be applied (bad path, value or op)."""
+
+
+class PatchTestFailed(PatchError):
+    """A JSON Patch "test" operation did not match."""
+
+
+# RFC 6902 JSON Patch
+
+
+class JsonPatchOperation(BaseModel):
+    """One RFC 6902 operation."""
+    op: Literal["add", "remove", "replace", "move", "copy", "test"]
+    path: str
+    value: Any = None
+    from_: Optional[str] = Field(default=None, alias="from")
+
+    model_config = {"populate_by_name": True}
+
+
+# Domain delta operations
+
+
+class MoveComponent(BaseModel):
+    """Place a component at a new position (and optionally rotation)."""
+    op: Literal["move_component"]
+    component_id: str
+    position: List[float]
+    rotation: Optional[float] = None
+
+
+class SetComponentProperty(BaseModel):
+    """Create or overwrite one component property."""
+    op: Literal["set_component_property"]
+    component_id: str
+    name: str
+    value: float | str
+    unit: Optional[str] = None
+
+
+class AddComponent(BaseModel):
+    """Append a component to the board."""
+    op: Literal["add_component"]
+    component: Component
+
+
+class RemoveComponent(BaseModel):
+    """Remove a component (nets referencing its pins are left as they are)."""
+    op: Literal["remove_component"]
+    component_id: str
+
+
+class AddNet(BaseModel):
+    """Append a net to the board."""
+    op: Literal["add_net"]
+    net: Net
+
+
+class RemoveNet(BaseModel):
+    """Remove a net."""
+    op: Literal["remove_net"]
+    net_id: str
+
+
+class ConnectPin(BaseModel):
+    """Add a pin (e.g. "R1.1") to a net."""
+    op: Literal["connect"]
+    net_id: str
+    connection_id: str
+
+
+class DisconnectPin(BaseModel):
+    """Remove a pin from a net."""
+    op: Literal["disconnect"]
+    net_id: str
+    connection_id: str
+
+
+class RenameDesign(BaseModel):
+    """Change the design name."""
+    op: Literal["rename"]
+    name: str
+
+
+class SetOutline(BaseModel):
+    """Replace the board outline polygon."""
+    op: Literal["set_outline"]
+    outline: List[List[float]]
+
+
+DeltaOperation = Annotated[
+    Union[
+        MoveComponent,
+        SetComponentProperty,
+        AddComponent,
+        RemoveComponent,
+        AddNet,
+        RemoveNet,
+        ConnectPin,
+        DisconnectPin,
+        RenameDesign,
+        SetOutline,
+    ],
+    Field(discriminator="op"),
+]
+
+
+class DesignDelta(BaseModel):
+    """Domain delta request body: a list of edit operations applied in order."""
+    ops: List[DeltaOperation]
+
+
+class PatchResult(BaseModel):
+    """Changed parts of a design after a patch (null marks a removed entity)."""
+    id: str
+    components: Dict[str, Optional[Component]] = Field(default_factory=dict)
+    nets: Dict[str, Optional[Net]] = Field(default_factory=dict)
+    fields: Dict[str, Any] = Field(
+        default_factory=dict,
+        description="Other changed fields by JSON pointer, e.g. '/name' or '/board/outline'",
+    )
+
+
+# JSON pointer helpers (RFC 6901) over plain JSON values
+
+
+def parse_pointer(pointer: str) -> List[str]:
+    """Split a JSON pointer into unescaped reference tokens."""
+    if pointer == "":
+        return []
+    if not pointer.startswith("/"):
+        raise PatchError(f"Invalid JSON pointer: {pointer!r}")
+    return [token.replace("~1", "/").replace("~0", "~") for token in pointer[1:].split("/")]
+
+
+def _list_index(items: list, token: str, allow_end: bool) -> int:
+    if token == "-" and allow_end:
+        return len(items)
+    if not token.isdigit() or (len(token) > 1 and token[0] == "0"):
+        raise PatchError(f"Invalid array index: {token!r}")
+    index = int(token)
+    if index > len(items) or (index == len(items) and not allow_end):
+        raise PatchError(f"Array index out of range: {index}")
+    return index
+
+
+def _json_parent(doc: Any, tokens: List[str]) -> Any:
+    target = doc
+    for token in tokens[:-1]:
+        if isinstance(target, dict):
+            if token not in target:
+                raise PatchError(f"Path not found: {token!r}")
+            target = target[token]
+        elif isinstance(target, list):
+            target = target[_list_index(target, token, allow_end=False)]
+        else:
+            raise PatchError(f"Cannot traverse into {type(target).__name__}")
+    return target
+
+
+def json_get(doc: Any, tokens: List[str]) -> Any:
+    """Value at `tokens` inside a JSON document."""
+    if not tokens:
+        return doc
+    parent = _json_parent(doc, tokens)
+    token = tokens[-1]
+    if isinstance(parent, dict):
+        if token not in parent:
+            raise PatchError(f"Path not found: {token!r}")
+        return parent[token]
+    if isinstance(parent, list):
+        return parent[_list_index(parent, token, allow_end=False)]
+    raise PatchError(f"Cannot traverse into {type(parent).__name__}")
+
+
+def json_apply(doc: Any, op: str, tokens: List[str], value: Any = None) -> Any:
+    """Apply add/remove/replace at `tokens` in place; returns the (possibly new) root."""
+    if not tokens:
+        if op == "remove":
+            raise PatchError("Cannot remove the document root")
+        return value
+
+    parent = _json_parent(doc, tokens)
+    token = tokens[-1]
+    if isinstance(parent, dict):
+        if op != "add" and token not in parent:
+            raise PatchError(f"Path not found: {token!r}")
+        if op == "remove":
+            del parent[token]
+        else:
+            parent[token] = value
+    elif isinstance(parent, list):
+        index = _list_index(parent, token, allow_end=op == "add")
+        if op == "add":
+            parent.insert(index, value)
+        elif op == "remove":
+            del parent[index]
+        else:
+            parent[index] = value
+    else:
+        raise PatchError(f"Cannot traverse into {type(parent).__name__}")
+    return doc
+
+
+def _replaces_entity_lists(tokens: List[str]) -> bool:
+    """True for pointers that swap out a whole entity list (or the whole board)."""
+    return tokens == ["board"] or (len(tokens) == 2 and tokens[0] == "board" and tokens[1] in _ENTITY_LISTS)
+
+
+def _escape(token: str) -> str:
+    return token.replace("~", "~0").replace("/", "~1")
+
+
+def _adapter(owner: type[BaseModel], field: str) -> TypeAdapter:
+    key = (owner, field)
+    if key not in _adapters:
+        if field not in owner.model_fields:
+            raise PatchError(f"Unknown field: {field!r}")
+        _adapters[key] = TypeAdapter(owner.model_fields[field].annotation)
+    return _adapters[key]
+
+
+def _validate(adapter_or_model: Any, value: Any) -> Any:
+    try:
+        if isinstance(adapter_or_model, TypeAdapter):
+            return adapter_or_model.validate_python(value)
+        return adapter_or_model.model_validate(value)
+    except ValidationError as exc:
+        raise PatchError(str(exc)) from exc
+
+
+class _WorkingCopy:
+    """Shallow copy of a design that records which entities and fields changed."""
+
+    def __init__(self, design: Design) -> None:
+        self.design = design.model_copy()
+        self.design.board = design.board.model_copy()
+        for name in _ENTITY_LISTS:
+            setattr(self.design.board, name, list(getattr(design.board, name)))
+        self.changes = BoardChanges()
+        self.reordered = False
+        self.changed_fields: Dict[str, None] = {}
+
+    # Bookkeeping
+
+    def touch_entity(self, kind: str, entity_id: str) -> None:
+        if kind == "components":
+            self.changes.components.add(entity_id)
+        elif kind == "nets":
+            self.changes.nets.add(entity_id)
+
+    def touch_field(self, tokens: List[str]) -> None:
+        if tokens[:2] == ["board", "outline"] or tokens == ["board"]:
+            self.changes.outline = True
+        if _replaces_entity_lists(tokens):
+            self.touch_all_entities()
+            self.reordered = True
+        self.changed_fields["/" + "/".join(_escape(t) for t in tokens)] = None
+
+    def touch_all_entities(self) -> None:
+        for name in _ENTITY_LISTS:
+            for entity in getattr(self.design.board, name):
+                self.touch_entity(name, entity.id)
+
+    def index_of(self, kind: str, entity_id: str) -> int:
+        for index, entity in enumerate(getattr(self.design.board, kind)):
+            if entity.id == entity_id:
+                return index
+        raise PatchError(f"{kind[:-1].capitalize()} not found: {entity_id!r}")
+
+    # Pointer-addressed access
+
+    def _entity_scope(self, tokens: List[str]) -> Optional[Tuple[str, list, List[str]]]:
+        """(kind, entity list, tokens below the list) if `tokens` address a board entity list."""
+        if len(tokens) >= 3 and tokens[0] == "board" and tokens[1] in _ENTITY_LISTS:
+            return tokens[1], getattr(self.design.board, tokens[1]), tokens[2:]
+        return None
+
+    def _field_owner(self, tokens: List[str]) -> Tuple[BaseModel, str, List[str]]:
+        if tokens[0] == "board" and len(tokens) > 1:
+            return self.design.board, tokens[1], tokens[2:]
+        return self.design, tokens[0], tokens[1:]
+
+    def get(self, pointer: str) -> Any:
+        tokens = parse_pointer(pointer)
+        if not tokens:
+            return self.design.model_dump(mode="json")
+        scope = self._entity_scope(tokens)
+        if scope is not None:
+            kind, items, rest = scope
+            entity = items[_list_index(items, rest[0], allow_end=False)]
+            return json_get(entity.model_dump(mode="json"), rest[1:])
+        owner, field, rest = self._field_owner(tokens)
+        if field not in type(owner).model_fields:
+            raise PatchError(f"Path not found: {pointer!r}")
+        return json_get(_adapter(type(owner), field).dump_python(getattr(owner, field), mode="json"), rest)
+
+    def apply(self, op: str, pointer: str, value: Any = None) -> None:
+        """Apply add/remove/replace at a JSON pointer, re-validating only the addressed entity or field."""
+        tokens = parse_pointer(pointer)
+        if not tokens:
+            raise PatchError("Patching the whole document is not supported; use PUT")
+        if tokens == ["id"]:
+            raise PatchError("Design ID cannot be changed")
+
+        scope = self._entity_scope(tokens)
+        if scope is not None:
+            kind, items, rest = scope
+            model = _ENTITY_LISTS[kind]
+            if len(rest) == 1:
+                # Whole entity: insert, remove or swap one list item
+                index = _list_index(items, rest[0], allow_end=op == "add")
+                if op != "add":
+                    self.touch_entity(kind, items[index].id)
+                if op == "remove":
+                    del items[index]
+                    if index < len(items):
+                        self.reordered = True
+                    return
+                entity = _validate(model, value)
+                if op == "add":
+                    items.insert(index, entity)
+                    if index < len(items) - 1:
+                        self.reordered = True
+                else:
+                    items[index] = entity
+                self.touch_entity(kind, entity.id)
+                return
+
+            # Inside one entity: edit its JSON form and re-validate just that entity
+            index = _list_index(items, rest[0], allow_end=False)
+            old = items[index]
+            doc = json_apply(old.model_dump(mode="json"), op, rest[1:], value)
+            items[index] = _validate(model, doc)
+            self.touch_entity(kind, old.id)
+            self.touch_entity(kind, items[index].id)
+            return
+
+        owner, field, rest = self._field_owner(tokens)
+        adapter = _adapter(type(owner), field)
+        if _replaces_entity_lists(tokens):
+            self.touch_all_entities()  # Entities about to be replaced count as changed too
+        if not rest:
+            if op == "remove":
+                field_info = type(owner).model_fields[field]
+                if field_info.is_required():
+                    raise PatchError(f"Cannot remove required field: {pointer!r}")
+                value = field_info.get_default(call_default_factory=True)
+            setattr(owner, field, _validate(adapter, value))
+        else:
+            doc = json_apply(adapter.dump_python(getattr(owner, field), mode="json"), op, rest, value)
+            setattr(owner, field, _validate(adapter, doc))
+        self.touch_field(tokens[: 2 if owner is self.design.board else 1])
+
+    # Result
+
+    def result(self) -> PatchResult:
+        board = self.design.board
+        components = {c.id: c for c in board.components if c.id in self.changes.components}
+        nets = {n.id: n for n in board.nets if n.id in self.changes.nets}
+        fields = {}
+        for pointer in self.changed_fields:
+            tokens = parse_pointer(pointer)
+            if tokens[0] == "board" and len(tokens) > 1 and tokens[1] in _ENTITY_LISTS:
+                continue  # Reported per entity below
+            fields[pointer] = self.get(pointer)
+        return PatchResult(
+            id=self.design.id,
+            components={c: components.get(c) for c in sorted(self.changes.components)},
+            nets={n: nets.get(n) for n in sorted(self.changes.nets)},
+            fields=fields,
+        )
+
+    def board_changes(self) -> BoardChanges | None:
+        """Touched entities for incremental DRC, or None if net order may have changed."""
+        return None if self.reordered else self.changes
+
+
+def _apply_json_patch(work: _WorkingCopy, operation: JsonPatchOperation) -> None:
+    op = operation.op
+    if op in ("add", "replace", "test") and "value" not in operation.model_fields_set:
+        raise PatchError(f"'{op}' requires 'value'")
+    if op in ("add", "replace"):
+        work.apply(op, operation.path, operation.value)
+    elif op == "remove":
+        work.apply("remove", operation.path)
+    elif op == "test":
+        if work.get(operation.path) != operation.value:
+            raise PatchTestFailed(f"Test failed at {operation.path!r}")
+    else:
+        if operation.from_ is None:
+            raise PatchError(f"'{op}' requires 'from'")
+        value = copy.deepcopy(work.get(operation.from_))
+        if op == "move":
+            if operation.path.startswith(operation.from_ + "/"):
+                raise PatchError("Cannot move a value into one of its children")
+            work.apply("remove", operation.from_)
+        work.apply("add", operation.path, value)
+
+
+def _apply_delta(work: _WorkingCopy, operation: Any) -> None:
+    board = work.design.board
+    if isinstance(operation, MoveComponent):
+        index = work.index_of("components", operation.component_id)
+        update: Dict[str, Any] = {"position": list(operation.position)}
+        if operation.rotation is not None:
+            update["rotation"] = operation.rotation
+        board.components[index] = board.components[index].model_copy(update=update)
+        work.touch_entity("components", operation.component_id)
+    elif isinstance(operation, SetComponentProperty):
+        index = work.index_of("components", operation.component_id)
+        component = board.components[index]
+        properties = dict(component.properties)
+        properties[operation.name] = ComponentProperty(
+            name=operation.name, value=operation.value, unit=operation.unit
+        )
+        board.components[index] = component.model_copy(update={"properties": properties})
+        work.touch_entity("components", operation.component_id)
+    elif isinstance(operation, AddComponent):
+        board.components.append(operation.component)
+        work.touch_entity("components", operation.component.id)
+    elif isinstance(operation, RemoveComponent):
+        del board.components[work.index_of("components", operation.component_id)]
+        work.touch_entity("components", operation.component_id)
+    elif isinstance(operation, AddNet):
+        board.nets.append(operation.net)
+        work.touch_entity("nets", operation.net.id)
+    elif isinstance(operation, RemoveNet):
+        del board.nets[work.index_of("nets", operation.net_id)]
+        work.touch_entity("nets", operation.net_id)
+    elif isinstance(operation, (ConnectPin, DisconnectPin)):
+        index = work.index_of("nets", operation.net_id)
+        net = board.nets[index]
+        connection_ids = list(net.connection_ids)
+        if isinstance(operation, ConnectPin):
+            connection_ids.append(operation.connection_id)
+        elif operation.connection_id in connection_ids:
+            connection_ids.remove(operation.connection_id)
+        else:
+            raise PatchError(f"Pin {operation.connection_id!r} is not on net {operation.net_id!r}")
+        board.nets[index] = net.model_copy(update={"connection_ids": connection_ids})
+        work.touch_entity("nets", operation.net_id)
+    elif isinstance(operation, RenameDesign):
+        work.design.name = operation.name
+        work.touch_field(["name"])
+    elif isinstance(operation, SetOutline):
+        board.outline = [list(point) for point in operation.outline]
+        work.touch_field(["board", "outline"])
+
+
+def apply_patch(
+    design: Design,
+    operations: List[JsonPatchOperation] | DesignDelta,
+) -> Tuple[Design, PatchResult, BoardChanges | None]:
+    """
+    Apply JSON Patch operations or a domain delta to a design.
+
+    Returns (patched design, changed parts, BoardChanges for incremental DRC
+    or None when the edit may have reordered nets). `design` itself is not
+    modified. Raises PatchError (PatchTestFailed for a failed "test").
+    """
+    work = _WorkingCopy(design)
+    if isinstance(operations, DesignDelta):
+        for operation in operations.ops:
+            _apply_delta(work, operation)
+    else:
+        for operation in operations:
+            _apply_json_patch(work, operation)
+    return work.design, work.result(), work.board_changes()
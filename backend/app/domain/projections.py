@@ -0,0 +1,78 @@
+"""
+Lightweight read models for designs.
+SOLID: Interface Segregation - listing callers get metadata, not full boards.
+"""
+
+import base64
+import binascii
+from typing import Dict, List, Optional
+
+from pydantic import BaseModel, Field
+
+from app.domain.models import Design
+
+
+class DesignSummary(BaseModel):
+    """Design metadata without the board contents."""
+    id: str
+    name: str
+    component_count: int = 0
+    net_count: int = 0
+    issue_counts: Dict[str, int] = Field(
+        default_factory=lambda: {"error": 0, "warning": 0, "info": 0},
+        description="Number of stored issues per severity",
+    )
+    created_at: Optional[str] = None
+    updated_at: Optional[str] = None
+    revision: int = Field(default=0, description="Assigned by the repository; increases on every save")
+
+
+class DesignPage(BaseModel):
+    """One page of design summaries, ordered by ID."""
+    items: List[DesignSummary]
+    next_cursor: Optional[str] = None
+
+
+def summarize(design: Design, revision: int = 0) -> DesignSummary:
+    """Build the listing projection of a design saved as `revision`."""
+    counts = {"error": 0, "warning": 0, "info": 0}
+    for issue in design.issues:
+        counts[issue.severity.value] += 1
+    return DesignSummary(
+        id=design.id,
+        name=design.name,
+        component_count=len(design.board.components),
+        net_count=len(design.board.nets),
+        issue_counts=counts,
+        created_at=design.created_at,
+        updated_at=design.updated_at,
+        revision=revision,
+    )
+
+
+def summary_matches(
+    summary: DesignSummary,
+    name_prefix: Optional[str] = None,
+    min_components: Optional[int] = None,
+    max_components: Optional[int] = None,
+) -> bool:
+    """Apply listing filters to a summary."""
+    return (
+        (not name_prefix or summary.name.startswith(name_prefix))
+        and (min_components is None or summary.component_count >= min_components)
+        and (max_components is None or summary.component_count <= max_components)
+    )
+
+
+def encode_cursor(design_id: str) -> str:
+    """Opaque pagination cursor pointing just after `design_id`."""
+    return base64.urlsafe_b64encode(design_id.encode()).decode().rstrip("=")
+
+
+def decode_cursor(cursor: str) -> str:
+    """Recover the design ID from a cursor, or raise ValueError if malformed."""
+    try:
+        padded = cursor + "=" * (-len(cursor) % 4)
+        return base64.b64decode(padded, altchars=b"-_", validate=True).decode()
+    except (binascii.Error, UnicodeDecodeError) as exc:
+        raise ValueError("Invalid cursor") from exc
@@ -0,0 +1,459 @@
+"""
+Ratsnest (airwire) computation.
+SOLID: Single Responsibility - finds the unrouted connections of every net;
+nothing is drawn or routed here.
+
+A net's airwires are the minimum spanning tree over its pin positions (pad
+centers). Pins that the net's traces already join count as one node, so a
+routed connection has no airwire. Small nets use every pin pair as a
+candidate edge. Large nets (power and ground) take each pin's exact nearest
+neighbours from the leaves of a kd-tree instead, which keeps them close to
+O(n log n) rather than quadratic. Kruskal's algorithm over the candidates gives the tree. If
+the candidates leave a net in pieces (clusters far apart), the closest pin
+pair between the smallest piece and the rest joins them.
+
+RatsnestService keeps each design's airwires between calls and recomputes
+only the nets whose pins moved, whose connections changed or whose traces
+changed.
+"""
+
+import math
+import threading
+from collections import OrderedDict
+from dataclasses import dataclass, field
+from typing import Dict, List, Sequence, Set, Tuple
+
+import numpy as np
+
+from app.domain.changes import BoardChanges
+from app.domain.connectivity import DisjointSet, split_connection_id
+from app.domain.incremental_drc import DesignLocks, component_signature
+from app.domain.models import Board, Component, Design, Net, Trace
+from app.domain.pads import pin_position
+
+# Nets with more pins than this take nearest neighbours instead of all pairs
+DENSE_NET_PINS = 32
+# Candidate edges kept per pin on large nets
+NEAREST_CANDIDATES = 8
+# kd-tree leaves compared per vectorized block (bounds the box-distance matrix)
+LEAF_BLOCK = 256
+# Candidate pins measured at once when joining disconnected pieces
+CLOSEST_PAIR_BLOCK = 256
+# A pin touches a trace when its pad center is this close to the centerline
+# (at least; half the trace width when that is larger)
+TRACE_TOLERANCE_MM = 1e-3
+
+
+@dataclass(frozen=True)
+class Airwire:
+    """One unrouted connection: a straight line between two pins of a net."""
+    net_id: str
+    source: str
+    target: str
+    start: Tuple[float, float]
+    end: Tuple[float, float]
+
+    @property
+    def length(self) -> float:
+        return math.dist(self.start, self.end)
+
+
+@dataclass
+class RatsnestResult:
+    """Airwires of every net, in board net order."""
+    airwires: List[Airwire] = field(default_factory=list)
+    # net_id -> total airwire length (mm); 0.0 for fully routed nets
+    net_lengths: Dict[str, float] = field(default_factory=dict)
+
+    @property
+    def unrouted_length(self) -> float:
+        return sum(self.net_lengths.values())
+
+    def summary(self) -> Dict:
+        """JSON-ready airwires and lengths, as returned by the API."""
+        return {
+            "unrouted_length": self.unrouted_length,
+            "airwire_count": len(self.airwires),
+            "net_lengths": self.net_lengths,
+            "airwires": [
+                {
+                    "net_id": wire.net_id,
+                    "source": wire.source,
+                    "target": wire.target,
+                    "start": list(wire.start),
+                    "end": list(wire.end),
+                    "length": wire.length,
+                }
+                for wire in self.airwires
+            ],
+        }
+
+
+def _pin_points(net: Net, component_by_id: Dict[str, Component]) -> Tuple[List[str], List[Tuple[float, float]]]:
+    """Distinct placed pins of a net and their pad centers."""
+    component_ids = component_by_id.keys()
+    pins: List[str] = []
+    points: List[Tuple[float, float]] = []
+    seen: Set[str] = set()
+    for connection_id in net.connection_ids:
+        if connection_id in seen:
+            continue
+        seen.add(connection_id)
+        component_id, pin = split_connection_id(connection_id, component_ids)
+        component = component_by_id.get(component_id)
+        point = pin_position(component, pin) if component is not None else None
+        if point is not None:
+            pins.append(connection_id)
+            points.append(point)
+    return pins, points
+
+
+def _segment_distances(points: np.ndarray, segments: np.ndarray) -> np.ndarray:
+    """(p, s) distances from points to [x0, y0, x1, y1] segments."""
+    a, b = segments[:, 0:2], segments[:, 2:4]
+    ab = b - a
+    length2 = np.maximum((ab ** 2).sum(axis=1), 1e-12)
+    rel = points[:, None, :] - a[None]
+    t = np.clip((rel * ab[None]).sum(axis=2) / length2, 0.0, 1.0)
+    closest = a[None] + t[..., None] * ab[None]
+    return np.hypot(*(points[:, None, :] - closest).transpose(2, 0, 1))
+
+
+def _join_routed(points: np.ndarray, traces: Sequence[Trace], sets: DisjointSet) -> None:
+    """
+    Merge pins joined by copper. Traces are nodes len(points).. in `sets`;
+    a trace joins the pins on its centerline and any trace it starts or ends on.
+    """
+    traces = [trace for trace in traces if trace.points]
+    rows, owners, widths = [], [], []
+    for t, trace in enumerate(traces):
+        coords = np.asarray(trace.points, dtype=np.float64).reshape(-1, 2)
+        if len(coords) == 1:
+            coords = np.vstack((coords, coords))
+        rows.append(np.hstack((coords[:-1], coords[1:])))
+        owners.append(np.full(len(coords) - 1, t))
+        widths.append(trace.width)
+    if not rows:
+        return
+    segments, owner = np.concatenate(rows), np.concatenate(owners)
+    tolerance = np.maximum(np.asarray(widths)[owner] / 2, TRACE_TOLERANCE_MM)
+    n = len(points)
+
+    for p, s in zip(*np.nonzero(_segment_distances(points, segments) <= tolerance)):
+        sets.union(int(p), n + int(owner[s]))
+
+    ends = np.array([[trace.points[0], trace.points[-1]] for trace in traces], dtype=np.float64).reshape(-1, 2)
+    for e, s in zip(*np.nonzero(_segment_distances(ends, segments) <= tolerance)):
+        sets.union(n + int(e) // 2, n + int(owner[s]))
+
+
+def _kd_leaves(points: np.ndarray, leaf_size: int) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    (order, offsets) of a kd-tree's leaves: points[order[offsets[k]:offsets[k + 1]]]
+    is leaf k. Every level splits all oversized leaves at their median along
+    their wider axis in one sort.
+    """
+    n = len(points)
+    order = np.arange(n)
+    offsets = np.array([0, n])
+    while True:
+        sizes = np.diff(offsets)
+        if sizes.max() <= leaf_size:
+            return order, offsets
+        segment = np.repeat(np.arange(len(sizes)), sizes)
+        coords = points[order]
+        low = np.minimum.reduceat(coords, offsets[:-1], axis=0)
+        high = np.maximum.reduceat(coords, offsets[:-1], axis=0)
+        extent = high - low
+        axis = (extent[:, 1] > extent[:, 0]).astype(np.int64)
+        # Position along the split axis, scaled to [0, 1] within the leaf
+        width = np.maximum(extent[np.arange(len(sizes)), axis], 1e-12)
+        along = (coords[np.arange(n), axis[segment]] - low[segment, axis[segment]]) / width[segment]
+        order = order[np.lexsort((along, segment))]
+        split = sizes > leaf_size
+        middles = offsets[:-1][split] + sizes[split] // 2
+        offsets = np.sort(np.concatenate((offsets, middles)))
+
+
+def _block_pairs(offsets: np.ndarray, first: np.ndarray, second: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+    """Every (slot in leaf first[p], slot in leaf second[p]) pair, for all leaf pairs p."""
+    starts_a, starts_b = offsets[first], offsets[second]
+    size_a, size_b = offsets[first + 1] - starts_a, offsets[second + 1] - starts_b
+    counts = size_a * size_b
+    owner = np.repeat(np.arange(len(first)), counts)
+    local = np.arange(counts.sum()) - np.repeat(np.cumsum(counts) - counts, counts)
+    return starts_a[owner] + local // size_b[owner], starts_b[owner] + local % size_b[owner]
+
+
+def _nearest(
+    points: np.ndarray, i: np.ndarray, j: np.ndarray, k: int, limit: np.ndarray | None = None
+) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """
+    The k nearest of each point's candidate pairs: (i, j, distance), grouped
+    by i. Pairs longer than `limit[i]` are dropped before ranking.
+    """
+    d = np.hypot(*(points[i] - points[j]).T)
+    keep = i != j
+    if limit is not None:
+        keep &= d <= limit[i]
+    i, j, d = i[keep], j[keep], d[keep]
+    # Source-major, distance-minor order from a single float key
+    ranked = np.argsort(i * (d.max() + 1.0) + d)
+    i, j, d = i[ranked], j[ranked], d[ranked]
+    starts = np.flatnonzero(np.append(True, i[1:] != i[:-1]))
+    rank = np.arange(len(i)) - np.repeat(starts, np.diff(np.append(starts, len(i))))
+    keep = rank < k
+    return i[keep], j[keep], d[keep]
+
+
+def _nearest_pairs(points: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Each pin paired with its NEAREST_CANDIDATES nearest pins (exactly), found
+    through kd-tree leaves: a leaf only searches leaves whose boxes are no
+    farther away than the k-th neighbour distance of its own points.
+    """
+    k = NEAREST_CANDIDATES
+    order, offsets = _kd_leaves(points, 2 * (k + 1))
+    sorted_points = points[order]
+    leaves = len(offsets) - 1
+    low = np.minimum.reduceat(sorted_points, offsets[:-1], axis=0)
+    high = np.maximum.reduceat(sorted_points, offsets[:-1], axis=0)
+
+    # k-th neighbour distance of every point inside its own leaf bounds its
+    # search; a leaf searches as far as its farthest-reaching point
+    own = np.arange(leaves)
+    i, _, d = _nearest(sorted_points, *_block_pairs(offsets, own, own), k)
+    last = np.flatnonzero(np.append(i[1:] != i[:-1], True))
+    reach = np.zeros(len(points))
+    reach[i[last]] = d[last]
+    radius = np.maximum.reduceat(reach, offsets[:-1])
+
+    firsts, seconds = [], []
+    for start in range(0, leaves, LEAF_BLOCK):
+        rows = slice(start, min(start + LEAF_BLOCK, leaves))
+        gap = np.maximum(
+            np.maximum(low[None, :, :] - high[rows, None, :], low[rows, None, :] - high[None, :, :]), 0.0
+        )
+        a, b = np.nonzero(np.hypot(gap[..., 0], gap[..., 1]) <= radius[rows, None])
+        firsts.append(a + start)
+        seconds.append(b)
+    pairs = _block_pairs(offsets, np.concatenate(firsts), np.concatenate(seconds))
+    i, j, _ = _nearest(sorted_points, *pairs, k, limit=reach)
+    # Mutual neighbours would be listed twice
+    pairs = np.unique(np.minimum(i, j) * len(points) + np.maximum(i, j))
+    return order[pairs // len(points)], order[pairs % len(points)]
+
+
+def _closest_pair(points: np.ndarray, members: np.ndarray, others: np.ndarray) -> Tuple[int, int]:
+    """
+    Closest (member, other) pair. Others are tried in order of their distance
+    to the members' bounding box, which bounds their distance to any member,
+    so the search stops as soon as no remaining candidate can be closer.
+    """
+    group = points[members]
+    low, high = group.min(axis=0), group.max(axis=0)
+    outside = np.maximum(np.maximum(low - points[others], points[others] - high), 0.0)
+    bound = np.hypot(outside[:, 0], outside[:, 1])
+    ranked = np.argsort(bound, kind="stable")
+    best, pair = math.inf, (int(members[0]), int(others[0]))
+    for start in range(0, len(ranked), CLOSEST_PAIR_BLOCK):
+        block = ranked[start:start + CLOSEST_PAIR_BLOCK]
+        if bound[block[0]] >= best:
+            break
+        gaps = np.hypot(*(group[:, None, :] - points[others[block]][None]).transpose(2, 0, 1))
+        a, b = np.unravel_index(np.argmin(gaps), gaps.shape)
+        if gaps[a, b] < best:
+            best, pair = float(gaps[a, b]), (int(members[a]), int(others[block[b]]))
+    return pair
+
+
+def spanning_edges(points: np.ndarray, sets: DisjointSet) -> List[Tuple[int, int]]:
+    """
+    Minimum spanning tree edges between the point indices of `points`.
+
+    Points already merged in `sets` count as connected; `sets` may hold
+    extra nodes beyond the points (trace nodes) and is updated in place.
+    """
+    n = len(points)
+    roots = {sets.find(p) for p in range(n)}
+    needed = len(roots) - 1
+    if needed <= 0:
+        return []
+    i, j = np.triu_indices(n, k=1) if n <= DENSE_NET_PINS else _nearest_pairs(points)
+    d = np.hypot(*(points[i] - points[j]).T)
+    edges: List[Tuple[int, int]] = []
+    for k in np.argsort(d, kind="stable").tolist():
+        a, b = int(i[k]), int(j[k])
+        if sets.union(a, b):
+            edges.append((a, b))
+            if len(edges) == needed:
+                return edges
+
+    # Candidates left pieces apart: join the smallest piece to its nearest pin elsewhere
+    while len(edges) < needed:
+        labels = np.array([sets.find(p) for p in range(n)])
+        values, counts = np.unique(labels, return_counts=True)
+        inside = labels == values[np.argmin(counts)]
+        a, b = _closest_pair(points, np.flatnonzero(inside), np.flatnonzero(~inside))
+        sets.union(a, b)
+        edges.append((a, b))
+    return edges
+
+
+def net_airwires(net: Net, component_by_id: Dict[str, Component], traces: Sequence[Trace] = ()) -> List[Airwire]:
+    """Airwires of one net: the spanning tree of its placed pins not yet joined by `traces`."""
+    pins, coords = _pin_points(net, component_by_id)
+    if len(pins) < 2:
+        return []
+    points = np.asarray(coords, dtype=np.float64)
+    sets = DisjointSet(len(points) + len(traces))
+    _join_routed(points, traces, sets)
+    return [
+        Airwire(net.id, pins[a], pins[b], coords[a], coords[b])
+        for a, b in spanning_edges(points, sets)
+    ]
+
+
+def _traces_by_net(board: Board) -> Dict[str, List[Trace]]:
+    grouped: Dict[str, List[Trace]] = {}
+    for trace in board.traces:
+        grouped.setdefault(trace.net_id, []).append(trace)
+    return grouped
+
+
+def _trace_signature(traces: Sequence[Trace]) -> Tuple:
+    return tuple((trace.width, tuple(map(tuple, trace.points))) for trace in traces)
+
+
+@dataclass
+class _DesignState:
+    """Airwires retained between calls for one design."""
+    net_signatures: Dict[str, Tuple] = field(default_factory=dict)
+    component_signatures: Dict[str, Tuple] = field(default_factory=dict)
+    # component_id -> nets with a connection on it
+    nets_by_component: Dict[str, Set[str]] = field(default_factory=dict)
+    airwires: Dict[str, List[Airwire]] = field(default_factory=dict)
+
+
+class RatsnestService:
+    """
+    Airwires per design, recomputed only for nets an edit touched.
+
+    Like IncrementalDRCService, state is kept per design ID. Callers may pass
+    the BoardChanges an edit produced; otherwise (and always for traces,
+    which BoardChanges does not track) touched nets are found by comparing
+    per-entity signatures with the previous call. Calls for one design are
+    serialized by a per-design lock, as in IncrementalDRCService.
+    """
+
+    def __init__(self, max_designs: int = 32) -> None:
+        self._max_designs = max_designs
+        self._states: "OrderedDict[str, _DesignState]" = OrderedDict()
+        self._states_lock = threading.Lock()
+        self._locks = DesignLocks()
+
+    def forget(self, design_id: str) -> None:
+        """Drop retained airwires for a design (e.g. after it is deleted)."""
+        with self._locks(design_id):
+            with self._states_lock:
+                self._states.pop(design_id, None)
+        self._locks.discard(design_id)
+
+    def compute(self, design: Design, changes: BoardChanges | None = None) -> RatsnestResult:
+        """Airwires and unrouted length of `design`, reusing untouched nets."""
+        with self._locks(design.id):
+            return self._compute_locked(design, changes)
+
+    def _compute_locked(self, design: Design, changes: BoardChanges | None) -> RatsnestResult:
+        board = design.board
+        component_by_id = {component.id: component for component in board.components}
+        traces_by_net = _traces_by_net(board)
+
+        with self._states_lock:
+            state = self._states.get(design.id)
+            if state is None:
+                state = _DesignState()
+                changes = BoardChanges({net.id for net in board.nets}, set(component_by_id))
+            self._states[design.id] = state
+            self._states.move_to_end(design.id)
+            evicted = []
+            while len(self._states) > self._max_designs:
+                evicted.append(self._states.popitem(last=False)[0])
+        for design_id in evicted:
+            self._locks.discard(design_id)
+
+        dirty = self._touched_nets(state, board, component_by_id, traces_by_net, changes)
+        net_by_id = {net.id: net for net in board.nets}
+        for net_id in dirty:
+            net = net_by_id.get(net_id)
+            if net is None:
+                state.airwires.pop(net_id, None)
+            else:
+                state.airwires[net_id] = net_airwires(net, component_by_id, traces_by_net.get(net_id, ()))
+
+        result = RatsnestResult()
+        for net in board.nets:
+            wires = state.airwires.get(net.id, [])
+            result.airwires.extend(wires)
+            result.net_lengths[net.id] = sum(wire.length for wire in wires)
+        return result
+
+    def _touched_nets(
+        self,
+        state: _DesignState,
+        board: Board,
+        component_by_id: Dict[str, Component],
+        traces_by_net: Dict[str, List[Trace]],
+        changes: BoardChanges | None,
+    ) -> Set[str]:
+        """Nets to recompute; updates the retained signatures and component -> nets map."""
+        if changes is None:
+            changes = BoardChanges()
+            changes.components = {
+                component_id
+                for component_id, component in component_by_id.items()
+                if state.component_signatures.get(component_id) != component_signature(component)
+            }
+            changes.components.update(c for c in state.component_signatures if c not in component_by_id)
+        for component_id in changes.components:
+            component = component_by_id.get(component_id)
+            if component is None:
+                state.component_signatures.pop(component_id, None)
+            else:
+                state.component_signatures[component_id] = component_signature(component)
+
+        dirty: Set[str] = set(changes.nets)
+        for component_id in changes.components:
+            dirty |= state.nets_by_component.get(component_id, set())
+
+        component_ids = component_by_id.keys()
+        current: Set[str] = set()
+        for net in board.nets:
+            current.add(net.id)
+            signature = (tuple(net.connection_ids), _trace_signature(traces_by_net.get(net.id, ())))
+            if state.net_signatures.get(net.id) == signature and net.id not in dirty:
+                continue
+            dirty.add(net.id)
+            old = state.net_signatures.get(net.id)
+            if old is None or old[0] != signature[0]:
+                self._index_net(state, net.id, old[0] if old else (), net.connection_ids, component_ids)
+            state.net_signatures[net.id] = signature
+        for net_id in [n for n in state.net_signatures if n not in current]:
+            old = state.net_signatures.pop(net_id)
+            self._index_net(state, net_id, old[0], (), component_ids)
+            dirty.add(net_id)
+        return dirty
+
+    def _index_net(self, state, net_id, old_connections, new_connections, component_ids) -> None:
+        """Move a net's entries in the component -> nets map from its old connections to its new ones."""
+        for connection_id in old_connections:
+            nets = state.nets_by_component.get(split_connection_id(connection_id, component_ids)[0])
+            if nets is not None:
+                nets.discard(net_id)
+        for connection_id in new_connections:
+            component_id, _ = split_connection_id(connection_id, component_ids)
+            state.nets_by_component.setdefault(component_id, set()).add(net_id)
+
+
+# Singleton ratsnest service for MVP (state lives in-process)
+ratsnest_service = RatsnestService()
@@ -3,10 +3,26 @@ Domain services - business logic for design operations.
 SOLID: Single Responsibility - each service handles one concern.
 """
 
-from typing import List
+import itertools
+import os
+from concurrent.futures import FIRST_COMPLETED, wait
+from typing import Callable, Iterable, Iterator, List, Tuple
 
-from app.domain.models import Design, Issue, IssueSeverity
-from app.infra.memory_repo import DesignRepository, design_repository
+import numpy as np
+
+from app.domain.board_arrays import BoardArrays
+from app.domain.footprints import component_bounding_boxes
+from app.domain.geometry import boxes_in_polygon, points_in_polygon
+from app.domain.gerber import gerber_files
+from app.domain.models import Component, Design, Issue, IssueSeverity, Net
+from app.domain.changes import BoardChanges
+from app.domain.connectivity import shorted_islands
+from app.domain.patching import DesignDelta, JsonPatchOperation, PatchResult, apply_patch
+from app.domain.projections import DesignPage
+from app.domain.spatial import UniformGrid, box_gap
+from app.infra.executor import CPUExecutor
+from app.infra.memory_repo import DEFAULT_PAGE_SIZE, DesignRepository, design_repository
+from app.infra.zip_stream import iter_zip
 
 
 class DesignService:
@@ -32,11 +48,62 @@ class DesignService:
             raise ValueError("Design not found")
         return design
 
+    def get_design_json(self, design_id: str) -> str:
+        """
+        Stored design as JSON text (raises ValueError if not found).
+
+        Trusted fast path: bodies were validated when saved, so they are
+        returned as stored instead of being parsed into a Design again.
+        """
+        body = self._repo.get_json(design_id)
+        if body is None:
+            raise ValueError("Design not found")
+        return body
+
+    def get_design_revision(self, design_id: str) -> int:
+        """Current stored revision of a design (raises ValueError if not found)."""
+        revision = self._repo.get_revision(design_id)
+        if revision is None:
+            raise ValueError("Design not found")
+        return revision
+
     def update_design(self, design: Design) -> Design:
         """Update an existing design."""
         self._repo.save(design)
         return design
 
+    def save_design(self, design: Design, expected_revision: int | None = None) -> int:
+        """
+        Save a design and return its new revision.
+
+        With `expected_revision` the save only happens if the stored design
+        is still at that revision (raises RevisionConflict otherwise).
+        """
+        return self._repo.save(design, expected_revision)
+
+    def patch_design(
+        self,
+        design_id: str,
+        operations: List[JsonPatchOperation] | DesignDelta,
+        expected_revision: int | None = None,
+    ) -> Tuple[PatchResult, BoardChanges | None, int]:
+        """
+        Apply a JSON Patch or domain delta, persist the result and return it
+        with the new revision.
+
+        Raises ValueError if the design is missing and PatchError if the
+        patch does not apply (the stored design is then unchanged). The save
+        is conditional on the revision the patch was applied to (or
+        `expected_revision`): RevisionConflict if another save got in first.
+        """
+        if expected_revision is None:
+            # Revision first: a save in between conflicts instead of being reverted
+            expected_revision = self.get_design_revision(design_id)
+        design = self.get_design(design_id)
+        patched, result, changes = apply_patch(design, operations)
+        revision = self._repo.save(patched, expected_revision)
+        return result, changes, revision
+
     def delete_design(self, design_id: str) -> None:
         """Delete a design."""
         self._repo.delete(design_id)
@@ -45,118 +112,346 @@ class DesignService:
         """List all designs."""
         return self._repo.list_all()
 
-    def export_gerber(self, design: Design) -> bytes:
-        """Export design to Gerber format (placeholder for MVP)."""
-        # TODO: Implement Gerber export
-        raise NotImplementedError("Gerber export coming soon")
+    def list_design_summaries(
+        self,
+        limit: int = DEFAULT_PAGE_SIZE,
+        cursor: str | None = None,
+        name_prefix: str | None = None,
+        min_components: int | None = None,
+        max_components: int | None = None,
+    ) -> DesignPage:
+        """List one page of design summaries; raises ValueError on a malformed cursor."""
+        return self._repo.list_summaries(
+            limit=limit,
+            cursor=cursor,
+            name_prefix=name_prefix,
+            min_components=min_components,
+            max_components=max_components,
+        )
+
+    def export_gerber(
+        self,
+        design: Design,
+        on_file: Callable[[int, int, str], None] | None = None,
+    ) -> Iterator[bytes]:
+        """
+        Export a design as a zip of Gerber layers and an Excellon drill file.
+
+        Returns the archive as a stream of byte chunks; layers are generated
+        while the zip is read, so the whole package is never held in memory.
+        `on_file(index, total, name)` is called as each file is started.
+        """
+        files = gerber_files(design)
+        if on_file is None:
+            return iter_zip(files)
+
+        def entries():
+            for index, (name, chunks) in enumerate(files):
+                on_file(index, len(files), name)
+                yield name, chunks
+
+        return iter_zip(entries())
+
+
+# Minimum copper-to-copper spacing between component footprints (mm)
+DEFAULT_CLEARANCE_MM = 0.2
+# Net and pin IDs named in a short-circuit message before "and N more"
+SHORT_MESSAGE_IDS = 5
+# Designs per batch-DRC task: small enough to balance uneven board sizes
+SHARD_SIZE = 4
 
 
 class DRCService:
     """
     Design Rule Check service.
     SOLID: Single Responsibility - only handles validation rules.
+
+    Each rule is split into a board-wide check and a per-entity issue builder,
+    so the incremental checker can re-run rules on just the touched parts.
     """
 
+    def __init__(self, clearance: float = DEFAULT_CLEARANCE_MM) -> None:
+        self.clearance = clearance
+
     def check_design(self, design: Design) -> List[Issue]:
         """
         Run DRC checks on design.
         Returns list of issues (errors, warnings, info).
         """
-        issues: List[Issue] = []
+        return list(self.iter_issues(design))
+
+    def iter_issues(self, design: Design) -> Iterator[Issue]:
+        """
+        Yield DRC issues as each rule produces them, in check_design order.
+
+        Rules emit issues one at a time rather than building per-rule lists,
+        so a consumer can forward the first issues before later rules run.
+        """
+        count = 0
 
         # Check 1: Unconnected nets
-        issues.extend(self._check_unconnected_nets(design))
+        for issue in self._check_unconnected_nets(design):
+            count += 1
+            yield issue
+
+        # Later rules scan one columnar copy of the board instead of the models
+        arrays = BoardArrays.build(design.board)
 
-        # Check 2: Short circuits (nets with overlapping connections)
-        issues.extend(self._check_short_circuits(design))
+        # Check 2: Short circuits (islands of nets merged through shared pins),
+        # then components that are on no net at all
+        for issue in self._check_short_circuits(arrays):
+            count += 1
+            yield issue
+        for issue in self._check_isolated_components(arrays):
+            count += 1
+            yield issue
 
         # Check 3: Missing board outline
         if not design.board.outline:
-            issues.append(
-                Issue(
-                    id=f"issue_{len(issues)}",
-                    type="board_edge",
-                    severity=IssueSeverity.ERROR,
-                    message="Board outline is missing. Define board boundaries first.",
-                    related_ids=[],
-                )
-            )
+            yield self.missing_outline_issue(count)
 
         # Check 4: Components outside board outline (if outline exists)
         if design.board.outline:
-            issues.extend(self._check_components_in_bounds(design))
+            yield from self._check_components_in_bounds(design, arrays)
 
-        return issues
+        # Check 5: Component clearance (spatial index, neighbours only)
+        yield from self._check_clearance(design, arrays)
 
-    def _check_unconnected_nets(self, design: Design) -> List[Issue]:
-        """Check for nets with less than 2 connections."""
-        issues: List[Issue] = []
+    def check_designs(
+        self,
+        designs: Iterable[Design],
+        executor: CPUExecutor | None = None,
+        max_workers: int | None = None,
+    ) -> Iterator[Tuple[str, List[Issue]]]:
+        """
+        Run DRC over many designs, yielding (design_id, issues) as each finishes.
 
-        for net in design.board.nets:
-            if len(net.connection_ids) < 2:
-                issues.append(
-                    Issue(
-                        id=f"unconnected_{net.id}",
-                        type="unconnected_net",
-                        severity=IssueSeverity.ERROR,
-                        message=(
-                            f"Net '{net.name or net.id}' is not connected properly. "
-                            f"Each net needs at least 2 connections."
-                        ),
-                        related_ids=[net.id],
-                        location={"net_id": net.id},
-                    )
-                )
-
-        return issues
-
-    def _check_short_circuits(self, design: Design) -> List[Issue]:
-        """Check for nets that share connections (potential shorts)."""
-        issues: List[Issue] = []
-
-        # Build connection map: component.pin -> net_id
-        pin_to_net: dict[str, str] = {}
+        Designs are taken from `designs` a shard at a time, so a lazy iterable
+        keeps at most `max_workers` shards in flight rather than every design
+        in memory. Shards run on `executor` (the application's shared pool);
+        without one everything runs in-process.
+        """
+        if executor is None:
+            for design in designs:
+                yield design.id, self.check_design(design)
+            return
+
+        in_flight = max(1, max_workers or os.cpu_count() or 1)
+        designs = iter(designs)
+        shards = iter(lambda: list(itertools.islice(designs, SHARD_SIZE)), [])
+        pending = set()
+        try:
+            for shard in itertools.islice(shards, in_flight):
+                pending.add(executor.submit(_check_shard, self.clearance, shard))
+            while pending:
+                done, pending = wait(pending, return_when=FIRST_COMPLETED)
+                # Top up before yielding, so the pool keeps working meanwhile
+                for shard in itertools.islice(shards, len(done)):
+                    pending.add(executor.submit(_check_shard, self.clearance, shard))
+                for future in done:
+                    yield from future.result()
+        finally:
+            # Drop queued shards if the consumer goes away mid-stream
+            for future in pending:
+                future.cancel()
 
+    def _check_unconnected_nets(self, design: Design) -> Iterator[Issue]:
+        """Check for nets with less than 2 connections."""
         for net in design.board.nets:
-            for conn_id in net.connection_ids:
-                if conn_id in pin_to_net:
-                    # Found a pin connected to multiple nets - potential short
-                    other_net = pin_to_net[conn_id]
-                    issues.append(
-                        Issue(
-                            id=f"short_{net.id}_{other_net}",
-                            type="short_circuit",
-                            severity=IssueSeverity.ERROR,
-                            message=(
-                                "Potential short circuit: pin "
-                                f"'{conn_id}' is connected to multiple nets "
-                                f"('{net.id}' and '{other_net}')."
-                            ),
-                            related_ids=[net.id, other_net, conn_id],
-                            location={"pin": conn_id, "net1": net.id, "net2": other_net},
-                        )
-                    )
-                else:
-                    pin_to_net[conn_id] = net.id
-
-        return issues
-
-    def _check_components_in_bounds(self, design: Design) -> List[Issue]:
-        """Check if components are within board outline (simplified check)."""
-        issues: List[Issue] = []
-
-        # Simplified: just check if components have positions
-        # Full implementation would check polygon containment
-        for component in design.board.components:
-            if component.position is None:
-                issues.append(
-                    Issue(
-                        id=f"no_position_{component.id}",
-                        severity=IssueSeverity.WARNING,
-                        message=f"Component '{component.id}' has no position defined.",
-                        related_ids=[component.id],
-                    )
-                )
-
-        return issues
+            issue = self.unconnected_net_issue(net)
+            if issue is not None:
+                yield issue
+
+    def _check_short_circuits(self, arrays: BoardArrays) -> Iterator[Issue]:
+        """Report every island of nets joined through shared pins as one short."""
+        # Each repeat of a pin on another net links that net to the pin's first net;
+        # union-find over the links gives the merged islands in near-linear time
+        slots, first_slots = arrays.repeated_pin_slots()
+        nets, first_nets = arrays.slot_nets[slots], arrays.slot_nets[first_slots]
+        crossing = nets != first_nets
+        pin_ids, net_ids = arrays.pin_ids, arrays.net_ids
+        links = zip(nets[crossing].tolist(), first_nets[crossing].tolist(), arrays.net_pins[slots[crossing]].tolist())
+        islands = shorted_islands(len(net_ids), ((net, first, pin_ids[pin]) for net, first, pin in links))
+        for members, pins in islands:
+            yield self.short_circuit_issue([net_ids[net] for net in members], pins)
+
+    def _check_isolated_components(self, arrays: BoardArrays) -> Iterator[Issue]:
+        """Check for components with no pin on any net (islands of their own)."""
+        for k in np.flatnonzero(arrays.component_net_counts() == 0).tolist():
+            yield self.isolated_component_issue(arrays.component_ids[k])
+
+    def _check_components_in_bounds(self, design: Design, arrays: BoardArrays | None = None) -> Iterator[Issue]:
+        """Check that component footprints lie inside the board outline polygon."""
+        arrays = arrays or BoardArrays.build(design.board)
+        components = design.board.components
+        for k in np.flatnonzero(~arrays.placed).tolist():
+            if components[k].position is None:
+                yield self.no_position_issue(components[k])
+        indices, boxes = arrays.placed_boxes
+        yield from self._iter_out_of_bounds_boxes(components, indices.tolist(), boxes, design.board.outline)
+
+    def _check_clearance(self, design: Design, arrays: BoardArrays | None = None) -> Iterator[Issue]:
+        """Check that component footprints keep the minimum clearance from each other."""
+        arrays = arrays or BoardArrays.build(design.board)
+        components = design.board.components
+        indices, boxes = arrays.placed_boxes
+        if len(indices) < 2:
+            return
+
+        # Grid is built once per check; only boxes sharing a cell are compared
+        grid = UniformGrid(boxes, margin=self.clearance / 2)
+        first, second = grid.candidate_pair_arrays()
+
+        # Vectorized prefilter: both axis gaps must be under the clearance
+        a, b = boxes[first], boxes[second]
+        dx = np.maximum(b[:, 0] - a[:, 2], a[:, 0] - b[:, 2])
+        dy = np.maximum(b[:, 1] - a[:, 3], a[:, 1] - b[:, 3])
+        near = (dx < self.clearance) & (dy < self.clearance)
+        first, second = first[near], second[near]
+
+        # Report in board order regardless of grid bucket order
+        order = np.lexsort((second, first))
+        box_list = boxes.tolist()
+        for i, j in zip(first[order].tolist(), second[order].tolist()):
+            gap = box_gap(box_list[i], box_list[j])
+            if gap < self.clearance:
+                yield self.clearance_issue(components[indices[i]], components[indices[j]], gap)
+
+    # Issue builders (shared with IncrementalDRCService)
+
+    def unconnected_net_issue(self, net: Net) -> Issue | None:
+        """Issue for a net with fewer than 2 connections, or None if it is fine."""
+        if len(net.connection_ids) >= 2:
+            return None
+        return Issue(
+            id=f"unconnected_{net.id}",
+            type="unconnected_net",
+            severity=IssueSeverity.ERROR,
+            message=(
+                f"Net '{net.name or net.id}' is not connected properly. "
+                f"Each net needs at least 2 connections."
+            ),
+            related_ids=[net.id],
+            location={"net_id": net.id},
+        )
+
+    def short_circuit_issue(self, net_ids: List[str], pins: List[str]) -> Issue:
+        """Issue for an island of two or more nets joined through shared pins (both lists in board order)."""
+        if len(net_ids) == 2:
+            nets = f"nets '{net_ids[0]}' and '{net_ids[1]}' are"
+        else:
+            nets = f"{len(net_ids)} nets ({_quoted(net_ids)}) are"
+        shared = f"pin '{pins[0]}'" if len(pins) == 1 else f"{len(pins)} shared pins ({_quoted(pins)})"
+        return Issue(
+            id=f"short_{net_ids[0]}_{net_ids[1]}",
+            type="short_circuit",
+            severity=IssueSeverity.ERROR,
+            message=f"Short circuit: {nets} joined through {shared}. Each pin should be on one net.",
+            related_ids=[*net_ids, *pins],
+            location={"nets": net_ids, "pins": pins},
+        )
+
+    def isolated_component_issue(self, component_id: str) -> Issue:
+        """Issue for a component none of whose pins is on a net."""
+        return Issue(
+            id=f"isolated_{component_id}",
+            type="unconnected_net",
+            severity=IssueSeverity.WARNING,
+            message=f"Component '{component_id}' is not connected to any net. Wire its pins or remove it.",
+            related_ids=[component_id],
+            location={"component_id": component_id},
+        )
+
+    def missing_outline_issue(self, index: int) -> Issue:
+        """Issue for a board without an outline; `index` is its position in the report."""
+        return Issue(
+            id=f"issue_{index}",
+            type="board_edge",
+            severity=IssueSeverity.ERROR,
+            message="Board outline is missing. Define board boundaries first.",
+            related_ids=[],
+        )
+
+    def no_position_issue(self, component: Component) -> Issue:
+        """Issue for a component that has not been placed."""
+        return Issue(
+            id=f"no_position_{component.id}",
+            severity=IssueSeverity.WARNING,
+            message=f"Component '{component.id}' has no position defined.",
+            related_ids=[component.id],
+        )
+
+    def out_of_bounds_issues(self, components: List[Component], outline: List[List[float]]) -> List[Issue]:
+        """board_edge issues for the given components' footprints against the outline."""
+        return list(self._iter_out_of_bounds(components, outline))
+
+    def _iter_out_of_bounds(self, components: List[Component], outline: List[List[float]]) -> Iterator[Issue]:
+        indices, boxes = component_bounding_boxes(components)
+        return self._iter_out_of_bounds_boxes(components, indices, boxes, outline)
+
+    def _iter_out_of_bounds_boxes(
+        self,
+        components: List[Component],
+        indices: List[int],
+        boxes: np.ndarray,
+        outline: List[List[float]],
+    ) -> Iterator[Issue]:
+        polygon = np.asarray(outline, dtype=np.float64)
+        if len(polygon) < 3 or not indices:
+            return
+
+        # One batched pass: component centers, then whole footprints
+        centers = (boxes[:, :2] + boxes[:, 2:]) / 2
+        center_inside = points_in_polygon(centers, polygon)
+        footprint_inside = boxes_in_polygon(boxes, polygon) & center_inside
+
+        for k in np.flatnonzero(~footprint_inside).tolist():
+            component = components[indices[k]]
+            x, y = component.position[0], component.position[1]
+            if center_inside[k]:
+                message = f"Component '{component.id}' extends past the board edge. Move it further inside the outline."
+            else:
+                message = f"Component '{component.id}' is outside the board outline. Move it onto the board."
+            yield Issue(
+                id=f"out_of_bounds_{component.id}",
+                type="board_edge",
+                severity=IssueSeverity.ERROR,
+                message=message,
+                related_ids=[component.id],
+                location={"component_id": component.id, "x": x, "y": y},
+            )
+
+    def clearance_issue(self, first: Component, second: Component, gap: float) -> Issue:
+        """Issue for two footprints closer than the clearance (`first` comes first on the board)."""
+        detail = "overlap" if gap == 0 else f"are {gap:.2f}mm apart"
+        return Issue(
+            id=f"clearance_{first.id}_{second.id}",
+            type="clearance_violation",
+            severity=IssueSeverity.ERROR,
+            message=(
+                f"Components '{first.id}' and '{second.id}' {detail}. "
+                f"Keep at least {self.clearance}mm between parts."
+            ),
+            related_ids=[first.id, second.id],
+            location={
+                "component_id": first.id,
+                "other_component_id": second.id,
+                "x": (first.position[0] + second.position[0]) / 2,
+                "y": (first.position[1] + second.position[1]) / 2,
+                "distance": gap,
+            },
+        )
+
+
+def _quoted(ids: List[str]) -> str:
+    """Quoted, comma-separated IDs, shortened to the first few for long lists."""
+    listed = ", ".join(f"'{item}'" for item in ids[:SHORT_MESSAGE_IDS])
+    if len(ids) > SHORT_MESSAGE_IDS:
+        listed += f" and {len(ids) - SHORT_MESSAGE_IDS} more"
+    return listed
+
 
+def _check_shard(clearance: float, designs: List[Design]) -> List[Tuple[str, List[Issue]]]:
+    """Executor entry point (module-level so process pools can pickle it): check one shard of designs."""
+    drc = DRCService(clearance=clearance)
+    return [(design.id, drc.check_design(design)) for design in designs]
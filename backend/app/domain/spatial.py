@@ -0,0 +1,223 @@
+"""
+Spatial indexing for board geometry.
+SOLID: Single Responsibility - answers "what is near what" without DRC policy.
+
+A uniform grid over axis-aligned bounding boxes is built once per check, so
+neighbour queries touch only the few cells a box overlaps instead of every
+other component on the board.
+"""
+
+import math
+from collections import defaultdict
+from typing import Dict, Iterator, List, Sequence, Tuple
+
+import numpy as np
+
+
+def suggest_cell_size(boxes: np.ndarray, margin: float = 0.0) -> float:
+    """
+    Pick a grid cell size for a set of boxes.
+
+    At least a typical (inflated) box, and about one box per cell on sparse
+    boards, so most boxes land in one to four cells.
+    """
+    boxes = np.asarray(boxes, dtype=np.float64).reshape(-1, 4)
+    if len(boxes) == 0:
+        return 1.0
+    extents = np.maximum(boxes[:, 2] - boxes[:, 0], boxes[:, 3] - boxes[:, 1])
+    span = boxes[:, 2:].max(axis=0) - boxes[:, :2].min(axis=0)
+    density_size = float(np.sqrt(span[0] * span[1] / len(boxes)))
+    return max(float(np.median(extents)) + 2 * margin, density_size)
+
+
+class UniformGrid:
+    """
+    Uniform grid spatial index over axis-aligned bounding boxes.
+
+    Boxes are inflated by `margin` on every side before insertion, so any two
+    boxes closer than `margin` are guaranteed to share at least one cell.
+    """
+
+    def __init__(self, boxes: np.ndarray, margin: float = 0.0, cell_size: float | None = None) -> None:
+        self._boxes = np.asarray(boxes, dtype=np.float64).reshape(-1, 4)
+        self._margin = margin
+        self._cells: Dict[Tuple[int, int], List[int]] = defaultdict(list)
+
+        if len(self._boxes) == 0:
+            self._cell_size = cell_size or 1.0
+            self._cell_ranges = np.zeros((0, 4), dtype=np.int64)
+            return
+
+        self._cell_size = max(cell_size or suggest_cell_size(self._boxes, margin), 1e-6)
+
+        # Cell ranges covered by every inflated box, computed in one vectorized pass
+        inflated = self._boxes + np.array([-margin, -margin, margin, margin])
+        self._cell_ranges = np.floor(inflated / self._cell_size).astype(np.int64)
+
+        cells = self._cells
+        for index, (x0, y0, x1, y1) in enumerate(self._cell_ranges.tolist()):
+            for cx in range(x0, x1 + 1):
+                for cy in range(y0, y1 + 1):
+                    cells[(cx, cy)].append(index)
+
+    @property
+    def cell_size(self) -> float:
+        """Edge length of one grid cell."""
+        return self._cell_size
+
+    def __len__(self) -> int:
+        return len(self._boxes)
+
+    def candidate_pairs(self) -> Iterator[Tuple[int, int]]:
+        """
+        Yield each pair (i, j), i < j, whose inflated boxes share a cell.
+
+        A pair spanning several shared cells is reported only once: from the
+        cell holding the lower-left corner of the two ranges' intersection.
+        """
+        ranges = self._cell_ranges.tolist()
+        for (cx, cy), members in self._cells.items():
+            if len(members) < 2:
+                continue
+            for a_pos in range(len(members)):
+                i = members[a_pos]
+                ri = ranges[i]
+                for b_pos in range(a_pos + 1, len(members)):
+                    j = members[b_pos]
+                    rj = ranges[j]
+                    if max(ri[0], rj[0]) != cx or max(ri[1], rj[1]) != cy:
+                        continue
+                    yield (i, j) if i < j else (j, i)
+
+    def candidate_pair_arrays(self) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Same pairs as `candidate_pairs`, as (i, j) index arrays built without Python loops.
+
+        Every (cell, box) membership is expanded and sorted by cell; pairs are
+        then enumerated within each cell's run and deduplicated with the same
+        lower-left-corner rule.
+        """
+        ranges = self._cell_ranges
+        empty = np.zeros(0, dtype=np.int64)
+        if len(ranges) < 2:
+            return empty, empty
+
+        columns = ranges[:, 2] - ranges[:, 0] + 1
+        rows = ranges[:, 3] - ranges[:, 1] + 1
+        counts = columns * rows
+        box = np.repeat(np.arange(len(ranges)), counts)
+        local = np.arange(len(box)) - np.repeat(np.cumsum(counts) - counts, counts)
+        cell_x = ranges[box, 0] + local // rows[box]
+        cell_y = ranges[box, 1] + local % rows[box]
+
+        # Group memberships by cell; boxes ascend within a cell, so i < j below
+        order = np.lexsort((box, cell_y, cell_x))
+        box, cell_x, cell_y = box[order], cell_x[order], cell_y[order]
+        starts = np.flatnonzero(np.r_[True, (cell_x[1:] != cell_x[:-1]) | (cell_y[1:] != cell_y[:-1])])
+        run_ends = np.repeat(np.r_[starts[1:], len(box)], np.diff(np.r_[starts, len(box)]))
+
+        # Entry k pairs with every later entry of its run
+        partners = run_ends - np.arange(len(box)) - 1
+        first = np.repeat(np.arange(len(box)), partners)
+        second = first + 1 + np.arange(len(first)) - np.repeat(np.cumsum(partners) - partners, partners)
+        i, j = box[first], box[second]
+
+        keep = (np.maximum(ranges[i, 0], ranges[j, 0]) == cell_x[first]) & (
+            np.maximum(ranges[i, 1], ranges[j, 1]) == cell_y[first]
+        )
+        return i[keep], j[keep]
+
+    def query(self, box: Tuple[float, float, float, float]) -> List[int]:
+        """Return indices of boxes whose inflated extent shares a cell with `box`."""
+        x0, y0, x1, y1 = (int(v) for v in np.floor(np.asarray(box) / self._cell_size))
+        found: set[int] = set()
+        for cx in range(x0, x1 + 1):
+            for cy in range(y0, y1 + 1):
+                found.update(self._cells.get((cx, cy), ()))
+        return sorted(found)
+
+
+class DynamicGrid:
+    """
+    Uniform grid keyed by entity ID that supports insert/remove/query.
+
+    Used by incremental DRC, where a single moved component must be re-indexed
+    without rebuilding the grid for the whole board.
+    """
+
+    def __init__(self, cell_size: float, margin: float = 0.0) -> None:
+        self._cell_size = max(cell_size, 1e-6)
+        self._margin = margin
+        self._cells: Dict[Tuple[int, int], set[str]] = defaultdict(set)
+        self._entries: Dict[str, Tuple[Tuple[float, float, float, float], Tuple[int, int, int, int]]] = {}
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def __contains__(self, key: str) -> bool:
+        return key in self._entries
+
+    def box(self, key: str) -> Tuple[float, float, float, float]:
+        """Return the (uninflated) box stored for `key`."""
+        return self._entries[key][0]
+
+    def _cell_range(self, box: Sequence[float]) -> Tuple[int, int, int, int]:
+        m, size = self._margin, self._cell_size
+        return (
+            math.floor((box[0] - m) / size),
+            math.floor((box[1] - m) / size),
+            math.floor((box[2] + m) / size),
+            math.floor((box[3] + m) / size),
+        )
+
+    def insert(self, key: str, box: Sequence[float]) -> None:
+        """Insert or replace the box for `key`."""
+        if key in self._entries:
+            self.remove(key)
+        cell_range = self._cell_range(box)
+        x0, y0, x1, y1 = cell_range
+        for cx in range(x0, x1 + 1):
+            for cy in range(y0, y1 + 1):
+                self._cells[(cx, cy)].add(key)
+        self._entries[key] = (tuple(box), cell_range)
+
+    def remove(self, key: str) -> None:
+        """Remove `key` if present."""
+        entry = self._entries.pop(key, None)
+        if entry is None:
+            return
+        x0, y0, x1, y1 = entry[1]
+        for cx in range(x0, x1 + 1):
+            for cy in range(y0, y1 + 1):
+                bucket = self._cells.get((cx, cy))
+                if bucket is not None:
+                    bucket.discard(key)
+                    if not bucket:
+                        del self._cells[(cx, cy)]
+
+    def neighbours(self, key: str) -> set[str]:
+        """Keys whose inflated boxes share a cell with the inflated box of `key`."""
+        found = self._collect(self._entries[key][1])
+        found.discard(key)
+        return found
+
+    def query(self, box: Sequence[float]) -> set[str]:
+        """Keys whose inflated boxes share a cell with `box` inflated by the margin."""
+        return self._collect(self._cell_range(box))
+
+    def _collect(self, cell_range: Tuple[int, int, int, int]) -> set[str]:
+        x0, y0, x1, y1 = cell_range
+        found: set[str] = set()
+        for cx in range(x0, x1 + 1):
+            for cy in range(y0, y1 + 1):
+                bucket = self._cells.get((cx, cy))
+                if bucket:
+                    found |= bucket
+        return found
+
+
+def box_gap(a: Sequence[float], b: Sequence[float]) -> float:
+    """Euclidean gap between two [min_x, min_y, max_x, max_y] boxes (0 if overlapping)."""
+    dx = max(b[0] - a[2], a[0] - b[2], 0.0)
+    dy = max(b[1] - a[3], a[1] - b[3], 0.0)
+    return math.hypot(dx, dy)
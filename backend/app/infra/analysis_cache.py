@@ -0,0 +1,71 @@
+"""
+Per-design cache of derived ML analysis.
+Infra layer: in-process LRU keyed by design ID, valid for one stored revision.
+"""
+
+import threading
+from collections import OrderedDict
+from typing import Any, Dict, Optional, Tuple
+
+DEFAULT_MAX_DESIGNS = 256
+
+
+class DesignAnalysisCache:
+    """
+    LRU cache holding the latest analysis of each design.
+
+    An entry is only returned for the revision it was computed from, so a
+    save (which assigns a new revision) invalidates it without any explicit
+    hook; the stale entry is replaced on the next computation. Deleting a
+    design calls `invalidate`, since no later computation would replace it.
+    """
+
+    def __init__(self, max_designs: int = DEFAULT_MAX_DESIGNS) -> None:
+        self._max_designs = max_designs
+        self._entries: "OrderedDict[str, Tuple[int, Dict[str, Any]]]" = OrderedDict()
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    def get(self, design_id: str, revision: int) -> Optional[Dict[str, Any]]:
+        """Cached analysis of `design_id` at `revision`, or None."""
+        with self._lock:
+            entry = self._entries.get(design_id)
+            if entry is None or entry[0] != revision:
+                self.misses += 1
+                return None
+            self._entries.move_to_end(design_id)
+            self.hits += 1
+            return entry[1]
+
+    def put(self, design_id: str, revision: int, analysis: Dict[str, Any]) -> None:
+        """Store the analysis of one revision, replacing older revisions of the design."""
+        with self._lock:
+            current = self._entries.get(design_id)
+            if current is not None and current[0] > revision:
+                return  # A newer revision was cached meanwhile
+            self._entries[design_id] = (revision, analysis)
+            self._entries.move_to_end(design_id)
+            while len(self._entries) > self._max_designs:
+                self._entries.popitem(last=False)
+
+    def invalidate(self, design_id: str) -> None:
+        """Drop any cached analysis of a design (called when it is deleted)."""
+        with self._lock:
+            self._entries.pop(design_id, None)
+
+    def stats(self) -> Dict[str, float]:
+        """Hit/miss counters and current occupancy."""
+        with self._lock:
+            lookups = self.hits + self.misses
+            return {
+                "hits": self.hits,
+                "misses": self.misses,
+                "hit_rate": self.hits / lookups if lookups else 0.0,
+                "entries": len(self._entries),
+                "max_designs": self._max_designs,
+            }
+
+
+# Singleton cache instance for MVP
+design_analysis_cache = DesignAnalysisCache()
@@ -0,0 +1,64 @@
+"""
+Executor for CPU-bound work.
+Infra layer: keeps DRC and ML computation off the asyncio event loop.
+"""
+
+import asyncio
+import functools
+from concurrent.futures import Executor, Future, ProcessPoolExecutor, ThreadPoolExecutor
+from typing import Any, Callable, TypeVar
+
+from app.config import Settings, get_settings
+
+T = TypeVar("T")
+
+EXECUTOR_KINDS = ("thread", "process")
+
+
+class CPUExecutor:
+    """
+    Dispatches blocking calls to a thread or process pool.
+
+    Thread pools share in-process state (caches, incremental DRC) but contend
+    for the GIL; process pools give true parallelism but require picklable
+    callables and arguments. The pool is created lazily on first use.
+    """
+
+    def __init__(self, kind: str = "thread", max_workers: int | None = None) -> None:
+        if kind not in EXECUTOR_KINDS:
+            raise ValueError(f"Unknown executor kind '{kind}' (expected one of {EXECUTOR_KINDS})")
+        self.kind = kind
+        self._max_workers = max_workers
+        self._pool: Executor | None = None
+
+    @classmethod
+    def from_settings(cls, settings: Settings) -> "CPUExecutor":
+        """Create an executor configured by application settings."""
+        return cls(settings.executor_kind, settings.executor_workers)
+
+    def _get_pool(self) -> Executor:
+        if self._pool is None:
+            if self.kind == "process":
+                self._pool = ProcessPoolExecutor(max_workers=self._max_workers)
+            else:
+                self._pool = ThreadPoolExecutor(max_workers=self._max_workers, thread_name_prefix="pcb-cpu")
+        return self._pool
+
+    async def run(self, fn: Callable[..., T], *args: Any) -> T:
+        """Run `fn(*args)` in the pool and await its result."""
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(self._get_pool(), functools.partial(fn, *args))
+
+    def submit(self, fn: Callable[..., T], *args: Any) -> Future:
+        """Schedule `fn(*args)` in the pool from synchronous code and return its future."""
+        return self._get_pool().submit(fn, *args)
+
+    def shutdown(self) -> None:
+        """Release pool workers (called on application shutdown)."""
+        if self._pool is not None:
+            self._pool.shutdown(wait=False, cancel_futures=True)
+            self._pool = None
+
+
+# Singleton executor for the application
+cpu_executor = CPUExecutor.from_settings(get_settings())
@@ -0,0 +1,352 @@
+"""
+In-process background jobs.
+Infra layer: a queue drained by asyncio worker tasks, with progress,
+cooperative cancellation and time-limited result retention (expired jobs
+are pruned on submit and by a periodic task). Needs no
+external broker, so it runs (and is tested) with the in-memory backend.
+
+Job functions are plain synchronous callables taking a JobContext; they
+run in the manager's own thread pool so the event loop stays free, and
+report progress or check for cancellation through the context.
+"""
+
+import asyncio
+import os
+import shutil
+import tempfile
+import threading
+import time
+import uuid
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field
+from enum import Enum
+from typing import Any, AsyncIterator, Callable, Dict, List, Optional
+
+from pydantic import BaseModel
+
+from app.config import Settings, get_settings
+
+
+class JobStatus(str, Enum):
+    """Lifecycle of a job; the last three are terminal."""
+    QUEUED = "queued"
+    RUNNING = "running"
+    SUCCEEDED = "succeeded"
+    FAILED = "failed"
+    CANCELLED = "cancelled"
+
+
+TERMINAL_STATUSES = frozenset({JobStatus.SUCCEEDED, JobStatus.FAILED, JobStatus.CANCELLED})
+
+# Longest wait between sweeps for expired jobs (seconds); shorter TTLs sweep more often
+PRUNE_INTERVAL = 60.0
+
+
+class JobCancelled(Exception):
+    """Raised inside a job function when cancellation was requested."""
+
+
+class JobInfo(BaseModel):
+    """Public snapshot of a job, as returned when polling."""
+    id: str
+    kind: str
+    status: JobStatus
+    progress: float = 0.0
+    message: str | None = None
+    error: str | None = None
+    has_result: bool = False
+    created_at: float
+    started_at: float | None = None
+    finished_at: float | None = None
+
+
+@dataclass
+class JobFile:
+    """A job result stored on disk (e.g. an export archive); deleted when the job expires."""
+    path: str
+    media_type: str
+    filename: str
+
+
+class JobContext:
+    """Handle a running job function uses to report progress and honour cancellation."""
+
+    def __init__(self, job: "_Job", manager: "JobManager") -> None:
+        self._job = job
+        self._manager = manager
+
+    @property
+    def cancelled(self) -> bool:
+        return self._job.cancel_requested.is_set()
+
+    def check_cancelled(self) -> None:
+        """Raise JobCancelled if the client cancelled the job."""
+        if self.cancelled:
+            raise JobCancelled()
+
+    def report(self, progress: float, message: str | None = None) -> None:
+        """Record progress in [0, 1] (and an optional status line); also a cancellation point."""
+        self.check_cancelled()
+        self._job.progress = min(max(progress, 0.0), 1.0)
+        if message is not None:
+            self._job.message = message
+        self._manager._notify(self._job)
+
+    def result_path(self, suffix: str = "") -> str:
+        """A fresh file path for a file result, removed with the job (or as soon as it fails)."""
+        return self._manager._result_path(self._job, suffix)
+
+
+@dataclass
+class _Job:
+    id: str
+    kind: str
+    fn: Callable[[JobContext], Any]
+    status: JobStatus = JobStatus.QUEUED
+    progress: float = 0.0
+    message: str | None = None
+    error: str | None = None
+    result: Any = None
+    created_at: float = field(default_factory=time.time)
+    started_at: float | None = None
+    finished_at: float | None = None
+    cancel_requested: threading.Event = field(default_factory=threading.Event)
+    # Paths handed out by JobContext.result_path, deleted unless the job succeeds
+    files: List[str] = field(default_factory=list)
+    # Replaced on every change; watchers await the one they saw last
+    changed: asyncio.Event = field(default_factory=asyncio.Event)
+
+    def info(self) -> JobInfo:
+        return JobInfo(
+            id=self.id,
+            kind=self.kind,
+            status=self.status,
+            progress=self.progress,
+            message=self.message,
+            error=self.error,
+            has_result=self.status == JobStatus.SUCCEEDED and self.result is not None,
+            created_at=self.created_at,
+            started_at=self.started_at,
+            finished_at=self.finished_at,
+        )
+
+
+class JobManager:
+    """
+    Queue of background jobs drained by `workers` asyncio tasks.
+
+    Workers are started with `start()` (the application lifespan does this)
+    or lazily on the first submit, and are bound to that event loop. Finished
+    jobs are kept for `result_ttl` seconds, then pruned on the next submit or
+    periodic sweep; failed and cancelled jobs lose their files at once.
+    """
+
+    def __init__(self, workers: int = 2, result_ttl: float = 900.0) -> None:
+        self._workers = max(1, workers)
+        self._result_ttl = result_ttl
+        self._jobs: Dict[str, _Job] = {}
+        self._lock = threading.Lock()
+        self._queue: asyncio.Queue[str] | None = None
+        self._tasks: List[asyncio.Task] = []
+        self._loop: asyncio.AbstractEventLoop | None = None
+        self._pool: ThreadPoolExecutor | None = None
+        self._files_dir: str | None = None
+
+    @classmethod
+    def from_settings(cls, settings: Settings) -> "JobManager":
+        """Create a job manager configured by application settings."""
+        return cls(settings.job_workers, settings.job_result_ttl)
+
+    # Lifecycle
+
+    def start(self) -> None:
+        """Start worker tasks on the running event loop (no-op if already running there)."""
+        loop = asyncio.get_running_loop()
+        if self._loop is loop and self._tasks:
+            return
+        self._loop = loop
+        self._queue = asyncio.Queue()
+        if self._pool is None:
+            self._pool = ThreadPoolExecutor(max_workers=self._workers, thread_name_prefix="pcb-job")
+        self._tasks = [loop.create_task(self._worker()) for _ in range(self._workers)]
+        self._tasks.append(loop.create_task(self._sweep()))
+        # Jobs queued on a previous loop would otherwise never run
+        for job in self._jobs.values():
+            if job.status == JobStatus.QUEUED:
+                self._queue.put_nowait(job.id)
+
+    async def shutdown(self) -> None:
+        """Cancel running jobs, stop workers and delete result files."""
+        for job in list(self._jobs.values()):
+            job.cancel_requested.set()
+        for task in self._tasks:
+            task.cancel()
+        await asyncio.gather(*self._tasks, return_exceptions=True)
+        self._tasks = []
+        if self._pool is not None:
+            self._pool.shutdown(wait=False, cancel_futures=True)
+            self._pool = None
+        if self._files_dir is not None:
+            shutil.rmtree(self._files_dir, ignore_errors=True)
+            self._files_dir = None
+        self._jobs.clear()
+
+    # Client operations
+
+    def submit(self, kind: str, fn: Callable[[JobContext], Any]) -> JobInfo:
+        """Queue `fn` and return its job; must be called from the event loop."""
+        self.start()
+        self._prune()
+        job = _Job(id=uuid.uuid4().hex, kind=kind, fn=fn)
+        with self._lock:
+            self._jobs[job.id] = job
+        self._queue.put_nowait(job.id)
+        return job.info()
+
+    def get(self, job_id: str) -> Optional[JobInfo]:
+        """Snapshot of a job, or None if unknown or expired."""
+        self._prune()
+        job = self._jobs.get(job_id)
+        return job.info() if job else None
+
+    def list(self) -> List[JobInfo]:
+        """Snapshots of all retained jobs, oldest first."""
+        self._prune()
+        return [job.info() for job in list(self._jobs.values())]
+
+    def result(self, job_id: str) -> Any:
+        """Result of a succeeded job (raises KeyError if unknown, LookupError if not ready)."""
+        job = self._jobs.get(job_id)
+        if job is None:
+            raise KeyError(job_id)
+        if job.status != JobStatus.SUCCEEDED:
+            raise LookupError(f"Job is {job.status.value}")
+        return job.result
+
+    def cancel(self, job_id: str) -> Optional[JobInfo]:
+        """
+        Request cancellation. Queued jobs are cancelled at once; running jobs
+        stop at their next progress report or cancellation check.
+        """
+        job = self._jobs.get(job_id)
+        if job is None:
+            return None
+        if job.status not in TERMINAL_STATUSES:
+            job.cancel_requested.set()
+            if job.status == JobStatus.QUEUED:
+                self._finish(job, JobStatus.CANCELLED)
+        return job.info()
+
+    async def watch(self, job_id: str) -> AsyncIterator[JobInfo]:
+        """Yield a snapshot now and after every change, ending once the job finishes."""
+        job = self._jobs.get(job_id)
+        if job is None:
+            return
+        while True:
+            changed = job.changed
+            info = job.info()
+            yield info
+            if info.status in TERMINAL_STATUSES:
+                return
+            await changed.wait()
+
+    # Workers
+
+    async def _worker(self) -> None:
+        while True:
+            job_id = await self._queue.get()
+            job = self._jobs.get(job_id)
+            if job is None or job.status != JobStatus.QUEUED:
+                continue  # Cancelled or expired while queued
+            job.status, job.started_at = JobStatus.RUNNING, time.time()
+            self._notify(job)
+            try:
+                result = await self._loop.run_in_executor(self._pool, job.fn, JobContext(job, self))
+            except JobCancelled:
+                self._discard_files(job)
+                self._finish(job, JobStatus.CANCELLED)
+            except asyncio.CancelledError:
+                job.cancel_requested.set()
+                self._discard_files(job)
+                self._finish(job, JobStatus.CANCELLED)
+                raise
+            except Exception as exc:  # Reported to the client, the worker keeps going
+                job.error = str(exc) or type(exc).__name__
+                self._discard_files(job)
+                self._finish(job, JobStatus.FAILED)
+            else:
+                if job.cancel_requested.is_set():
+                    self._discard_files(job, result)
+                    self._finish(job, JobStatus.CANCELLED)
+                else:
+                    job.result, job.progress = result, 1.0
+                    self._finish(job, JobStatus.SUCCEEDED)
+
+    def _finish(self, job: _Job, status: JobStatus) -> None:
+        job.status, job.finished_at = status, time.time()
+        self._notify(job)
+
+    def _notify(self, job: _Job) -> None:
+        """Wake watchers; safe to call from job threads."""
+        loop = self._loop
+        if loop is None or loop.is_closed():
+            return
+        try:
+            running = asyncio.get_running_loop()
+        except RuntimeError:
+            running = None
+        if running is loop:
+            self._wake(job)
+        else:
+            loop.call_soon_threadsafe(self._wake, job)
+
+    @staticmethod
+    def _wake(job: _Job) -> None:
+        changed, job.changed = job.changed, asyncio.Event()
+        changed.set()
+
+    # Retention
+
+    def _result_path(self, job: _Job, suffix: str) -> str:
+        with self._lock:
+            if self._files_dir is None:
+                self._files_dir = tempfile.mkdtemp(prefix="pcb-jobs-")
+            path = os.path.join(self._files_dir, f"{job.id}-{len(job.files)}{suffix}")
+            job.files.append(path)
+        return path
+
+    @staticmethod
+    def _discard_files(job: _Job, result: Any = None) -> None:
+        """Delete the files a job was given, and its file result (missing ones are skipped)."""
+        paths = list(job.files)
+        if isinstance(result, JobFile):
+            paths.append(result.path)
+        for path in dict.fromkeys(paths):
+            try:
+                os.remove(path)
+            except OSError:
+                pass
+
+    async def _sweep(self) -> None:
+        """Prune expired jobs periodically, so idle servers release result files too."""
+        interval = max(min(self._result_ttl, PRUNE_INTERVAL), 0.01)
+        while True:
+            await asyncio.sleep(interval)
+            self._prune()
+
+    def _prune(self) -> None:
+        """Drop finished jobs older than the TTL, with their result files."""
+        cutoff = time.time() - self._result_ttl
+        with self._lock:
+            expired = [
+                job for job in self._jobs.values()
+                if job.status in TERMINAL_STATUSES and job.finished_at is not None and job.finished_at < cutoff
+            ]
+            for job in expired:
+                del self._jobs[job.id]
+        for job in expired:
+            self._discard_files(job, job.result)
+
+
+# Singleton job manager for MVP
+job_manager = JobManager.from_settings(get_settings())
@@ -3,35 +3,133 @@ In-memory repository for Design entities.
 Infra layer: persistence implementation (MVP uses in-memory store).
 """
 
+import bisect
+import itertools
+import threading
 from typing import Dict, Optional, List
 
 from app.domain.models import Design
+from app.domain.projections import (
+    DesignPage,
+    DesignSummary,
+    decode_cursor,
+    encode_cursor,
+    summarize,
+    summary_matches,
+)
+
+DEFAULT_PAGE_SIZE = 50
+
+
+class RevisionConflict(Exception):
+    """A conditional save found the design at a different revision (or missing)."""
+
+    def __init__(self, design_id: str, expected: int, current: Optional[int]) -> None:
+        super().__init__(f"Design {design_id} is at revision {current}, not {expected}")
+        self.expected = expected
+        self.current = current
 
 
 class DesignRepository:
-    """Repository for Design objects (in-memory implementation)."""
+    """
+    Repository for Design objects (in-memory implementation).
+
+    Summaries are maintained on every save, so listing pages never touch
+    full boards. Every save is stamped with a repository-wide revision number
+    that only increases (also across delete and re-create), so
+    (design ID, revision) identifies one stored version of a design. A save
+    may be made conditional on the revision the caller last read.
+    """
 
     def __init__(self) -> None:
         self._designs: Dict[str, Design] = {}
+        self._summaries: Dict[str, DesignSummary] = {}
+        self._sorted_ids: List[str] = []
+        self._revision = itertools.count(1)
+        self._save_lock = threading.Lock()
 
-    def save(self, design: Design) -> None:
-        """Create or update a design."""
-        self._designs[design.id] = design
+    def save(self, design: Design, expected_revision: Optional[int] = None) -> int:
+        """
+        Create or update a design and return its new revision.
+
+        With `expected_revision`, the save only happens if the stored design
+        is still at that revision; otherwise RevisionConflict is raised.
+        """
+        with self._save_lock:
+            self._check_revision(design.id, expected_revision)
+            revision = next(self._revision)
+            self._designs[design.id] = design
+            self._index_summary(summarize(design, revision))
+        return revision
 
     def get(self, design_id: str) -> Optional[Design]:
         """Get a design by ID, or None if not found."""
         return self._designs.get(design_id)
 
+    def get_json(self, design_id: str) -> Optional[str]:
+        """Stored design serialized as JSON, or None if not found (trusted: validated on save)."""
+        design = self._designs.get(design_id)
+        return design.model_dump_json() if design is not None else None
+
     def delete(self, design_id: str) -> None:
         """Delete a design if it exists."""
         self._designs.pop(design_id, None)
+        self._unindex_summary(design_id)
+
+    def get_revision(self, design_id: str) -> Optional[int]:
+        """Revision of the stored design, or None if not found (no board is loaded)."""
+        summary = self._summaries.get(design_id)
+        return summary.revision if summary else None
+
+    def _check_revision(self, design_id: str, expected_revision: Optional[int]) -> None:
+        """Raise RevisionConflict unless the design is at `expected_revision` (None: no check)."""
+        if expected_revision is None:
+            return
+        current = self.get_revision(design_id)
+        if current != expected_revision:
+            raise RevisionConflict(design_id, expected_revision, current)
 
     def list_all(self) -> List[Design]:
         """Return all designs."""
         return list(self._designs.values())
 
+    def list_summaries(
+        self,
+        limit: int = DEFAULT_PAGE_SIZE,
+        cursor: Optional[str] = None,
+        name_prefix: Optional[str] = None,
+        min_components: Optional[int] = None,
+        max_components: Optional[int] = None,
+    ) -> DesignPage:
+        """Return one page of design summaries matching the filters, ordered by ID."""
+        start = bisect.bisect_right(self._sorted_ids, decode_cursor(cursor)) if cursor else 0
 
-# Singleton repository instance for MVP
-design_repository = DesignRepository()
+        items: List[DesignSummary] = []
+        has_more = False
+        for design_id in self._sorted_ids[start:]:
+            summary = self._summaries[design_id]
+            if not summary_matches(summary, name_prefix, min_components, max_components):
+                continue
+            if len(items) == limit:
+                has_more = True
+                break
+            items.append(summary)
+
+        next_cursor = encode_cursor(items[-1].id) if has_more and items else None
+        return DesignPage(items=items, next_cursor=next_cursor)
+
+    def _index_summary(self, summary: DesignSummary) -> None:
+        if summary.id not in self._summaries:
+            bisect.insort(self._sorted_ids, summary.id)
+        self._summaries[summary.id] = summary
 
+    def _unindex_summary(self, design_id: str) -> None:
+        if self._summaries.pop(design_id, None) is not None:
+            del self._sorted_ids[bisect.bisect_left(self._sorted_ids, design_id)]
 
+    def close(self) -> None:
+        """Release storage resources (nothing to do in memory)."""
+
+
+# Singleton repository instance for MVP
+design_repository = DesignRepository()
@@ -0,0 +1,35 @@
+"""
+Repository selection.
+Infra layer: builds the DesignRepository implementation chosen in settings.
+"""
+
+from functools import lru_cache
+from pathlib import Path
+
+from app.config import Settings, get_settings
+from app.infra.memory_repo import DesignRepository, design_repository
+from app.infra.sqlite_repo import SQLiteDesignRepository
+from app.infra.wal_repo import WALDesignRepository
+
+REPO_BACKENDS = ("memory", "wal", "sqlite")
+
+SQLITE_FILE = "designs.sqlite3"
+
+
+def create_repository(settings: Settings) -> DesignRepository:
+    """Build the repository for `settings.repo_backend`."""
+    if settings.repo_backend == "memory":
+        return design_repository
+    if settings.repo_backend == "wal":
+        return WALDesignRepository(settings.data_dir, fsync=settings.repo_fsync)
+    if settings.repo_backend == "sqlite":
+        return SQLiteDesignRepository(Path(settings.data_dir) / SQLITE_FILE, pool_size=settings.sqlite_pool_size)
+    raise ValueError(
+        f"Unknown repository backend '{settings.repo_backend}' (expected one of {REPO_BACKENDS})"
+    )
+
+
+@lru_cache
+def get_configured_repository() -> DesignRepository:
+    """Application-wide repository instance, created on first use."""
+    return create_repository(get_settings())
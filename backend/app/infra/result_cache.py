@@ -0,0 +1,102 @@
+"""
+Content-addressed cache for DRC results.
+Infra layer: in-process LRU cache keyed by a stable hash of the board.
+"""
+
+import hashlib
+import json
+import threading
+from collections import OrderedDict
+from typing import Dict, List, Optional, Tuple
+
+from app.domain.models import Board, Issue
+
+# Default memory budget for cached issue lists (bytes)
+DEFAULT_MAX_BYTES = 64 * 1024 * 1024
+
+
+def board_fingerprint(board: Board, salt: str = "") -> str:
+    """
+    Stable SHA-256 of a canonicalized board.
+
+    Keys are sorted so property dict ordering does not change the hash;
+    `salt` distinguishes results produced under different rule settings.
+    """
+    canonical = json.dumps(
+        board.model_dump(mode="json"),
+        sort_keys=True,
+        separators=(",", ":"),
+    )
+    digest = hashlib.sha256(salt.encode())
+    digest.update(canonical.encode())
+    return digest.hexdigest()
+
+
+class DRCResultCache:
+    """
+    LRU cache of DRC issue lists bounded by an estimated memory size.
+
+    Entry size is the serialized size of its issues, which tracks the
+    in-memory footprint closely enough to size the cache.
+    """
+
+    def __init__(self, max_bytes: int = DEFAULT_MAX_BYTES) -> None:
+        self._max_bytes = max_bytes
+        self._entries: "OrderedDict[str, Tuple[Tuple[Issue, ...], int]]" = OrderedDict()
+        self._bytes = 0
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def get(self, key: str) -> Optional[List[Issue]]:
+        """Return cached issues for `key`, or None on a miss."""
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                self.misses += 1
+                return None
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return list(entry[0])
+
+    def put(self, key: str, issues: List[Issue]) -> None:
+        """Store issues for `key`, evicting least recently used entries to fit."""
+        size = sum(len(issue.model_dump_json()) for issue in issues) + len(key)
+        if size > self._max_bytes:
+            return  # Larger than the whole budget; caching it would flush everything
+
+        with self._lock:
+            previous = self._entries.pop(key, None)
+            if previous is not None:
+                self._bytes -= previous[1]
+            self._entries[key] = (tuple(issues), size)
+            self._bytes += size
+            while self._bytes > self._max_bytes:
+                _, (_, evicted_size) = self._entries.popitem(last=False)
+                self._bytes -= evicted_size
+                self.evictions += 1
+
+    def clear(self) -> None:
+        """Drop all entries (counters are kept)."""
+        with self._lock:
+            self._entries.clear()
+            self._bytes = 0
+
+    def stats(self) -> Dict[str, float]:
+        """Hit/miss counters and current occupancy."""
+        with self._lock:
+            lookups = self.hits + self.misses
+            return {
+                "hits": self.hits,
+                "misses": self.misses,
+                "hit_rate": self.hits / lookups if lookups else 0.0,
+                "evictions": self.evictions,
+                "entries": len(self._entries),
+                "bytes": self._bytes,
+                "max_bytes": self._max_bytes,
+            }
+
+
+# Singleton cache instance for MVP
+drc_result_cache = DRCResultCache()
@@ -0,0 +1,240 @@
+"""
+SQLite-backed repository for Design entities.
+Infra layer: local, dependency-free persistence with indexed metadata, safe to
+share between several worker processes.
+
+Each design is stored as its JSON body plus indexed metadata columns, so
+listing and filtering read only small rows and never parse full boards.
+"""
+
+import queue
+import sqlite3
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Iterator, List, Optional
+
+from app.domain.models import Design
+from app.domain.projections import DesignPage, DesignSummary, decode_cursor, encode_cursor, summarize
+from app.infra.memory_repo import DEFAULT_PAGE_SIZE, DesignRepository, RevisionConflict
+
+DEFAULT_POOL_SIZE = 4
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS designs (
+    id TEXT PRIMARY KEY,
+    name TEXT NOT NULL,
+    created_at TEXT,
+    updated_at TEXT,
+    component_count INTEGER NOT NULL,
+    net_count INTEGER NOT NULL,
+    error_count INTEGER NOT NULL,
+    warning_count INTEGER NOT NULL,
+    info_count INTEGER NOT NULL,
+    revision INTEGER NOT NULL,
+    body TEXT NOT NULL
+);
+-- Repository-wide revision counter shared by every process using the file
+CREATE TABLE IF NOT EXISTS revision_counter (
+    id INTEGER PRIMARY KEY CHECK (id = 0),
+    last INTEGER NOT NULL
+);
+INSERT OR IGNORE INTO revision_counter (id, last) VALUES (0, 0);
+CREATE INDEX IF NOT EXISTS idx_designs_name ON designs (name);
+CREATE INDEX IF NOT EXISTS idx_designs_updated_at ON designs (updated_at, id);
+CREATE INDEX IF NOT EXISTS idx_designs_component_count ON designs (component_count);
+CREATE INDEX IF NOT EXISTS idx_designs_net_count ON designs (net_count);
+"""
+
+_SUMMARY_COLUMNS = (
+    "id, name, component_count, net_count, error_count, warning_count, info_count, "
+    "created_at, updated_at, revision"
+)
+
+
+@contextmanager
+def _immediate_transaction(conn: sqlite3.Connection) -> Iterator[None]:
+    """Run the block in a write transaction taken up front (no upgrade deadlocks)."""
+    conn.execute("BEGIN IMMEDIATE")
+    try:
+        yield
+    except BaseException:
+        conn.execute("ROLLBACK")
+        raise
+    conn.execute("COMMIT")
+
+
+class SQLiteConnectionPool:
+    """Fixed-size pool of SQLite connections shared across threads."""
+
+    def __init__(self, path: str | Path, size: int = DEFAULT_POOL_SIZE) -> None:
+        self._connections: "queue.Queue[sqlite3.Connection]" = queue.Queue()
+        self._all: List[sqlite3.Connection] = []
+        for _ in range(size):
+            conn = sqlite3.connect(str(path), check_same_thread=False, timeout=5.0, isolation_level=None)
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute("PRAGMA synchronous=NORMAL")
+            self._connections.put(conn)
+            self._all.append(conn)
+
+    @contextmanager
+    def connection(self) -> Iterator[sqlite3.Connection]:
+        """Borrow a connection for the duration of the block."""
+        conn = self._connections.get()
+        try:
+            yield conn
+        finally:
+            self._connections.put(conn)
+
+    def close(self) -> None:
+        """Close every pooled connection."""
+        for conn in self._all:
+            conn.close()
+        self._all.clear()
+
+
+class SQLiteDesignRepository(DesignRepository):
+    """Repository for Design objects stored in a local SQLite database (WAL mode)."""
+
+    def __init__(self, path: str | Path, pool_size: int = DEFAULT_POOL_SIZE) -> None:
+        super().__init__()
+        Path(path).parent.mkdir(parents=True, exist_ok=True)
+        self._pool = SQLiteConnectionPool(path, pool_size)
+        with self._pool.connection() as conn:
+            conn.executescript(_SCHEMA)
+
+    def save(self, design: Design, expected_revision: Optional[int] = None) -> int:
+        """
+        Create or update a design and return its new revision.
+
+        With `expected_revision` the save is conditional; the check runs in
+        the same write transaction, so it holds across processes too.
+        """
+        body = design.model_dump_json()
+        with self._pool.connection() as conn, _immediate_transaction(conn):
+            if expected_revision is not None:
+                row = conn.execute("SELECT revision FROM designs WHERE id = ?", (design.id,)).fetchone()
+                current = row[0] if row else None
+                if current != expected_revision:
+                    raise RevisionConflict(design.id, expected_revision, current)
+            revision = conn.execute(
+                "UPDATE revision_counter SET last = last + 1 WHERE id = 0 RETURNING last"
+            ).fetchone()[0]
+            summary = summarize(design, revision)
+            conn.execute(
+                """
+                INSERT INTO designs (
+                    id, name, created_at, updated_at, component_count, net_count,
+                    error_count, warning_count, info_count, revision, body
+                )
+                VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+                ON CONFLICT(id) DO UPDATE SET
+                    name = excluded.name,
+                    created_at = excluded.created_at,
+                    updated_at = excluded.updated_at,
+                    component_count = excluded.component_count,
+                    net_count = excluded.net_count,
+                    error_count = excluded.error_count,
+                    warning_count = excluded.warning_count,
+                    info_count = excluded.info_count,
+                    revision = excluded.revision,
+                    body = excluded.body
+                """,
+                (
+                    summary.id,
+                    summary.name,
+                    summary.created_at,
+                    summary.updated_at,
+                    summary.component_count,
+                    summary.net_count,
+                    summary.issue_counts["error"],
+                    summary.issue_counts["warning"],
+                    summary.issue_counts["info"],
+                    summary.revision,
+                    body,
+                ),
+            )
+        return revision
+
+    def get(self, design_id: str) -> Optional[Design]:
+        """Get a design by ID, or None if not found."""
+        with self._pool.connection() as conn:
+            row = conn.execute("SELECT body FROM designs WHERE id = ?", (design_id,)).fetchone()
+        return Design.model_validate_json(row[0]) if row else None
+
+    def get_json(self, design_id: str) -> Optional[str]:
+        """Stored design body as JSON text, or None if not found (no model is built)."""
+        with self._pool.connection() as conn:
+            row = conn.execute("SELECT body FROM designs WHERE id = ?", (design_id,)).fetchone()
+        return row[0] if row else None
+
+    def get_revision(self, design_id: str) -> Optional[int]:
+        """Revision of the stored design, or None if not found (the body is not read)."""
+        with self._pool.connection() as conn:
+            row = conn.execute("SELECT revision FROM designs WHERE id = ?", (design_id,)).fetchone()
+        return row[0] if row else None
+
+    def delete(self, design_id: str) -> None:
+        """Delete a design if it exists."""
+        with self._pool.connection() as conn:
+            conn.execute("DELETE FROM designs WHERE id = ?", (design_id,))
+
+    def list_all(self) -> List[Design]:
+        """Return all designs."""
+        with self._pool.connection() as conn:
+            rows = conn.execute("SELECT body FROM designs ORDER BY id").fetchall()
+        return [Design.model_validate_json(row[0]) for row in rows]
+
+    def list_summaries(
+        self,
+        limit: int = DEFAULT_PAGE_SIZE,
+        cursor: Optional[str] = None,
+        name_prefix: Optional[str] = None,
+        min_components: Optional[int] = None,
+        max_components: Optional[int] = None,
+    ) -> DesignPage:
+        """Return one page of design summaries matching the filters, ordered by ID."""
+        clauses: List[str] = []
+        params: List[object] = []
+        if cursor:
+            # Keyset pagination on the primary key: no OFFSET scan on deep pages
+            clauses.append("id > ?")
+            params.append(decode_cursor(cursor))
+        if name_prefix:
+            # Range scan on the name index (LIKE would bypass it)
+            clauses.append("name >= ? AND name < ?")
+            params.extend([name_prefix, name_prefix + "\U0010ffff"])
+        if min_components is not None:
+            clauses.append("component_count >= ?")
+            params.append(min_components)
+        if max_components is not None:
+            clauses.append("component_count <= ?")
+            params.append(max_components)
+
+        sql = f"SELECT {_SUMMARY_COLUMNS} FROM designs"
+        if clauses:
+            sql += " WHERE " + " AND ".join(clauses)
+        # One extra row tells us whether another page exists
+        sql += " ORDER BY id LIMIT ?"
+        params.append(limit + 1)
+
+        with self._pool.connection() as conn:
+            rows = conn.execute(sql, params).fetchall()
+        items = [
+            DesignSummary(
+                id=row[0],
+                name=row[1],
+                component_count=row[2],
+                net_count=row[3],
+                issue_counts={"error": row[4], "warning": row[5], "info": row[6]},
+                created_at=row[7],
+                updated_at=row[8],
+                revision=row[9],
+            )
+            for row in rows[:limit]
+        ]
+        next_cursor = encode_cursor(items[-1].id) if len(rows) > limit and items else None
+        return DesignPage(items=items, next_cursor=next_cursor)
+
+    def close(self) -> None:
+        """Close pooled connections."""
+        self._pool.close()
@@ -0,0 +1,287 @@
+"""
+Durable repository for Design entities backed by a write-ahead log.
+Infra layer: append-only log + periodic snapshot, same interface as the
+in-memory DesignRepository.
+
+On-disk layout inside `data_dir`:
+- snapshot.jsonl  revision high-water mark, then one save record per live
+                  design; written atomically on compaction
+- wal.jsonl       one operation per line, appended by save/delete
+
+Save records carry the design's listing summary ahead of its body:
+    {"op":"save","summary":{...},"design":{...}}
+
+Recovery loads the snapshot and replays the log. A torn final log line
+(crash mid-append) is ignored and truncated away. Only the small summaries
+are parsed at startup; design bodies stay as raw JSON until first access, so
+startup cost is dominated by reading the files rather than by Pydantic
+validation, and listing never parses boards.
+"""
+
+import json
+import os
+import threading
+from pathlib import Path
+from typing import List, Optional
+
+from app.domain.models import Design
+from app.domain.projections import DesignPage, DesignSummary, summarize
+from app.infra.memory_repo import DesignRepository
+
+SNAPSHOT_FILE = "snapshot.jsonl"
+WAL_FILE = "wal.jsonl"
+
+# Compact once the log holds this many operations...
+DEFAULT_COMPACT_EVERY = 10_000
+# ...or has grown this much larger than the live data it describes
+DEFAULT_COMPACT_RATIO = 4.0
+
+# Records are written with these exact separators so recovery can slice out
+# the embedded design JSON without parsing it
+_SAVE_PREFIX = '{"op":"save","summary":'
+_DESIGN_SEPARATOR = ',"design":'
+# First snapshot line: highest revision issued before compaction
+_REVISION_PREFIX = b'{"op":"revision",'
+
+_decoder = json.JSONDecoder()
+
+
+def _save_record(summary: DesignSummary, design_json: str) -> bytes:
+    return (_SAVE_PREFIX + summary.model_dump_json() + _DESIGN_SEPARATOR + design_json + "}\n").encode()
+
+
+def _parse_save_record(text: str) -> tuple[DesignSummary, str]:
+    """Split a save record into (summary, raw design JSON) without parsing the design."""
+    if not text.startswith(_SAVE_PREFIX):
+        raise ValueError("Not a save record")
+    summary_data, end = _decoder.raw_decode(text, len(_SAVE_PREFIX))
+    if not text.startswith(_DESIGN_SEPARATOR, end) or not text.endswith("}\n"):
+        raise ValueError("Malformed save record")
+    return DesignSummary.model_validate(summary_data), text[end + len(_DESIGN_SEPARATOR):-2]
+
+
+class WALDesignRepository(DesignRepository):
+    """
+    Repository that keeps designs in memory and logs every change to disk.
+
+    `save` appends one JSON line, so its cost is O(size of the design) rather
+    than rewriting a store file. Compaction rewrites the snapshot from memory
+    and truncates the log.
+    """
+
+    def __init__(
+        self,
+        data_dir: str | Path,
+        fsync: bool = True,
+        compact_every: int = DEFAULT_COMPACT_EVERY,
+        compact_ratio: float = DEFAULT_COMPACT_RATIO,
+    ) -> None:
+        super().__init__()
+        self._dir = Path(data_dir)
+        self._dir.mkdir(parents=True, exist_ok=True)
+        self._snapshot_path = self._dir / SNAPSHOT_FILE
+        self._wal_path = self._dir / WAL_FILE
+        self._fsync = fsync
+        self._compact_every = compact_every
+        self._compact_ratio = compact_ratio
+        self._lock = threading.RLock()
+
+        self._wal_ops = 0
+        self._wal_bytes = 0
+        self._live_bytes: dict[str, int] = {}
+        self._live_total = 0
+        # Recovered but not yet parsed designs: id -> design JSON
+        self._raw: dict[str, str] = {}
+        # Highest revision ever issued; recovered from disk so it never repeats
+        self._last_revision = 0
+
+        self._recover()
+        self._wal = open(self._wal_path, "ab")
+
+    # Recovery
+
+    def _recover(self) -> None:
+        """Rebuild in-memory state from the snapshot plus the log."""
+        if self._snapshot_path.exists():
+            with open(self._snapshot_path, "rb") as snapshot:
+                for line in snapshot:
+                    if line.startswith(_REVISION_PREFIX):
+                        self._last_revision = max(self._last_revision, json.loads(line)["last"])
+                    else:
+                        self._apply_save(line)
+
+        if not self._wal_path.exists():
+            return
+
+        valid_bytes = 0
+        with open(self._wal_path, "rb") as wal:
+            for line in wal:
+                if not line.endswith(b"\n"):
+                    break  # Torn write from a crash; everything after is garbage
+                try:
+                    self._replay(line)
+                except (ValueError, KeyError):
+                    break
+                valid_bytes += len(line)
+                self._wal_ops += 1
+
+        self._wal_bytes = valid_bytes
+        if valid_bytes != self._wal_path.stat().st_size:
+            with open(self._wal_path, "r+b") as wal:
+                wal.truncate(valid_bytes)
+
+    def _apply_save(self, line: bytes) -> None:
+        text = line.decode()
+        if not text.endswith("\n"):
+            text += "\n"
+        summary, raw = _parse_save_record(text)
+        self._designs.pop(summary.id, None)
+        self._raw[summary.id] = raw
+        self._index_summary(summary)
+        self._track_size(summary.id, len(line))
+        self._last_revision = max(self._last_revision, summary.revision)
+
+    def _replay(self, line: bytes) -> None:
+        if not line.startswith(b'{"op":"delete"'):
+            self._apply_save(line)
+            return
+
+        record = json.loads(line)
+        self._last_revision = max(self._last_revision, record["revision"])
+        self._designs.pop(record["id"], None)
+        self._raw.pop(record["id"], None)
+        self._unindex_summary(record["id"])
+        self._track_size(record["id"], None)
+
+    # Write path
+
+    def _track_size(self, design_id: str, size: int | None) -> None:
+        """Keep a running total of live record bytes (None removes the design)."""
+        self._live_total -= self._live_bytes.pop(design_id, 0)
+        if size is not None:
+            self._live_bytes[design_id] = size
+            self._live_total += size
+
+    def _append(self, line: bytes) -> None:
+        self._wal.write(line)
+        self._wal.flush()
+        if self._fsync:
+            os.fsync(self._wal.fileno())
+        self._wal_ops += 1
+        self._wal_bytes += len(line)
+
+    def save(self, design: Design, expected_revision: int | None = None) -> int:
+        """
+        Create or update a design, logging it before it becomes visible.
+
+        Returns the new revision; with `expected_revision` the save is
+        conditional (RevisionConflict if the stored revision differs).
+        """
+        design_json = design.model_dump_json()
+        with self._lock:
+            self._check_revision(design.id, expected_revision)
+            # Revisions are issued under the lock so they increase in log order
+            self._last_revision += 1
+            summary = summarize(design, self._last_revision)
+            line = _save_record(summary, design_json)
+            self._append(line)
+            self._raw.pop(design.id, None)
+            self._designs[design.id] = design
+            self._index_summary(summary)
+            self._track_size(design.id, len(line))
+            self._maybe_compact()
+            return self._last_revision
+
+    def delete(self, design_id: str) -> None:
+        """Delete a design if it exists."""
+        with self._lock:
+            if design_id not in self._summaries:
+                return
+            # Deletes consume a revision too, so a re-created design never reuses one
+            self._last_revision += 1
+            record = {"op": "delete", "id": design_id, "revision": self._last_revision}
+            self._append(json.dumps(record, separators=(",", ":")).encode() + b"\n")
+            self._raw.pop(design_id, None)
+            super().delete(design_id)
+            self._track_size(design_id, None)
+            self._maybe_compact()
+
+    def _materialize(self, design_id: str) -> Optional[Design]:
+        """Parse a recovered design on first access."""
+        raw = self._raw.pop(design_id, None)
+        if raw is None:
+            return self._designs.get(design_id)
+        design = Design.model_validate_json(raw)
+        self._designs[design_id] = design
+        return design
+
+    def get(self, design_id: str) -> Optional[Design]:
+        """Get a design by ID, or None if not found."""
+        with self._lock:
+            return self._materialize(design_id)
+
+    def get_json(self, design_id: str) -> Optional[str]:
+        """Stored design as JSON; recovered bodies are returned as logged, without parsing."""
+        with self._lock:
+            raw = self._raw.get(design_id)
+            if raw is not None:
+                return raw
+            design = self._designs.get(design_id)
+        return design.model_dump_json() if design is not None else None
+
+    def list_all(self) -> List[Design]:
+        """Return all designs."""
+        with self._lock:
+            for design_id in list(self._raw):
+                self._materialize(design_id)
+            return list(self._designs.values())
+
+    def list_summaries(self, *args, **kwargs) -> DesignPage:
+        """Return one page of design summaries (served from the in-memory index)."""
+        with self._lock:
+            return super().list_summaries(*args, **kwargs)
+
+    # Compaction
+
+    def _maybe_compact(self) -> None:
+        live = max(self._live_total, 1)
+        if self._wal_ops >= self._compact_every or self._wal_bytes > live * self._compact_ratio:
+            self.compact()
+
+    def compact(self) -> None:
+        """Write a fresh snapshot of all live designs and truncate the log."""
+        with self._lock:
+            tmp_path = self._snapshot_path.with_suffix(".tmp")
+            with open(tmp_path, "wb") as tmp:
+                tmp.write(_REVISION_PREFIX + b'"last":' + str(self._last_revision).encode() + b"}\n")
+                for design_id, design in self._designs.items():
+                    tmp.write(_save_record(self._summaries[design_id], design.model_dump_json()))
+                for design_id, raw in self._raw.items():
+                    tmp.write(_save_record(self._summaries[design_id], raw))
+                tmp.flush()
+                os.fsync(tmp.fileno())
+            # Atomic swap: a crash leaves either the old or the new snapshot.
+            # Crashing before the log is truncated is safe too: replaying the
+            # old log over the new snapshot ends in the same state.
+            os.replace(tmp_path, self._snapshot_path)
+            if self._fsync:
+                # Make the rename durable before the log it supersedes is emptied
+                dir_fd = os.open(self._dir, os.O_RDONLY)
+                try:
+                    os.fsync(dir_fd)
+                finally:
+                    os.close(dir_fd)
+
+            self._wal.close()
+            self._wal = open(self._wal_path, "wb")
+            if self._fsync:
+                os.fsync(self._wal.fileno())
+            self._wal_ops = 0
+            self._wal_bytes = 0
+
+    def close(self) -> None:
+        """Flush and close the log file."""
+        with self._lock:
+            if not self._wal.closed:
+                self._wal.flush()
+                self._wal.close()
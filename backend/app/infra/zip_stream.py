@@ -0,0 +1,59 @@
+"""
+Streaming zip archives.
+Infra layer: packs (name, chunks) entries into a zip while yielding the
+archive bytes as they are produced, so nothing is buffered whole.
+"""
+
+import time
+import zipfile
+from typing import Iterable, Iterator, List, Tuple
+
+DEFAULT_FLUSH_BYTES = 64 * 1024
+
+
+class _Sink:
+    """Write-only file object collecting compressed output between flushes."""
+
+    def __init__(self) -> None:
+        self._chunks: List[bytes] = []
+        self.size = 0
+
+    def write(self, data: bytes) -> int:
+        self._chunks.append(bytes(data))
+        self.size += len(data)
+        return len(data)
+
+    def flush(self) -> None:
+        pass
+
+    def drain(self) -> bytes:
+        data = b"".join(self._chunks)
+        self._chunks.clear()
+        self.size = 0
+        return data
+
+
+def iter_zip(
+    entries: Iterable[Tuple[str, Iterable[str]]],
+    flush_bytes: int = DEFAULT_FLUSH_BYTES,
+) -> Iterator[bytes]:
+    """
+    Yield a deflated zip of `entries` as (file name, text chunks) pairs.
+
+    The sink is not seekable, so zipfile writes sizes in data descriptors
+    after each entry; output is yielded whenever `flush_bytes` accumulate.
+    """
+    sink = _Sink()
+    timestamp = time.localtime()[:6]
+    with zipfile.ZipFile(sink, mode="w", compression=zipfile.ZIP_DEFLATED) as archive:
+        for name, chunks in entries:
+            info = zipfile.ZipInfo(name, date_time=timestamp)
+            info.compress_type = zipfile.ZIP_DEFLATED
+            with archive.open(info, mode="w") as entry:
+                for chunk in chunks:
+                    entry.write(chunk.encode())
+                    if sink.size >= flush_bytes:
+                        yield sink.drain()
+            if sink.size >= flush_bytes:
+                yield sink.drain()
+    yield sink.drain()
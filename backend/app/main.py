@@ -3,14 +3,32 @@ FastAPI application entry point.
 Clean architecture: thin controllers, rich domain.
 """
 
+from contextlib import asynccontextmanager
+
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
-from app.api import designs, ml
+from app.api import designs, jobs, live, ml
+from app.infra.executor import cpu_executor
+from app.infra.jobs import job_manager
+from app.infra.repo_factory import get_configured_repository
+
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    """Application startup/shutdown hooks."""
+    job_manager.start()
+    yield
+    await job_manager.shutdown()
+    cpu_executor.shutdown()
+    if get_configured_repository.cache_info().currsize:
+        get_configured_repository().close()
+
 
 app = FastAPI(
     title="PCB Design API",
     description="Beginner-friendly PCB design backend with ML guidance",
-    version="0.1.0"
+    version="0.1.0",
+    lifespan=lifespan,
 )
 
 # CORS for frontend development
@@ -20,11 +38,14 @@ app.add_middleware(
     allow_credentials=True,
     allow_methods=["*"],
     allow_headers=["*"],
+    expose_headers=["ETag"],  # Conditional GET/PUT on designs
 )
 
 # Register API routers
 app.include_router(designs.router)
 app.include_router(ml.router)
+app.include_router(live.router)
+app.include_router(jobs.router)
 
 
 @app.get("/")
@@ -0,0 +1 @@
+"""Performance benchmarks for the PCB Design backend."""
@@ -0,0 +1,40 @@
+"""
+Benchmark: autoplacer wire length and wall time against board size.
+
+Synthetic boards start from their jittered grid placement; a second run
+starts with every part unplaced, so the placer builds the layout from
+random positions. Reports HPWL before and after, and the parts that could
+not be moved clear of their neighbours.
+
+Run from the backend directory:
+    python -m benchmarks.bench_autoplace
+"""
+
+import time
+
+from app.domain.autoplacer import AutoplacerService
+from benchmarks.synthetic import generate_design
+
+SIZES = [100, 1_000, 10_000]
+
+
+def run() -> None:
+    placer = AutoplacerService()
+    print(f"{'components':>10} {'start':>9} {'seconds':>9} {'hpwl before':>12} {'hpwl after':>11} {'overlaps':>9}")
+    for size in SIZES:
+        for start in ("placed", "unplaced"):
+            design = generate_design(size)
+            if start == "unplaced":
+                for component in design.board.components:
+                    component.position = None
+            begin = time.perf_counter()
+            result = placer.place(design.board)
+            elapsed = time.perf_counter() - begin
+            print(
+                f"{size:>10} {start:>9} {elapsed:>9.2f} {result.hpwl_before:>12.0f} "
+                f"{result.hpwl_after:>11.0f} {len(result.overlaps):>9}"
+            )
+
+
+if __name__ == "__main__":
+    run()
@@ -0,0 +1,63 @@
+"""
+Benchmark: autorouter completion rate and wall time against net count.
+
+Each net joins pin 2 of one part to pin 1 of another part nearby in board
+order (a shuffle within small blocks, so nets cross each other). No pin is
+shared, so every net is routable in principle. Boards are routed on one and
+two layers, in-process and with a worker pool.
+
+Run from the backend directory:
+    python -m benchmarks.bench_autoroute
+"""
+
+import os
+import random
+import time
+
+from app.domain.autorouter import AutorouterService
+from app.domain.models import Net
+from benchmarks.synthetic import generate_design
+
+NET_COUNTS = [10, 50, 200, 1_000]
+# Parts whose pin-1 partners are shuffled together
+SHUFFLE_BLOCK = 6
+
+
+def routing_design(n_nets: int, layers: int):
+    """A board of two-terminal parts with `n_nets` crossing two-pin nets."""
+    rng = random.Random(n_nets)
+    design = generate_design(n_nets, n_nets=0, seed=n_nets)
+    design.board.layers = layers
+    for component in design.board.components:
+        component.type = "resistor"
+    partners = list(range(n_nets))
+    for start in range(0, n_nets, SHUFFLE_BLOCK):
+        block = partners[start:start + SHUFFLE_BLOCK]
+        rng.shuffle(block)
+        partners[start:start + SHUFFLE_BLOCK] = block
+    design.board.nets = [
+        Net(id=f"N{i}", connection_ids=[f"C{i}.2", f"C{j}.1"]) for i, j in enumerate(partners) if i != j
+    ]
+    return design
+
+
+def run() -> None:
+    router = AutorouterService()
+    worker_counts = sorted({1, 4, os.cpu_count() or 1})
+    print(f"{'nets':>6} {'layers':>7} {'workers':>8} {'seconds':>9} {'completion':>11} {'vias':>6}")
+    for n_nets in NET_COUNTS:
+        for layers in (1, 2):
+            design = routing_design(n_nets, layers)
+            n_routable = len(design.board.nets)
+            for workers in worker_counts:
+                start = time.perf_counter()
+                result = router.route(design, max_workers=workers)
+                elapsed = time.perf_counter() - start
+                print(
+                    f"{n_routable:>6} {layers:>7} {workers:>8} {elapsed:>9.2f} "
+                    f"{result.completion_rate:>11.1%} {len(result.vias):>6}"
+                )
+
+
+if __name__ == "__main__":
+    run()
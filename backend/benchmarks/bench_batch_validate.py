@@ -0,0 +1,42 @@
+"""
+Benchmark: batch DRC throughput against executor pool size.
+
+Run from the backend directory:
+    python -m benchmarks.bench_batch_validate
+"""
+
+import os
+import time
+
+from app.domain.services import DRCService
+from app.infra.executor import CPUExecutor
+from benchmarks.synthetic import generate_design
+
+N_DESIGNS = 64
+COMPONENTS_PER_DESIGN = 2_000
+
+
+def run() -> None:
+    designs = [
+        generate_design(COMPONENTS_PER_DESIGN, design_id=f"lib-{i}", seed=i)
+        for i in range(N_DESIGNS)
+    ]
+    drc = DRCService()
+
+    worker_counts = sorted({1, 2, 4, os.cpu_count() or 1})
+    baseline = None
+    print(f"{N_DESIGNS} designs x {COMPONENTS_PER_DESIGN} components, {os.cpu_count()} CPUs")
+    print(f"{'workers':>8} {'seconds':>10} {'designs/s':>10} {'speedup':>8}")
+    for workers in worker_counts:
+        executor = CPUExecutor("process", max_workers=workers)
+        start = time.perf_counter()
+        for _ in drc.check_designs(designs, executor, max_workers=workers):
+            pass
+        elapsed = time.perf_counter() - start
+        executor.shutdown()
+        baseline = baseline or elapsed
+        print(f"{workers:>8} {elapsed:>10.2f} {N_DESIGNS / elapsed:>10.1f} {baseline / elapsed:>8.2f}")
+
+
+if __name__ == "__main__":
+    run()
@@ -0,0 +1,52 @@
+"""
+Benchmark: columnar board arrays.
+
+Reports the memory retained by the arrays, their build time and full DRC /
+ML suggestion times on boards that use them.
+
+Run from the backend directory:
+    python -m benchmarks.bench_board_arrays
+"""
+
+import time
+import tracemalloc
+
+from app.domain.board_arrays import BoardArrays
+from app.domain.ml_services import MLService
+from app.domain.services import DRCService
+from benchmarks.synthetic import generate_design
+
+SIZES = [1_000, 10_000, 50_000]
+
+
+def retained_mb(build) -> float:
+    """Memory still allocated by the result of `build()`."""
+    tracemalloc.start()
+    result = build()
+    current = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    del result
+    return current / 1e6
+
+
+def timed_ms(fn) -> float:
+    start = time.perf_counter()
+    fn()
+    return (time.perf_counter() - start) * 1e3
+
+
+def run() -> None:
+    drc, ml = DRCService(), MLService()
+    print(f"{'components':>10} {'arrays MB':>10} {'build ms':>9} {'drc ms':>8} {'ml ms':>8}")
+    for size in SIZES:
+        design = generate_design(size)
+        board = design.board
+        arrays_mb = retained_mb(lambda: BoardArrays.build(board))
+        build_ms = timed_ms(lambda: BoardArrays.build(board))
+        drc_ms = timed_ms(lambda: drc.check_design(design))
+        ml_ms = timed_ms(lambda: ml.get_suggestions(design))
+        print(f"{size:>10} {arrays_mb:>10.2f} {build_ms:>9.1f} {drc_ms:>8.1f} {ml_ms:>8.1f}")
+
+
+if __name__ == "__main__":
+    run()
@@ -0,0 +1,28 @@
+"""
+Benchmark: vectorized board-outline containment.
+
+Run from the backend directory:
+    python -m benchmarks.bench_bounds
+"""
+
+import time
+
+from app.domain.services import DRCService
+from benchmarks.synthetic import generate_design
+
+SIZES = [100, 1_000, 10_000, 50_000]
+
+
+def run() -> None:
+    drc = DRCService()
+    print(f"{'components':>10} {'ms':>10} {'us/component':>14} {'issues':>8}")
+    for size in SIZES:
+        design = generate_design(size, n_nets=0)
+        start = time.perf_counter()
+        issues = list(drc._check_components_in_bounds(design))
+        elapsed = time.perf_counter() - start
+        print(f"{size:>10} {elapsed * 1e3:>10.2f} {elapsed / size * 1e6:>14.2f} {len(issues):>8}")
+
+
+if __name__ == "__main__":
+    run()
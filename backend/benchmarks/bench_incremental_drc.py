@@ -0,0 +1,44 @@
+"""
+Benchmark: incremental DRC after a single-component move vs. a full check.
+
+Run from the backend directory:
+    python -m benchmarks.bench_incremental_drc
+"""
+
+import time
+
+from app.domain.incremental_drc import BoardChanges, IncrementalDRCService
+from app.domain.services import DRCService
+from benchmarks.synthetic import generate_design
+
+SIZES = [1_000, 10_000, 50_000]
+
+
+def _timed(fn) -> float:
+    start = time.perf_counter()
+    fn()
+    return time.perf_counter() - start
+
+
+def run() -> None:
+    print(f"{'components':>10} {'full ms':>10} {'diff ms':>10} {'hinted ms':>10}")
+    for size in SIZES:
+        design = generate_design(size)
+        full = DRCService()
+        incremental = IncrementalDRCService()
+        incremental.check_design(design)
+
+        component = design.board.components[size // 2]
+        component.position = [component.position[0] + 1.0, component.position[1]]
+        full_time = _timed(lambda: full.check_design(design))
+        diff_time = _timed(lambda: incremental.check_design(design))
+
+        component.position = [component.position[0] - 1.0, component.position[1]]
+        changes = BoardChanges(components={component.id})
+        hinted_time = _timed(lambda: incremental.check_design(design, changes))
+
+        print(f"{size:>10} {full_time * 1e3:>10.1f} {diff_time * 1e3:>10.1f} {hinted_time * 1e3:>10.1f}")
+
+
+if __name__ == "__main__":
+    run()
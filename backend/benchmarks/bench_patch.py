@@ -0,0 +1,74 @@
+"""
+Benchmark: moving one component with PATCH vs. resending the design with PUT.
+
+Run from the backend directory:
+    python -m benchmarks.bench_patch
+"""
+
+import json
+import statistics
+import time
+
+from fastapi.testclient import TestClient
+
+from app.api.designs import get_design_service
+from app.domain.services import DesignService
+from app.infra.memory_repo import DesignRepository
+from app.main import app
+from benchmarks.synthetic import generate_design
+
+N_COMPONENTS = 10_000
+ROUNDS = 20
+
+
+def _median_ms(fn) -> float:
+    samples = []
+    for i in range(ROUNDS):
+        start = time.perf_counter()
+        fn(i)
+        samples.append(time.perf_counter() - start)
+    return statistics.median(samples) * 1e3
+
+
+def run() -> None:
+    repo = DesignRepository()
+    app.dependency_overrides[get_design_service] = lambda: DesignService(repo)
+    client = TestClient(app)
+
+    design = generate_design(N_COMPONENTS)
+    client.post("/designs", content=design.model_dump_json(), headers={"Content-Type": "application/json"})
+    target = N_COMPONENTS // 2
+    component_id = design.board.components[target].id
+
+    def put(i: int) -> None:
+        design.board.components[target].position = [float(i), 1.0]
+        body = design.model_dump_json()
+        put.bytes = len(body)
+        response = client.put(f"/designs/{design.id}", content=body, headers={"Content-Type": "application/json"})
+        put.response_bytes = len(response.content)
+
+    def json_patch(i: int) -> None:
+        body = json.dumps([{"op": "replace", "path": f"/board/components/{target}/position", "value": [float(i), 2.0]}])
+        json_patch.bytes = len(body)
+        response = client.patch(
+            f"/designs/{design.id}", content=body, headers={"Content-Type": "application/json-patch+json"}
+        )
+        json_patch.response_bytes = len(response.content)
+
+    def delta(i: int) -> None:
+        body = json.dumps({"ops": [{"op": "move_component", "component_id": component_id, "position": [float(i), 3.0]}]})
+        delta.bytes = len(body)
+        response = client.patch(f"/designs/{design.id}", content=body, headers={"Content-Type": "application/json"})
+        delta.response_bytes = len(response.content)
+
+    print(f"{N_COMPONENTS} components, median of {ROUNDS} single-component moves")
+    print(f"{'method':>12} {'request B':>12} {'response B':>12} {'ms':>8}")
+    for name, fn in [("PUT", put), ("JSON Patch", json_patch), ("delta", delta)]:
+        ms = _median_ms(fn)
+        print(f"{name:>12} {fn.bytes:>12} {fn.response_bytes:>12} {ms:>8.2f}")
+
+    app.dependency_overrides.clear()
+
+
+if __name__ == "__main__":
+    run()
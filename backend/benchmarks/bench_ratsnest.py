@@ -0,0 +1,74 @@
+"""
+Benchmark: ratsnest recompute after a single-component move vs. a full
+compute, and the spanning tree of one large net vs. all pin pairs.
+
+The second table is the power/ground case: one net with thousands of pins,
+where Kruskal over every pair is quadratic in memory and time.
+
+Run from the backend directory:
+    python -m benchmarks.bench_ratsnest
+"""
+
+import time
+
+import numpy as np
+
+from app.domain.changes import BoardChanges
+from app.domain.connectivity import DisjointSet
+from app.domain.ratsnest import RatsnestService, spanning_edges
+from benchmarks.synthetic import generate_design
+
+SIZES = [1_000, 10_000, 50_000]
+NET_PINS = [1_000, 3_000, 10_000]
+# All-pairs Kruskal is skipped above this many pins (n^2 / 2 edges)
+ALL_PAIRS_LIMIT = 3_000
+
+
+def _timed(fn) -> float:
+    start = time.perf_counter()
+    fn()
+    return time.perf_counter() - start
+
+
+def _all_pairs(points: np.ndarray) -> None:
+    i, j = np.triu_indices(len(points), k=1)
+    d = np.hypot(*(points[i] - points[j]).T)
+    sets = DisjointSet(len(points))
+    joined = 0
+    for k in np.argsort(d, kind="stable").tolist():
+        if sets.union(int(i[k]), int(j[k])):
+            joined += 1
+            if joined == len(points) - 1:
+                return
+
+
+def run() -> None:
+    print(f"{'components':>10} {'full ms':>10} {'diff ms':>10} {'hinted ms':>10} {'airwires':>9}")
+    for size in SIZES:
+        design = generate_design(size)
+        service = RatsnestService()
+        full_time = _timed(lambda: service.compute(design))
+
+        component = design.board.components[size // 2]
+        component.position = [component.position[0] + 1.0, component.position[1]]
+        diff_time = _timed(lambda: service.compute(design))
+
+        component.position = [component.position[0] - 1.0, component.position[1]]
+        changes = BoardChanges(components={component.id})
+        hinted_time = _timed(lambda: service.compute(design, changes))
+        airwires = len(service.compute(design).airwires)
+
+        print(f"{size:>10} {full_time * 1e3:>10.1f} {diff_time * 1e3:>10.1f} {hinted_time * 1e3:>10.1f} {airwires:>9}")
+
+    print()
+    print(f"{'net pins':>10} {'tree ms':>10} {'all pairs ms':>13}")
+    rng = np.random.default_rng(0)
+    for pins in NET_PINS:
+        points = rng.uniform(0, 200, size=(pins, 2))
+        tree_time = _timed(lambda: spanning_edges(points, DisjointSet(pins)))
+        pairs = f"{_timed(lambda: _all_pairs(points)) * 1e3:>13.1f}" if pins <= ALL_PAIRS_LIMIT else f"{'-':>13}"
+        print(f"{pins:>10} {tree_time * 1e3:>10.1f} {pairs}")
+
+
+if __name__ == "__main__":
+    run()
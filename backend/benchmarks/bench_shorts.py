@@ -0,0 +1,56 @@
+"""
+Benchmark: short-circuit islands on dense synthetic netlists.
+
+Each net steals a pin from an earlier net with probability `short_density`,
+so dense boards merge hundreds of nets into a few islands. Reports the
+union-find pass on its own, the islands and shorted nets it finds, and an
+incremental re-check after one net is rewired.
+
+Run from the backend directory:
+    python -m benchmarks.bench_shorts
+"""
+
+import time
+
+from app.domain.board_arrays import BoardArrays
+from app.domain.incremental_drc import IncrementalDRCService
+from app.domain.services import DRCService
+from benchmarks.synthetic import generate_design
+
+SIZES = [1_000, 10_000, 50_000]
+DENSITIES = [0.0, 0.1, 0.5, 1.0]
+
+
+def _timed(fn):
+    start = time.perf_counter()
+    result = fn()
+    return result, time.perf_counter() - start
+
+
+def run() -> None:
+    drc = DRCService()
+    print(
+        f"{'components':>10} {'density':>8} {'shorts ms':>10} {'islands':>8} "
+        f"{'shorted nets':>13} {'largest':>8} {'rewire ms':>10}"
+    )
+    for size in SIZES:
+        for density in DENSITIES:
+            design = generate_design(size, short_density=density)
+            arrays = BoardArrays.build(design.board)
+            shorts, elapsed = _timed(lambda: list(drc._check_short_circuits(arrays)))
+            sizes = [len(issue.location["nets"]) for issue in shorts]
+
+            incremental = IncrementalDRCService(drc)
+            incremental.check_design(design)
+            net = design.board.nets[len(design.board.nets) // 2]
+            net.connection_ids = net.connection_ids + [design.board.nets[0].connection_ids[0]]
+            _, rewire = _timed(lambda: incremental.check_design(design))
+
+            print(
+                f"{size:>10} {density:>8.1f} {elapsed * 1e3:>10.1f} {len(shorts):>8} "
+                f"{sum(sizes):>13} {max(sizes, default=0):>8} {rewire * 1e3:>10.1f}"
+            )
+
+
+if __name__ == "__main__":
+    run()
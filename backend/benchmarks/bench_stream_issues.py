@@ -0,0 +1,119 @@
+"""
+Benchmark: POST /designs/{id}/validate streamed as NDJSON vs. the one JSON
+response, measured through the real endpoint.
+
+Reports time to the first issue, time to the whole response and peak
+traced memory. The streamed peak still includes the issue objects the
+endpoint collects to cache and save on the design; what streaming removes
+is the serialized response body held in one piece.
+
+Run from the backend directory:
+    python -m benchmarks.bench_stream_issues
+"""
+
+import asyncio
+import time
+import tracemalloc
+
+from app.api.designs import get_design_service, get_drc_cache
+from app.domain.services import DesignService
+from app.infra.memory_repo import DesignRepository
+from app.infra.result_cache import DRCResultCache
+from app.main import app
+from benchmarks.synthetic import generate_design
+
+SIZES = [10_000, 50_000]
+
+
+def _post(path: str, query: str = "") -> tuple[float, float, int]:
+    """
+    Call the ASGI app directly and time the first and last body chunk
+    (TestClient buffers the whole response, hiding when chunks are sent).
+    Returns (first chunk s, total s, lines).
+    """
+    scope = {
+        "type": "http",
+        "asgi": {"version": "3.0"},
+        "http_version": "1.1",
+        "method": "POST",
+        "scheme": "http",
+        "path": path,
+        "raw_path": path.encode(),
+        "query_string": query.encode(),
+        "headers": [(b"host", b"bench")],
+        "server": ("bench", 80),
+        "client": ("bench", 1),
+        "root_path": "",
+    }
+    timings = {"first": None, "lines": 0}
+
+    async def call() -> None:
+        requested = False
+        finished = asyncio.Event()
+
+        async def receive():
+            nonlocal requested
+            if not requested:
+                requested = True
+                return {"type": "http.request", "body": b"", "more_body": False}
+            # The client stays connected until the response is complete
+            await finished.wait()
+            return {"type": "http.disconnect"}
+
+        async def send(message):
+            if message["type"] != "http.response.body":
+                return
+            if message.get("body"):
+                if timings["first"] is None:
+                    timings["first"] = time.perf_counter() - start
+                timings["lines"] += message["body"].count(b"\n")
+            if not message.get("more_body"):
+                finished.set()
+
+        await app(scope, receive, send)
+
+    start = time.perf_counter()
+    asyncio.run(call())
+    return timings["first"] or 0.0, time.perf_counter() - start, timings["lines"]
+
+
+def _peak_mb(fn) -> float:
+    tracemalloc.start()
+    fn()
+    peak = tracemalloc.get_traced_memory()[1]
+    tracemalloc.stop()
+    return peak / 2**20
+
+
+def run() -> None:
+    repo = DesignRepository()
+    app.dependency_overrides[get_design_service] = lambda: DesignService(repo)
+    # A fresh result cache per request, so every call runs the checks
+    app.dependency_overrides[get_drc_cache] = DRCResultCache
+
+    print(f"{'components':>10} {'issues':>8} {'first ms':>10} {'stream ms':>10} {'full ms':>10} {'stream peak MB':>15} {'full peak MB':>13}")
+    try:
+        for size in SIZES:
+            design = generate_design(size)
+            # Half the nets lose a pin, so there are thousands of issues to report
+            for net in design.board.nets[::2]:
+                net.connection_ids = net.connection_ids[:1]
+            repo.save(design)
+            path = f"/designs/{design.id}/validate"
+
+            first, streamed, count = _post(path, "stream=ndjson")
+            _, full, _ = _post(path)
+            stream_peak = _peak_mb(lambda: _post(path, "stream=ndjson"))
+            full_peak = _peak_mb(lambda: _post(path))
+
+            print(
+                f"{size:>10} {count:>8} {first * 1e3:>10.2f} {streamed * 1e3:>10.1f} {full * 1e3:>10.1f} "
+                f"{stream_peak:>15.1f} {full_peak:>13.1f}"
+            )
+    finally:
+        app.dependency_overrides.pop(get_design_service, None)
+        app.dependency_overrides.pop(get_drc_cache, None)
+
+
+if __name__ == "__main__":
+    run()
@@ -0,0 +1,247 @@
+"""
+Benchmark suite: backend hot paths with machine-readable results.
+
+Times each DRC rule, MLService.get_suggestions, every repository backend
+and end-to-end API latency on synthetic boards, and writes the results as
+JSON so runs can be compared over time.
+
+Run from the backend directory:
+    python -m benchmarks.suite --output results.json
+    python -m benchmarks.suite --output new.json --compare results.json
+"""
+
+import argparse
+import json
+import os
+import platform
+import statistics
+import sys
+import tempfile
+import time
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Callable, Dict, Iterator, List
+
+from fastapi.testclient import TestClient
+
+from app.api.designs import get_drc_cache, get_repo
+from app.domain.board_arrays import BoardArrays
+from app.domain.ml_services import MLService
+from app.domain.services import DRCService
+from app.infra.memory_repo import DesignRepository
+from app.infra.result_cache import DRCResultCache
+from app.infra.sqlite_repo import SQLiteDesignRepository
+from app.infra.wal_repo import WALDesignRepository
+from app.main import app
+from benchmarks.synthetic import generate_design
+
+SCHEMA_VERSION = 1
+
+SIZES = [100, 1_000, 10_000]
+QUICK_SIZES = [50, 200]
+ROUNDS = 5
+
+# Board variants timed at every size: (name, generate_design keyword arguments)
+VARIANTS = [
+    ("rectangle", {}),
+    ("l_shape", {"outline": "l_shape"}),
+    ("dense_shorts", {"short_density": 0.5}),
+]
+
+# Designs stored per repository benchmark
+REPO_DESIGNS = 200
+REPO_COMPONENTS = 50
+
+
+def measure(fn: Callable[[], object], rounds: int) -> Dict[str, float]:
+    """Run `fn` `rounds` times and summarize the wall time in milliseconds."""
+    samples = []
+    for _ in range(rounds):
+        start = time.perf_counter()
+        fn()
+        samples.append((time.perf_counter() - start) * 1e3)
+    return {
+        "rounds": rounds,
+        "median_ms": statistics.median(samples),
+        "min_ms": min(samples),
+        "max_ms": max(samples),
+    }
+
+
+def _result(name: str, params: Dict, timing: Dict[str, float]) -> Dict:
+    return {"name": name, "params": params, **timing}
+
+
+def bench_drc(sizes: List[int], rounds: int) -> Iterator[Dict]:
+    """Full check_design plus each rule on its own, per board variant."""
+    drc = DRCService()
+    for size in sizes:
+        for variant, kwargs in VARIANTS:
+            design = generate_design(size, **kwargs)
+            arrays = BoardArrays.build(design.board)
+            params = {"components": size, "nets": len(design.board.nets), "variant": variant}
+            rules = {
+                "drc.check_design": lambda: drc.check_design(design),
+                "drc.board_arrays": lambda: BoardArrays.build(design.board),
+                "drc.unconnected_nets": lambda: list(drc._check_unconnected_nets(design)),
+                "drc.short_circuits": lambda: list(drc._check_short_circuits(arrays)),
+                "drc.isolated_components": lambda: list(drc._check_isolated_components(arrays)),
+                "drc.components_in_bounds": lambda: list(drc._check_components_in_bounds(design, arrays)),
+                "drc.clearance": lambda: list(drc._check_clearance(design, arrays)),
+            }
+            for name, fn in rules.items():
+                yield _result(name, params, measure(fn, rounds))
+
+
+def bench_ml(sizes: List[int], rounds: int) -> Iterator[Dict]:
+    """MLService.get_suggestions, including its classification pass."""
+    ml = MLService()
+    for size in sizes:
+        design = generate_design(size)
+        params = {"components": size, "nets": len(design.board.nets)}
+        yield _result("ml.get_suggestions", params, measure(lambda: ml.get_suggestions(design), rounds))
+
+
+def _repositories(data_dir: Path) -> Iterator[tuple]:
+    yield "memory", DesignRepository()
+    yield "wal", WALDesignRepository(data_dir / "wal", fsync=False)
+    yield "sqlite", SQLiteDesignRepository(data_dir / "designs.sqlite3")
+
+
+def bench_repositories(rounds: int, n_designs: int = REPO_DESIGNS) -> Iterator[Dict]:
+    """save/get/list_summaries throughput for every repository backend."""
+    designs = [
+        generate_design(REPO_COMPONENTS, design_id=f"bench-{i:05d}", seed=i) for i in range(n_designs)
+    ]
+    with tempfile.TemporaryDirectory() as data_dir:
+        for backend, repo in _repositories(Path(data_dir)):
+            try:
+                params = {"backend": backend, "designs": n_designs, "components": REPO_COMPONENTS}
+
+                def save_all():
+                    for design in designs:
+                        repo.save(design)
+
+                def get_all():
+                    for design in designs:
+                        repo.get(design.id)
+
+                def list_pages():
+                    page = repo.list_summaries()
+                    while page.next_cursor:
+                        page = repo.list_summaries(cursor=page.next_cursor)
+
+                yield _result("repo.save", params, measure(save_all, rounds))
+                yield _result("repo.get", params, measure(get_all, rounds))
+                yield _result("repo.list_summaries", params, measure(list_pages, rounds))
+            finally:
+                repo.close()
+
+
+def bench_api(sizes: List[int], rounds: int) -> Iterator[Dict]:
+    """End-to-end request latency through TestClient against a fresh repository."""
+    repo = DesignRepository()
+    app.dependency_overrides[get_repo] = lambda: repo
+    # A fresh cache per request, so validation always runs the checks
+    app.dependency_overrides[get_drc_cache] = lambda: DRCResultCache()
+    headers = {"Content-Type": "application/json"}
+    try:
+        with TestClient(app) as client:
+            for size in sizes:
+                design = generate_design(size, design_id=f"api-{size}")
+                body = design.model_dump_json()
+                params = {"components": size, "request_bytes": len(body)}
+                requests = {
+                    "api.create_design": lambda: client.post("/designs", content=body, headers=headers),
+                    "api.get_design": lambda: client.get(f"/designs/{design.id}"),
+                    "api.update_design": lambda: client.put(f"/designs/{design.id}", content=body, headers=headers),
+                    "api.validate": lambda: client.post(f"/designs/{design.id}/validate"),
+                    "api.ml_suggestions": lambda: client.post("/ml/suggestions", content=body, headers=headers),
+                    "api.list_designs": lambda: client.get("/designs"),
+                }
+                for name, request in requests.items():
+                    yield _result(name, params, measure(lambda: request().raise_for_status(), rounds))
+    finally:
+        app.dependency_overrides.pop(get_repo, None)
+        app.dependency_overrides.pop(get_drc_cache, None)
+
+
+def run_suite(sizes: List[int] = SIZES, rounds: int = ROUNDS, repo_designs: int = REPO_DESIGNS) -> Dict:
+    """Run every benchmark and return the JSON-ready report."""
+    results: List[Dict] = []
+    for bench in (
+        lambda: bench_drc(sizes, rounds),
+        lambda: bench_ml(sizes, rounds),
+        lambda: bench_repositories(rounds, repo_designs),
+        lambda: bench_api(sizes, rounds),
+    ):
+        for result in bench():
+            results.append(result)
+            print(f"{result['name']:<26} {_param_label(result['params']):<44} {result['median_ms']:>10.2f} ms", file=sys.stderr)
+    return {
+        "schema": SCHEMA_VERSION,
+        "created_at": datetime.now(timezone.utc).isoformat(),
+        "environment": {
+            "python": platform.python_version(),
+            "platform": platform.platform(),
+            "cpu_count": os.cpu_count(),
+        },
+        "results": results,
+    }
+
+
+def result_key(result: Dict) -> str:
+    """Identity of a measurement across runs: its name plus sorted params."""
+    return result["name"] + json.dumps(result["params"], sort_keys=True)
+
+
+def compare(current: Dict, baseline: Dict) -> List[Dict]:
+    """Median ratios (current / baseline) for the measurements both runs share."""
+    previous = {result_key(r): r for r in baseline["results"]}
+    rows = []
+    for result in current["results"]:
+        before = previous.get(result_key(result))
+        if before is None or before["median_ms"] <= 0:
+            continue
+        rows.append({
+            "name": result["name"],
+            "params": result["params"],
+            "baseline_ms": before["median_ms"],
+            "current_ms": result["median_ms"],
+            "ratio": result["median_ms"] / before["median_ms"],
+        })
+    return rows
+
+
+def _param_label(params: Dict) -> str:
+    return " ".join(f"{key}={value}" for key, value in params.items())
+
+
+def main(argv: List[str] | None = None) -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--output", type=Path, help="write the JSON report here (default: stdout)")
+    parser.add_argument("--compare", type=Path, help="baseline JSON report to compare against")
+    parser.add_argument("--sizes", type=int, nargs="+", help=f"component counts (default: {SIZES})")
+    parser.add_argument("--rounds", type=int, default=ROUNDS, help="timed rounds per measurement")
+    parser.add_argument("--quick", action="store_true", help=f"small boards only ({QUICK_SIZES}), for smoke runs")
+    args = parser.parse_args(argv)
+
+    sizes = args.sizes or (QUICK_SIZES if args.quick else SIZES)
+    report = run_suite(sizes, args.rounds, repo_designs=20 if args.quick else REPO_DESIGNS)
+
+    if args.compare:
+        baseline = json.loads(args.compare.read_text())
+        report["comparison"] = compare(report, baseline)
+        print(f"\n{'ratio':>7}  vs {args.compare}", file=sys.stderr)
+        for row in sorted(report["comparison"], key=lambda r: r["ratio"], reverse=True):
+            print(f"{row['ratio']:>7.2f}  {row['name']:<26} {_param_label(row['params'])}", file=sys.stderr)
+
+    text = json.dumps(report, indent=2)
+    if args.output:
+        args.output.write_text(text)
+    else:
+        sys.stdout.write(text + "\n")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,99 @@
+"""
+Synthetic board generator for benchmarks.
+Produces reproducible boards of arbitrary size from a seed.
+"""
+
+import math
+import random
+from typing import List
+
+from app.domain.models import Board, Component, Design, Net
+
+COMPONENT_TYPES = ["resistor", "capacitor", "led", "ic", "header", "mcu"]
+
+OUTLINE_SHAPES = ("rectangle", "l_shape", "octagon")
+
+
+def generate_board(
+    n_components: int,
+    n_nets: int | None = None,
+    pitch: float = 12.0,
+    jitter: float = 3.0,
+    seed: int = 0,
+    outline: str = "rectangle",
+    short_density: float = 0.0,
+) -> Board:
+    """
+    Generate a board with components on a jittered square grid.
+
+    `pitch` is the grid spacing in mm; with the default jitter a small fraction
+    of neighbouring parts end up closer than the DRC clearance.
+
+    `outline` is one of OUTLINE_SHAPES; the non-rectangular ones leave some
+    parts off the board. `short_density` is the fraction of nets that also
+    pick up a pin already used by a random earlier net, so shorts can be
+    scaled up to pathological densities.
+    """
+    if outline not in OUTLINE_SHAPES:
+        raise ValueError(f"Unknown outline shape '{outline}' (expected one of {OUTLINE_SHAPES})")
+    rng = random.Random(seed)
+    columns = max(1, math.ceil(math.sqrt(n_components)))
+
+    components: List[Component] = []
+    for i in range(n_components):
+        row, col = divmod(i, columns)
+        components.append(
+            Component(
+                id=f"C{i}",
+                type=rng.choice(COMPONENT_TYPES),
+                position=[
+                    col * pitch + rng.uniform(-jitter, jitter),
+                    row * pitch + rng.uniform(-jitter, jitter),
+                ],
+                rotation=rng.choice([0.0, 90.0]),
+            )
+        )
+
+    # Nets join a few nearby components, like short local signal runs
+    if n_nets is None:
+        n_nets = n_components // 2
+    nets: List[Net] = []
+    for n in range(n_nets):
+        start = rng.randrange(max(1, n_components))
+        span = rng.randint(2, 4)
+        members = [(start + k) % max(1, n_components) for k in range(span)]
+        nets.append(Net(id=f"N{n}", connection_ids=[f"C{m}.{n % 4 + 1}" for m in members]))
+
+    # Drawn after the base netlist so seeds keep producing the same board
+    if short_density > 0:
+        for n in range(1, n_nets):
+            if rng.random() < short_density:
+                pin = rng.choice(nets[rng.randrange(n)].connection_ids)
+                if pin not in nets[n].connection_ids:
+                    nets[n].connection_ids.append(pin)
+
+    rows = math.ceil(n_components / columns)
+    width, height = columns * pitch, rows * pitch
+
+    return Board(outline=_outline(outline, width, height, pitch), components=components, nets=nets, layers=2)
+
+
+def _outline(shape: str, width: float, height: float, margin: float) -> List[List[float]]:
+    """Outline polygon of the given shape around a width x height grid."""
+    left, bottom = -margin, -margin
+    if shape == "l_shape":
+        # Top-right quarter cut away
+        mid_x, mid_y = width / 2, height / 2
+        return [[left, bottom], [width, bottom], [width, mid_y], [mid_x, mid_y], [mid_x, height], [left, height]]
+    if shape == "octagon":
+        cut = min(width - left, height - bottom) / 4
+        return [
+            [left + cut, bottom], [width - cut, bottom], [width, bottom + cut], [width, height - cut],
+            [width - cut, height], [left + cut, height], [left, height - cut], [left, bottom + cut],
+        ]
+    return [[left, bottom], [width, bottom], [width, height], [left, height]]
+
+
+def generate_design(n_components: int, design_id: str = "bench", **kwargs) -> Design:
+    """Wrap a synthetic board in a Design."""
+    return Design(id=design_id, name=f"Synthetic {n_components}", board=generate_board(n_components, **kwargs))
@@ -0,0 +1,168 @@
+"""
+Tests for the annealing autoplacer, the placement suggestion and the autoplace job.
+"""
+
+import numpy as np
+import pytest
+from fastapi.testclient import TestClient
+
+from app.api.designs import get_design_service
+from app.domain.autoplacer import AutoplacerService
+from app.domain.footprints import component_bounding_boxes
+from app.domain.geometry import boxes_in_polygon
+from app.domain.ml_services import MLService
+from app.domain.models import Board, Component, Design, Net
+from app.domain.services import DesignService, DRCService
+from app.infra.memory_repo import DesignRepository
+from app.main import app
+from benchmarks.synthetic import generate_design
+
+OUTLINE = [[0, 0], [60, 0], [60, 40], [0, 40]]
+
+
+def scattered_design() -> Design:
+    """Two chains of parts placed in swapped corners, so every net crosses the board."""
+    corners = [[5, 5], [55, 35], [55, 5], [5, 35], [30, 5], [30, 35]]
+    return Design(id="scattered", name="Scattered", board=Board(
+        outline=OUTLINE,
+        components=[Component(id=f"R{i}", type="resistor", position=corners[i]) for i in range(6)],
+        nets=[
+            Net(id="a", connection_ids=["R0.1", "R1.1"]),
+            Net(id="b", connection_ids=["R2.1", "R3.1"]),
+            Net(id="c", connection_ids=["R1.2", "R4.2", "R5.2"]),
+        ],
+    ))
+
+
+def test_shortens_wiring_and_stays_legal():
+    """HPWL drops, every footprint stays inside the outline and DRC finds no overlaps."""
+    design = generate_design(300, outline="l_shape")
+    placer = AutoplacerService()
+    result = placer.place(design.board)
+    placed = placer.apply(design, result)
+
+    assert result.hpwl_after < 0.7 * result.hpwl_before
+    assert result.overlaps == []
+    _, boxes = component_bounding_boxes(placed.board.components)
+    assert boxes_in_polygon(boxes, np.asarray(design.board.outline)).all()
+    kinds = {issue.type for issue in DRCService().check_design(placed)}
+    assert not kinds & {"clearance_violation", "board_edge"}
+
+
+def test_fixed_parts_stay_and_unplaced_parts_get_positions():
+    """Fixed components never move; components without a position are placed."""
+    design = scattered_design()
+    design.board.components.append(Component(id="R6", type="resistor"))
+    design.board.nets.append(Net(id="d", connection_ids=["R6.1", "R0.2"]))
+    result = AutoplacerService().place(design.board, fixed=["R0", "R1"])
+
+    assert "R0" not in result.positions and "R1" not in result.positions
+    assert set(result.positions) == {"R2", "R3", "R4", "R5", "R6"}
+    # Same seed, same proposal
+    assert AutoplacerService().place(design.board, fixed=["R0", "R1"]).positions == result.positions
+
+
+def test_boxes_spanning_a_slot_are_outside():
+    """All corners inside and no vertex inside the box is not enough: the slot edges cross it."""
+    u_shape = np.asarray([[0, 0], [30, 0], [30, 30], [20, 30], [20, 10], [10, 10], [10, 30], [0, 30]])
+    boxes = [[5, 15, 25, 20], [1, 1, 29, 9], [1, 11, 9, 29], [20, 11, 29, 29]]
+    assert boxes_in_polygon(boxes, u_shape).tolist() == [False, True, True, True]
+
+
+def test_parts_are_not_placed_across_a_slot():
+    """Chained parts on both sides of a narrow slot stay off it."""
+    slotted = [[0, 0], [60, 0], [60, 40], [30.5, 40], [30.5, 8], [29.5, 8], [29.5, 40], [0, 40]]
+    components = [Component(id=f"R{i}", type="resistor", position=[5 + 50 * (i % 2), 30 - 2 * i]) for i in range(12)]
+    nets = [Net(id=f"n{i}", connection_ids=[f"R{i}.2", f"R{i + 1}.1"]) for i in range(11)]
+    design = Design(id="slotted", name="Slotted", board=Board(outline=slotted, components=components, nets=nets))
+    for seed in range(5):
+        placer = AutoplacerService(seed=seed)
+        _, boxes = component_bounding_boxes(placer.apply(design, placer.place(design.board)).board.components)
+        assert not ((boxes[:, 0] < 30.5) & (boxes[:, 2] > 29.5) & (boxes[:, 3] > 8)).any(), seed
+
+
+def test_requires_outline():
+    design = scattered_design()
+    design.board.outline = []
+    with pytest.raises(ValueError):
+        AutoplacerService().place(design.board)
+
+
+def test_placement_suggestion_carries_move_action():
+    """On request, the placement suggestion hands the frontend concrete positions to apply."""
+    suggestions = MLService().get_suggestions(scattered_design(), placement=True)
+    placement = next(s for s in suggestions if s["id"] == "suggest_placement")
+
+    assert placement["action"]["type"] == "move_components"
+    params = placement["action"]["params"]
+    assert params["hpwl_after"] < params["hpwl_before"]
+    assert set(params["positions"]) == {f"R{i}" for i in range(6)}
+
+    unassisted = MLService(placer=None).get_suggestions(scattered_design(), placement=True)
+    assert next(s for s in unassisted if s["id"] == "suggest_placement")["action"] is None
+
+
+def test_suggestion_endpoint_runs_placer_only_on_request(monkeypatch):
+    """Coaching calls never invoke the placer; placement=true does."""
+    calls = []
+    original = AutoplacerService.place
+    monkeypatch.setattr(AutoplacerService, "place", lambda self, board, *a, **kw: calls.append(board) or original(self, board, *a, **kw))
+    body = scattered_design().model_dump(mode="json")
+    with TestClient(app) as client:
+        plain = client.post("/ml/suggestions", json=body).json()["suggestions"]
+        client.post("/ml/next-action", json=body)
+        assert calls == []
+        assert next(s for s in plain if s["id"] == "suggest_placement")["action"] is None
+
+        placed = client.post("/ml/suggestions", params={"placement": "true"}, json=body).json()["suggestions"]
+        assert len(calls) == 1
+        assert next(s for s in placed if s["id"] == "suggest_placement")["action"]["type"] == "move_components"
+
+
+def test_autoplace_job_saves_positions():
+    """The job moves the stored design's components and reports the saving."""
+    with TestClient(app) as client:
+        client.post("/designs", content=scattered_design().model_dump_json(), headers={"Content-Type": "application/json"})
+
+        response = client.post("/designs/scattered/autoplace/job", json={"fixed": ["R0"]})
+        assert response.status_code == 202
+        job_id = response.json()["id"]
+        events = client.get(f"/jobs/{job_id}/events")
+        assert "event: done" in events.text
+
+        result = client.get(f"/jobs/{job_id}/result").json()
+        assert result["design_id"] == "scattered" and result["moved_components"] == 5
+        assert result["hpwl_after"] < result["hpwl_before"]
+        stored = {c["id"]: c["position"] for c in client.get("/designs/scattered").json()["board"]["components"]}
+        assert stored["R0"] == [5, 5]
+
+        assert client.post("/designs/missing/autoplace/job").status_code == 404
+
+
+def test_autoplace_job_does_not_overwrite_concurrent_edits(monkeypatch):
+    """A design edited while the job anneals keeps the edit and the job fails."""
+    repo = DesignRepository()
+    place = AutoplacerService.place
+
+    def place_then_edit(self, board, *args, **kwargs):
+        result = place(self, board, *args, **kwargs)
+        edited = repo.get("scattered-edited").model_copy(deep=True)
+        edited.name = "Edited meanwhile"
+        repo.save(edited)
+        return result
+
+    monkeypatch.setattr(AutoplacerService, "place", place_then_edit)
+    monkeypatch.setitem(app.dependency_overrides, get_design_service, lambda: DesignService(repo))
+    with TestClient(app) as client:
+        design = scattered_design()
+        design.id = "scattered-edited"
+        client.post("/designs", content=design.model_dump_json(), headers={"Content-Type": "application/json"})
+
+        job_id = client.post("/designs/scattered-edited/autoplace/job").json()["id"]
+        assert "event: done" in client.get(f"/jobs/{job_id}/events").text
+
+        job = client.get(f"/jobs/{job_id}").json()
+        assert job["status"] == "failed" and "changed while the job ran" in job["error"]
+        stored = client.get("/designs/scattered-edited").json()
+        assert stored["name"] == "Edited meanwhile"
+        assert [c["position"] for c in stored["board"]["components"]] == [c.position for c in design.board.components]
@@ -0,0 +1,169 @@
+"""
+Tests for the grid/A* autorouter and its job endpoint.
+"""
+
+import time
+
+import numpy as np
+import pytest
+from fastapi.testclient import TestClient
+
+from app.api.designs import get_design_service
+from app.domain.autorouter import AutorouterService
+from app.domain.gerber import iter_excellon, iter_pad_layer, F_CU
+from app.domain.geometry import points_in_polygon
+from app.domain.models import Board, Component, Design, Net
+from app.domain.pads import pin_position
+from app.domain.services import DesignService
+from app.infra.memory_repo import DesignRepository
+from app.main import app
+from benchmarks.bench_autoroute import routing_design
+
+OUTLINE = [[0, 0], [40, 0], [40, 20], [0, 20]]
+
+
+def walled_design(layers: int) -> Design:
+    """R1 and R2 on either side of a column of ICs whose pads wall off the top layer."""
+    wall = [Component(id=f"U{i}", type="ic", position=[20, 2.5 + 5 * i]) for i in range(4)]
+    return Design(
+        id="walled",
+        name="Walled",
+        board=Board(
+            outline=OUTLINE,
+            components=[
+                Component(id="R1", type="resistor", position=[8, 10]),
+                Component(id="R2", type="resistor", position=[32, 10]),
+                *wall,
+            ],
+            nets=[Net(id="sig", connection_ids=["R1.2", "R2.1"])],
+            layers=layers,
+        ),
+    )
+
+
+def test_routes_between_pad_centers_inside_outline():
+    """Multi-pin nets are fully routed; traces end on pads and stay on the board."""
+    design = Design(id="simple", name="Simple", board=Board(
+        outline=OUTLINE,
+        components=[
+            Component(id="R1", type="resistor", position=[8, 5]),
+            Component(id="R2", type="resistor", position=[32, 15]),
+            Component(id="J1", type="header", position=[20, 10]),
+            Component(id="R3", type="resistor"),
+        ],
+        nets=[
+            Net(id="a", connection_ids=["R1.2", "R2.1", "J1.3"]),
+            Net(id="b", connection_ids=["R1.1", "R2.2"]),
+            Net(id="lonely", connection_ids=["R1.1", "R3.1"]),
+        ],
+    ))
+    result = AutorouterService().route(design, max_workers=1)
+
+    assert result.routed_nets == ["a", "b"]
+    assert result.skipped_nets == ["lonely"]
+    assert result.completion_rate == 1.0
+    assert not result.vias and all(trace.layer == 1 for trace in result.traces)
+
+    ends = {tuple(trace.points[0]) for trace in result.traces} | {tuple(trace.points[-1]) for trace in result.traces}
+    components = {component.id: component for component in design.board.components}
+    for connection in ["R1.2", "R2.1", "J1.3", "R1.1", "R2.2"]:
+        component_id, pin = connection.split(".")
+        x, y = pin_position(components[component_id], pin)
+        assert (round(x, 4), round(y, 4)) in ends
+
+    points = np.array([point for trace in result.traces for point in trace.points])
+    assert points_in_polygon(points, np.array(OUTLINE)).all()
+
+
+def test_second_layer_and_vias_route_past_top_layer_wall():
+    """A top-layer wall fails on one layer and is crossed through vias on two."""
+    router = AutorouterService()
+
+    single = router.route(walled_design(layers=1), max_workers=1)
+    assert single.failed_nets == ["sig"] and single.completion_rate == 0.0
+
+    double = router.route(walled_design(layers=2), max_workers=1)
+    assert double.routed_nets == ["sig"]
+    assert len(double.vias) == 2
+    assert {trace.layer for trace in double.traces} == {1, 2}
+
+    # Routed copper reaches the fabrication files: via flashes and drill hits
+    routed = router.apply(walled_design(layers=2), double)
+    assert routed.board.traces == double.traces
+    top, drill = "".join(iter_pad_layer(routed, F_CU, copper=1)), "".join(iter_excellon(routed))
+    for via in double.vias:
+        x, y = via.position
+        assert f"X{round(x * 1e6)}Y{round(-y * 1e6)}D03*" in top
+        assert f"X{x:.4f}Y{-y:.4f}" in drill
+    assert top.count("D02*") == sum(trace.layer == 1 for trace in double.traces)
+
+
+def test_parallel_routing_matches_in_process():
+    """Window batches give the same traces whether routed in workers or in-process."""
+    design = routing_design(40, layers=2)
+    router = AutorouterService()
+
+    serial = router.route(design, max_workers=1)
+    parallel = router.route(design, max_workers=2)
+
+    assert serial.completion_rate == 1.0
+    assert parallel.traces == serial.traces and parallel.vias == serial.vias
+
+
+def test_board_without_outline_is_rejected():
+    design = walled_design(layers=2)
+    design.board.outline = []
+    with pytest.raises(ValueError):
+        AutorouterService().route(design)
+
+
+def test_autoroute_job_saves_traces():
+    """The job routes the stored design, saves the traces and reports the summary."""
+    with TestClient(app) as client:
+        client.post("/designs", content=walled_design(layers=2).model_dump_json(),
+                    headers={"Content-Type": "application/json"})
+
+        response = client.post("/designs/walled/autoroute/job", json={"max_workers": 1})
+        assert response.status_code == 202
+        job_id = response.json()["id"]
+        deadline = time.monotonic() + 30
+        while client.get(f"/jobs/{job_id}").json()["finished_at"] is None and time.monotonic() < deadline:
+            time.sleep(0.01)
+
+        result = client.get(f"/jobs/{job_id}/result").json()
+        assert result["routed_nets"] == ["sig"] and result["via_count"] == 2
+        stored = client.get("/designs/walled").json()
+        assert len(stored["board"]["traces"]) == result["trace_count"]
+        assert len(stored["board"]["vias"]) == 2
+
+        assert client.post("/designs/missing/autoroute/job").status_code == 404
+
+
+def test_autoroute_job_does_not_overwrite_concurrent_edits(monkeypatch):
+    """A design edited while the job routes is left as edited and the job fails."""
+    repo = DesignRepository()
+    route = AutorouterService.route
+
+    def route_then_edit(self, design, *args, **kwargs):
+        result = route(self, design, *args, **kwargs)
+        edited = design.model_copy(deep=True)
+        edited.name = "Edited meanwhile"
+        repo.save(edited)
+        return result
+
+    monkeypatch.setattr(AutorouterService, "route", route_then_edit)
+    monkeypatch.setitem(app.dependency_overrides, get_design_service, lambda: DesignService(repo))
+    with TestClient(app) as client:
+        design = walled_design(layers=2)
+        design.id = "walled-edited"
+        client.post("/designs", content=design.model_dump_json(), headers={"Content-Type": "application/json"})
+
+        job_id = client.post("/designs/walled-edited/autoroute/job", json={"max_workers": 1}).json()["id"]
+        deadline = time.monotonic() + 30
+        while client.get(f"/jobs/{job_id}").json()["finished_at"] is None and time.monotonic() < deadline:
+            time.sleep(0.01)
+
+        job = client.get(f"/jobs/{job_id}").json()
+        assert job["status"] == "failed" and "changed while the job ran" in job["error"]
+        stored = client.get("/designs/walled-edited").json()
+        assert stored["name"] == "Edited meanwhile" and stored["board"]["traces"] == []
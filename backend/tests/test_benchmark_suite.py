@@ -0,0 +1,42 @@
+"""
+Tests for the benchmark suite and its synthetic board generator.
+"""
+
+import json
+
+from app.domain.services import DRCService
+from benchmarks.suite import compare, run_suite
+from benchmarks.synthetic import generate_design
+
+
+def test_generator_variants_trigger_their_rules():
+    """Dense shorts and cut-away outlines show up in DRC; the default board is unchanged."""
+    drc = DRCService()
+
+    plain = drc.check_design(generate_design(200))
+    shorted = drc.check_design(generate_design(200, short_density=0.5))
+    l_shape = drc.check_design(generate_design(200, outline="l_shape"))
+
+    def count(issues, issue_type):
+        return sum(issue.type == issue_type for issue in issues)
+
+    def shorted_nets(issues):
+        return sum(len(issue.location["nets"]) for issue in issues if issue.type == "short_circuit")
+
+    assert shorted_nets(shorted) > shorted_nets(plain) + 20
+    assert count(l_shape, "board_edge") > count(plain, "board_edge")
+    assert generate_design(200) == generate_design(200)
+
+
+def test_suite_report_is_json_and_comparable():
+    """A tiny run covers every area and compares against itself with ratio 1."""
+    report = json.loads(json.dumps(run_suite(sizes=[20], rounds=1, repo_designs=3)))
+
+    names = {result["name"] for result in report["results"]}
+    assert {"drc.check_design", "drc.clearance", "ml.get_suggestions", "repo.save", "api.validate"} <= names
+    backends = {r["params"]["backend"] for r in report["results"] if r["name"] == "repo.get"}
+    assert backends == {"memory", "wal", "sqlite"}
+
+    rows = compare(report, report)
+    assert len(rows) == sum(result["median_ms"] > 0 for result in report["results"])
+    assert all(row["ratio"] == 1 for row in rows)
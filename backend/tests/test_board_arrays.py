@@ -0,0 +1,82 @@
+"""
+Tests for the columnar board representation.
+"""
+
+import numpy as np
+
+from app.domain.board_arrays import DANGLING, BoardArrays
+from app.domain.footprints import component_bounding_boxes
+from app.domain.models import Board, Component, ComponentProperty, Net
+from app.domain.spatial import UniformGrid
+from benchmarks.synthetic import generate_board
+
+
+def make_board() -> Board:
+    return Board(
+        components=[
+            Component(id="U1", type="IC", position=[10, 10], rotation=90),
+            Component(id="U10", type="ic"),
+            Component(
+                id="J1.A",
+                type="header",
+                position=[30, 5],
+                properties={"width": ComponentProperty(name="width", value=4.0)},
+            ),
+        ],
+        nets=[
+            Net(id="vcc", connection_ids=["U1.8", "U10.8", "J1.A.1"]),
+            Net(id="gnd", connection_ids=["U1.4", "U1.4", "X9.1"]),
+            Net(id="sig", connection_ids=["U10.1", "U1.4"]),
+        ],
+    )
+
+
+def test_board_is_interned_into_columns_and_csr():
+    """Types, positions and net membership become flat arrays in board order."""
+    board = make_board()
+    arrays = BoardArrays.build(board)
+
+    assert arrays.type_names == ["ic", "header"]
+    assert arrays.type_codes.tolist() == [0, 0, 1]
+    assert arrays.placed.tolist() == [True, False, True]
+    assert arrays.net_offsets.tolist() == [0, 3, 6, 8]
+    assert [arrays.pin_ids[p] for p in arrays.net_pins] == [c for n in board.nets for c in n.connection_ids]
+    assert arrays.pin_components.tolist() == [0, 1, 2, 0, DANGLING, 1]
+    assert arrays.net_sizes().tolist() == [3, 3, 2]
+    assert arrays.component_net_counts().tolist() == [3, 2, 1]
+
+    indices, boxes = component_bounding_boxes(board.components)
+    placed, placed_boxes = arrays.placed_boxes
+    assert placed.tolist() == indices
+    assert np.array_equal(placed_boxes, boxes)
+
+
+def test_repeated_pins_match_brute_force():
+    """Each repeat slot points at the first slot that listed the same pin."""
+    board = generate_board(400, n_nets=300, seed=3)
+    arrays = BoardArrays.build(board)
+    slots, first_slots = arrays.repeated_pin_slots()
+
+    first_net = {}
+    expected = []
+    for net in board.nets:
+        for pin in net.connection_ids:
+            if pin in first_net:
+                expected.append((net.id, first_net[pin], pin))
+            else:
+                first_net[pin] = net.id
+    found = [
+        (arrays.net_ids[arrays.slot_nets[s]], arrays.net_ids[arrays.slot_nets[f]], arrays.pin_ids[arrays.net_pins[s]])
+        for s, f in zip(slots.tolist(), first_slots.tolist())
+    ]
+    assert found == expected
+
+
+def test_vectorized_grid_pairs_match_generator():
+    """candidate_pair_arrays yields exactly the pairs of candidate_pairs."""
+    _, boxes = component_bounding_boxes(generate_board(2_000, n_nets=0, seed=1).components)
+    grid = UniformGrid(boxes, margin=0.1)
+    first, second = grid.candidate_pair_arrays()
+
+    assert sorted(zip(first.tolist(), second.tolist())) == sorted(grid.candidate_pairs())
+    assert (first < second).all()
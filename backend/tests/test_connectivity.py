@@ -0,0 +1,32 @@
+"""
+Tests for connection ID parsing and the rules built on it.
+"""
+
+from app.domain.connectivity import split_connection_id
+from app.domain.ml_services import MLService
+from app.domain.models import Board, Component, Design, Net
+
+
+def test_split_connection_id_prefers_known_components():
+    """Dotted component IDs split at the longest known prefix, others at the first dot."""
+    assert split_connection_id("LED1.anode") == ("LED1", "anode")
+    assert split_connection_id("J1.A.1", {"J1.A"}) == ("J1.A", "1")
+    assert split_connection_id("J1.A.1") == ("J1", "A.1")
+    assert split_connection_id("TP1") == ("TP1", "")
+
+
+def test_floating_input_detection_does_not_match_id_prefixes():
+    """An IC is not credited with nets that only touch a component whose ID extends its own."""
+    design = Design(
+        id="prefix",
+        name="Prefix",
+        board=Board(
+            components=[Component(id="U1", type="ic"), Component(id="U10", type="ic")],
+            nets=[
+                Net(id="n1", name="VCC", connection_ids=["U10.1", "U10.2"]),
+                Net(id="n2", name="GND", connection_ids=["U10.3", "U10.4"]),
+            ],
+        ),
+    )
+    floating = {s["id"] for s in MLService().get_suggestions(design) if s["id"].startswith("floating_input_")}
+    assert floating == {"floating_input_U1"}
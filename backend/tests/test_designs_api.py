@@ -3,17 +3,24 @@ Integration tests for design API endpoints.
 Uses FastAPI TestClient with dependency overrides for isolated testing.
 """
 
+import json
+
 from fastapi.testclient import TestClient
 from app.main import app
-from app.api.designs import get_design_service, get_drc_service
+from app.api.designs import get_design_service, get_drc_service, get_incremental_drc_service
+from app.domain.incremental_drc import IncrementalDRCService
 from app.domain.services import DesignService, DRCService
 from app.infra.memory_repo import DesignRepository
 from app.domain.models import Design, Board
 
 
+# One isolated repository shared by every request in this module
+test_repo = DesignRepository()
+
+
 def get_test_design_service():
-    """Provide a fresh DesignService with in-memory repo for testing."""
-    return DesignService(DesignRepository())
+    """Provide a DesignService backed by the isolated test repository."""
+    return DesignService(test_repo)
 
 
 def get_test_drc_service():
@@ -174,8 +181,37 @@ def test_list_designs():
     assert response.status_code == 200
 
     data = response.json()
-    assert len(data) >= 3
-    assert any(d["id"] == "list-test-0" for d in data)
+    assert len(data["items"]) >= 3
+    assert any(d["id"] == "list-test-0" for d in data["items"])
+    assert "board" not in data["items"][0]
+
+
+def test_list_designs_paginates_with_cursor():
+    """Listing walks every matching design exactly once via next_cursor."""
+    for i in range(5):
+        client.post(
+            "/designs",
+            json={
+                "id": f"page-test-{i}",
+                "name": f"Page Test {i}",
+                "board": {"outline": [], "components": [], "nets": [], "layers": 1},
+            },
+        )
+
+    seen = []
+    cursor = None
+    while True:
+        params = {"limit": 2, "name_prefix": "Page Test"}
+        if cursor:
+            params["cursor"] = cursor
+        page = client.get("/designs", params=params).json()
+        seen.extend(d["id"] for d in page["items"])
+        cursor = page["next_cursor"]
+        if cursor is None:
+            break
+
+    assert seen == [f"page-test-{i}" for i in range(5)]
+    assert client.get("/designs", params={"cursor": "%%%"}).status_code == 400
 
 
 def test_update_design():
@@ -199,6 +235,33 @@ def test_update_design():
     assert response.json()["name"] == "Updated"
 
 
+def test_etag_conditional_get_and_put():
+    """If-None-Match returns 304 while unchanged; If-Match rejects stale writes with 412."""
+    design_payload = {
+        "id": "test-etag",
+        "name": "Original",
+        "board": {"outline": [], "components": [], "nets": [], "layers": 1},
+    }
+    client.post("/designs", json=design_payload)
+
+    first = client.get("/designs/test-etag")
+    etag = first.headers["ETag"]
+    not_modified = client.get("/designs/test-etag", headers={"If-None-Match": etag})
+    assert (not_modified.status_code, not_modified.content) == (304, b"")
+    assert not_modified.headers["ETag"] == etag
+
+    saved = client.put("/designs/test-etag", json={**design_payload, "name": "Mine"}, headers={"If-Match": etag})
+    assert saved.status_code == 200
+    assert saved.headers["ETag"] != etag
+    assert client.get("/designs/test-etag", headers={"If-None-Match": etag}).json()["name"] == "Mine"
+
+    # A second editor still holding the old ETag must not clobber the save
+    stale = client.put("/designs/test-etag", json={**design_payload, "name": "Theirs"}, headers={"If-Match": etag})
+    assert stale.status_code == 412
+    assert client.get("/designs/test-etag").json()["name"] == "Mine"
+    assert client.put("/designs/missing", json={**design_payload, "id": "missing"}, headers={"If-Match": "*"}).status_code == 412
+
+
 def test_delete_design():
     """Test deleting a design."""
     # Create
@@ -217,3 +280,199 @@ def test_delete_design():
     response = client.get("/designs/test-delete")
     assert response.status_code == 404
 
+
+
+def test_incremental_validate_tracks_edits():
+    """Incremental validation reflects an edit between two validate calls."""
+    design_payload = {
+        "id": "test-incremental",
+        "name": "Incremental",
+        "board": {
+            "outline": [[0, 0], [50, 0], [50, 50], [0, 50]],
+            "components": [
+                {"id": "R1", "type": "resistor", "position": [10, 10]},
+                {"id": "R2", "type": "resistor", "position": [30, 30]},
+            ],
+            "nets": [{"id": "net1", "connection_ids": ["R1.1", "R2.1"]}],
+            "layers": 1,
+        },
+    }
+    client.post("/designs", json=design_payload)
+
+    response = client.post("/designs/test-incremental/validate?incremental=true")
+    assert response.status_code == 200
+    assert response.json()["issues"] == []
+
+    # Move R2 on top of R1
+    design_payload["board"]["components"][1]["position"] = [11, 10]
+    client.put("/designs/test-incremental", json=design_payload)
+
+    response = client.post("/designs/test-incremental/validate?incremental=true")
+    types = [i["type"] for i in response.json()["issues"]]
+    assert types == ["clearance_violation"]
+
+
+def test_repeat_validate_hits_result_cache():
+    """Validating an unchanged board twice is served from the DRC cache."""
+    design_payload = {
+        "id": "test-cache",
+        "name": "Cache Test",
+        "board": {"outline": [], "components": [], "nets": [{"id": "cache-net", "connection_ids": ["Q9.1"]}], "layers": 1},
+    }
+    client.post("/designs", json=design_payload)
+
+    before = client.get("/designs/drc-cache/stats").json()
+    first = client.post("/designs/test-cache/validate").json()
+    second = client.post("/designs/test-cache/validate").json()
+    after = client.get("/designs/drc-cache/stats").json()
+
+    assert first == second
+    assert after["misses"] - before["misses"] == 1
+    assert after["hits"] - before["hits"] == 1
+
+
+def test_validate_batch_streams_results():
+    """Batch validation streams one NDJSON line per design, including unknown IDs."""
+    import json
+
+    ids = []
+    for i in range(4):
+        design_payload = {
+            "id": f"batch-{i}",
+            "name": f"Batch {i}",
+            "board": {"outline": [], "components": [], "nets": [{"id": "n", "connection_ids": ["R1.1"]}], "layers": 1},
+        }
+        client.post("/designs", json=design_payload)
+        ids.append(f"batch-{i}")
+
+    response = client.post(
+        "/designs/validate-batch",
+        json={"design_ids": ids + ["batch-missing"], "max_workers": 2},
+    )
+    assert response.status_code == 200
+    assert response.headers["content-type"].startswith("application/x-ndjson")
+
+    lines = [json.loads(line) for line in response.text.splitlines()]
+    assert lines[0] == {"design_id": "batch-missing", "error": "Design not found"}
+    assert sorted(line["design_id"] for line in lines[1:]) == ids
+    assert all(any(i["type"] == "unconnected_net" for i in line["issues"]) for line in lines[1:])
+
+    # Results are persisted on the designs
+    assert client.get("/designs/batch-0").json()["issues"]
+
+
+def test_patch_design_returns_only_changes():
+    """PATCH accepts JSON Patch and domain deltas and returns only changed parts."""
+    client.post(
+        "/designs",
+        json={
+            "id": "test-patch",
+            "name": "Patch",
+            "board": {
+                "outline": [],
+                "components": [
+                    {"id": "R1", "type": "resistor", "position": [1, 1]},
+                    {"id": "R2", "type": "resistor", "position": [9, 9]},
+                ],
+                "nets": [],
+                "layers": 1,
+            },
+        },
+    )
+
+    response = client.patch(
+        "/designs/test-patch",
+        content='[{"op": "replace", "path": "/board/components/1/position", "value": [5, 5]}]',
+        headers={"Content-Type": "application/json-patch+json"},
+    )
+    assert response.status_code == 200
+    assert response.json() == {
+        "id": "test-patch",
+        "components": {"R2": {"id": "R2", "type": "resistor", "properties": {}, "position": [5.0, 5.0], "rotation": None}},
+        "nets": {},
+        "fields": {},
+    }
+
+    response = client.patch(
+        "/designs/test-patch",
+        json={"ops": [{"op": "move_component", "component_id": "R1", "position": [2, 2]}]},
+    )
+    assert response.status_code == 200
+    assert list(response.json()["components"]) == ["R1"]
+
+    stored = client.get("/designs/test-patch").json()
+    assert [c["position"] for c in stored["board"]["components"]] == [[2, 2], [5, 5]]
+
+    conflict = client.patch("/designs/test-patch", json=[{"op": "test", "path": "/name", "value": "Nope"}])
+    assert conflict.status_code == 409
+    invalid = client.patch("/designs/test-patch", json=[{"op": "remove", "path": "/board/components/7"}])
+    assert invalid.status_code == 422
+    missing = client.patch("/designs/nope", json={"ops": []})
+    assert missing.status_code == 404
+
+
+def test_patch_honours_if_match():
+    """PATCH returns the new ETag and, with a stale If-Match, writes nothing (412)."""
+    client.post("/designs", json={"id": "test-patch-etag", "name": "Before", "board": {"outline": [], "components": [], "nets": [], "layers": 1}})
+    etag = client.get("/designs/test-patch-etag").headers["ETag"]
+
+    patched = client.patch("/designs/test-patch-etag", json=[{"op": "replace", "path": "/name", "value": "Mine"}], headers={"If-Match": etag})
+    assert patched.status_code == 200
+    assert patched.headers["ETag"] == client.get("/designs/test-patch-etag").headers["ETag"] != etag
+
+    stale = client.patch("/designs/test-patch-etag", json=[{"op": "replace", "path": "/name", "value": "Theirs"}], headers={"If-Match": etag})
+    assert stale.status_code == 412
+    assert client.get("/designs/test-patch-etag").json()["name"] == "Mine"
+    assert client.patch("/designs/nope", json={"ops": []}, headers={"If-Match": "*"}).status_code == 412
+
+
+def test_validate_does_not_revert_concurrent_edit():
+    """A save landing while DRC runs is kept; validate reports 409 instead of storing stale issues."""
+
+    class EditingDRC(IncrementalDRCService):
+        def check_design(self, design, changes=None, owner=None):
+            edited = design.model_copy(deep=True)
+            edited.name = "Edited meanwhile"
+            test_repo.save(edited)
+            return super().check_design(design, changes, owner)
+
+    client.post("/designs", json={"id": "test-validate-race", "name": "Before", "board": {"outline": [], "components": [], "nets": [], "layers": 1}})
+    checker = EditingDRC()
+    app.dependency_overrides[get_incremental_drc_service] = lambda: checker
+    try:
+        response = client.post("/designs/test-validate-race/validate?incremental=true")
+    finally:
+        app.dependency_overrides.pop(get_incremental_drc_service, None)
+    assert response.status_code == 409
+    stored = client.get("/designs/test-validate-race").json()
+    assert stored["name"] == "Edited meanwhile" and stored["issues"] == []
+
+
+def test_validate_streams_ndjson_and_sse():
+    """Streaming validation sends the same issues one at a time and persists them."""
+    design_payload = {
+        "id": "test-stream",
+        "name": "Stream",
+        "board": {
+            "outline": [],
+            "components": [],
+            "nets": [{"id": f"n{i}", "connection_ids": [f"R{i}.1"]} for i in range(5)],
+            "layers": 1,
+        },
+    }
+    client.post("/designs", json=design_payload)
+    expected = client.post("/designs/test-stream/validate").json()["issues"]
+
+    for _ in range(2):  # Cold, then served from the result cache
+        response = client.post("/designs/test-stream/validate?stream=ndjson")
+        assert response.headers["content-type"].startswith("application/x-ndjson")
+        assert [json.loads(line) for line in response.text.splitlines()] == expected
+
+    response = client.post("/designs/test-stream/validate?stream=sse")
+    assert response.headers["content-type"].startswith("text/event-stream")
+    events = [block.split("\n") for block in response.text.strip().split("\n\n")]
+    assert [json.loads(data[6:]) for name, data in events if name == "event: issue"] == expected
+    assert events[-1] == ["event: done", 'data: {"count": 6}']
+
+    stored = client.get("/designs/test-stream").json()
+    assert stored["issues"] == expected
@@ -0,0 +1,203 @@
+"""
+Unit tests for DRCService rules.
+Exercises the domain layer directly, without going through the API.
+"""
+
+import random
+
+from app.domain.footprints import component_bounding_boxes
+from app.domain.models import Board, Component, Design, Net
+from app.domain.services import SHARD_SIZE, DRCService
+from app.domain.spatial import box_gap
+from app.infra.executor import CPUExecutor
+
+
+def make_design(components, outline=None, nets=None) -> Design:
+    """Build a design around the given components."""
+    return Design(
+        id="drc-test",
+        name="DRC Test",
+        board=Board(outline=outline or [], components=components, nets=nets or []),
+    )
+
+
+def test_clearance_violation_for_overlapping_components():
+    """Overlapping footprints are reported as a clearance violation."""
+    design = make_design([
+        Component(id="R1", type="resistor", position=[0.0, 0.0]),
+        Component(id="R2", type="resistor", position=[1.0, 0.0]),
+    ])
+
+    issues = list(DRCService()._check_clearance(design))
+
+    assert len(issues) == 1
+    assert issues[0].type == "clearance_violation"
+    assert issues[0].related_ids == ["R1", "R2"]
+    assert issues[0].location["distance"] == 0
+
+
+def test_no_clearance_violation_for_spaced_components():
+    """Parts further apart than the clearance produce no issues."""
+    design = make_design([
+        Component(id="R1", type="resistor", position=[0.0, 0.0]),
+        Component(id="R2", type="resistor", position=[10.0, 0.0]),
+        Component(id="R3", type="resistor"),  # Unplaced parts are skipped
+    ])
+
+    assert list(DRCService()._check_clearance(design)) == []
+
+
+def test_clearance_respects_rotation():
+    """A rotated footprint occupies its rotated extent."""
+    # Resistors are 3.2 x 1.6; side by side vertically they only clash when rotated
+    components = [
+        Component(id="R1", type="resistor", position=[0.0, 0.0]),
+        Component(id="R2", type="resistor", position=[0.0, 2.5]),
+    ]
+    assert list(DRCService()._check_clearance(make_design(components))) == []
+
+    components[1].rotation = 90
+    assert len(list(DRCService()._check_clearance(make_design(components)))) == 1
+
+
+def test_clearance_matches_brute_force():
+    """The grid-backed check finds exactly the pairs an all-pairs scan finds."""
+    rng = random.Random(42)
+    components = [
+        Component(
+            id=f"C{i}",
+            type=rng.choice(["resistor", "led", "mcu", "header"]),
+            position=[rng.uniform(0, 80), rng.uniform(0, 80)],
+            rotation=rng.choice([0.0, 45.0, 90.0]),
+        )
+        for i in range(300)
+    ]
+    drc = DRCService(clearance=0.5)
+
+    indices, boxes = component_bounding_boxes(components)
+    expected = {
+        (components[indices[i]].id, components[indices[j]].id)
+        for i in range(len(indices))
+        for j in range(i + 1, len(indices))
+        if box_gap(boxes[i], boxes[j]) < drc.clearance
+    }
+
+    found = {tuple(issue.related_ids) for issue in drc._check_clearance(make_design(components))}
+    assert found == expected
+    assert expected  # The random board must exercise at least one violation
+
+
+def test_components_outside_outline_reported_as_board_edge():
+    """Parts outside or straddling the outline produce board_edge issues with coordinates."""
+    outline = [[0, 0], [50, 0], [50, 50], [0, 50]]
+    design = make_design(
+        [
+            Component(id="R1", type="resistor", position=[25.0, 25.0]),
+            Component(id="R2", type="resistor", position=[80.0, 25.0]),
+            Component(id="R3", type="resistor", position=[49.5, 10.0]),
+        ],
+        outline=outline,
+    )
+
+    issues = list(DRCService()._check_components_in_bounds(design))
+
+    assert [i.related_ids for i in issues] == [["R2"], ["R3"]]
+    assert all(i.type == "board_edge" for i in issues)
+    assert issues[0].location == {"component_id": "R2", "x": 80.0, "y": 25.0}
+    assert "outside" in issues[0].message
+    assert "extends past" in issues[1].message
+
+
+def test_concave_outline_containment():
+    """Footprints sitting in the notch of an L-shaped board are flagged."""
+    outline = [[0, 0], [40, 0], [40, 20], [20, 20], [20, 40], [0, 40]]
+    design = make_design(
+        [
+            Component(id="IN_A", type="resistor", position=[10.0, 30.0]),
+            Component(id="IN_B", type="resistor", position=[30.0, 10.0]),
+            Component(id="NOTCH", type="resistor", position=[30.0, 30.0]),
+            Component(id="CORNER", type="mcu", position=[20.0, 20.0]),
+        ],
+        outline=outline,
+    )
+
+    flagged = [i.related_ids[0] for i in DRCService()._check_components_in_bounds(design)]
+    assert flagged == ["NOTCH", "CORNER"]
+
+
+def test_check_designs_in_process_pool_matches_serial():
+    """Sharded validation on a process pool returns the same issues as serial checks."""
+    from benchmarks.synthetic import generate_design
+
+    designs = [generate_design(60, design_id=f"d{i}", seed=i, pitch=5.0) for i in range(6)]
+    drc = DRCService()
+
+    executor = CPUExecutor("process", max_workers=2)
+    try:
+        pooled = dict(drc.check_designs(designs, executor, max_workers=2))
+    finally:
+        executor.shutdown()
+    serial = dict(drc.check_designs(designs))
+
+    assert set(pooled) == {d.id for d in designs}
+    for design_id, issues in serial.items():
+        assert [i.model_dump() for i in pooled[design_id]] == [i.model_dump() for i in issues]
+
+
+def test_check_designs_pulls_designs_a_shard_at_a_time():
+    """Only the shards in flight are taken from a lazy source, not every design up front."""
+    from benchmarks.synthetic import generate_design
+
+    taken = []
+
+    def source():
+        for i in range(40):
+            taken.append(i)
+            yield generate_design(5, design_id=f"lazy-{i}", seed=i)
+
+    executor = CPUExecutor("thread", max_workers=2)
+    try:
+        results = DRCService().check_designs(source(), executor, max_workers=2)
+        next(results)
+        # Two shards in flight, plus at most two taken to replace finished ones
+        assert len(taken) <= 4 * SHARD_SIZE
+        assert len(list(results)) == 39
+    finally:
+        executor.shutdown()
+
+
+def test_shorts_aggregate_into_islands():
+    """Nets merged through shared pins, even transitively, give one short listing every net and pin."""
+    components = [Component(id=f"R{i}", type="resistor", position=[10 * i, 0]) for i in range(6)]
+    nets = [
+        Net(id="a", connection_ids=["R0.1", "R1.1"]),
+        Net(id="b", connection_ids=["R1.1", "R2.1"]),
+        Net(id="c", connection_ids=["R2.1", "R3.1", "R1.1"]),
+        Net(id="d", connection_ids=["R4.1", "R0.2"]),
+        Net(id="e", connection_ids=["R0.2", "R4.2"]),
+    ]
+    issues = DRCService().check_design(make_design(components, nets=nets))
+
+    shorts = [issue for issue in issues if issue.type == "short_circuit"]
+    assert [(s.id, s.location) for s in shorts] == [
+        ("short_a_b", {"nets": ["a", "b", "c"], "pins": ["R1.1", "R2.1"]}),
+        ("short_d_e", {"nets": ["d", "e"], "pins": ["R0.2"]}),
+    ]
+    isolated = [issue for issue in issues if issue.id.startswith("isolated_")]
+    assert [issue.related_ids for issue in isolated] == [["R5"]]
+    assert all(issue.severity == "warning" for issue in isolated)
+
+
+def test_iter_issues_yields_before_later_rules_run(monkeypatch):
+    """The first issue is available before expensive later rules start."""
+    design = make_design(
+        [Component(id="R1", type="resistor", position=[10, 10])],
+        nets=[Net(id="n1", connection_ids=["R1.1"])],
+    )
+    drc = DRCService()
+
+    def not_yet(_design):
+        raise AssertionError("clearance ran before the first issue was consumed")
+
+    monkeypatch.setattr(drc, "_check_clearance", not_yet)
+    assert next(drc.iter_issues(design)).id == "unconnected_n1"
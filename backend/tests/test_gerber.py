@@ -0,0 +1,133 @@
+"""
+Tests for Gerber/Excellon export and the streaming zip endpoint.
+"""
+
+import io
+import re
+import zipfile
+
+from fastapi.testclient import TestClient
+
+from app.domain.gerber import gerber_files, iter_excellon, iter_outline, iter_pad_layer, F_CU, B_CU
+from app.domain.models import Board, Component, ComponentProperty, Design
+from app.domain.pads import pin_position
+from app.infra.zip_stream import iter_zip
+from app.main import app
+
+client = TestClient(app)
+
+
+def make_design(layers: int = 2) -> Design:
+    return Design(
+        id="gerber-1",
+        name="Blinky *v1*",
+        board=Board(
+            outline=[[0, 0], [40, 0], [40, 30], [0, 30]],
+            components=[
+                Component(id="R1", type="resistor", position=[10, 10]),
+                Component(id="J1", type="header", position=[20, 10], rotation=90),
+                Component(id="U1", type="ic", position=[30, 20], rotation=45),
+                Component(id="X1", type="resistor"),
+            ],
+            layers=layers,
+        ),
+    )
+
+
+def text(chunks) -> str:
+    return "".join(chunks)
+
+
+def test_copper_layer_flashes_every_pad():
+    """Pads are flashed with rectangular/round apertures; off-axis parts become regions."""
+    gerber = text(iter_pad_layer(make_design(), F_CU))
+    lines = gerber.splitlines()
+
+    assert lines[0] == "G04 Blinky v1 F_Cu*"
+    assert "%FSLAX46Y46*%" in lines and "%MOMM*%" in lines
+    assert lines[-1] == "M02*"
+    assert re.findall(r"%ADD(\d+)", gerber) == ["10", "11"]
+    assert "%ADD10R,0.960000X1.600000*%" in lines
+    assert "%ADD11C,1.700000*%" in lines
+
+    # R1 pad 1 sits 1.12 mm left of center; Y is negated for Gerber's upward axis
+    assert "X8880000Y-10000000D03*" in lines
+    assert gerber.count("D03*") == 2 + 4
+    assert gerber.count("G36*") == gerber.count("G37*") == 8
+
+    # Bottom copper only carries the through-hole header pads
+    bottom = text(iter_pad_layer(make_design(), B_CU, lambda pad: pad.drill is not None))
+    assert bottom.count("D03*") == 4 and "G36*" not in bottom
+
+
+def test_more_footprint_sizes_than_the_pad_cache_holds():
+    """Both passes agree even when the pad layout cache evicts between them."""
+    components = [
+        Component(
+            id=f"R{i}",
+            type="resistor",
+            position=[1.0 + i % 50, 1.0 + i // 50],
+            properties={"width": ComponentProperty(name="width", value=1.0 + i / 1000)},
+        )
+        for i in range(1100)
+    ]
+    design = Design(id="sizes", name="Sizes", board=Board(outline=[[0, 0], [60, 0], [60, 30], [0, 30]], components=components))
+    assert text(iter_pad_layer(design, F_CU)).count("D03*") == 2 * 1100
+
+
+def test_drill_and_outline_files():
+    """Excellon holes follow the rotated header; the profile is a closed path."""
+    drill = text(iter_excellon(make_design())).splitlines()
+    assert drill[0] == "M48" and drill[-1] == "M30"
+    assert "T1C1.000" in drill
+    holes = [line for line in drill if line.startswith("X")]
+    assert holes == ["X23.8100Y-10.0000", "X21.2700Y-10.0000", "X18.7300Y-10.0000", "X16.1900Y-10.0000"]
+
+    outline = text(iter_outline(make_design())).splitlines()
+    assert outline.count("X0Y0D02*") == 1 and outline.count("X0Y0D01*") == 1
+    assert sum(line.endswith("D01*") for line in outline) == 4
+
+
+def test_zip_is_streamed_in_chunks():
+    """The archive arrives in several chunks and holds one file per layer."""
+    chunks = list(iter_zip(gerber_files(make_design()), flush_bytes=256))
+    assert len(chunks) > 3
+
+    archive = zipfile.ZipFile(io.BytesIO(b"".join(chunks)))
+    assert archive.namelist() == [
+        "Blinky_v1-F_Cu.gtl",
+        "Blinky_v1-F_Mask.gts",
+        "Blinky_v1-B_Cu.gbl",
+        "Blinky_v1-B_Mask.gbs",
+        "Blinky_v1-F_SilkS.gto",
+        "Blinky_v1-Edge_Cuts.gm1",
+        "Blinky_v1-PTH.drl",
+    ]
+    assert archive.read("Blinky_v1-F_Cu.gtl").decode() == text(iter_pad_layer(make_design(), F_CU))
+
+    single_sided = [name for name, _ in gerber_files(make_design(layers=1))]
+    assert not any("B_" in name for name in single_sided)
+
+
+def test_export_endpoint_streams_zip():
+    """GET /designs/{id}/export/gerber downloads the package; unknown designs are 404."""
+    client.post("/designs", json=make_design().model_dump())
+
+    response = client.get("/designs/gerber-1/export/gerber")
+    assert response.status_code == 200
+    assert response.headers["content-type"] == "application/zip"
+    assert 'filename="Blinky_v1-gerber.zip"' in response.headers["content-disposition"]
+    assert len(zipfile.ZipFile(io.BytesIO(response.content)).namelist()) == 7
+
+    assert client.get("/designs/missing/export/gerber").status_code == 404
+
+
+def test_pin_positions_follow_rotation_and_aliases():
+    """Pin names resolve to pad centers in board coordinates."""
+    led = Component(id="D1", type="led", position=[5, 5], rotation=90)
+    anode = pin_position(led, "anode")
+    assert anode is not None
+    assert round(anode[0], 6) == 5 and round(anode[1], 6) == 5 - 1.12
+    assert pin_position(led, "2") != anode
+    assert pin_position(led, "gate") is None
+    assert pin_position(Component(id="D2", type="led"), "1") is None
@@ -0,0 +1,109 @@
+"""
+Tests for incremental DRC.
+Every incremental result must match a full DRCService.check_design run.
+"""
+
+import random
+from concurrent.futures import ThreadPoolExecutor
+
+from app.domain.incremental_drc import BoardChanges, IncrementalDRCService
+from app.domain.models import Component, Net
+from app.domain.services import DRCService
+from benchmarks.synthetic import generate_design
+
+
+def dump(issues):
+    return [issue.model_dump() for issue in issues]
+
+
+def test_matches_full_check_through_random_edits():
+    """Moves, rewires, additions and removals all converge to the full-check result."""
+    rng = random.Random(7)
+    design = generate_design(200, pitch=6.0)
+    full = DRCService()
+    incremental = IncrementalDRCService()
+
+    assert dump(incremental.check_design(design)) == dump(full.check_design(design))
+
+    board = design.board
+    for step in range(60):
+        action = step % 6
+        if action == 0:
+            component = rng.choice(board.components)
+            component.position = [rng.uniform(-10, 90), rng.uniform(-10, 90)]
+        elif action == 1:
+            net = rng.choice(board.nets)
+            net.connection_ids = net.connection_ids[:1]
+        elif action == 2:
+            net = rng.choice(board.nets)
+            net.connection_ids = net.connection_ids + [rng.choice(rng.choice(board.nets).connection_ids)]
+        elif action == 3:
+            board.components.append(
+                Component(id=f"NEW{step}", type="mcu", position=[rng.uniform(0, 80), rng.uniform(0, 80)])
+            )
+        elif action == 4:
+            board.nets.pop(rng.randrange(len(board.nets)))
+            board.components.pop(rng.randrange(len(board.components)))
+        else:
+            board.nets.append(Net(id=f"NET{step}", connection_ids=[f"C{step}.1"]))
+            if step % 4 == 0:
+                board.outline = [[0, 0], [60, 0], [60, 60], [0, 60]]
+
+        assert dump(incremental.check_design(design)) == dump(full.check_design(design)), step
+
+
+def test_short_islands_merge_and_split_like_full_check():
+    """Rewiring a densely shorted board regroups its islands exactly as a full check does."""
+    rng = random.Random(11)
+    design = generate_design(300, short_density=0.3)
+    full = DRCService()
+    incremental = IncrementalDRCService()
+    incremental.check_design(design)
+
+    nets = design.board.nets
+    for step in range(40):
+        net = rng.choice(nets)
+        if step % 2:
+            net.connection_ids = [c for c in net.connection_ids if rng.random() < 0.5] or net.connection_ids[:1]
+        else:
+            net.connection_ids = net.connection_ids + [rng.choice(rng.choice(nets).connection_ids)]
+        assert dump(incremental.check_design(design)) == dump(full.check_design(design)), step
+
+
+def test_concurrent_checks_of_one_design_match_full_check():
+    """Threads checking different versions of one design each get that version's result."""
+    base = generate_design(200, pitch=6.0)
+    incremental = IncrementalDRCService()
+    full = DRCService()
+
+    def check(step):
+        design = base.model_copy(deep=True)
+        component = design.board.components[step % 50]
+        component.position = list(design.board.components[step % 50 + 1].position)
+        return dump(incremental.check_design(design)) == dump(full.check_design(design))
+
+    with ThreadPoolExecutor(max_workers=8) as pool:
+        assert all(pool.map(check, range(64)))
+
+
+def test_explicit_changes_skip_the_diff():
+    """Passing BoardChanges re-checks only the named entities."""
+    design = generate_design(50)
+    incremental = IncrementalDRCService()
+    incremental.check_design(design)
+
+    moved = design.board.components[0]
+    moved.position = list(design.board.components[1].position)
+
+    issues = incremental.check_design(design, BoardChanges(components={moved.id}))
+    assert any(i.type == "clearance_violation" and moved.id in i.related_ids for i in issues)
+    assert dump(issues) == dump(DRCService().check_design(design))
+
+
+def test_duplicate_ids_fall_back_to_full_check():
+    """Boards with duplicate net IDs still validate correctly."""
+    design = generate_design(10)
+    design.board.nets.append(Net(id=design.board.nets[0].id, connection_ids=["X.1"]))
+
+    issues = IncrementalDRCService().check_design(design)
+    assert dump(issues) == dump(DRCService().check_design(design))
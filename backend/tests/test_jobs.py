@@ -0,0 +1,224 @@
+"""
+Tests for the in-process job queue and the job endpoints.
+"""
+
+import asyncio
+import io
+import json
+import os
+import threading
+import time
+import zipfile
+
+from fastapi.testclient import TestClient
+
+from app.api.deps import get_job_manager
+from app.infra.jobs import JobCancelled, JobFile, JobManager, JobStatus
+from app.main import app
+
+
+def make_design(design_id: str) -> dict:
+    return {
+        "id": design_id,
+        "name": "Job board",
+        "board": {
+            "outline": [[0, 0], [40, 0], [40, 30], [0, 30]],
+            "components": [
+                {"id": "R1", "type": "resistor", "position": [10, 10]},
+                {"id": "J1", "type": "header", "position": [30, 10]},
+            ],
+            "nets": [{"id": "n1", "connection_ids": ["R1.1", "J1.1"]}],
+            "layers": 2,
+        },
+    }
+
+
+def wait_for(client: TestClient, job_id: str, timeout: float = 10.0) -> dict:
+    deadline = time.monotonic() + timeout
+    while True:
+        job = client.get(f"/jobs/{job_id}").json()
+        if job["finished_at"] is not None or time.monotonic() > deadline:
+            return job
+        time.sleep(0.01)
+
+
+def test_manager_reports_progress_and_failures():
+    """Jobs run off the loop, report progress to watchers, and record errors."""
+    async def scenario():
+        manager = JobManager(workers=2)
+        manager.start()
+
+        def work(ctx):
+            for step in range(4):
+                ctx.report(step / 4, f"step {step}")
+            return {"answer": 42}
+
+        def broken(ctx):
+            raise RuntimeError("boom")
+
+        job = manager.submit("work", work)
+        failed = manager.submit("broken", broken)
+        seen = [info async for info in manager.watch(job.id)]
+        while manager.get(failed.id).finished_at is None:
+            await asyncio.sleep(0.01)
+
+        assert seen[-1].status == JobStatus.SUCCEEDED and seen[-1].progress == 1.0
+        assert manager.result(job.id) == {"answer": 42}
+        assert manager.get(failed.id).status == JobStatus.FAILED
+        assert manager.get(failed.id).error == "boom"
+        await manager.shutdown()
+
+    asyncio.run(scenario())
+
+
+def test_manager_cancels_queued_and_running_jobs():
+    """Queued jobs never start; running jobs stop at their next cancellation point."""
+    async def scenario():
+        manager = JobManager(workers=1)
+        manager.start()
+        started, release = threading.Event(), threading.Event()
+        ran = []
+
+        def blocking(ctx):
+            started.set()
+            release.wait(5)
+            ctx.check_cancelled()
+            return "unreachable"
+
+        running = manager.submit("blocking", blocking)
+        queued = manager.submit("queued", lambda ctx: ran.append(True))
+        while not started.is_set():
+            await asyncio.sleep(0.01)
+
+        assert manager.cancel(queued.id).status == JobStatus.CANCELLED
+        assert manager.cancel(running.id).status == JobStatus.RUNNING
+        release.set()
+        async for info in manager.watch(running.id):
+            pass
+        assert info.status == JobStatus.CANCELLED
+        await asyncio.sleep(0.05)
+        assert ran == []
+        await manager.shutdown()
+
+    asyncio.run(scenario())
+
+
+def test_manager_expires_results_after_ttl():
+    """Finished jobs (and their result files) are dropped once the TTL passes."""
+    async def scenario():
+        manager = JobManager(workers=1, result_ttl=0.05)
+        manager.start()
+
+        def write(ctx):
+            path = ctx.result_path(".txt")
+            with open(path, "w") as handle:
+                handle.write("done")
+            return JobFile(path, "text/plain", "done.txt")
+
+        job = manager.submit("write", write)
+        async for info in manager.watch(job.id):
+            pass
+        path = manager.result(job.id).path
+        assert open(path).read() == "done"
+
+        # The periodic sweep deletes the file without anyone touching the manager
+        await asyncio.sleep(0.15)
+        assert not os.path.exists(path)
+        assert manager.get(job.id) is None
+        assert manager.list() == []
+        await manager.shutdown()
+
+    asyncio.run(scenario())
+
+
+def test_failed_and_cancelled_jobs_delete_partial_files():
+    """Files a job started writing are removed as soon as it fails or is cancelled."""
+    async def scenario():
+        manager = JobManager(workers=1)
+        manager.start()
+        paths = []
+
+        def partial(ctx):
+            paths.append(ctx.result_path(".zip"))
+            with open(paths[-1], "w") as handle:
+                handle.write("half an archive")
+            if len(paths) == 1:
+                raise RuntimeError("disk full")
+            raise JobCancelled()
+
+        for kind in ("failing", "cancelled"):
+            job = manager.submit(kind, partial)
+            async for info in manager.watch(job.id):
+                pass
+        assert [job.status for job in manager.list()] == [JobStatus.FAILED, JobStatus.CANCELLED]
+        assert len(paths) == 2 and not any(os.path.exists(path) for path in paths)
+        await manager.shutdown()
+
+    asyncio.run(scenario())
+
+
+def test_gerber_export_job_endpoints():
+    """Submit an export job, stream its progress, then download the zip."""
+    with TestClient(app) as client:
+        client.post("/designs", json=make_design("job-gerber"))
+
+        response = client.post("/designs/job-gerber/export/gerber/job")
+        assert response.status_code == 202
+        job_id = response.json()["id"]
+        assert response.headers["location"] == f"/jobs/{job_id}"
+
+        events = client.get(f"/jobs/{job_id}/events")
+        assert events.headers["content-type"].startswith("text/event-stream")
+        blocks = [block for block in events.text.split("\n\n") if block]
+        assert blocks[-1].startswith("event: done\n")
+        final = json.loads(blocks[-1].split("data: ", 1)[1])
+        assert final["status"] == "succeeded" and final["has_result"]
+
+        result = client.get(f"/jobs/{job_id}/result")
+        assert result.status_code == 200
+        assert result.headers["content-type"] == "application/zip"
+        assert 'filename="Job_board-gerber.zip"' in result.headers["content-disposition"]
+        assert len(zipfile.ZipFile(io.BytesIO(result.content)).namelist()) == 7
+
+        assert job_id in [job["id"] for job in client.get("/jobs").json()]
+        assert client.post("/designs/missing/export/gerber/job").status_code == 404
+        assert client.get("/jobs/unknown").status_code == 404
+
+
+def test_validate_batch_job_persists_issues():
+    """Batch DRC runs as a job; the result lists every design and issues are saved."""
+    with TestClient(app) as client:
+        client.post("/designs", json=make_design("job-drc"))
+
+        response = client.post("/designs/validate-batch/job", json={"design_ids": ["job-drc", "nope"], "max_workers": 1})
+        assert response.status_code == 202
+        job = wait_for(client, response.json()["id"])
+        assert job["status"] == "succeeded" and job["progress"] == 1.0
+
+        results = client.get(f"/jobs/{job['id']}/result").json()
+        assert results[0] == {"design_id": "nope", "error": "Design not found"}
+        assert results[1]["design_id"] == "job-drc"
+        stored = client.get("/designs/job-drc").json()
+        assert len(stored["issues"]) == len(results[1]["issues"])
+
+        # Cancelling a finished job changes nothing; its result stays available
+        assert client.delete(f"/jobs/{job['id']}").json()["status"] == "succeeded"
+        assert client.get(f"/jobs/{job['id']}/result").status_code == 200
+
+
+def test_result_conflicts_until_succeeded():
+    """A cancelled job has no result to download."""
+    with TestClient(app) as client:
+        manager = get_job_manager()
+        release = threading.Event()
+
+        def blocking(ctx):
+            release.wait(5)
+            ctx.check_cancelled()
+
+        info = client.portal.call(manager.submit, "blocking", blocking)
+        assert client.delete(f"/jobs/{info.id}").status_code == 200
+        release.set()
+        job = wait_for(client, info.id)
+        assert job["status"] == "cancelled"
+        assert client.get(f"/jobs/{info.id}/result").status_code == 409
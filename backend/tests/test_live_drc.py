@@ -0,0 +1,169 @@
+"""
+Tests for live DRC sessions and the WebSocket endpoint.
+"""
+
+import asyncio
+
+import pytest
+from fastapi.testclient import TestClient
+from starlette.websockets import WebSocketDisconnect
+
+from app.domain.changes import BoardChanges
+from app.domain.incremental_drc import IncrementalDRCService
+from app.domain.live_drc import LiveDRCSession, diff_issues
+from app.domain.models import Design, Issue
+from app.domain.services import DRCService
+from app.main import app
+
+client = TestClient(app)
+
+
+def make_design(design_id: str) -> dict:
+    return {
+        "id": design_id,
+        "name": "Live",
+        "board": {
+            "outline": [[0, 0], [50, 0], [50, 50], [0, 50]],
+            "components": [
+                {"id": "R1", "type": "resistor", "position": [10, 10]},
+                {"id": "R2", "type": "resistor", "position": [30, 10]},
+            ],
+            "nets": [{"id": "n1", "connection_ids": ["R1.1", "R2.1"]}],
+            "layers": 1,
+        },
+    }
+
+
+def issue(issue_id: str, message: str = "m") -> Issue:
+    return Issue(id=issue_id, type="clearance_violation", severity="error", message=message)
+
+
+def test_diff_issues_resends_changed_id_groups():
+    """Unchanged IDs are omitted; changed or duplicated IDs are removed and re-sent as a group."""
+    old = [issue("a"), issue("b"), issue("dup"), issue("dup", "x")]
+    new = [issue("a"), issue("b", "moved"), issue("dup"), issue("c")]
+
+    added, removed = diff_issues(old, new)
+
+    assert removed == ["b", "dup"]
+    assert [(i.id, i.message) for i in added] == [("b", "moved"), ("dup", "m"), ("c", "m")]
+    assert diff_issues(new, new) == ([], [])
+
+
+def test_live_edits_are_coalesced_into_one_issue_delta():
+    """Several quick edits produce one delta; the last one is persisted."""
+    client.post("/designs", json=make_design("live-1"))
+
+    with client.websocket_connect("/designs/live-1/live?debounce_ms=5000&max_wait_ms=10000") as ws:
+        assert ws.receive_json() == {"type": "snapshot", "issues": []}
+
+        for x in (20, 15, 10.5):
+            ws.send_json({"type": "edit", "ops": [
+                {"op": "move_component", "component_id": "R2", "position": [x, 10]},
+            ]})
+        ws.send_json({"type": "flush"})
+
+        delta = ws.receive_json()
+        assert delta["type"] == "issues" and delta["seq"] == 1
+        assert delta["removed"] == []
+        assert [i["type"] for i in delta["added"]] == ["clearance_violation"]
+
+        ws.send_json({"type": "patch", "patch": [
+            {"op": "replace", "path": "/board/components/1/position", "value": [30, 10]},
+        ]})
+        ws.send_json({"type": "flush"})
+        delta = ws.receive_json()
+        assert delta == {"type": "issues", "seq": 2, "added": [], "removed": [delta["removed"][0]]}
+
+    stored = client.get("/designs/live-1").json()
+    assert stored["board"]["components"][1]["position"] == [30, 10]
+
+
+def test_pending_edits_are_saved_on_disconnect():
+    """Closing the socket before the debounce fires still persists the edit."""
+    client.post("/designs", json=make_design("live-2"))
+
+    with client.websocket_connect("/designs/live-2/live?debounce_ms=5000&max_wait_ms=10000") as ws:
+        ws.receive_json()
+        ws.send_json({"type": "edit", "ops": [{"op": "rename", "name": "Renamed live"}]})
+
+    assert client.get("/designs/live-2").json()["name"] == "Renamed live"
+
+
+def test_edits_are_applied_off_the_event_loop(monkeypatch):
+    """Patching a large board must not block other requests on the loop."""
+    on_loop = []
+    apply = LiveDRCSession.apply
+
+    def recording_apply(self, operations):
+        try:
+            asyncio.get_running_loop()
+            on_loop.append(True)
+        except RuntimeError:
+            on_loop.append(False)
+        return apply(self, operations)
+
+    monkeypatch.setattr(LiveDRCSession, "apply", recording_apply)
+    client.post("/designs", json=make_design("live-thread"))
+    with client.websocket_connect("/designs/live-thread/live?debounce_ms=5000&max_wait_ms=10000") as ws:
+        ws.receive_json()
+        ws.send_json({"type": "edit", "ops": [{"op": "rename", "name": "Threaded"}]})
+        ws.send_json({"type": "flush"})
+        assert ws.receive_json()["type"] == "issues"
+
+    assert on_loop == [False]
+    assert client.get("/designs/live-thread").json()["name"] == "Threaded"
+
+
+def test_change_hints_from_another_base_are_not_trusted():
+    """A hint relative to one caller's last check is ignored once another caller checked the design."""
+    incremental = IncrementalDRCService()
+    mine = Design.model_validate(make_design("live-hint"))
+    incremental.check_design(mine, owner="a")
+
+    theirs = mine.model_copy(deep=True)
+    theirs.board.components[1].position = [10.5, 10]
+    assert incremental.check_design(theirs, owner="b")
+
+    mine.name = "Renamed"
+    assert incremental.check_design(mine, BoardChanges(), owner="a") == DRCService().check_design(mine) == []
+
+
+def test_concurrent_sessions_conflict_instead_of_overwriting():
+    """A session saving over another session's edit gets a conflict and the stored edit survives."""
+    client.post("/designs", json=make_design("live-4"))
+    url = "/designs/live-4/live?debounce_ms=5000&max_wait_ms=10000"
+
+    with client.websocket_connect(url) as first, client.websocket_connect(url) as second:
+        first.receive_json()
+        second.receive_json()
+
+        second.send_json({"type": "edit", "ops": [{"op": "move_component", "component_id": "R2", "position": [10.5, 10]}]})
+        second.send_json({"type": "flush"})
+        assert second.receive_json()["type"] == "issues"
+
+        first.send_json({"type": "edit", "ops": [{"op": "rename", "name": "Stale"}]})
+        first.send_json({"type": "flush"})
+        conflict = first.receive_json()
+        assert conflict["type"] == "conflict"
+        assert [i["id"] for i in conflict["issues"]] == ["clearance_R1_R2"]
+
+    stored = client.get("/designs/live-4").json()
+    assert (stored["name"], stored["board"]["components"][1]["position"]) == ("Live", [10.5, 10])
+
+
+def test_invalid_edits_report_errors_and_unknown_designs_close():
+    """Malformed or failing edits are reported without ending the session."""
+    client.post("/designs", json=make_design("live-3"))
+
+    with client.websocket_connect("/designs/live-3/live") as ws:
+        ws.receive_json()
+        ws.send_json({"type": "edit", "ops": [{"op": "move_component", "component_id": "nope", "position": [0, 0]}]})
+        assert ws.receive_json()["type"] == "error"
+        ws.send_json({"type": "teleport"})
+        assert ws.receive_json()["type"] == "error"
+
+    with pytest.raises(WebSocketDisconnect) as exc:
+        with client.websocket_connect("/designs/missing/live") as ws:
+            ws.receive_json()
+    assert exc.value.code == 4404
@@ -0,0 +1,75 @@
+"""
+Load test: light endpoints stay responsive while large validations run.
+
+Heavy DRC work is dispatched through the CPU executor, so the event loop
+keeps serving GET /health and GET /designs/{id} in the meantime.
+"""
+
+import asyncio
+import time
+
+import httpx
+
+from app.api.designs import get_drc_cache
+from app.infra.result_cache import DRCResultCache
+from app.main import app
+from benchmarks.synthetic import generate_design
+
+N_PROBES = 200
+LARGE_BOARD_COMPONENTS = 20_000
+
+
+def p99(samples):
+    ordered = sorted(samples)
+    return ordered[int(len(ordered) * 0.99) - 1]
+
+
+async def probe_latencies(client: httpx.AsyncClient, design_id: str) -> list:
+    """Alternate /health and GET /designs/{id}, recording each latency."""
+    latencies = []
+    for i in range(N_PROBES):
+        url = "/health" if i % 2 == 0 else f"/designs/{design_id}"
+        start = time.perf_counter()
+        response = await client.get(url)
+        latencies.append(time.perf_counter() - start)
+        assert response.status_code == 200
+        await asyncio.sleep(0.002)
+    return latencies
+
+
+async def run_load_test():
+    # Fresh cache so every validation does real work
+    app.dependency_overrides[get_drc_cache] = lambda: DRCResultCache()
+    try:
+        async with httpx.AsyncClient(app=app, base_url="http://test", timeout=120) as client:
+            small = {"id": "load-small", "name": "Small", "board": {"outline": [], "components": [], "nets": []}}
+            await client.post("/designs", json=small)
+            for i in range(2):
+                large = generate_design(LARGE_BOARD_COMPONENTS, design_id=f"load-large-{i}", seed=i)
+                await client.post("/designs", content=large.model_dump_json(), headers={"content-type": "application/json"})
+
+            idle = await probe_latencies(client, "load-small")
+
+            validations = [
+                asyncio.create_task(client.post(f"/designs/load-large-{i}/validate")) for i in range(2)
+            ]
+            busy_start = time.perf_counter()
+            busy = await probe_latencies(client, "load-small")
+            probing_time = time.perf_counter() - busy_start
+            results = await asyncio.gather(*validations)
+            validation_time = time.perf_counter() - busy_start
+    finally:
+        app.dependency_overrides.pop(get_drc_cache, None)
+
+    assert all(r.status_code == 200 for r in results)
+    return p99(idle), p99(busy), probing_time, validation_time
+
+
+def test_light_endpoints_stay_responsive_during_large_validations():
+    """p99 of /health and GET /designs/{id} stays low while big boards validate."""
+    _, busy_p99, probing_time, validation_time = asyncio.run(run_load_test())
+
+    # Validations must still be running for most of the probing window
+    assert validation_time > probing_time * 0.5
+    # A blocked loop would push p99 to roughly the full validation time
+    assert busy_p99 < max(0.1, validation_time / 5)
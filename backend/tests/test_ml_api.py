@@ -0,0 +1,76 @@
+"""
+Integration tests for ID-based ML endpoints and their per-revision cache.
+"""
+
+from fastapi.testclient import TestClient
+
+from app.api.deps import get_analysis_cache
+from app.infra.analysis_cache import DesignAnalysisCache
+from app.infra.memory_repo import DesignRepository
+from app.main import app
+from app.domain.models import Board, Component, Design
+
+client = TestClient(app)
+
+
+def test_id_based_suggestions_match_body_endpoint_and_refresh_on_save():
+    """Stored designs are analysed once per revision, re-analysed after a save and forgotten on delete."""
+    cache = DesignAnalysisCache()
+    app.dependency_overrides[get_analysis_cache] = lambda: cache
+    try:
+        design = {
+            "id": "ml-by-id",
+            "name": "ML by ID",
+            "board": {"outline": [], "components": [{"id": "D1", "type": "led"}], "nets": [], "layers": 1},
+        }
+        client.post("/designs", json=design)
+
+        by_id = client.get("/ml/designs/ml-by-id/suggestions")
+        assert by_id.status_code == 200
+        assert by_id.json() == client.post("/ml/suggestions", json=design).json()
+        assert client.get("/ml/designs/ml-by-id/next-action").json() == client.post("/ml/next-action", json=design).json()
+        assert cache.stats()["misses"] == 1 and cache.stats()["hits"] == 1
+
+        design["board"]["components"].append({"id": "R1", "type": "resistor"})
+        client.put("/designs/ml-by-id", json=design)
+        ids = [s["id"] for s in client.get("/ml/designs/ml-by-id/suggestions").json()["suggestions"]]
+        assert "suggest_led_resistor" not in ids
+        assert cache.stats()["misses"] == 2
+
+        assert client.get("/ml/designs/missing/suggestions").status_code == 404
+
+        # Deleting the design drops its entry instead of leaving it to eviction
+        client.delete("/designs/ml-by-id")
+        assert cache.stats()["entries"] == 0
+    finally:
+        app.dependency_overrides.pop(get_analysis_cache, None)
+
+
+def test_revisions_increase_across_saves_and_recreation():
+    """Every save gets a new revision, even after delete and re-create."""
+    repo = DesignRepository()
+    design = Design(id="rev", name="Rev", board=Board(components=[Component(id="R1", type="resistor")]))
+
+    repo.save(design)
+    first = repo.get_revision("rev")
+    repo.save(design)
+    second = repo.get_revision("rev")
+    repo.delete("rev")
+    assert repo.get_revision("rev") is None
+    repo.save(design)
+
+    assert first < second < repo.get_revision("rev")
+    assert repo.list_summaries().items[0].revision == repo.get_revision("rev")
+
+
+def test_analysis_cache_keeps_only_current_revision():
+    """Lookups for other revisions miss, and older results never overwrite newer ones."""
+    cache = DesignAnalysisCache(max_designs=2)
+    cache.put("a", 2, {"v": 2})
+    cache.put("a", 1, {"v": 1})
+    assert cache.get("a", 2) == {"v": 2}
+    assert cache.get("a", 1) is None
+
+    cache.put("b", 1, {})
+    cache.put("c", 1, {})
+    assert cache.get("a", 2) is None  # Evicted as least recently used
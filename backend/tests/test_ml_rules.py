@@ -0,0 +1,80 @@
+"""
+Tests for the MLService rule pipeline, including a per-rule micro-benchmark.
+"""
+
+import time
+
+from app.domain.ml_rules import DEFAULT_RULES, SuggestionRule, classify_design
+from app.domain.ml_services import MLService
+from app.domain.models import Board, Component, Design, Net
+from benchmarks.synthetic import generate_design
+
+BENCH_COMPONENTS = 20_000
+BENCH_ROUNDS = 5
+
+
+def test_classification_groups_components_and_nets():
+    """One pass sorts parts and nets into the groups rules rely on."""
+    design = Design(
+        id="classify",
+        name="Classify",
+        board=Board(
+            components=[
+                Component(id="D1", type="LED", position=[1, 1]),
+                Component(id="R1", type="Resistor"),
+                Component(id="C1", type="ceramic_cap"),
+                Component(id="U1", type="MCU"),
+                Component(id="U2", type="gate"),
+            ],
+            nets=[Net(id="n1", name="gnd"), Net(id="n2", name="Vcc"), Net(id="n3", name="SDA"), Net(id="n4")],
+        ),
+    )
+    facts = classify_design(design)
+
+    assert [c.id for c in facts.leds] == ["D1"]
+    assert [c.id for c in facts.resistors] == ["R1"]
+    assert [c.id for c in facts.capacitors] == ["C1"]
+    assert [c.id for c in facts.ics] == ["U1", "U2"]
+    assert [c.id for c in facts.decoupled_ics] == ["U1"]
+    assert [c.id for c in facts.positioned] == ["D1"]
+    assert [n.id for n in facts.supply_nets] == ["n1", "n2"]
+
+
+def test_custom_rules_plug_into_pipeline():
+    """Extra rules run after the defaults over the same facts."""
+
+    class CountRule(SuggestionRule):
+        name = "count"
+
+        def suggest(self, facts):
+            return [{"id": "count", "type": "general", "message": str(len(facts.ics)), "action": None, "related_ids": []}]
+
+    design = generate_design(50)
+    service = MLService(rules=DEFAULT_RULES + [CountRule()])
+    suggestions = service.get_suggestions(design)
+
+    assert suggestions[:-1] == MLService().get_suggestions(design)
+    assert suggestions[-1]["id"] == "count"
+
+
+def test_rule_cost_micro_benchmark():
+    """Per-rule cost stays far below the single classification pass it reads from."""
+    design = generate_design(BENCH_COMPONENTS)
+    for net in design.board.nets[::50]:
+        net.name = "GND"
+
+    start = time.perf_counter()
+    for _ in range(BENCH_ROUNDS):
+        facts = classify_design(design)
+    classify_ms = (time.perf_counter() - start) / BENCH_ROUNDS * 1e3
+
+    costs = {}
+    for rule in DEFAULT_RULES:
+        start = time.perf_counter()
+        for _ in range(BENCH_ROUNDS):
+            rule.suggest(facts)
+        costs[rule.name] = (time.perf_counter() - start) / BENCH_ROUNDS * 1e3
+
+    # Rules read precomputed groups, so none of them re-scans the board
+    for name, ms in costs.items():
+        assert ms < classify_ms, name
@@ -0,0 +1,130 @@
+"""
+Tests for JSON Patch and domain delta updates.
+"""
+
+import pytest
+
+from app.domain.incremental_drc import IncrementalDRCService
+from app.domain.models import Board, Component, Design, Net
+from app.domain.patching import (
+    DesignDelta,
+    JsonPatchOperation,
+    PatchError,
+    PatchTestFailed,
+    apply_patch,
+)
+from app.domain.services import DRCService
+
+
+def make_design() -> Design:
+    return Design(
+        id="p1",
+        name="Patch Me",
+        board=Board(
+            outline=[[0, 0], [50, 0], [50, 50], [0, 50]],
+            components=[
+                Component(id="R1", type="resistor", position=[10, 10]),
+                Component(id="R2", type="resistor", position=[20, 10]),
+            ],
+            nets=[Net(id="n1", connection_ids=["R1.1", "R2.1"])],
+        ),
+    )
+
+
+def json_patch(*ops):
+    return [JsonPatchOperation.model_validate(op) for op in ops]
+
+
+def test_json_patch_edits_only_addressed_entities():
+    """Replace/add/remove/move/copy apply like RFC 6902 and report only touched entities."""
+    design = make_design()
+    patched, result, changes = apply_patch(design, json_patch(
+        {"op": "test", "path": "/board/components/0/id", "value": "R1"},
+        {"op": "replace", "path": "/board/components/0/position", "value": [30, 30]},
+        {"op": "add", "path": "/board/nets/0/connection_ids/-", "value": "R1.2"},
+        {"op": "copy", "from": "/name", "path": "/board/nets/0/name"},
+        {"op": "replace", "path": "/name", "value": "Patched"},
+    ))
+
+    assert patched.board.components[0].position == [30, 30]
+    assert patched.board.nets[0].connection_ids == ["R1.1", "R2.1", "R1.2"]
+    assert patched.board.nets[0].name == "Patch Me"
+    assert patched.name == "Patched"
+    assert patched.board.components[1] is design.board.components[1]
+
+    assert set(result.components) == {"R1"}
+    assert set(result.nets) == {"n1"}
+    assert result.fields == {"/name": "Patched"}
+    assert changes.components == {"R1"} and changes.nets == {"n1"}
+
+    # The original design is untouched
+    assert design.board.components[0].position == [10, 10]
+    assert design.name == "Patch Me"
+
+
+def test_failed_operation_leaves_design_unchanged():
+    """Patches are atomic: an error after earlier ops applies nothing."""
+    design = make_design()
+    with pytest.raises(PatchTestFailed):
+        apply_patch(design, json_patch(
+            {"op": "replace", "path": "/board/components/0/position", "value": [1, 1]},
+            {"op": "test", "path": "/name", "value": "Something else"},
+        ))
+    assert design.board.components[0].position == [10, 10]
+
+    for bad in [
+        {"op": "replace", "path": "/board/components/9/position", "value": [1, 1]},
+        {"op": "replace", "path": "/board/components/0/position", "value": "nowhere"},
+        {"op": "replace", "path": "/id", "value": "other"},
+        {"op": "remove", "path": "/name"},
+        {"op": "add", "path": "/board/components/0/position"},
+    ]:
+        with pytest.raises(PatchError):
+            apply_patch(design, json_patch(bad))
+
+
+def test_domain_delta_operations():
+    """Domain ops move, rewire, add and remove entities by ID."""
+    design = make_design()
+    delta = DesignDelta.model_validate({"ops": [
+        {"op": "move_component", "component_id": "R2", "position": [40, 40], "rotation": 90},
+        {"op": "set_component_property", "component_id": "R2", "name": "resistance", "value": 220, "unit": "ohm"},
+        {"op": "add_component", "component": {"id": "C1", "type": "capacitor", "position": [5, 5]}},
+        {"op": "remove_component", "component_id": "R1"},
+        {"op": "connect", "net_id": "n1", "connection_id": "C1.1"},
+        {"op": "disconnect", "net_id": "n1", "connection_id": "R1.1"},
+        {"op": "set_outline", "outline": [[0, 0], [60, 0], [60, 60], [0, 60]]},
+    ]})
+    patched, result, changes = apply_patch(design, delta)
+
+    assert [c.id for c in patched.board.components] == ["R2", "C1"]
+    assert patched.board.components[0].position == [40, 40]
+    assert patched.board.components[0].rotation == 90
+    assert patched.board.components[0].properties["resistance"].value == 220
+    assert patched.board.nets[0].connection_ids == ["R2.1", "C1.1"]
+    assert result.components["R1"] is None
+    assert result.fields == {"/board/outline": [[0, 0], [60, 0], [60, 60], [0, 60]]}
+    assert changes.outline
+
+    with pytest.raises(PatchError):
+        apply_patch(design, DesignDelta.model_validate({"ops": [
+            {"op": "move_component", "component_id": "missing", "position": [0, 0]},
+        ]}))
+
+
+def test_board_changes_drive_incremental_drc():
+    """Changes reported by a patch are enough for incremental DRC to match a full check."""
+    design = make_design()
+    incremental = IncrementalDRCService()
+    incremental.check_design(design)
+
+    patched, _, changes = apply_patch(design, DesignDelta.model_validate({"ops": [
+        {"op": "move_component", "component_id": "R2", "position": [10.5, 10]},
+        {"op": "add_net", "net": {"id": "n2", "connection_ids": ["R1.1"]}},
+    ]}))
+    assert changes is not None
+    assert incremental.check_design(patched, changes) == DRCService().check_design(patched)
+
+    # Reordering nets cannot be described as touched entities
+    _, _, changes = apply_patch(patched, json_patch({"op": "move", "from": "/board/nets/1", "path": "/board/nets/0"}))
+    assert changes is None
@@ -0,0 +1,94 @@
+"""
+Tests for the ratsnest: spanning-tree airwires, trace-joined pins and
+incremental recompute.
+"""
+
+import numpy as np
+from fastapi.testclient import TestClient
+
+from app.domain.changes import BoardChanges
+from app.domain.connectivity import DisjointSet
+from app.domain.models import Board, Component, Design, Net, Trace
+from app.domain.pads import pin_position
+from app.domain.ratsnest import RatsnestService, spanning_edges
+from app.main import app
+from benchmarks.synthetic import generate_design
+
+
+def prim_length(points: np.ndarray) -> float:
+    """Brute-force minimum spanning tree length."""
+    n = len(points)
+    best = np.hypot(*(points - points[0]).T)
+    inside = np.zeros(n, dtype=bool)
+    inside[0] = True
+    total = 0.0
+    for _ in range(n - 1):
+        candidates = np.where(inside, np.inf, best)
+        k = int(np.argmin(candidates))
+        total += candidates[k]
+        inside[k] = True
+        best = np.minimum(best, np.hypot(*(points - points[k]).T))
+    return total
+
+
+def summaries(result):
+    return sorted((w.net_id, w.source, w.target) for w in result.airwires), result.net_lengths
+
+
+def test_large_net_tree_is_minimal():
+    """Nearest-neighbour candidates give the same tree length as brute force, clustered or not."""
+    rng = np.random.default_rng(3)
+    uniform = rng.uniform(0, 100, size=(1500, 2))
+    clusters = np.concatenate([rng.normal(center, 2.0, size=(300, 2)) for center in ([0, 0], [500, 0], [0, 800])])
+    for points in (uniform, clusters):
+        edges = spanning_edges(points, DisjointSet(len(points)))
+        assert len(edges) == len(points) - 1
+        length = sum(float(np.hypot(*(points[a] - points[b]))) for a, b in edges)
+        assert abs(length - prim_length(points)) < 1e-6
+
+
+def test_incremental_matches_full_compute():
+    """Moving and rewiring updates only the touched nets and agrees with a fresh service."""
+    design = generate_design(400)
+    incremental = RatsnestService()
+    incremental.compute(design)
+
+    board = design.board
+    moved = board.components[17]
+    moved.position = [moved.position[0] + 7.5, moved.position[1] - 3.0]
+    assert summaries(incremental.compute(design)) == summaries(RatsnestService().compute(design))
+
+    board.nets[5].connection_ids.append("C200.1")
+    changes = BoardChanges(nets={board.nets[5].id})
+    assert summaries(incremental.compute(design, changes)) == summaries(RatsnestService().compute(design))
+
+
+def test_traces_remove_airwires():
+    """A trace joining two pins removes their airwire; the third pin still needs one."""
+    components = [Component(id=f"R{i}", type="resistor", position=[10.0 * i, 0.0]) for i in range(3)]
+    board = Board(
+        outline=[[-5, -5], [30, -5], [30, 5], [-5, 5]],
+        components=components,
+        nets=[Net(id="n", connection_ids=["R0.2", "R1.1", "R2.1"])],
+    )
+    design = Design(id="routed", name="Routed", board=board)
+    service = RatsnestService()
+    assert len(service.compute(design).airwires) == 2
+
+    start, end = pin_position(components[0], "2"), pin_position(components[1], "1")
+    board.traces.append(Trace(id="t", net_id="n", points=[list(start), [start[0], 1.0], [end[0], 1.0], list(end)]))
+    result = service.compute(design)
+    assert [(w.source, w.target) for w in result.airwires] in ([("R1.1", "R2.1")], [("R2.1", "R1.1")])
+
+
+def test_ratsnest_endpoint():
+    """The endpoint reports airwires and unrouted length, and 404s for unknown designs."""
+    design = generate_design(50, design_id="ratsnest-api")
+    with TestClient(app) as client:
+        client.post("/designs", content=design.model_dump_json(), headers={"Content-Type": "application/json"})
+        body = client.get("/designs/ratsnest-api/ratsnest").json()
+        assert body["design_id"] == "ratsnest-api"
+        assert body["airwire_count"] == len(body["airwires"]) > 0
+        assert abs(body["unrouted_length"] - sum(body["net_lengths"].values())) < 1e-6
+        assert client.get("/designs/missing/ratsnest").status_code == 404
+        client.delete("/designs/ratsnest-api")
@@ -0,0 +1,50 @@
+"""
+Tests for the content-addressed DRC result cache.
+"""
+
+from app.domain.models import Board, Component, ComponentProperty, Issue, IssueSeverity
+from app.infra.result_cache import DRCResultCache, board_fingerprint
+
+
+def make_issue(issue_id: str) -> Issue:
+    return Issue(id=issue_id, severity=IssueSeverity.ERROR, message="x" * 100)
+
+
+def test_fingerprint_ignores_property_order():
+    """Canonicalization makes dict ordering irrelevant to the hash."""
+    first = Board(components=[Component(id="R1", type="resistor", properties={
+        "a": ComponentProperty(name="a", value=1),
+        "b": ComponentProperty(name="b", value=2),
+    })])
+    second = Board(components=[Component(id="R1", type="resistor", properties={
+        "b": ComponentProperty(name="b", value=2),
+        "a": ComponentProperty(name="a", value=1),
+    })])
+
+    assert board_fingerprint(first) == board_fingerprint(second)
+    assert board_fingerprint(first) != board_fingerprint(first, salt="clearance=0.5")
+
+    second.components[0].position = [1.0, 2.0]
+    assert board_fingerprint(first) != board_fingerprint(second)
+
+
+def test_hits_misses_and_lru_eviction():
+    """Entries are evicted least-recently-used first once the byte budget is exceeded."""
+    entry_size = len(make_issue("a").model_dump_json()) + 1
+    cache = DRCResultCache(max_bytes=entry_size * 2)
+
+    assert cache.get("a") is None
+    cache.put("a", [make_issue("a")])
+    cache.put("b", [make_issue("b")])
+    assert [i.id for i in cache.get("a")] == ["a"]  # "a" is now most recent
+
+    cache.put("c", [make_issue("c")])
+    assert cache.get("b") is None
+    assert cache.get("a") is not None
+
+    stats = cache.stats()
+    assert stats["hits"] == 2
+    assert stats["misses"] == 2
+    assert stats["evictions"] == 1
+    assert stats["entries"] == 2
+    assert stats["bytes"] <= stats["max_bytes"]
@@ -0,0 +1,130 @@
+"""
+Tests for the SQLite design repository.
+"""
+
+import sqlite3
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+
+from app.domain.models import Board, Component, Design, Issue, IssueSeverity, Net
+from app.infra.memory_repo import DesignRepository, RevisionConflict
+from app.infra.sqlite_repo import SQLiteDesignRepository
+
+
+def make_design(design_id: str, name: str, n_components: int = 0, updated_at: str | None = None) -> Design:
+    return Design(
+        id=design_id,
+        name=name,
+        updated_at=updated_at,
+        board=Board(
+            components=[Component(id=f"R{i}", type="resistor") for i in range(n_components)],
+            nets=[Net(id="n1", connection_ids=["R0.1", "R1.1"])],
+        ),
+    )
+
+
+def test_crud_round_trip(tmp_path):
+    """Designs are stored, updated, reloaded from disk and deleted."""
+    path = tmp_path / "designs.sqlite3"
+    repo = SQLiteDesignRepository(path)
+    repo.save(make_design("a", "Alpha", 2))
+    repo.save(make_design("a", "Alpha v2", 3))
+    repo.close()
+
+    reopened = SQLiteDesignRepository(path)
+    design = reopened.get("a")
+    assert design.name == "Alpha v2"
+    assert len(design.board.components) == 3
+
+    reopened.delete("a")
+    assert reopened.get("a") is None
+    assert reopened.list_all() == []
+
+
+def test_summaries_match_memory_repository(tmp_path):
+    """SQLite and in-memory repositories filter and paginate summaries identically."""
+    sqlite_repo = SQLiteDesignRepository(tmp_path / "designs.sqlite3")
+    memory_repo = DesignRepository()
+    designs = [
+        make_design("1", "Blinky", 2, "2026-01-01"),
+        make_design("2", "Blinky Pro", 8, "2026-03-01"),
+        make_design("3", "Amplifier", 5, "2026-02-01"),
+        make_design("4", "Blinker", 1),
+    ]
+    for design in designs:
+        sqlite_repo.save(design)
+        memory_repo.save(design)
+
+    for kwargs in [{}, {"name_prefix": "Blink"}, {"min_components": 2, "max_components": 5}, {"limit": 2}]:
+        assert sqlite_repo.list_summaries(**kwargs) == memory_repo.list_summaries(**kwargs), kwargs
+
+    assert [s.id for s in sqlite_repo.list_summaries(name_prefix="Blink").items] == ["1", "2", "4"]
+
+    first = sqlite_repo.list_summaries(limit=2)
+    second = sqlite_repo.list_summaries(limit=2, cursor=first.next_cursor)
+    assert [s.id for s in first.items] == ["1", "2"]
+    assert [s.id for s in second.items] == ["3", "4"]
+    assert second.next_cursor is None
+    assert second == memory_repo.list_summaries(limit=2, cursor=first.next_cursor)
+
+
+def test_issue_counts_are_stored_per_severity(tmp_path):
+    """Listing reports issue counts from the indexed columns, without reading bodies."""
+    design = make_design("a", "Alpha", 2)
+    design.issues = [
+        Issue(id="i1", type="short_circuit", severity=IssueSeverity.ERROR, message="short"),
+        Issue(id="i2", type="clearance_violation", severity=IssueSeverity.WARNING, message="close"),
+        Issue(id="i3", type="clearance_violation", severity=IssueSeverity.WARNING, message="close"),
+    ]
+    repo = SQLiteDesignRepository(tmp_path / "designs.sqlite3")
+    repo.save(design)
+
+    [summary] = repo.list_summaries().items
+    assert summary.issue_counts == {"error": 1, "warning": 2, "info": 0}
+
+
+def test_wal_mode_indexes_and_concurrent_writers(tmp_path):
+    """The database runs in WAL mode, filters use indexes, and pooled writers don't collide."""
+    path = tmp_path / "designs.sqlite3"
+    repo = SQLiteDesignRepository(path, pool_size=4)
+
+    with ThreadPoolExecutor(max_workers=8) as pool:
+        list(pool.map(lambda i: repo.save(make_design(f"d{i}", f"Design {i}", i % 7)), range(200)))
+    assert len(repo.list_summaries(limit=500).items) == 200
+
+    conn = sqlite3.connect(path)
+    assert conn.execute("PRAGMA journal_mode").fetchone()[0] == "wal"
+    plan = " ".join(
+        str(row) for row in conn.execute(
+            "EXPLAIN QUERY PLAN SELECT id FROM designs WHERE component_count >= 3"
+        )
+    )
+    assert "idx_designs_component_count" in plan
+
+
+def test_conditional_save_checks_revision_in_the_transaction(tmp_path):
+    """A save expecting an old revision fails once another connection has saved."""
+    path = tmp_path / "designs.sqlite3"
+    first, second = SQLiteDesignRepository(path), SQLiteDesignRepository(path)
+    revision = first.save(make_design("a", "Alpha"))
+    assert second.save(make_design("a", "Beta"), expected_revision=revision) == revision + 1
+
+    with pytest.raises(RevisionConflict) as conflict:
+        first.save(make_design("a", "Gamma"), expected_revision=revision)
+    assert (conflict.value.expected, conflict.value.current) == (revision, revision + 1)
+    assert first.get("a").name == "Beta"
+
+
+def test_revisions_are_shared_across_connections(tmp_path):
+    """Revisions come from one counter in the database file."""
+    path = tmp_path / "designs.sqlite3"
+    first, second = SQLiteDesignRepository(path), SQLiteDesignRepository(path)
+    first.save(make_design("a", "Alpha"))
+    second.save(make_design("a", "Alpha"))
+    second.delete("a")
+    first.save(make_design("a", "Alpha"))
+
+    assert first.get_revision("a") == 3
+    assert second.list_summaries().items[0].revision == 3
+    assert first.get_revision("missing") is None
@@ -0,0 +1,118 @@
+"""
+Tests for the write-ahead-log design repository.
+"""
+
+import os
+import stat
+
+from app.domain.models import Board, Design
+from app.infra.wal_repo import SNAPSHOT_FILE, WAL_FILE, WALDesignRepository
+
+
+def make_design(design_id: str, name: str = "WAL Test") -> Design:
+    return Design(id=design_id, name=name, board=Board())
+
+
+def test_designs_survive_restart(tmp_path):
+    """Saves and deletes are recovered by a new repository instance."""
+    repo = WALDesignRepository(tmp_path, fsync=False)
+    repo.save(make_design("a"))
+    repo.save(make_design("b"))
+    repo.save(make_design("a", name="Renamed"))
+    repo.delete("b")
+    repo.close()
+
+    recovered = WALDesignRepository(tmp_path, fsync=False)
+    assert recovered.get("a").name == "Renamed"
+    assert recovered.get("b") is None
+    assert [d.id for d in recovered.list_all()] == ["a"]
+
+
+def test_torn_log_tail_is_discarded(tmp_path):
+    """A partially written final record (crash mid-append) is ignored and truncated."""
+    repo = WALDesignRepository(tmp_path, fsync=False)
+    repo.save(make_design("ok"))
+    repo.close()
+
+    wal_path = tmp_path / WAL_FILE
+    intact_size = wal_path.stat().st_size
+    with open(wal_path, "ab") as wal:
+        wal.write(b'{"op":"save","design":{"id":"torn","na')
+
+    recovered = WALDesignRepository(tmp_path, fsync=False)
+    assert recovered.get("ok") is not None
+    assert recovered.get("torn") is None
+    assert wal_path.stat().st_size == intact_size
+
+    # The log stays appendable after recovery
+    recovered.save(make_design("after"))
+    recovered.close()
+    assert WALDesignRepository(tmp_path, fsync=False).get("after") is not None
+
+
+def test_compaction_writes_snapshot_and_truncates_log(tmp_path):
+    """Compaction folds the log into the snapshot without losing data."""
+    repo = WALDesignRepository(tmp_path, fsync=False, compact_every=5)
+    for i in range(12):
+        repo.save(make_design(f"d{i % 3}", name=f"v{i}"))
+
+    assert (tmp_path / SNAPSHOT_FILE).exists()
+    assert repo._wal_ops < 5
+    repo.close()
+
+    recovered = WALDesignRepository(tmp_path, fsync=False)
+    assert {d.id: d.name for d in recovered.list_all()} == {"d0": "v9", "d1": "v10", "d2": "v11"}
+
+
+def test_compaction_syncs_directory_before_truncating_log(tmp_path, monkeypatch):
+    """With fsync on, the snapshot rename is made durable before the log is emptied."""
+    repo = WALDesignRepository(tmp_path, fsync=True)
+    repo.save(make_design("a"))
+
+    log_sizes_at_dir_sync = []
+    real_fsync = os.fsync
+
+    def recording_fsync(fd):
+        if stat.S_ISDIR(os.fstat(fd).st_mode):
+            log_sizes_at_dir_sync.append((tmp_path / WAL_FILE).stat().st_size)
+        real_fsync(fd)
+
+    monkeypatch.setattr(os, "fsync", recording_fsync)
+    repo.compact()
+    repo.close()
+
+    assert log_sizes_at_dir_sync and all(size > 0 for size in log_sizes_at_dir_sync)
+    assert (tmp_path / WAL_FILE).stat().st_size == 0
+    assert WALDesignRepository(tmp_path, fsync=False).get("a") is not None
+
+
+def test_listing_after_restart_does_not_parse_designs(tmp_path):
+    """Summaries are recovered from the log; listing pages never materializes boards."""
+    repo = WALDesignRepository(tmp_path, fsync=False)
+    for i in range(5):
+        repo.save(make_design(f"d{i}", name=f"Board {i}"))
+    repo.delete("d2")
+    repo.close()
+
+    recovered = WALDesignRepository(tmp_path, fsync=False)
+    first = recovered.list_summaries(limit=2)
+    second = recovered.list_summaries(limit=2, cursor=first.next_cursor)
+    assert [s.id for s in first.items + second.items] == ["d0", "d1", "d3", "d4"]
+    assert second.next_cursor is None
+    assert Design.model_validate_json(recovered.get_json("d3")) == make_design("d3", name="Board 3")
+    assert recovered.get_json("d2") is None
+    assert recovered._designs == {}
+
+
+def test_revisions_survive_restart_and_compaction(tmp_path):
+    """Revisions keep increasing after recovery, even when the newest save was deleted."""
+    repo = WALDesignRepository(tmp_path, fsync=False, compact_every=3)
+    repo.save(make_design("a"))
+    repo.save(make_design("b"))
+    repo.delete("b")  # Third operation: compaction drops every record of "b"
+    assert (repo.get_revision("a"), repo._wal_ops) == (1, 0)
+    repo.close()
+
+    recovered = WALDesignRepository(tmp_path, fsync=False)
+    recovered.save(make_design("b"))
+    assert recovered.get_revision("b") == 4
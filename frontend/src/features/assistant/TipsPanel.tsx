@@ -1,6 +1,7 @@
 import { useEffect, useState } from 'react'
 import { Design } from '../../../shared/schema/schema'
 import { mlApi } from '@shared/api/mlApi'
+import { useDesignStore } from '../../shared/state/designStore'
 import './TipsPanel.css'
 
 interface TipsPanelProps {
@@ -14,15 +15,16 @@ interface TipsPanelProps {
 export default function TipsPanel({ design }: TipsPanelProps) {
   const [suggestions, setSuggestions] = useState<any[]>([])
   const [loading, setLoading] = useState(true)
+  const { updateDesign } = useDesignStore()
 
   useEffect(() => {
     loadSuggestions()
   }, [design.id])
 
-  const loadSuggestions = async () => {
+  const loadSuggestions = async (placement = false) => {
     try {
       setLoading(true)
-      const response = await mlApi.getSuggestions(design)
+      const response = await mlApi.getSuggestions(design, placement)
       setSuggestions(response.suggestions)
     } catch (error) {
       console.error('Failed to load suggestions:', error)
@@ -31,6 +33,21 @@ export default function TipsPanel({ design }: TipsPanelProps) {
     }
   }
 
+  // Autoplacer proposals arrive as component_id -> [x, y]
+  const applySuggestion = async (suggestion: any) => {
+    if (suggestion.action?.type !== 'move_components') return
+    const positions: Record<string, [number, number]> = suggestion.action.params.positions
+    const components = design.board.components.map(component =>
+      positions[component.id] ? { ...component, position: positions[component.id] } : component
+    )
+    try {
+      await updateDesign({ ...design, board: { ...design.board, components } })
+      await loadSuggestions()
+    } catch (error) {
+      console.error('Failed to apply suggestion:', error)
+    }
+  }
+
   if (loading) {
     return (
       <div className="tips-panel">
@@ -54,7 +71,7 @@ export default function TipsPanel({ design }: TipsPanelProps) {
     <div className="tips-panel">
       <div className="tips-header">
         <h3>💡 Design Tips</h3>
-        <button onClick={loadSuggestions} className="refresh-btn">Refresh</button>
+        <button onClick={() => loadSuggestions()} className="refresh-btn">Refresh</button>
       </div>
 
       <div className="tips-list">
@@ -67,8 +84,10 @@ export default function TipsPanel({ design }: TipsPanelProps) {
             </div>
             <div className="tip-content">
               <p className="tip-message">{suggestion.message}</p>
-              {suggestion.action && (
-                <button className="apply-btn">Apply suggestion</button>
+              {suggestion.action ? (
+                <button className="apply-btn" onClick={() => applySuggestion(suggestion)}>Apply suggestion</button>
+              ) : suggestion.id === 'suggest_placement' && (
+                <button className="apply-btn" onClick={() => loadSuggestions(true)}>Propose positions</button>
               )}
             </div>
           </div>
@@ -1,4 +1,6 @@
+import { useEffect, useState } from 'react'
 import { Design } from '../../../shared/schema/schema'
+import { designApi, RatsnestResponse } from '@shared/api/designApi'
 import './BoardCanvas.css'
 
 interface BoardCanvasProps {
@@ -11,6 +13,16 @@ interface BoardCanvasProps {
  * TODO: Implement with Konva.js for interactive canvas.
  */
 export default function BoardCanvas({ design, isTutorial }: BoardCanvasProps) {
+  const [ratsnest, setRatsnest] = useState<RatsnestResponse | null>(null)
+
+  // Refetch after every saved edit; the backend only recomputes nets that changed
+  useEffect(() => {
+    designApi
+      .getRatsnest(design.id)
+      .then(setRatsnest)
+      .catch(error => console.error('Failed to load ratsnest:', error))
+  }, [design])
+
   return (
     <div className="board-canvas">
       <div className="canvas-placeholder">
@@ -22,6 +34,12 @@ export default function BoardCanvas({ design, isTutorial }: BoardCanvasProps) {
           Components: {design.board.components.length} | 
           Board Outline: {design.board.outline.length > 0 ? 'Defined' : 'Not defined'}
         </p>
+        {ratsnest && (
+          <p className="placeholder-stats">
+            Airwires: {ratsnest.airwire_count} | 
+            Unrouted: {ratsnest.unrouted_length.toFixed(1)} mm
+          </p>
+        )}
       </div>
     </div>
   )
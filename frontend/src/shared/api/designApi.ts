@@ -1,7 +1,25 @@
-import { Design, ValidateDesignResponse, Issue } from '../schema/schema'
+import { Design, DesignPage, ListDesignsParams, ValidateDesignResponse, Issue } from '../schema/schema'
 import { validateIssues } from '../schema/issueValidation'
 import { apiClient } from './client'
 
+/** One unrouted connection: the spanning-tree edge between two pins of a net */
+export interface Airwire {
+  net_id: string
+  source: string
+  target: string
+  start: [number, number]
+  end: [number, number]
+  length: number
+}
+
+export interface RatsnestResponse {
+  design_id: string
+  unrouted_length: number
+  airwire_count: number
+  net_lengths: Record<string, number>
+  airwires: Airwire[]
+}
+
 /**
  * Design API - typed API calls for design operations.
  * SOLID: Interface Segregation - focused API surface.
@@ -27,8 +45,8 @@ export const designApi = {
     await apiClient.delete(`/designs/${id}`)
   },
 
-  async listDesigns(): Promise<Design[]> {
-    const response = await apiClient.get<Design[]>('/designs')
+  async listDesigns(params: ListDesignsParams = {}): Promise<DesignPage> {
+    const response = await apiClient.get<DesignPage>('/designs', { params })
     return response.data
   },
 
@@ -40,5 +58,16 @@ export const designApi = {
     const validatedIssues = validateIssues(response.data.issues)
     return { issues: validatedIssues }
   },
+
+  /** Airwires of the stored design; the backend recomputes only nets changed since the last call */
+  async getRatsnest(id: string): Promise<RatsnestResponse> {
+    const response = await apiClient.get<RatsnestResponse>(`/designs/${encodeURIComponent(id)}/ratsnest`)
+    return response.data
+  },
+
+  /** URL of the Gerber/Excellon zip; use as a link href so the browser streams the download */
+  gerberExportUrl(id: string): string {
+    return `${apiClient.defaults.baseURL}/designs/${encodeURIComponent(id)}/export/gerber`
+  },
 }
 
@@ -1,4 +1,8 @@
 export { mlApi } from './mlApi'
 export { designApi } from './designApi'
+export type { Airwire, RatsnestResponse } from './designApi'
 export { apiClient } from './client'
+export { jobsApi } from './jobsApi'
+export type { JobInfo, JobStatus } from './jobsApi'
 
+export { openLiveDrc } from './liveDrc'
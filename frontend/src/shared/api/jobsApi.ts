@@ -0,0 +1,76 @@
+import { apiClient } from './client'
+
+/**
+ * Jobs API - background jobs (exports, batch DRC, autorouting) submitted by design routes.
+ * SOLID: Interface Segregation - submit, poll, watch, cancel; see backend
+ * app/api/jobs.py for the endpoints.
+ */
+export type JobStatus = 'queued' | 'running' | 'succeeded' | 'failed' | 'cancelled'
+
+export interface JobInfo {
+  id: string
+  kind: string
+  status: JobStatus
+  progress: number
+  message: string | null
+  error: string | null
+  has_result: boolean
+  created_at: number
+  started_at: number | null
+  finished_at: number | null
+}
+
+export const jobsApi = {
+  async exportGerber(designId: string): Promise<JobInfo> {
+    const response = await apiClient.post<JobInfo>(`/designs/${encodeURIComponent(designId)}/export/gerber/job`)
+    return response.data
+  },
+
+  async autoroute(
+    designId: string,
+    options: { grid?: number; trace_width?: number; max_workers?: number } = {}
+  ): Promise<JobInfo> {
+    const response = await apiClient.post<JobInfo>(`/designs/${encodeURIComponent(designId)}/autoroute/job`, options)
+    return response.data
+  },
+
+  async autoplace(
+    designId: string,
+    options: { fixed?: string[]; moves_per_component?: number } = {}
+  ): Promise<JobInfo> {
+    const response = await apiClient.post<JobInfo>(`/designs/${encodeURIComponent(designId)}/autoplace/job`, options)
+    return response.data
+  },
+
+  async validateBatch(designIds: string[] | 'all' = 'all'): Promise<JobInfo> {
+    const response = await apiClient.post<JobInfo>('/designs/validate-batch/job', { design_ids: designIds })
+    return response.data
+  },
+
+  async getJob(id: string): Promise<JobInfo> {
+    const response = await apiClient.get<JobInfo>(`/jobs/${id}`)
+    return response.data
+  },
+
+  async cancelJob(id: string): Promise<JobInfo> {
+    const response = await apiClient.delete<JobInfo>(`/jobs/${id}`)
+    return response.data
+  },
+
+  /** URL of a succeeded job's result; use as a link href for file results */
+  resultUrl(id: string): string {
+    return `${apiClient.defaults.baseURL}/jobs/${id}/result`
+  },
+
+  /** Follow a job's progress over Server-Sent Events; returns a function that stops watching */
+  watchJob(id: string, onUpdate: (job: JobInfo) => void): () => void {
+    const source = new EventSource(`${apiClient.defaults.baseURL}/jobs/${id}/events`)
+    const handle = (event: MessageEvent) => onUpdate(JSON.parse(event.data) as JobInfo)
+    source.addEventListener('progress', handle)
+    source.addEventListener('done', (event) => {
+      handle(event as MessageEvent)
+      source.close()
+    })
+    return () => source.close()
+  },
+}
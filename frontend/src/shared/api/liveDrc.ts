@@ -0,0 +1,68 @@
+import { Issue } from '../schema/schema'
+
+/**
+ * Live DRC - WebSocket session pushing edits and receiving issue deltas.
+ * SOLID: Single Responsibility - owns the socket and the local issue list;
+ * see backend app/api/live.py for the message protocol.
+ */
+export interface LiveDrcHandlers {
+  onIssues: (issues: Issue[]) => void
+  onError?: (detail: string) => void
+}
+
+export interface LiveDrcSession {
+  /** Domain delta ops, e.g. { op: 'move_component', component_id, position } */
+  edit: (ops: Record<string, unknown>[]) => void
+  /** Check immediately instead of waiting for the debounce */
+  flush: () => void
+  close: () => void
+}
+
+function liveUrl(designId: string, debounceMs?: number): string {
+  const protocol = window.location.protocol === 'https:' ? 'wss:' : 'ws:'
+  const query = debounceMs === undefined ? '' : `?debounce_ms=${debounceMs}`
+  return `${protocol}//${window.location.host}/api/designs/${encodeURIComponent(designId)}/live${query}`
+}
+
+export function openLiveDrc(
+  designId: string,
+  handlers: LiveDrcHandlers,
+  debounceMs?: number
+): LiveDrcSession {
+  const socket = new WebSocket(liveUrl(designId, debounceMs))
+  let issues: Issue[] = []
+  const queued: string[] = []
+
+  const send = (message: object) => {
+    const text = JSON.stringify(message)
+    if (socket.readyState === WebSocket.OPEN) {
+      socket.send(text)
+    } else {
+      queued.push(text)
+    }
+  }
+
+  socket.onopen = () => {
+    queued.splice(0).forEach((text) => socket.send(text))
+  }
+
+  socket.onmessage = (event) => {
+    const message = JSON.parse(event.data)
+    if (message.type === 'snapshot') {
+      issues = message.issues
+    } else if (message.type === 'issues') {
+      const removed = new Set<string>(message.removed)
+      issues = issues.filter((issue) => !removed.has(issue.id)).concat(message.added)
+    } else if (message.type === 'error') {
+      handlers.onError?.(message.detail)
+      return
+    }
+    handlers.onIssues(issues)
+  }
+
+  return {
+    edit: (ops) => send({ type: 'edit', ops }),
+    flush: () => send({ type: 'flush' }),
+    close: () => socket.close(),
+  }
+}
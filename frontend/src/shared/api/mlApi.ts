@@ -6,10 +6,12 @@ import { apiClient } from './client'
  * SOLID: Interface Segregation - focused ML API surface.
  */
 export const mlApi = {
-  async getSuggestions(design: Design): Promise<MLSuggestionsResponse> {
+  // `placement` runs the autoplacer for a move_components proposal (slow on big boards)
+  async getSuggestions(design: Design, placement = false): Promise<MLSuggestionsResponse> {
     const response = await apiClient.post<MLSuggestionsResponse>(
       '/ml/suggestions',
-      design
+      design,
+      { params: placement ? { placement: true } : undefined }
     )
     return response.data
   },
@@ -26,5 +28,16 @@ export const mlApi = {
     const response = await apiClient.post('/ml/next-action', design)
     return response.data
   },
+
+  // ID-based variants: the server analyses its stored copy (cached per revision)
+  async getSuggestionsForDesign(designId: string): Promise<MLSuggestionsResponse> {
+    const response = await apiClient.get<MLSuggestionsResponse>(`/ml/designs/${designId}/suggestions`)
+    return response.data
+  },
+
+  async suggestNextActionForDesign(designId: string): Promise<any> {
+    const response = await apiClient.get(`/ml/designs/${designId}/next-action`)
+    return response.data
+  },
 }
 
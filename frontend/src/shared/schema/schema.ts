@@ -28,11 +28,29 @@ export interface Net {
   name?: string
 }
 
+export interface Trace {
+  id: string
+  netId: string
+  layer: number
+  width: number
+  points: [number, number][]
+}
+
+export interface Via {
+  id: string
+  netId: string
+  position: [number, number]
+  diameter: number
+  drill: number
+}
+
 export interface Board {
   outline: [number, number][]
   components: Component[]
   nets: Net[]
   layers: number
+  traces?: Trace[]
+  vias?: Via[]
 }
 
 export interface Issue {
@@ -53,6 +71,31 @@ export interface Design {
 }
 
 // API types
+// Listing projection returned by GET /designs (field names as sent on the wire)
+export interface DesignSummary {
+  id: string
+  name: string
+  component_count: number
+  net_count: number
+  issue_counts: Record<'error' | 'warning' | 'info', number>
+  created_at?: string | null
+  updated_at?: string | null
+  revision: number
+}
+
+export interface DesignPage {
+  items: DesignSummary[]
+  next_cursor: string | null
+}
+
+export interface ListDesignsParams {
+  limit?: number
+  cursor?: string
+  name_prefix?: string
+  min_components?: number
+  max_components?: number
+}
+
 export interface ValidateDesignResponse {
   issues: Issue[]
 }
@@ -7,6 +7,8 @@ from .models import (
     Component,
     ComponentProperty,
     Net,
+    Trace,
+    Via,
     Board,
     Issue,
     IssueSeverity,
@@ -17,6 +19,8 @@ __all__ = [
     "Component",
     "ComponentProperty",
     "Net",
+    "Trace",
+    "Via",
     "Board",
     "Issue",
     "IssueSeverity",
@@ -41,6 +41,27 @@ class Net(BaseModel):
     name: Optional[str] = None  # Optional net name (e.g., "VCC", "GND")
 
 
+class Trace(BaseModel):
+    """Routed copper track: a polyline on one copper layer belonging to a net."""
+    id: str
+    net_id: str
+    layer: int = Field(default=1, description="Copper layer: 1 = top, 2 = bottom")
+    width: float = Field(default=0.25, description="Track width (mm)")
+    points: List[List[float]] = Field(
+        default_factory=list,
+        description="Polyline points: [[x, y], [x, y], ...]"
+    )
+
+
+class Via(BaseModel):
+    """Plated hole joining a net's tracks on the top and bottom layers."""
+    id: str
+    net_id: str
+    position: List[float]  # [x, y]
+    diameter: float = 0.6  # copper ring (mm)
+    drill: float = 0.3  # hole (mm)
+
+
 class Board(BaseModel):
     """PCB board definition."""
     outline: List[List[float]] = Field(
@@ -50,6 +71,8 @@ class Board(BaseModel):
     components: List[Component] = Field(default_factory=list)
     nets: List[Net] = Field(default_factory=list)
     layers: int = Field(default=1, description="Number of layers (MVP: 1-2)")
+    traces: List[Trace] = Field(default_factory=list)
+    vias: List[Via] = Field(default_factory=list)
 
 
 class Issue(BaseModel):
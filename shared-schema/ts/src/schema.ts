@@ -33,11 +33,29 @@ export interface Net {
   name?: string; // Optional net name (e.g., "VCC", "GND")
 }
 
+export interface Trace {
+  id: string;
+  netId: string;
+  layer: number; // Copper layer: 1 = top, 2 = bottom
+  width: number; // Track width (mm)
+  points: [number, number][]; // Polyline points
+}
+
+export interface Via {
+  id: string;
+  netId: string;
+  position: [number, number];
+  diameter: number; // Copper ring (mm)
+  drill: number; // Hole (mm)
+}
+
 export interface Board {
   outline: [number, number][]; // Polygon points: [[x, y], [x, y], ...]
   components: Component[];
   nets: Net[];
   layers: number; // Number of layers (MVP: 1-2)
+  traces?: Trace[]; // Routed copper (empty until routed)
+  vias?: Via[];
 }
 
 export interface Issue {
@@ -59,6 +77,31 @@ export interface Design {
 }
 
 // API Request/Response types
+// Listing projection returned by GET /designs (field names as sent on the wire)
+export interface DesignSummary {
+  id: string;
+  name: string;
+  component_count: number;
+  net_count: number;
+  issue_counts: Record<'error' | 'warning' | 'info', number>;
+  created_at?: string | null;
+  updated_at?: string | null;
+  revision: number;
+}
+
+export interface DesignPage {
+  items: DesignSummary[];
+  next_cursor: string | null;
+}
+
+export interface ListDesignsParams {
+  limit?: number;
+  cursor?: string;
+  name_prefix?: string;
+  min_components?: number;
+  max_components?: number;
+}
+
 export interface ValidateDesignResponse {
   issues: Issue[];
 }